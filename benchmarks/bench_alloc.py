@@ -0,0 +1,156 @@
+# ============================================================================
+# BENCHMARKS/BENCH_ALLOC.PY - Steady-State Allocations per Frame
+# ============================================================================
+# Measures the memory allocated per frame by the frame path, with tracemalloc
+# (NumPy and OpenCV output arrays are traced):
+# - legacy: cap.read() into a new array, cv2.flip() copy, cv2.cvtColor() copy,
+#   full-frame overlay copy for the info panel, hands.process()
+# - pooled: FrameGrabber reading into reused buffers, HandTracker on the
+#   captured frame with landmarks mirrored (no flipped copy for inference),
+#   the preview flip into a FramePool buffer and the in-place panel blend
+# - pooled headless: as pooled, without any preview flip or drawing
+#
+# Usage:
+#   python benchmarks/bench_alloc.py [--frames 200] [--video file.mp4]
+# ============================================================================
+
+# Import required libraries
+import argparse  # Command-line options
+import os  # Temporary file cleanup
+import tracemalloc  # Allocation measurement
+
+import numpy as np  # Statistics
+
+from common import make_test_video, print_table  # Benchmark helpers
+import cv2  # Legacy path
+from config import *  # Panel height and colors
+from capture import FrameGrabber  # Pooled capture
+from frame_pool import FramePool  # Pooled display buffer
+from gesture_utils import blend_region  # In-place panel background
+from hand_tracker import HandTracker, load_mediapipe  # Inference
+
+
+def measure(step, frames, warmup=10):
+    """
+    Run step() once per frame and record the bytes allocated during each call.
+
+    Parameters:
+        step (callable): Processes one frame, returns False when out of frames
+        frames (int): Frames to measure
+        warmup (int): Frames run before measuring (buffers get allocated)
+
+    Returns:
+        numpy.ndarray: Transient bytes allocated per frame (peak above start)
+    """
+    for _ in range(warmup):
+        step()
+
+    tracemalloc.start()
+    allocated = []
+    for _ in range(frames):
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        if not step():
+            break
+        _, peak = tracemalloc.get_traced_memory()
+        allocated.append(peak - before)
+    tracemalloc.stop()
+    return np.array(allocated)
+
+
+def legacy_path(path):
+    """Original per-frame code path: every step returns a new array."""
+    cap = cv2.VideoCapture(path)
+    mp_hands = load_mediapipe().solutions.hands
+    hands = mp_hands.Hands(static_image_mode=False, max_num_hands=MAX_NUM_HANDS,
+                           model_complexity=MODEL_COMPLEXITY)
+
+    def step():
+        ret, frame = cap.read()
+        if not ret:
+            return False
+        frame = cv2.flip(frame, 1)
+        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        hands.process(rgb_frame)
+        overlay = frame.copy()
+        cv2.rectangle(overlay, (0, 0), (frame.shape[1], INFO_PANEL_HEIGHT), COLOR_BLACK, -1)
+        cv2.addWeighted(overlay, 0.6, frame, 0.4, 0, frame)
+        return True
+
+    def close():
+        cap.release()
+        hands.close()
+
+    return step, close, None
+
+
+def pooled_path(path, headless):
+    """Current code path: reused capture, inference and display buffers."""
+    cap = FrameGrabber(path, realtime=False).start()
+    tracker = HandTracker(mirror=True)
+    pool = FramePool(count=1)
+
+    def step():
+        ret, frame = cap.read()
+        if not ret:
+            return False
+        tracker.process(frame)
+        if not headless:
+            frame = cv2.flip(frame, 1, dst=pool.get(frame.shape))
+            blend_region(frame, 0, 0, frame.shape[1], INFO_PANEL_HEIGHT + 1, COLOR_BLACK, 0.6)
+        return True
+
+    def close():
+        cap.release()
+        tracker.close()
+
+    return step, close, (cap, pool)
+
+
+def main():
+    """
+    Measure every variant and print the results table.
+    """
+    parser = argparse.ArgumentParser(description="Per-frame allocation benchmark")
+    parser.add_argument("--frames", type=int, default=200, help="Frames to measure")
+    parser.add_argument("--video", help="Video file (synthetic if omitted)")
+    parser.add_argument("--fps", type=float, default=60, help="Frame rate for the MB/s column")
+    args = parser.parse_args()
+
+    path = args.video or make_test_video(num_frames=args.frames + 20,
+                                         width=CAMERA_WIDTH, height=CAMERA_HEIGHT)
+    frame_kib = CAMERA_WIDTH * CAMERA_HEIGHT * 3 / 1024
+    rows = []
+    try:
+        for name, factory in (("legacy", lambda: legacy_path(path)),
+                              ("pooled", lambda: pooled_path(path, False)),
+                              ("pooled headless", lambda: pooled_path(path, True))):
+            step, close, owners = factory()
+            try:
+                allocated = measure(step, args.frames)
+            finally:
+                close()
+
+            kib = allocated / 1024
+            buffers = "-"
+            if owners is not None:
+                cap, pool = owners
+                buffers = f"{cap.get_stats()['allocations']} + {pool.allocations}"
+            rows.append((name, f"{np.median(kib):.0f}", f"{np.mean(kib):.0f}",
+                         f"{np.median(kib) / frame_kib:.2f}",
+                         f"{np.mean(kib) * args.fps / 1024:.0f}", buffers))
+    finally:
+        if not args.video:
+            os.remove(path)
+
+    print_table(
+        f"Allocated per frame, steady state ({len(allocated)} frames, "
+        f"{CAMERA_WIDTH}x{CAMERA_HEIGHT} frame = {frame_kib:.0f} KiB)",
+        rows,
+        ("path", "median KiB", "mean KiB", "frames' worth", f"MB/s at {args.fps:.0f} FPS",
+         "buffers (capture + display)"),
+    )
+
+
+if __name__ == "__main__":
+    main()
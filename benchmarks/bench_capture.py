@@ -0,0 +1,130 @@
+# ============================================================================
+# BENCHMARKS/BENCH_CAPTURE.PY - Synchronous vs Threaded Capture
+# ============================================================================
+# Replays a video file as if it were a live camera and simulates a slow
+# inference step. Reports how old each frame is when processing starts:
+# - synchronous: frames are consumed strictly in order, so when processing
+#   is slower than the source the backlog (and frame age) keeps growing
+# - threaded: FrameGrabber keeps only the newest frame, frame age stays
+#   bounded by one capture interval plus one processing step
+#
+# Usage:
+#   python benchmarks/bench_capture.py [--video FILE] [--work-ms 40]
+# ============================================================================
+
+# Import required libraries
+import argparse  # Command-line options
+import os  # Temporary file cleanup
+import time  # Timing
+
+import cv2  # OpenCV capture properties
+import numpy as np  # Statistics
+
+from common import make_test_video, print_table  # Benchmark helpers
+from capture import FrameGrabber, open_capture  # Module under test
+
+
+def run_synchronous(video, work_s):
+    """
+    Consume every frame in order, modelling an unbounded driver queue.
+
+    Parameters:
+        video (str): Path to the video file
+        work_s (float): Simulated per-frame processing time in seconds
+
+    Returns:
+        dict: processed frame count and frame age statistics in ms
+    """
+    cap = open_capture(video)
+    interval = 1.0 / (cap.get(cv2.CAP_PROP_FPS) or 30.0)
+    ages = []
+    index = 0
+    start = time.perf_counter()
+
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+
+        # A camera would have delivered frame <index> at start + index * interval
+        ages.append(time.perf_counter() - (start + index * interval))
+        index += 1
+
+        # Simulated inference
+        time.sleep(work_s)
+
+    cap.release()
+    return {"processed": index, "dropped": 0, "ages_ms": np.array(ages) * 1000}
+
+
+def run_threaded(video, work_s):
+    """
+    Consume the newest frame from a realtime-paced FrameGrabber.
+
+    Parameters:
+        video (str): Path to the video file
+        work_s (float): Simulated per-frame processing time in seconds
+
+    Returns:
+        dict: processed/dropped frame counts and frame age statistics in ms
+    """
+    grabber = FrameGrabber(video, realtime=True).start()
+    ages = []
+
+    while True:
+        ret, frame, capture_time = grabber.read_with_timestamp(timeout=2.0)
+        if not ret:
+            break
+
+        # Age = time since the producer read this frame from the source
+        ages.append(time.perf_counter() - capture_time)
+
+        # Simulated inference
+        time.sleep(work_s)
+
+    stats = grabber.get_stats()
+    grabber.release()
+    return {"processed": stats["delivered"], "dropped": stats["dropped"],
+            "ages_ms": np.array(ages) * 1000}
+
+
+def main():
+    """
+    Run both capture strategies and print a comparison table.
+    """
+    parser = argparse.ArgumentParser(description="Capture latency benchmark")
+    parser.add_argument("--video", help="Video file (a synthetic one is generated if omitted)")
+    parser.add_argument("--frames", type=int, default=150, help="Frames in the synthetic video")
+    parser.add_argument("--work-ms", type=float, default=40.0, help="Simulated inference time per frame")
+    args = parser.parse_args()
+
+    # Generate a 30 FPS synthetic video when none is given
+    video = args.video or make_test_video(num_frames=args.frames, fps=30)
+
+    try:
+        rows = []
+        for name, runner in (("synchronous", run_synchronous), ("threaded", run_threaded)):
+            result = runner(video, args.work_ms / 1000.0)
+            ages = result["ages_ms"]
+            rows.append((
+                name,
+                result["processed"],
+                result["dropped"],
+                f"{np.mean(ages):.1f}",
+                f"{np.percentile(ages, 95):.1f}",
+                f"{np.max(ages):.1f}",
+            ))
+
+        print_table(
+            f"Frame age at processing start (simulated work: {args.work_ms:.0f} ms/frame)",
+            rows,
+            ("mode", "processed", "dropped", "mean ms", "p95 ms", "max ms"),
+        )
+    finally:
+        # Remove the generated video
+        if not args.video:
+            os.remove(video)
+
+
+if __name__ == "__main__":
+    main()
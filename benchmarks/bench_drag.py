@@ -0,0 +1,181 @@
+# ============================================================================
+# BENCHMARKS/BENCH_DRAG.PY - Mouse Events per Drag and Click Gesture
+# ============================================================================
+# Runs the gesture logic (GestureSession) over the labeled noisy landmark
+# stream of bench_gestures.py with a RecordingBackend and counts the mouse
+# events every intended gesture produced:
+#   drag  - must be exactly one mouse_down, moves while held, one mouse_up
+#   tap   - must be exactly one mouse_down and one mouse_up with no move in
+#           between (a click, not a tiny drag)
+# and no click() calls for left pinches at all. The same stream is also sent
+# through the MouseDispatcher to check that button events keep their order
+# around coalesced moves (the stream is fed unpaced, so nearly all moves of
+# a gesture coalesce into one). For comparison, the original logic (a click() on pinch and
+# a drag flag, button never held) is counted on the same frames.
+#
+# Exits with code 1 if any drag or tap produced the wrong events.
+#
+# Usage:
+#   python benchmarks/bench_drag.py [--noise 4] [--seconds 60]
+# ============================================================================
+
+# Import required libraries
+import argparse  # Command-line options
+import sys  # Exit code
+
+from bench_gestures import FRAME_HEIGHT, FRAME_WIDTH, LegacyGestures, make_labeled_stream  # Labeled stream
+from common import print_table  # Benchmark helpers
+from config import *  # Gesture settings
+from gesture_features import FeatureEngine  # Hand features (legacy path)
+from gesture_logic import GestureSession  # Implementation under test
+from gesture_state import EVENT_PRESS, EVENT_RIGHT_CLICK  # Legacy click events
+from mouse_output import *  # RecordingBackend, MouseDispatcher, event kinds
+
+# Screen the cursor is mapped to
+SCREEN_WIDTH = 1920
+SCREEN_HEIGHT = 1080
+
+
+def run_session(points, times, dispatcher):
+    """
+    Feed the stream through a new GestureSession.
+
+    Parameters:
+        dispatcher (bool): Send the events through a MouseDispatcher
+
+    Returns:
+        list: Recorded (frame, action, args) events
+    """
+    backend = RecordingBackend(SCREEN_WIDTH, SCREEN_HEIGHT)
+    mouse = MouseDispatcher(backend).start() if dispatcher else backend
+    session = GestureSession()
+    for i in range(len(points)):
+        mouse.frame = i
+        session.process_hand(points[i], FRAME_WIDTH, FRAME_HEIGHT,
+                             SCREEN_WIDTH, SCREEN_HEIGHT, mouse, times[i])
+    session.release(mouse)
+    if dispatcher:
+        mouse.close()
+    return backend.events
+
+
+def run_legacy(points, times):
+    """
+    Events of the original logic: one move per frame plus its clicks.
+
+    Returns:
+        list: (frame, action, args) events like RecordingBackend
+    """
+    legacy = LegacyGestures()
+    engine = FeatureEngine()
+    events = []
+    for i in range(len(points)):
+        events.append((i, EVENT_MOVE, ()))
+        for event in legacy.update(engine.compute(points[i]), times[i]):
+            if event == EVENT_PRESS:
+                events.append((i, EVENT_CLICK, ()))
+            elif event == EVENT_RIGHT_CLICK:
+                events.append((i, EVENT_RIGHT_CLICK, ()))
+    return events
+
+
+def gesture_events(events, segments, kind, tail):
+    """
+    Group the events by intended gesture segment.
+
+    Parameters:
+        tail (int): Frames after a segment that still belong to it (the
+                    release fires GESTURE_EXIT_FRAMES after the fingers open)
+
+    Returns:
+        list: Per segment of the kind, its list of event actions
+    """
+    groups = []
+    for segment_kind, first, end, _ in segments:
+        if segment_kind == kind:
+            groups.append([action for frame, action, _ in events if first <= frame < end + tail])
+    return groups
+
+
+def check_gesture(actions, kind):
+    """
+    Check one gesture's events.
+
+    Returns:
+        tuple: (ok, moves between mouse_down and mouse_up)
+    """
+    downs = actions.count(EVENT_MOUSE_DOWN)
+    ups = actions.count(EVENT_MOUSE_UP)
+    if downs != 1 or ups != 1 or EVENT_CLICK in actions:
+        return False, 0
+    down, up = actions.index(EVENT_MOUSE_DOWN), actions.index(EVENT_MOUSE_UP)
+    held_moves = actions[down:up].count(EVENT_MOVE)
+    ok = up > down and (held_moves > 0 if kind == "drag" else held_moves == 0)
+    return ok, held_moves
+
+
+def main():
+    """
+    Count events per gesture for every variant and print the results table.
+    """
+    parser = argparse.ArgumentParser(description="Mouse events per drag gesture")
+    parser.add_argument("--noise", type=float, default=4.0, help="Landmark noise (pixels, std)")
+    parser.add_argument("--seconds", type=float, default=60, help="Stream duration")
+    parser.add_argument("--fps", type=float, default=30, help="Stream frame rate")
+    args = parser.parse_args()
+
+    points, times, segments = make_labeled_stream(args.seconds, args.fps, args.noise)
+    tail = GESTURE_EXIT_FRAMES + 2
+
+    rows = []
+    failures = []
+    for name in ("original", "direct", "dispatcher"):
+        if name == "original":
+            events = run_legacy(points, times)
+        else:
+            events = run_session(points, times, dispatcher=(name == "dispatcher"))
+
+        drags = gesture_events(events, segments, "drag", tail)
+        taps = gesture_events(events, segments, "tap", tail)
+        held = []
+        bad = 0
+        for kind, groups in (("drag", drags), ("tap", taps)):
+            for actions in groups:
+                ok, moves = check_gesture(actions, kind)
+                if kind == "drag":
+                    held.append(moves)
+                if not ok:
+                    bad += 1
+        if name != "original" and bad:
+            failures.append(f"{name}: {bad} gestures with wrong events")
+
+        def per_gesture(groups, action):
+            return sum(actions.count(action) for actions in groups) / max(len(groups), 1)
+
+        rows.append((name, len(drags),
+                     f"{per_gesture(drags, EVENT_MOUSE_DOWN):.2f} / {per_gesture(drags, EVENT_MOUSE_UP):.2f}",
+                     f"{per_gesture(drags, EVENT_CLICK):.2f}",
+                     f"{sum(held) / max(len(held), 1):.1f}",
+                     f"{sum(len(actions) for actions in drags) / max(len(drags), 1):.1f}",
+                     f"{per_gesture(taps, EVENT_CLICK) + per_gesture(taps, EVENT_MOUSE_DOWN):.2f}",
+                     f"{sum(len(actions) for actions in taps) / max(len(taps), 1):.1f}",
+                     len(events), bad))
+
+    print_table(
+        f"Mouse events per gesture ({args.seconds:.0f} s labeled stream, noise {args.noise:g} px, "
+        f"drag after {DRAG_HOLD_FRAMES} frames)",
+        rows,
+        ("variant", "drags", "down / up per drag", "clicks per drag", "moves held",
+         "calls per drag", "clicks+downs per tap", "calls per tap", "total calls",
+         "wrong gestures"),
+    )
+    print("original: click on pinch, button never held (no real drag); "
+          "dispatcher: calls reaching the backend, stream fed unpaced (moves coalesce)")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
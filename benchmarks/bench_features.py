@@ -0,0 +1,175 @@
+# ============================================================================
+# BENCHMARKS/BENCH_FEATURES.PY - Scalar vs Batched Gesture Features
+# ============================================================================
+# Compares three ways of computing the gesture features for one hand:
+# - legacy: per-landmark attribute access, two scalar distance calls and a
+#   per-finger loop (the original gesture_controller code)
+# - scalar on array: fingertip_distances() + count_extended_fingers() on the
+#   (21, 3) landmark array
+# - FeatureEngine: the full 5x5 distance matrix, extension flags and palm
+#   ratios in one pass, then the GESTURE_TABLE lookup
+# - compute_batch: the same features for every hand of the session in a
+#   single NumPy pass (offline analysis and replay)
+# Reports time per hand and checks all three classify every hand the same.
+#
+# Usage:
+#   python benchmarks/bench_features.py [--hands 5000] [--recording session.vmlm]
+# ============================================================================
+
+# Import required libraries
+import argparse  # Command-line options
+import math  # Legacy scalar distance
+import time  # Timing
+
+import numpy as np  # Synthetic hands
+
+from common import HAND_TEMPLATE, make_hand_results, print_table  # Benchmark helpers
+from config import *  # Landmark indices and thresholds
+from gesture_utils import landmarks_to_array, fingertip_distances, count_extended_fingers
+from gesture_features import FeatureEngine, compute_batch, classify_batch
+from landmark_recorder import load_recording  # Recorded landmark streams
+
+
+def make_hands(count, width, height, seed=0):
+    """
+    Generate perturbed copies of the open-hand template, including pinches.
+
+    Parameters:
+        count (int): Number of hands
+        width (int): Frame width in pixels
+        height (int): Frame height in pixels
+        seed (int): Random seed
+
+    Returns:
+        list: MediaPipe NormalizedLandmarkList objects, one per hand
+    """
+    rng = np.random.default_rng(seed)
+    hands = []
+    for i in range(count):
+        points = HAND_TEMPLATE + rng.normal(0, 0.02, HAND_TEMPLATE.shape).astype(np.float32)
+        # Every third hand pinches thumb to index, every fifth thumb to middle
+        if i % 3 == 0:
+            points[THUMB_TIP] = points[INDEX_TIP] + rng.normal(0, 0.01, 2)
+        elif i % 5 == 0:
+            points[THUMB_TIP] = points[MIDDLE_TIP] + rng.normal(0, 0.01, 2)
+        hands.append(make_hand_results(points).multi_hand_landmarks[0])
+    return hands
+
+
+def load_hands(path):
+    """
+    Load the hands of a landmark recording (frames without a hand are skipped).
+
+    Parameters:
+        path (str): Recording made with gesture_controller.py --record
+
+    Returns:
+        tuple: (list of NormalizedLandmarkList objects, frame width, frame height)
+    """
+    header, records = load_recording(path)
+    landmarks = records["landmarks"][records["present"] != 0]
+    hands = [make_hand_results(points[:, :2]).multi_hand_landmarks[0] for points in landmarks]
+    return hands, header["frame_width"], header["frame_height"]
+
+
+def classify_legacy(hand, width, height):
+    """Original per-attribute scalar code path."""
+    lm = hand.landmark
+    index_x, index_y = int(lm[INDEX_TIP].x * width), int(lm[INDEX_TIP].y * height)
+    middle_x, middle_y = int(lm[MIDDLE_TIP].x * width), int(lm[MIDDLE_TIP].y * height)
+    thumb_x, thumb_y = int(lm[THUMB_TIP].x * width), int(lm[THUMB_TIP].y * height)
+
+    thumb_index_dist = math.sqrt((index_x - thumb_x) ** 2 + (index_y - thumb_y) ** 2)
+    thumb_middle_dist = math.sqrt((middle_x - thumb_x) ** 2 + (middle_y - thumb_y) ** 2)
+
+    fingers = 0
+    if lm[THUMB_TIP].x < lm[THUMB_IP].x:
+        fingers += 1
+    for tip, pip in ((INDEX_TIP, INDEX_PIP), (MIDDLE_TIP, MIDDLE_PIP),
+                     (RING_TIP, RING_PIP), (PINKY_TIP, PINKY_PIP)):
+        if lm[tip].y < lm[pip].y:
+            fingers += 1
+
+    if thumb_index_dist < CLICK_THRESHOLD:
+        return MODE_LEFT_CLICK
+    if thumb_middle_dist < CLICK_THRESHOLD:
+        return MODE_RIGHT_CLICK
+    if fingers == 5:
+        return MODE_SCROLL
+    return MODE_CURSOR
+
+
+def classify_scalar_array(points, width, height):
+    """Pairwise distances and finger count on the landmark array."""
+    thumb_index_dist, thumb_middle_dist = fingertip_distances(points, [INDEX_TIP, MIDDLE_TIP])
+    fingers = count_extended_fingers(points, width, height)
+    if thumb_index_dist < CLICK_THRESHOLD:
+        return MODE_LEFT_CLICK
+    if thumb_middle_dist < CLICK_THRESHOLD:
+        return MODE_RIGHT_CLICK
+    if fingers == 5:
+        return MODE_SCROLL
+    return MODE_CURSOR
+
+
+def main():
+    """
+    Run the comparison and print the results table.
+    """
+    parser = argparse.ArgumentParser(description="Gesture feature benchmark")
+    parser.add_argument("--hands", type=int, default=5000, help="Synthetic hands")
+    parser.add_argument("--width", type=int, default=CAMERA_WIDTH, help="Frame width")
+    parser.add_argument("--height", type=int, default=CAMERA_HEIGHT, help="Frame height")
+    parser.add_argument("--recording", help="Use the hands of a landmark recording instead")
+    args = parser.parse_args()
+
+    if args.recording:
+        hands, width, height = load_hands(args.recording)
+    else:
+        width, height = args.width, args.height
+        hands = make_hands(args.hands, width, height)
+    arrays = [landmarks_to_array(hand, width, height) for hand in hands]
+    batch = np.stack(arrays)
+    engine = FeatureEngine()
+    batch_modes = []
+
+    def run_batch(i):
+        # The whole session is classified on the first call
+        if i == 0:
+            distances, extended, _, _ = compute_batch(batch)
+            batch_modes[:] = classify_batch(distances, extended, CLICK_THRESHOLD)
+        return batch_modes[i]
+
+    variants = [
+        ("legacy scalar (protobuf)", lambda i: classify_legacy(hands[i], width, height)),
+        ("scalar on array", lambda i: classify_scalar_array(arrays[i], width, height)),
+        ("FeatureEngine (5x5 matrix)", lambda i: engine.compute(arrays[i]).classify(CLICK_THRESHOLD)),
+        ("compute_batch (all hands)", run_batch),
+    ]
+
+    rows = []
+    reference = None
+    for name, func in variants:
+        start = time.perf_counter()
+        modes = [func(i) for i in range(len(hands))]
+        elapsed = time.perf_counter() - start
+
+        if reference is None:
+            reference = modes
+        agree = sum(a == b for a, b in zip(modes, reference))
+        rows.append((name, f"{1e6 * elapsed / len(hands):.2f}", f"{agree}/{len(hands)}"))
+
+    counts = {mode: reference.count(mode) for mode in sorted(set(reference))}
+    print_table(
+        f"Gesture features per hand ({len(hands)} hands, {width}x{height})",
+        rows,
+        ("variant", "us per hand", "agrees with legacy"),
+    )
+    print(f"Gesture mix: {counts}")
+    print("Per hand, FeatureEngine computes all 10 fingertip pairs, 5 extension flags "
+          "and palm ratios;\nthe legacy path computes 2 distances. Legacy truncates "
+          "tips to whole pixels, so hands\nwithin a pixel of CLICK_THRESHOLD may differ.")
+
+
+if __name__ == "__main__":
+    main()
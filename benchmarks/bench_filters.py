@@ -0,0 +1,277 @@
+# ============================================================================
+# BENCHMARKS/BENCH_FILTERS.PY - Cursor Filter Jitter vs Lag
+# ============================================================================
+# Runs every cursor filter (cursor_filters.py) over the same cursor paths
+# and reports the trade-off between jitter and lag:
+#
+# 1. Synthetic paths with ground truth (screen pixels, 30 FPS) plus
+#    fingertip noise: a hand held still, and a path of holds, slow drifts,
+#    fast sweeps and quick target moves.
+#    - jitter: RMS distance from the true position while the hand is still
+#    - lag: time shift of the true path that best matches the output
+#    - error: RMS distance from the true position while moving
+#    - overshoot: how far the cursor flies past a target after a fast move
+# 2. Recorded landmark stream (--recording, synthetic if omitted), index
+#    fingertip mapped to the screen like process_hand(). No ground truth:
+#    - jitter: RMS of the high-frequency part of the output (output minus
+#      its zero-phase Gaussian smoothing), independent of lag
+#    - lag: time shift of the raw fingertip path that best matches the output
+#
+# Usage:
+#   python benchmarks/bench_filters.py [--recording session.vmlm] [--seconds 60]
+# ============================================================================
+
+# Import required libraries
+import argparse  # Command-line options
+import os  # Temporary file cleanup
+import time  # Timing
+
+import numpy as np  # Paths and statistics
+
+from common import make_landmark_recording, print_table  # Benchmark helpers
+from config import *  # Control area and filter settings
+from cursor_filters import FILTERS, create_filter  # Implementation under test
+from landmark_recorder import load_recording  # Recorded streams
+
+# Screen the cursor is mapped to
+SCREEN_WIDTH = 1920
+SCREEN_HEIGHT = 1080
+
+# Fingertip noise on the screen: about 0.002 of the frame width (MediaPipe
+# landmark noise) magnified by the control area (60% of the frame)
+NOISE_PX = 6.0
+
+# Largest lag searched for (seconds)
+MAX_LAG = 0.5
+
+
+def make_path(seconds, fps, seed=0):
+    """
+    Build a synthetic cursor path with known truth.
+
+    Segments repeat: hold, slow drift, hold, fast sweep, hold, a quick move
+    to a random target.
+
+    Parameters:
+        seconds (float): Path duration
+        fps (float): Samples per second
+        seed (int): Random seed
+
+    Returns:
+        tuple: (times (N,), truth (N, 2), measured (N, 2), moving (N,) bool)
+    """
+    rng = np.random.default_rng(seed)
+    times = np.arange(int(seconds * fps)) / fps
+    truth = np.zeros((len(times), 2))
+    moving = np.zeros(len(times), dtype=bool)
+
+    position = np.array([SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2])
+    i = 0
+    while i < len(times):
+        for kind, duration in (("hold", 1.0), ("drift", 2.0), ("hold", 1.0),
+                               ("sweep", 0.6), ("hold", 1.0), ("target", 0.25)):
+            count = min(int(duration * fps), len(times) - i)
+            if count <= 0:
+                break
+            phase = np.arange(1, count + 1) / count
+            if kind == "hold":
+                segment = np.tile(position, (count, 1))
+            else:
+                if kind == "drift":
+                    delta = rng.uniform(-150, 150, 2)
+                elif kind == "sweep":
+                    delta = rng.uniform(-900, 900, 2) * (1, 0.5)
+                else:
+                    delta = rng.uniform(-400, 400, 2)
+                # Smooth start and stop (cosine ease)
+                ease = (1 - np.cos(np.pi * phase)) / 2
+                target = np.clip(position + delta, 100, (SCREEN_WIDTH - 100, SCREEN_HEIGHT - 100))
+                segment = position + (target - position) * ease[:, None]
+                moving[i:i + count] = True
+                position = target
+            truth[i:i + count] = segment
+            i += count
+
+    measured = truth + rng.normal(0, NOISE_PX, truth.shape)
+    return times, truth, measured, moving
+
+
+def run_filter(cursor_filter, times, measured):
+    """
+    Filter a measured path sample by sample.
+
+    Returns:
+        tuple: (output (N, 2), mean microseconds per update)
+    """
+    output = np.zeros_like(measured)
+    start = time.perf_counter()
+    for i, (t, (x, y)) in enumerate(zip(times, measured)):
+        output[i] = cursor_filter.update(x, y, t)
+    elapsed = time.perf_counter() - start
+    return output, 1e6 * elapsed / len(times)
+
+
+def best_lag(times, output, reference, mask):
+    """
+    Time shift of the reference path that best matches the output.
+
+    Parameters:
+        times (numpy.ndarray): Sample times
+        output (numpy.ndarray): Filtered path
+        reference (numpy.ndarray): Path to shift (truth or raw input)
+        mask (numpy.ndarray): Samples to compare
+
+    Returns:
+        float: Lag in milliseconds (negative = output leads)
+    """
+    lags = np.arange(-MAX_LAG / 2, MAX_LAG, 0.001)
+    errors = []
+    for lag in lags:
+        shifted = np.stack([np.interp(times[mask] - lag, times, reference[:, axis])
+                            for axis in (0, 1)], axis=-1)
+        errors.append(np.linalg.norm(output[mask] - shifted, axis=1).mean())
+    return 1000 * lags[int(np.argmin(errors))]
+
+
+def overshoot(output, truth, moving, fps):
+    """
+    Mean of the largest distance past the target in the 0.3 s after each stop.
+
+    Returns:
+        float: Overshoot in pixels
+    """
+    stops = np.flatnonzero(moving[:-1] & ~moving[1:]) + 1
+    window = int(0.3 * fps)
+    values = []
+    for stop in stops:
+        if stop + window > len(truth):
+            break
+        direction = truth[stop] - truth[stop - 2]
+        norm = np.linalg.norm(direction)
+        if norm < 1e-6:
+            continue
+        direction /= norm
+        # Signed distance along the movement direction beyond the target
+        beyond = (output[stop:stop + window] - truth[stop]) @ direction
+        values.append(max(beyond.max(), 0.0))
+    return float(np.mean(values)) if values else 0.0
+
+
+def high_frequency_rms(path, sigma=2.0):
+    """
+    RMS of a path minus its zero-phase Gaussian smoothing (noise, not motion).
+
+    Parameters:
+        path (numpy.ndarray): (N, 2) positions
+        sigma (float): Gaussian width in samples
+
+    Returns:
+        float: RMS in pixels
+    """
+    radius = int(3 * sigma)
+    kernel = np.exp(-0.5 * (np.arange(-radius, radius + 1) / sigma) ** 2)
+    kernel /= kernel.sum()
+    padded = np.pad(path, ((radius, radius), (0, 0)), mode="edge")
+    smooth = np.stack([np.convolve(padded[:, axis], kernel, mode="valid") for axis in (0, 1)], axis=-1)
+    return float(np.sqrt(np.mean(np.sum((path - smooth) ** 2, axis=1))))
+
+
+def load_fingertip_path(path):
+    """
+    Map the index fingertip of a recording to screen positions.
+
+    Returns:
+        tuple: (times (N,), screen positions (N, 2)) for frames with a hand
+    """
+    header, records = load_recording(path)
+    width, height = header["frame_width"], header["frame_height"]
+    present = np.asarray(records["present"]) != 0
+    times = np.asarray(records["ts_ns"])[present] / 1e9
+    tips = np.asarray(records["landmarks"])[present, INDEX_TIP, :2] * (width, height)
+
+    screen_x = np.interp(tips[:, 0], [int(width * CONTROL_AREA_START), int(width * CONTROL_AREA_END)],
+                         [0, SCREEN_WIDTH])
+    screen_y = np.interp(tips[:, 1], [int(height * CONTROL_AREA_START), int(height * CONTROL_AREA_END)],
+                         [0, SCREEN_HEIGHT])
+    return times - times[0], np.stack([screen_x, screen_y], axis=-1)
+
+
+def main():
+    """
+    Evaluate every filter and print the results tables.
+    """
+    parser = argparse.ArgumentParser(description="Cursor filter jitter vs lag benchmark")
+    parser.add_argument("--recording", help="Landmark recording (synthetic if omitted)")
+    parser.add_argument("--seconds", type=float, default=60, help="Synthetic path duration")
+    parser.add_argument("--fps", type=float, default=30, help="Synthetic path sample rate")
+    args = parser.parse_args()
+
+    # ------------------------------------------------------------------------
+    # Synthetic path with ground truth
+    # ------------------------------------------------------------------------
+    times, truth, measured, moving = make_path(args.seconds, args.fps)
+
+    # Hand held still in the middle of the screen (first 2 s skipped, so
+    # every filter has settled, including lerp sliding in from (0, 0))
+    rng = np.random.default_rng(1)
+    still_times = np.arange(int(20 * args.fps)) / args.fps
+    center = np.array([SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2])
+    still_measured = center + rng.normal(0, NOISE_PX, (len(still_times), 2))
+    settled = still_times >= 2.0
+
+    rows = []
+    for name in ["raw"] + list(FILTERS):
+        if name == "raw":
+            output, us = measured, 0.0
+            still_output = still_measured
+        else:
+            output, us = run_filter(create_filter(name), times, measured)
+            still_output, _ = run_filter(create_filter(name), still_times, still_measured)
+        error = np.linalg.norm(output - truth, axis=1)
+        still_error = np.linalg.norm(still_output[settled] - center, axis=1)
+        rows.append((name, f"{np.sqrt(np.mean(still_error ** 2)):.2f}",
+                     f"{best_lag(times, output, truth, moving):.0f}",
+                     f"{np.sqrt(np.mean(error[moving] ** 2)):.1f}",
+                     f"{overshoot(output, truth, moving, args.fps):.1f}", f"{us:.1f}"))
+
+    print_table(
+        f"Synthetic cursor path ({args.seconds:.0f} s at {args.fps:.0f} FPS, "
+        f"noise {NOISE_PX:.0f} px, screen {SCREEN_WIDTH}x{SCREEN_HEIGHT})",
+        rows,
+        ("filter", "jitter still px", "lag ms", "error moving px", "overshoot px", "us/update"),
+    )
+
+    # ------------------------------------------------------------------------
+    # Recorded landmark stream (no ground truth)
+    # ------------------------------------------------------------------------
+    path = args.recording or make_landmark_recording(num_frames=int(args.seconds * args.fps))
+    try:
+        times, raw = load_fingertip_path(path)
+    finally:
+        if args.recording is None:
+            os.remove(path)
+
+    rows = []
+    everything = np.ones(len(times), dtype=bool)
+    for name in ["raw"] + list(FILTERS):
+        if name == "raw":
+            output = raw
+        else:
+            output, _ = run_filter(create_filter(name), times, raw)
+        rows.append((name, f"{high_frequency_rms(output):.2f}",
+                     f"{best_lag(times, output, raw, everything):.0f}"))
+
+    print_table(
+        f"Recorded fingertip stream ({'synthetic' if args.recording is None else args.recording}, "
+        f"{len(times)} hand frames)",
+        rows,
+        ("filter", "jitter px", "lag vs raw ms"),
+    )
+    print(f"configured: CURSOR_FILTER={CURSOR_FILTER}, SMOOTHING_FACTOR={SMOOTHING_FACTOR}, "
+          f"one_euro min_cutoff={ONE_EURO_MIN_CUTOFF} beta={ONE_EURO_BETA}, "
+          f"kalman q={KALMAN_PROCESS_NOISE:g} r={KALMAN_MEASUREMENT_NOISE:g} "
+          f"prediction={KALMAN_PREDICTION}s")
+
+
+if __name__ == "__main__":
+    main()
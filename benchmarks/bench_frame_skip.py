@@ -0,0 +1,213 @@
+# ============================================================================
+# BENCHMARKS/BENCH_FRAME_SKIP.PY - Frame Skipping: Accuracy vs Inference Cost
+# ============================================================================
+# Two measurements:
+#
+# 1. Replay (always, no MediaPipe needed): frames of a synthetic hand that
+#    alternately moves and holds still (like pointing at a button and
+#    dwelling on it), with per-frame sensor noise, are fed to FrameSkipper.
+#    Inference is replaced by the drawn landmarks plus 1 pixel of jitter.
+#    Per variant: the fraction of frames inferred, the estimated CPU time
+#    per frame (inferred fraction x --inference-ms, plus the measured
+#    skipping overhead) and the index fingertip error against the drawn
+#    hand, overall and while moving.
+#
+# 2. Live inference (--live, needs MediaPipe): HandTracker on the same
+#    frames with each frame skip: measured time per frame and fingertip
+#    error.
+#
+# Variants: every frame, fixed intervals (no motion trigger), adaptive
+# (motion trigger), with extrapolated or held landmarks.
+#
+# Usage:
+#   python benchmarks/bench_frame_skip.py [--seconds 20] [--inference-ms 20]
+#   python benchmarks/bench_frame_skip.py --threshold 1.0
+#   python benchmarks/bench_frame_skip.py --live
+# ============================================================================
+
+# Import required libraries
+import argparse  # Command-line options
+import time  # Timing
+
+import numpy as np  # Trajectories and statistics
+
+from common import draw_synthetic_hand, hand_trajectory, print_table, BACKGROUND_COLOR  # Benchmark helpers
+import cv2  # Frame blur
+from config import *  # Frame skip settings
+from frame_skip import FrameSkipper  # Implementation under test
+from hand_tracker import HandTracker  # Live inference
+
+# (name, max skip, motion trigger, extrapolate)
+VARIANTS = (
+    ("every frame", 1, False, False),
+    ("fixed 2, extrapolated", 2, False, True),
+    ("fixed 3, extrapolated", 3, False, True),
+    ("fixed 3, held", 3, False, False),
+    ("fixed 4, extrapolated", 4, False, True),
+    ("adaptive 4, extrapolated", 4, True, True),
+    ("adaptive 4, held", 4, True, False),
+    ("adaptive 8, held", 8, True, False),
+)
+
+
+def dwell_trajectory(frames, fps, width, height, move=1.5, hold=2.0):
+    """
+    Wrist positions of a hand that moves for move seconds, then holds still.
+
+    Returns:
+        tuple: ((frames, 2) wrist positions in pixels, (frames,) moving flags)
+    """
+    t = np.arange(frames) / fps
+    phase = t % (move + hold)
+    moving = phase < move
+    # Trajectory time only advances while moving
+    cycles = np.floor(t / (move + hold))
+    motion_time = cycles * move + np.minimum(phase, move)
+    return hand_trajectory(motion_time, width, height), moving
+
+
+class SyntheticCamera:
+    """
+    Frames of the synthetic hand with sensor noise that changes every frame.
+    """
+
+    def __init__(self, wrists, width, height, noise=3.0, seed=0):
+        self.wrists = wrists
+        self.size = 0.15 * height
+        self.background = np.full((height, width, 3), BACKGROUND_COLOR, dtype=np.uint8)
+        # Noise patterns used in turn (drawing new noise is slower than the replay)
+        rng = np.random.default_rng(seed)
+        self.patterns = [rng.normal(0, noise, self.background.shape).astype(np.float32)
+                         for _ in range(8)]
+
+    def frames(self):
+        """
+        Yield (frame, (21, 2) drawn landmarks in pixels) per wrist position.
+        """
+        for i, wrist in enumerate(self.wrists):
+            frame = self.background.copy()
+            points = draw_synthetic_hand(frame, wrist, self.size)
+            frame = cv2.GaussianBlur(frame, (5, 5), 0)
+            frame = np.clip(frame + self.patterns[i % len(self.patterns)], 0, 255).astype(np.uint8)
+            yield frame, points
+
+
+def replay(camera, moving, max_skip, threshold, extrapolate, width, height, seed=1):
+    """
+    Run FrameSkipper on the synthetic frames with a simulated inference.
+
+    Returns:
+        dict: inferred fraction, skipper overhead (ms/frame), fingertip errors
+    """
+    skipper = FrameSkipper(max_skip=max_skip, motion_threshold=threshold, extrapolate=extrapolate)
+    rng = np.random.default_rng(seed)
+    scale = np.array([width, height], dtype=np.float32)
+    errors = []
+    overhead_ms = 0.0
+
+    for frame, truth in camera.frames():
+        start = time.perf_counter()
+        infer = skipper.should_infer(frame)
+        if not infer:
+            points = skipper.predict()
+        overhead_ms += 1000.0 * (time.perf_counter() - start)
+
+        if infer:
+            # Simulated inference: drawn landmarks with 1 pixel of jitter
+            detected = (truth + rng.normal(0, 1.0, truth.shape)) / scale
+            points = np.concatenate([detected, np.zeros((21, 1))], axis=1)[np.newaxis]
+            start = time.perf_counter()
+            skipper.observe(points)
+            overhead_ms += 1000.0 * (time.perf_counter() - start)
+
+        tip = points[0, INDEX_TIP, :2] * scale
+        errors.append(float(np.hypot(*(tip - truth[INDEX_TIP]))))
+
+    errors = np.array(errors)
+    return {
+        "inferred": skipper.inferred / len(errors),
+        "overhead_ms": overhead_ms / len(errors),
+        "motion_triggers": skipper.motion_triggers,
+        "errors": errors,
+        "moving_errors": errors[moving[:len(errors)]],
+    }
+
+
+def live(camera, max_skip, threshold, width, height):
+    """
+    Run HandTracker with a frame skip on the synthetic frames.
+
+    Returns:
+        tuple: (ms per frame, fingertip errors in pixels, frames with a hand,
+                skipped frames)
+    """
+    errors = []
+    total_ms = 0.0
+    frames = 0
+    with HandTracker(frame_skip=max_skip, mirror=False) as tracker:
+        tracker.skipper.motion_threshold = threshold
+        for frame, truth in camera.frames():
+            start = time.perf_counter()
+            results = tracker.process(frame)
+            total_ms += 1000.0 * (time.perf_counter() - start)
+            frames += 1
+            if results.multi_hand_landmarks:
+                lm = results.multi_hand_landmarks[0].landmark[INDEX_TIP]
+                errors.append(float(np.hypot(lm.x * width - truth[INDEX_TIP][0],
+                                             lm.y * height - truth[INDEX_TIP][1])))
+        skipped = tracker.get_stats()["skipped_frames"]
+    return total_ms / frames, np.array(errors), len(errors), skipped
+
+
+def main():
+    """
+    Replay every variant (and run them live with --live), then print the tables.
+    """
+    parser = argparse.ArgumentParser(description="Frame skipping benchmark")
+    parser.add_argument("--seconds", type=float, default=20, help="Length of the synthetic session")
+    parser.add_argument("--fps", type=float, default=30, help="Camera frame rate")
+    parser.add_argument("--inference-ms", type=float, default=20,
+                        help="Inference time per frame used for the CPU estimate")
+    parser.add_argument("--noise", type=float, default=3.0, help="Sensor noise (gray levels, std)")
+    parser.add_argument("--threshold", type=float, default=FRAME_SKIP_MOTION_THRESHOLD,
+                        help="Motion threshold of the adaptive variants (%% of pixels changed)")
+    parser.add_argument("--live", action="store_true", help="Also run HandTracker (needs MediaPipe)")
+    args = parser.parse_args()
+
+    width, height = CAMERA_WIDTH, CAMERA_HEIGHT
+    frames = int(args.seconds * args.fps)
+    wrists, moving = dwell_trajectory(frames, args.fps, width, height)
+    camera = SyntheticCamera(wrists, width, height, noise=args.noise)
+
+    rows = []
+    for name, max_skip, motion, extrapolate in VARIANTS:
+        threshold = args.threshold if motion else None
+        result = replay(camera, moving, max_skip, threshold, extrapolate, width, height)
+        cpu_ms = result["inferred"] * args.inference_ms + result["overhead_ms"]
+        rows.append((name, f"{result['inferred']:.0%}", f"{cpu_ms:.1f}",
+                     f"{1000 * result['overhead_ms']:.0f}", result["motion_triggers"],
+                     f"{result['errors'].mean():.1f}", f"{np.percentile(result['errors'], 95):.1f}",
+                     f"{np.percentile(result['moving_errors'], 95):.1f}",
+                     f"{result['errors'].max():.1f}"))
+
+    print_table(f"Frame skipping replay ({frames} frames, {moving.mean():.0%} moving, "
+                f"noise {args.noise:g}, threshold {args.threshold:g}%, "
+                f"inference {args.inference_ms:g} ms)",
+                rows, ("variant", "inferred", "est. ms/frame", "skip µs/frame", "motion triggers",
+                       "tip err mean px", "p95 px", "p95 moving px", "max px"))
+
+    if args.live:
+        rows = []
+        for max_skip in (1, 2, 4, 8):
+            ms, errors, detected, skipped = live(camera, max_skip, args.threshold, width, height)
+            rows.append((max_skip, f"{ms:.1f}", f"{skipped / frames:.0%}", f"{detected / frames:.0%}",
+                         f"{errors.mean():.1f}" if len(errors) else "-",
+                         f"{np.percentile(errors, 95):.1f}" if len(errors) else "-"))
+        print_table(f"HandTracker with frame skipping (threshold {args.threshold:g}%, "
+                    f"{'extrapolated' if FRAME_SKIP_EXTRAPOLATE else 'held'} landmarks)",
+                    rows, ("frame skip", "ms/frame", "skipped", "hand found",
+                           "tip err mean px", "p95 px"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+# ============================================================================
+# BENCHMARKS/BENCH_GESTURES.PY - Gesture False Triggers and Event Counts
+# ============================================================================
+# Compares the original per-frame if/elif gesture classification with the
+# gesture state machine (gesture_state.py) on landmark streams:
+#
+# 1. Labeled synthetic stream: a repeating sequence of pointing, a quick
+#    tap, a near miss (fingers hovering just above the click threshold), a
+#    held pinch with movement (drag), a right pinch and an open hand
+#    (scroll), with landmark noise (--noise pixels). Per variant:
+#    - clicks / right clicks emitted vs intended, false triggers (extra
+#      events, or events where none was intended) and missed gestures
+#    - mode changes per minute (flicker) and drag releases
+#    - click delay: first frame below the threshold -> click event
+# 2. Recorded landmark stream (--recording, synthetic if omitted): event
+#    counts and mode changes without ground truth.
+#
+# Usage:
+#   python benchmarks/bench_gestures.py [--noise 4] [--seconds 120]
+#   python benchmarks/bench_gestures.py --recording session.vmlm
+# ============================================================================
+
+# Import required libraries
+import argparse  # Command-line options
+import os  # Temporary file cleanup
+
+import numpy as np  # Streams and statistics
+
+from common import HAND_TEMPLATE, make_landmark_recording, print_table  # Benchmark helpers
+from config import *  # Thresholds and landmark indices
+from gesture_features import FeatureEngine  # Hand features
+from gesture_state import *  # Implementation under test
+from landmark_recorder import load_recording  # Recorded streams
+
+# Frame size of the synthetic stream
+FRAME_WIDTH = 1280
+FRAME_HEIGHT = 720
+
+# Fingertip distance while pinched and while pointing (pixels)
+PINCH_DISTANCE = 15
+NEAR_MISS_DISTANCE = 48
+
+
+class LegacyGestures:
+    """
+    The original per-frame classification (if/elif chain in process_hand).
+
+    Its clicks are reported as EVENT_PRESS, like the state machine's button
+    presses (each press is one click or the start of one drag).
+    """
+
+    def __init__(self):
+        self.mode = MODE_CURSOR
+        self.drag_mode = False
+        self.last_click_time = 0
+
+    def update(self, features, now):
+        events = []
+        pose = features.classify(CLICK_THRESHOLD)
+        if pose == MODE_LEFT_CLICK:
+            if now - self.last_click_time > CLICK_COOLDOWN:
+                if not self.drag_mode:
+                    events.append(EVENT_PRESS)
+                    self.last_click_time = now
+                self.drag_mode = True
+        elif pose == MODE_RIGHT_CLICK:
+            if now - self.last_click_time > CLICK_COOLDOWN:
+                events.append(EVENT_RIGHT_CLICK)
+                self.last_click_time = now
+        elif pose != MODE_SCROLL:
+            if self.drag_mode:
+                self.drag_mode = False
+                events.append(EVENT_DRAG_END)
+        self.mode = pose
+        return events
+
+
+class MachineGestures:
+    """
+    Adapter giving GestureStateMachine the same interface as LegacyGestures.
+    """
+
+    def __init__(self):
+        self.machine = GestureStateMachine()
+
+    @property
+    def mode(self):
+        return self.machine.mode
+
+    def update(self, features, now):
+        return self.machine.update(features, now)
+
+
+def make_labeled_stream(seconds, fps, noise, seed=0):
+    """
+    Build a noisy landmark stream with known intended gestures.
+
+    Returns:
+        tuple: (points (N, 21, 3) pixels, times (N,), segments) where
+               segments is a list of (kind, first frame, end frame, first
+               frame below CLICK_THRESHOLD or None)
+    """
+    rng = np.random.default_rng(seed)
+    scale = np.array([FRAME_WIDTH, FRAME_HEIGHT], dtype=np.float32)
+    open_hand = HAND_TEMPLATE * scale
+
+    # Pointing hand: middle, ring and pinky folded below their PIP joints
+    fist = open_hand.copy()
+    for tip, pip in ((MIDDLE_TIP, MIDDLE_PIP), (RING_TIP, RING_PIP), (PINKY_TIP, PINKY_PIP)):
+        fist[tip, 1] = fist[pip, 1] + 0.03 * FRAME_HEIGHT
+
+    # (kind, seconds, fingertip the thumb approaches, closest distance)
+    sequence = [
+        ("point", 1.0, None, None),
+        ("tap", 0.55, INDEX_TIP, PINCH_DISTANCE),
+        ("point", 0.7, None, None),
+        ("near_miss", 1.1, INDEX_TIP, NEAR_MISS_DISTANCE),
+        ("point", 0.7, None, None),
+        ("drag", 1.8, INDEX_TIP, PINCH_DISTANCE),
+        ("point", 0.7, None, None),
+        ("right", 1.2, MIDDLE_TIP, PINCH_DISTANCE),
+        ("point", 0.7, None, None),
+        ("scroll", 1.5, None, None),
+    ]
+
+    frames = []
+    segments = []
+    while len(frames) < seconds * fps:
+        for kind, duration, target, closest in sequence:
+            count = int(duration * fps)
+            first = len(frames)
+            below = None
+            # Fingers close in 0.15 s, hold, then open in 0.15 s
+            ramp = int(0.15 * fps)
+            for j in range(count):
+                t = (first + j) / fps
+                # Whole hand drifting slowly (fast during a drag)
+                speed = 3.0 if kind == "drag" else 0.7
+                offset = np.array([80 * np.sin(speed * t), 50 * np.sin(0.8 * speed * t)], dtype=np.float32)
+                points = (open_hand if kind == "scroll" else fist) + offset
+                if kind == "scroll":
+                    points[:, 1] += 60 * np.sin(2 * np.pi * 0.5 * t)
+                if target is not None:
+                    rest = np.linalg.norm(points[THUMB_TIP] - points[target])
+                    closing = min(j / ramp, 1.0, (count - 1 - j) / ramp)
+                    distance = rest + (closest - rest) * max(closing, 0.0)
+                    direction = (points[THUMB_TIP] - points[target]) / rest
+                    points[THUMB_TIP] = points[target] + direction * distance
+                    if below is None and distance < CLICK_THRESHOLD:
+                        below = first + j
+                frames.append(points)
+            segments.append((kind, first, len(frames), below))
+
+    points = np.stack(frames) + rng.normal(0, noise, (len(frames), 21, 2)).astype(np.float32)
+    points = np.concatenate([points, np.zeros((len(points), 21, 1), dtype=np.float32)], axis=2)
+    return points, np.arange(len(points)) / fps, segments
+
+
+def run_stream(variant, points, times):
+    """
+    Feed a landmark stream to a gesture variant.
+
+    Returns:
+        tuple: (events as (frame, event) list, mode changes)
+    """
+    engine = FeatureEngine()
+    events = []
+    changes = 0
+    mode = MODE_CURSOR
+    for i in range(len(points)):
+        for event in variant.update(engine.compute(points[i]), times[i]):
+            events.append((i, event))
+        if variant.mode != mode:
+            changes += 1
+            mode = variant.mode
+    return events, changes
+
+
+def score(events, segments, kind, event_name, fps):
+    """
+    Compare one event type with the segments that intend it.
+
+    Returns:
+        tuple: (emitted, intended, false triggers, missed, mean delay ms)
+    """
+    frames = [frame for frame, event in events if event == event_name]
+    intended = [segment for segment in segments if segment[0] in kind]
+    matched = set()
+    delays = []
+    false = 0
+    for frame in frames:
+        segment = next((s for s in segments if s[1] <= frame < s[2]), None)
+        if segment is None or segment[0] not in kind or segment[1] in matched:
+            false += 1
+            continue
+        matched.add(segment[1])
+        if segment[3] is not None:
+            delays.append((frame - segment[3]) * 1000.0 / fps)
+    missed = len(intended) - len(matched)
+    return len(frames), len(intended), false, missed, float(np.mean(delays)) if delays else 0.0
+
+
+def main():
+    """
+    Run both variants on both streams and print the results tables.
+    """
+    parser = argparse.ArgumentParser(description="Gesture false trigger benchmark")
+    parser.add_argument("--noise", type=float, default=4.0, help="Landmark noise (pixels, std)")
+    parser.add_argument("--seconds", type=float, default=120, help="Labeled stream duration")
+    parser.add_argument("--fps", type=float, default=30, help="Stream frame rate")
+    parser.add_argument("--recording", help="Landmark recording (synthetic if omitted)")
+    args = parser.parse_args()
+
+    # ------------------------------------------------------------------------
+    # Labeled synthetic stream
+    # ------------------------------------------------------------------------
+    points, times, segments = make_labeled_stream(args.seconds, args.fps, args.noise)
+    minutes = times[-1] / 60
+
+    # Pinch thresholds of the state machine (pixels or palm lengths)
+    enter, release, _ = THRESHOLD_DEFAULTS[GESTURE_THRESHOLD_UNITS]
+
+    rows = []
+    for name, variant in (("if/elif", LegacyGestures()), ("state machine", MachineGestures())):
+        events, changes = run_stream(variant, points, times)
+        clicks = score(events, segments, ("tap", "drag"), EVENT_PRESS, args.fps)
+        rights = score(events, segments, ("right",), EVENT_RIGHT_CLICK, args.fps)
+        releases = sum(1 for _, event in events if event == EVENT_DRAG_END)
+        rows.append((name, f"{clicks[0]} / {clicks[1]}", clicks[2], clicks[3], f"{clicks[4]:.0f}",
+                     f"{rights[0]} / {rights[1]}", rights[2], rights[3], releases,
+                     f"{changes / minutes:.0f}"))
+
+    print_table(
+        f"Labeled stream: {args.seconds:.0f} s at {args.fps:.0f} FPS, noise {args.noise:g} px, "
+        f"pinch {CLICK_THRESHOLD} px / {enter:g}-{release:g} {GESTURE_THRESHOLD_UNITS}, dwell {GESTURE_ENTER_FRAMES}/"
+        f"{GESTURE_EXIT_FRAMES} frames",
+        rows,
+        ("variant", "clicks / intended", "false clicks", "missed", "click delay ms",
+         "right clicks / intended", "false right", "missed right", "drag releases",
+         "mode changes/min"),
+    )
+    drags = sum(1 for segment in segments if segment[0] == "drag")
+    print(f"intended drags: {drags}; near misses (no click intended): "
+          f"{sum(1 for segment in segments if segment[0] == 'near_miss')}")
+
+    # ------------------------------------------------------------------------
+    # Recorded landmark stream (no ground truth)
+    # ------------------------------------------------------------------------
+    path = args.recording or make_landmark_recording()
+    try:
+        header, records = load_recording(path)
+    finally:
+        if args.recording is None:
+            os.remove(path)
+    width, height = header["frame_width"], header["frame_height"]
+    present = np.asarray(records["present"]) != 0
+    recorded = np.asarray(records["landmarks"])[present] * np.array([width, height, width], dtype=np.float32)
+    recorded_times = np.asarray(records["ts_ns"])[present] / 1e9
+
+    rows = []
+    for name, variant in (("if/elif", LegacyGestures()), ("state machine", MachineGestures())):
+        events, changes = run_stream(variant, recorded, recorded_times)
+        counts = {event: 0 for event in (EVENT_PRESS, EVENT_RIGHT_CLICK, EVENT_DRAG_END)}
+        for _, event in events:
+            if event in counts:
+                counts[event] += 1
+        rows.append((name, counts[EVENT_PRESS], counts[EVENT_RIGHT_CLICK], counts[EVENT_DRAG_END],
+                     changes))
+
+    print_table(
+        f"Recorded stream ({'synthetic' if args.recording is None else args.recording}, "
+        f"{len(recorded)} hand frames)",
+        rows,
+        ("variant", "clicks", "right clicks", "drag releases", "mode changes"),
+    )
+
+
+if __name__ == "__main__":
+    main()
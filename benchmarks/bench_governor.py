@@ -0,0 +1,202 @@
+# ============================================================================
+# BENCHMARKS/BENCH_GOVERNOR.PY - Quality Governor Convergence on a Budget
+# ============================================================================
+# Replays a trace of hand-detection times through QualityGovernor with a
+# simulated clock and checks that it settles on a level that keeps the
+# percentile within the budget, and stays there.
+#
+# The trace is either an inference profile exported by the application
+# (gesture_controller.py --profile run.json, recorded at level 0) or a
+# synthetic one (log-normal times with occasional slow frames). Each
+# frame's time is scaled by the simulated CPU speed and by the cost of the
+# current level relative to level 0:
+#
+#   model complexity 0  -> x0.55 (lite landmark model)
+#   inference scale s   -> x(0.4 + 0.6 * s^2) (resize/convert and palm
+#                          detection input shrink with the pixel count)
+#
+# A change of model complexity takes --rebuild seconds to take effect
+# (background graph build); those frames run at the previous level and
+# are reported to the governor as pending, like HandTracker.rebuilding.
+#
+# Scenarios: CPUs of different speed, and a load spike in the middle of
+# the run (another process takes the CPU for a while). Per scenario:
+# final level, time of the last change, number of changes, and the
+# percentile over the final --tail seconds against the budget.
+#
+# With --check the exit code is 1 when a scenario whose cheapest level can
+# meet the budget ends over it or is still changing in the final --tail
+# seconds, so the governor can be gated on it.
+#
+# Usage:
+#   python benchmarks/bench_governor.py [--seconds 90] [--budget 33]
+#   python benchmarks/bench_governor.py --profile run.json --check
+# ============================================================================
+
+# Import required libraries
+import argparse  # Command-line options
+import json  # Exported inference profile
+import sys  # Exit code
+
+import numpy as np  # Trace generation and percentiles
+
+from common import print_table  # Benchmark helpers
+from config import *  # Governor settings
+from governor import QualityGovernor  # Implementation under test
+
+# (name, CPU factor before, during and after the spike, spike start/end as
+# fractions of the run)
+SCENARIOS = (
+    ("fast desktop", 0.5, 0.5, 0.5),
+    ("mid-range laptop", 1.0, 1.0, 1.0),
+    ("kiosk CPU", 1.8, 1.8, 1.8),
+    ("very slow CPU", 3.5, 3.5, 3.5),
+    ("load spike", 1.0, 2.5, 1.0),
+)
+SPIKE = (0.35, 0.6)
+
+
+def level_cost(level):
+    """
+    Cost of a level relative to level 0 settings (complexity 1, scale 1.0).
+    """
+    complexity = 1.0 if level.get("model_complexity", MODEL_COMPLEXITY) == 1 else 0.55
+    scale = level.get("inference_scale", INFERENCE_SCALE)
+    return complexity * (0.4 + 0.6 * scale * scale)
+
+
+def synthetic_trace(frames, median_ms=22.0, seed=0):
+    """
+    Detection times at level 0 on a reference CPU.
+
+    Returns:
+        numpy.ndarray: Milliseconds per frame
+    """
+    rng = np.random.default_rng(seed)
+    trace = rng.lognormal(np.log(median_ms), 0.15, frames)
+    slow = rng.random(frames) < 0.02  # Re-detection / scheduling hiccups
+    trace[slow] *= rng.uniform(1.5, 2.5, slow.sum())
+    return trace
+
+
+def load_profile_trace(path):
+    """
+    Inference times from a profile exported with --profile.
+
+    Returns:
+        numpy.ndarray: Milliseconds per frame
+    """
+    with open(path, "r") as f:
+        samples = json.load(f)["samples_ms"]
+    times = samples.get("inference") or samples.get("preprocess")
+    if not times:
+        raise ValueError(f"No inference samples in {path}")
+    return np.asarray(times, dtype=np.float64)
+
+
+def simulate(trace, cpu_factors, seconds, budget_ms, camera_fps, rebuild_seconds):
+    """
+    Replay a trace through the governor with a simulated clock.
+
+    Parameters:
+        trace (numpy.ndarray): Level-0 detection times (cycled)
+        cpu_factors (tuple): CPU factor before, during and after the spike
+        seconds (float): Simulated run time
+        budget_ms (float): Governor budget
+        camera_fps (float): Camera frame rate (a frame waits for the camera
+                            when detection is faster)
+        rebuild_seconds (float): Time until a model change takes effect
+
+    Returns:
+        tuple: (QualityGovernor, list of (time, frame ms, level in effect))
+    """
+    governor = QualityGovernor(budget_ms=budget_ms, publish=False, verbose=False)
+    costs = [level_cost(level) for level in governor.levels]
+
+    now = 0.0
+    active = governor.level  # Level whose model is running
+    switch_at = None  # When a pending model change takes effect
+    frames = []
+    i = 0
+    while now < seconds:
+        progress = now / seconds
+        factor = cpu_factors[0] if progress < SPIKE[0] else (
+            cpu_factors[1] if progress < SPIKE[1] else cpu_factors[2])
+
+        # Apply the governor's level: scale at once, model after the rebuild
+        if governor.level != active:
+            model_change = (governor.levels[governor.level].get("model_complexity")
+                            != governor.levels[active].get("model_complexity"))
+            if not model_change:
+                active, switch_at = governor.level, None
+            elif switch_at is None:
+                switch_at = now + rebuild_seconds
+            elif now >= switch_at:
+                active, switch_at = governor.level, None
+
+        frame_ms = trace[i % len(trace)] * factor * costs[active]
+        governor.update(frame_ms, now, pending=switch_at is not None)
+        frames.append((now, frame_ms, active))
+        now += max(frame_ms / 1000.0, 1.0 / camera_fps)
+        i += 1
+
+    return governor, frames
+
+
+def main():
+    """
+    Run every scenario and print the convergence table.
+    """
+    parser = argparse.ArgumentParser(description="Quality governor convergence benchmark")
+    parser.add_argument("--profile", help="Inference profile exported with --profile (synthetic if omitted)")
+    parser.add_argument("--seconds", type=float, default=90, help="Simulated run time per scenario")
+    parser.add_argument("--budget", type=float, default=GOVERNOR_BUDGET_MS, help="Budget (ms)")
+    parser.add_argument("--camera-fps", type=float, default=30, help="Camera frame rate")
+    parser.add_argument("--rebuild", type=float, default=0.8, help="Model rebuild time (s)")
+    parser.add_argument("--tail", type=float, default=15, help="Final seconds checked for convergence")
+    parser.add_argument("--check", action="store_true", help="Exit with 1 if a feasible scenario fails")
+    args = parser.parse_args()
+
+    trace = load_profile_trace(args.profile) if args.profile else synthetic_trace(20000)
+
+    rows = []
+    failures = []
+    for name, *cpu_factors in SCENARIOS:
+        governor, frames = simulate(trace, cpu_factors, args.seconds, args.budget,
+                                    args.camera_fps, args.rebuild)
+        times = np.array([frame[0] for frame in frames])
+        frame_ms = np.array([frame[1] for frame in frames])
+        tail = times >= args.seconds - args.tail
+        tail_ms = float(np.percentile(frame_ms[tail], GOVERNOR_PERCENTILE))
+        last_change = governor.decisions[-1]["time"] if governor.decisions else 0.0
+        settled = last_change < args.seconds - args.tail
+
+        # Feasible: the cheapest level meets the budget on this CPU (final phase)
+        cheapest = min(level_cost(level) for level in governor.levels)
+        feasible = np.percentile(trace, GOVERNOR_PERCENTILE) * cpu_factors[2] * cheapest <= args.budget
+        ok = tail_ms <= args.budget and settled
+        if feasible and not ok:
+            failures.append(name)
+
+        path = " ".join(str(decision["to"]) for decision in governor.decisions) or "-"
+        rows.append((name, f"{governor.level}", f"{last_change:.1f}", len(governor.decisions),
+                     path, f"{tail_ms:.1f}", "yes" if ok else ("no" if feasible else "infeasible"),
+                     f"{len(frames) / args.seconds:.1f}"))
+
+    print_table(
+        f"Governor on a {args.budget:.1f} ms p{GOVERNOR_PERCENTILE} budget "
+        f"({'trace ' + args.profile if args.profile else 'synthetic trace'}, {args.seconds:.0f} s, "
+        f"spike {SPIKE[0]:.0%}-{SPIKE[1]:.0%} of the run, {len(GOVERNOR_LEVELS)} levels)",
+        rows,
+        ("scenario", "final level", "last change s", "changes", "levels visited",
+         f"tail p{GOVERNOR_PERCENTILE} ms", "within budget", "frames/s"),
+    )
+    print("'infeasible': even the cheapest level cannot meet the budget on that CPU.")
+
+    if args.check and failures:
+        print(f"FAILED: did not converge within budget: {', '.join(failures)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+# ============================================================================
+# BENCHMARKS/BENCH_IMPORT.PY - Module Import Time and Import Side Effects
+# ============================================================================
+# Imports each project module in a fresh interpreter with
+# "python -X importtime" and reports per module:
+# - cumulative import time (best of --repeat runs, warm file cache)
+# - lines printed to stdout while importing (should be 0)
+# - which heavy libraries the import loaded (cv2, mediapipe, pyautogui)
+#
+# With --compare REV the same measurements are made on another git revision
+# (extracted with "git archive" into a temporary directory), e.g. the
+# commit before lazy imports, to show the difference side by side.
+#
+# Usage:
+#   python benchmarks/bench_import.py [--repeat 5]
+#   python benchmarks/bench_import.py --compare HEAD~1
+# ============================================================================
+
+# Import required libraries
+import argparse  # Command-line options
+import io  # git archive output
+import os  # Environment for the child interpreters
+import subprocess  # Fresh interpreters and git archive
+import sys  # Interpreter path
+import tarfile  # Extracting the compared revision
+import tempfile  # Directory for the compared revision
+
+from common import PROJECT_ROOT, print_table  # Benchmark helpers
+
+# Modules measured, from the cheapest to the whole application
+MODULES = ["config", "gesture_utils", "gesture_features", "gesture_logic", "replay",
+           "hand_tracker", "gesture_controller"]
+
+# Libraries reported when an import loads them
+HEAVY_LIBRARIES = ("cv2", "mediapipe", "pyautogui")
+
+
+def measure_import(module, root):
+    """
+    Import one module in a fresh interpreter with -X importtime.
+
+    Parameters:
+        module (str): Module name
+        root (str): Project directory the module is imported from
+
+    Returns:
+        tuple: (cumulative microseconds or None if the import failed,
+                stdout lines, set of heavy libraries loaded)
+    """
+    env = dict(os.environ, PYTHONPATH=root)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=root, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        return None, 0, set()
+
+    cumulative = None
+    loaded = set()
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line.split("|")
+        name = parts[2].strip()
+        if name in HEAVY_LIBRARIES:
+            loaded.add(name)
+        if name == module and parts[2].startswith(" " + module):
+            cumulative = int(parts[1])
+
+    printed = len(result.stdout.splitlines())
+    return cumulative, printed, loaded
+
+
+def measure_tree(root, repeat):
+    """
+    Measure every module of a project tree.
+
+    Returns:
+        dict: Module -> (best cumulative ms or None, stdout lines, heavy libraries)
+    """
+    results = {}
+    for module in MODULES:
+        if not os.path.exists(os.path.join(root, module + ".py")):
+            continue
+        runs = [measure_import(module, root) for _ in range(repeat)]
+        times = [run[0] for run in runs if run[0] is not None]
+        best = min(times) / 1000.0 if times else None
+        results[module] = (best, runs[-1][1], runs[-1][2])
+    return results
+
+
+def extract_revision(revision, directory):
+    """
+    Write the files of a git revision into a directory.
+    """
+    archive = subprocess.run(["git", "archive", "--format=tar", revision],
+                             cwd=PROJECT_ROOT, capture_output=True, check=True).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(directory)
+
+
+def format_result(result):
+    """
+    Format one (ms, lines, libraries) measurement as table cells.
+    """
+    if result is None:
+        return ("-", "-", "-")
+    ms, printed, loaded = result
+    return ("failed" if ms is None else f"{ms:.1f}", printed,
+            ", ".join(sorted(loaded)) or "none")
+
+
+def main():
+    """
+    Measure the current tree (and optionally another revision) and print the table.
+    """
+    parser = argparse.ArgumentParser(description="Module import time benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="Imports per module (best is reported)")
+    parser.add_argument("--compare", help="Git revision to compare against (e.g. HEAD~1)")
+    args = parser.parse_args()
+
+    current = measure_tree(PROJECT_ROOT, args.repeat)
+
+    if args.compare is None:
+        rows = [(module, *format_result(result)) for module, result in current.items()]
+        print_table(f"Import cost (best of {args.repeat}, fresh interpreter each)", rows,
+                    ("module", "import ms", "lines printed", "heavy libraries loaded"))
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        extract_revision(args.compare, directory)
+        reference = measure_tree(directory, args.repeat)
+
+    rows = []
+    for module, result in current.items():
+        before = format_result(reference.get(module))
+        after = format_result(result)
+        rows.append((module, before[0], after[0], before[1], after[1], before[2], after[2]))
+    print_table(f"Import cost, {args.compare} vs working tree (best of {args.repeat})", rows,
+                ("module", "ms before", "ms after", "lines before", "lines after",
+                 "libraries before", "libraries after"))
+    print("An import that failed (e.g. a mouse backend without a display) is shown as 'failed'.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+# ============================================================================
+# BENCHMARKS/BENCH_INFERENCE.PY - Inference Resolution vs FPS and Jitter
+# ============================================================================
+# Runs HandTracker over the same video at every scale in INFERENCE_SCALES
+# and reports, per scale:
+# - inference time per frame and the FPS it allows
+# - hand detection rate
+# - landmark jitter: mean frame-to-frame second difference of the landmark
+#   positions in full-frame pixels (noise on top of smooth hand motion)
+# - mean landmark offset from the full-resolution result
+# Finally runs the automatic scale with the configured target FPS.
+#
+# Jitter and offsets need a video showing a hand (--video); the synthetic
+# fallback video only measures timing.
+#
+# Usage:
+#   python benchmarks/bench_inference.py [--video hand.mp4] [--frames 300]
+# ============================================================================
+
+# Import required libraries
+import argparse  # Command-line options
+import os  # Temporary file cleanup
+import time  # Timing
+
+import numpy as np  # Statistics
+
+from common import make_test_video, print_table  # Benchmark helpers
+import cv2  # Video decoding
+from config import *  # Scales and target FPS
+from gesture_utils import landmarks_to_array  # Full-frame pixel landmarks
+from hand_tracker import HandTracker  # Implementation under test
+
+
+def load_frames(path, limit):
+    """
+    Decode up to limit frames into memory (decode is not timed).
+
+    Frames stay as captured: HandTracker mirrors the landmarks itself.
+
+    Parameters:
+        path (str): Video file path
+        limit (int): Maximum number of frames
+
+    Returns:
+        list: BGR frames
+    """
+    cap = cv2.VideoCapture(path)
+    frames = []
+    while len(frames) < limit:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames.append(frame)
+    cap.release()
+    return frames
+
+
+def run_tracker(tracker, frames):
+    """
+    Process every frame and collect the first hand's pixel landmarks.
+
+    Returns:
+        tuple: (per-frame inference ms array, list of (21, 3) arrays or None)
+    """
+    height, width = frames[0].shape[:2]
+    times, landmarks = [], []
+    for frame in frames:
+        start = time.perf_counter()
+        results = tracker.process(frame)
+        times.append(1000.0 * (time.perf_counter() - start))
+        if results.multi_hand_landmarks:
+            landmarks.append(landmarks_to_array(results.multi_hand_landmarks[0], width, height))
+        else:
+            landmarks.append(None)
+    return np.array(times), landmarks
+
+
+def jitter(landmarks):
+    """
+    Mean magnitude of the landmark second difference over consecutive
+    detected frames (pixels).
+    """
+    values = []
+    for a, b, c in zip(landmarks, landmarks[1:], landmarks[2:]):
+        if a is not None and b is not None and c is not None:
+            second = a[:, :2] - 2 * b[:, :2] + c[:, :2]
+            values.append(np.mean(np.hypot(second[:, 0], second[:, 1])))
+    return np.mean(values) if values else None
+
+
+def offset(landmarks, reference):
+    """
+    Mean landmark distance to the reference on frames where both detected.
+    """
+    values = [np.mean(np.hypot(*(a[:, :2] - b[:, :2]).T))
+              for a, b in zip(landmarks, reference) if a is not None and b is not None]
+    return np.mean(values) if values else None
+
+
+def fmt(value):
+    """Format an optional pixel value."""
+    return "n/a" if value is None else f"{value:.2f}"
+
+
+def main():
+    """
+    Benchmark every inference scale and the automatic scale.
+    """
+    parser = argparse.ArgumentParser(description="Inference resolution benchmark")
+    parser.add_argument("--video", help="Video with a hand (synthetic if omitted)")
+    parser.add_argument("--frames", type=int, default=300, help="Frames to process")
+    parser.add_argument("--complexity", type=int, default=MODEL_COMPLEXITY, help="Model complexity")
+    args = parser.parse_args()
+
+    path = args.video or make_test_video(num_frames=args.frames, width=CAMERA_WIDTH,
+                                         height=CAMERA_HEIGHT)
+    try:
+        frames = load_frames(path, args.frames)
+    finally:
+        if not args.video:
+            os.remove(path)
+    height, width = frames[0].shape[:2]
+
+    rows = []
+    reference = None
+    for scale in INFERENCE_SCALES:
+        with HandTracker(inference_scale=scale, model_complexity=args.complexity) as tracker:
+            times, landmarks = run_tracker(tracker, frames)
+        if reference is None:
+            reference = landmarks
+        detected = sum(lm is not None for lm in landmarks)
+        rows.append((
+            f"{scale:.2f}", f"{int(width * scale)}x{int(height * scale)}",
+            f"{np.mean(times):.1f}", f"{np.percentile(times, 95):.1f}",
+            f"{1000.0 / np.mean(times):.0f}", f"{detected}/{len(frames)}",
+            fmt(jitter(landmarks)), fmt(offset(landmarks, reference)),
+        ))
+
+    print_table(
+        f"HandTracker per scale on {width}x{height} ({len(frames)} frames, "
+        f"model complexity {args.complexity})",
+        rows,
+        ("scale", "inference size", "mean ms", "p95 ms", "max FPS", "detected",
+         "jitter px", "offset vs 1.0 px"),
+    )
+
+    # Automatic scale: loop the frames so it has time to settle
+    with HandTracker(auto_scale=True, model_complexity=args.complexity) as tracker:
+        for _ in range(3):
+            run_tracker(tracker, frames)
+        stats = tracker.get_stats()
+    print(f"\nAuto scale (target {INFERENCE_TARGET_FPS} FPS, budget {1000 / INFERENCE_TARGET_FPS:.1f} ms): "
+          f"settled at {stats['scale']} after {stats['scale_changes']} changes, "
+          f"{stats['mean_ms']:.1f} ms/frame overall")
+    if not args.video:
+        print("(synthetic video has no hand: pass --video to measure jitter and offsets)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+# ============================================================================
+# BENCHMARKS/BENCH_INTERPOLATOR.PY - Cursor Smoothness at Display Rate
+# ============================================================================
+# Simulates the vision loop producing one cursor position per processed
+# frame (default 25 FPS with timing jitter and processing delay) for a hand
+# moving along a known path, and compares how the cursor reaches the screen:
+#   direct       - one move per processed frame (CURSOR_INTERPOLATION off)
+#   extrapolate  - CursorInterpolator at the display rate, no delay
+#   interpolate  - CursorInterpolator running one frame interval behind
+#
+# Reports, per variant:
+# - cursor moves per second sent to the OS
+# - refreshes with motion: share of display refreshes (at --display-hz)
+#   where the pointer moved, and the mean / p95 / max jump per refresh
+# - error: distance between the cursor and the true hand position at
+#   each display refresh (includes the vision delay)
+#
+# Usage:
+#   python benchmarks/bench_interpolator.py [--fps 25] [--display-hz 144] [--seconds 4]
+# ============================================================================
+
+# Import required libraries
+import argparse  # Command-line options
+import time  # Timing
+
+import numpy as np  # Paths and statistics
+
+from common import print_table  # Benchmark helpers
+from cursor_interpolator import CursorInterpolator  # Implementation under test
+from mouse_output import MouseBackend  # Backend base class
+
+# Screen the path runs on
+SCREEN_WIDTH = 1920
+SCREEN_HEIGHT = 1080
+
+# Delay between capture and the gesture logic's move (inference etc.)
+PROCESSING_DELAY = 0.015
+
+
+class TimedBackend(MouseBackend):
+    """
+    Backend that records (time, x, y) of every cursor move.
+    """
+
+    name = "timed"
+
+    def __init__(self):
+        self.moves = []
+
+    def move_to(self, x, y):
+        self.moves.append((time.perf_counter(), float(x), float(y)))
+
+
+def true_position(t):
+    """
+    Hand position on the screen at time t (a Lissajous path, ~1000 px/s).
+
+    Returns:
+        tuple: (x, y) in pixels
+    """
+    return (SCREEN_WIDTH / 2 + 700 * np.sin(2 * np.pi * 0.3 * t),
+            SCREEN_HEIGHT / 2 + 350 * np.sin(2 * np.pi * 0.45 * t))
+
+
+def vision_loop(mouse, fps, seconds, start):
+    """
+    Submit one cursor position per simulated processed frame.
+
+    Parameters:
+        mouse: Object with move_to()
+        fps (float): Processed frames per second
+        seconds (float): Duration
+        start (float): perf_counter() time of t = 0
+    """
+    rng = np.random.default_rng(0)
+    frame = 0
+    while True:
+        capture = start + frame / fps + rng.uniform(0, 0.004)
+        if capture - start > seconds:
+            break
+        # The position is known PROCESSING_DELAY after the frame was captured
+        delay = capture + PROCESSING_DELAY + rng.uniform(0, 0.005) - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        mouse.move_to(*true_position(capture - start))
+        frame += 1
+
+
+def run_variant(name, fps, seconds, display_hz):
+    """
+    Run the simulated loop with one output variant.
+
+    Returns:
+        tuple: (backend moves as (N, 3) array, start time)
+    """
+    backend = TimedBackend()
+    if name == "direct":
+        mouse = backend
+    else:
+        delay = 1.0 / fps if name == "interpolate" else 0.0
+        mouse = CursorInterpolator(backend, rate_hz=display_hz, delay=delay).start()
+
+    start = time.perf_counter() + 0.05
+    vision_loop(mouse, fps, seconds, start)
+    if mouse is not backend:
+        mouse.close()
+    return np.array(backend.moves), start
+
+
+def evaluate(moves, start, seconds, display_hz):
+    """
+    Sample the cursor at every display refresh and compare with the truth.
+
+    Returns:
+        dict: Moves per second, motion share, jumps and errors
+    """
+    # Skip the first half second (the first positions arrive)
+    refreshes = start + np.arange(0.5, seconds, 1.0 / display_hz)
+    # Latest move before each refresh
+    index = np.searchsorted(moves[:, 0], refreshes, side="right") - 1
+    valid = index >= 0
+    cursor = moves[index[valid], 1:]
+    truth = np.stack(true_position(refreshes[valid] - start), axis=-1)
+
+    jumps = np.linalg.norm(np.diff(cursor, axis=0), axis=1)
+    error = np.linalg.norm(cursor - truth, axis=1)
+    return {
+        "moves_per_second": len(moves) / seconds,
+        "motion": np.mean(jumps > 0.5),
+        "jump_mean": jumps[jumps > 0.5].mean() if np.any(jumps > 0.5) else 0.0,
+        "jump_p95": np.percentile(jumps, 95),
+        "jump_max": jumps.max(),
+        "error": error.mean(),
+        "error_p95": np.percentile(error, 95),
+    }
+
+
+def main():
+    """
+    Run every variant and print the results table.
+    """
+    parser = argparse.ArgumentParser(description="Cursor interpolation benchmark")
+    parser.add_argument("--fps", type=float, default=25, help="Processed frames per second")
+    parser.add_argument("--display-hz", type=float, default=144, help="Display refresh rate")
+    parser.add_argument("--seconds", type=float, default=4, help="Duration per variant")
+    args = parser.parse_args()
+
+    rows = []
+    for name in ("direct", "extrapolate", "interpolate"):
+        moves, start = run_variant(name, args.fps, args.seconds, args.display_hz)
+        result = evaluate(moves, start, args.seconds, args.display_hz)
+        rows.append((name, f"{result['moves_per_second']:.0f}", f"{result['motion']:.0%}",
+                     f"{result['jump_mean']:.1f}", f"{result['jump_p95']:.1f}",
+                     f"{result['jump_max']:.1f}",
+                     f"{result['error']:.1f} / {result['error_p95']:.1f}"))
+
+    print_table(
+        f"Cursor output at {args.display_hz:.0f} Hz display, {args.fps:.0f} processed FPS, "
+        f"{args.seconds:.0f} s per variant",
+        rows,
+        ("variant", "moves/s", "refreshes with motion", "jump mean px", "jump p95 px",
+         "jump max px", "error mean/p95 px"),
+    )
+
+
+if __name__ == "__main__":
+    main()
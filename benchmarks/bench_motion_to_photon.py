@@ -0,0 +1,261 @@
+# ============================================================================
+# BENCHMARKS/BENCH_MOTION_TO_PHOTON.PY - End-to-End Finger-to-Cursor Latency
+# ============================================================================
+# Runs the complete application (gesture_controller.main, headless) on a
+# video of a synthetic hand moving on a known trajectory, with the camera
+# replaced by the video file (played in realtime, like a camera) and the
+# mouse replaced by a recording backend. Every injected cursor move carries
+# the capture time of the frame it came from (MouseBackend.frame), so per
+# mode (sequential and pipelined) it reports:
+# - pipeline latency: frame captured -> cursor move injected (p50/p95/p99)
+# - motion-to-cursor lag: time shift that best aligns the cursor path with
+#   the true fingertip path (includes the cursor filter, --filter)
+# - cursor error against the true fingertip position at injection time and
+#   against the position in the frame the move came from
+# - throughput: frames with a hand processed per second
+#
+# Runs on a Linux host without GPU, webcam or display. With --max-latency
+# or --max-error the exit code is 1 when a limit is exceeded, so changes
+# to the loop can be gated on it.
+#
+# Usage:
+#   python benchmarks/bench_motion_to_photon.py [--frames 300] [--mode both]
+#   python benchmarks/bench_motion_to_photon.py --video hand.avi --truth hand.npy
+#   python benchmarks/bench_motion_to_photon.py --max-latency 80 --max-error 150
+#   python benchmarks/bench_motion_to_photon.py --filter lerp
+# ============================================================================
+
+# Import required libraries
+import argparse  # Command-line options
+import os  # Temporary file cleanup
+import sys  # Exit code
+import time  # Timing
+
+import numpy as np  # Statistics
+
+from common import make_hand_video, print_table  # Benchmark helpers
+import cv2  # Video properties
+import config  # Mouse backend override
+from config import *  # Control area and landmark indices
+from mouse_output import RecordingBackend  # Recorded mouse events
+
+# Screen the cursor positions are mapped to
+SCREEN_WIDTH = 1920
+SCREEN_HEIGHT = 1080
+
+# Largest motion-to-cursor lag searched for (seconds)
+MAX_LAG = 1.0
+
+
+class TimedRecordingBackend(RecordingBackend):
+    """
+    Recording backend that also stores when each move was injected.
+
+    Attributes:
+        moves (list): (frame capture ns, x, y, injection ns) per cursor move
+    """
+
+    name = "timed-recording"
+
+    def __init__(self, screen_width=SCREEN_WIDTH, screen_height=SCREEN_HEIGHT):
+        super().__init__(screen_width, screen_height)
+        self.moves = []
+
+    def move_to(self, x, y):
+        super().move_to(x, y)
+        self.moves.append((self.frame, float(x), float(y), time.perf_counter_ns()))
+
+
+def truth_to_screen(tips, frame_width, frame_height):
+    """
+    Map true fingertip pixels (unmirrored) to screen positions like process_hand.
+
+    Parameters:
+        tips (numpy.ndarray): (N, 2) index fingertip positions in the video
+        frame_width (int): Frame width in pixels
+        frame_height (int): Frame height in pixels
+
+    Returns:
+        numpy.ndarray: (N, 2) unsmoothed screen positions
+    """
+    # The application mirrors the landmarks (or the frame) first
+    x = frame_width - tips[:, 0]
+    y = tips[:, 1]
+    screen_x = np.interp(x, [int(frame_width * CONTROL_AREA_START), int(frame_width * CONTROL_AREA_END)],
+                         [0, SCREEN_WIDTH])
+    screen_y = np.interp(y, [int(frame_height * CONTROL_AREA_START), int(frame_height * CONTROL_AREA_END)],
+                         [0, SCREEN_HEIGHT])
+    return np.stack([screen_x, screen_y], axis=-1)
+
+
+def run_mode(video, pipeline_mode, filter_name=None):
+    """
+    Run gesture_controller.main() headless on the video.
+
+    Parameters:
+        video (str): Video file path
+        pipeline_mode (bool): Use the pipelined loop
+        filter_name (str): Cursor filter to use (None = CURSOR_FILTER)
+
+    Returns:
+        tuple: (TimedRecordingBackend, wall seconds, profiler summary)
+    """
+    import gesture_controller
+    import gesture_logic
+    from cursor_filters import create_filter
+    from profiling import profiler
+
+    # Swap the mouse for the recording backend (the dispatcher wraps it)
+    backend = TimedRecordingBackend()
+    gesture_controller.init(backend)
+    if filter_name is not None:
+        gesture_logic.default_session.cursor_filter = create_filter(filter_name)
+    gesture_logic.reset_state()
+    profiler.reset()
+
+    start = time.perf_counter()
+    gesture_controller.main(source=video, pipeline_mode=pipeline_mode, headless=True)
+    return backend, time.perf_counter() - start, profiler.summary()
+
+
+def analyze(moves, truth_screen, fps):
+    """
+    Compare the injected cursor moves with the true fingertip path.
+
+    The first move is assumed to come from frame 0 (the hand is visible
+    from the start); frame indices of the others follow from their capture
+    times at the video frame rate.
+
+    Parameters:
+        moves (list): TimedRecordingBackend.moves
+        truth_screen (numpy.ndarray): (N, 2) true screen positions per frame
+        fps (float): Video frame rate
+
+    Returns:
+        dict: Latency (ms), lag (ms), errors (px) and frame counts
+    """
+    moves = np.array([move for move in moves if move[0] is not None], dtype=np.float64)
+    capture_s = moves[:, 0] / 1e9
+    cursor = moves[:, 1:3]
+    inject_s = moves[:, 3] / 1e9
+
+    # Frame each move came from, and the time its content was shown
+    start = capture_s.min()
+    frames = np.clip(np.round((capture_s - start) * fps).astype(int), 0, len(truth_screen) - 1)
+    frame_times = start + np.arange(len(truth_screen)) / fps
+
+    def truth_at(times):
+        # True screen position at arbitrary times (linear between frames)
+        return np.stack([np.interp(times, frame_times, truth_screen[:, axis]) for axis in (0, 1)], axis=-1)
+
+    latency_ms = (inject_s - capture_s) * 1000
+    error_now = np.linalg.norm(cursor - truth_at(inject_s), axis=1)
+    error_frame = np.linalg.norm(cursor - truth_screen[frames], axis=1)
+
+    # Motion-to-cursor lag: shift of the true path that best explains the
+    # cursor path (1 ms steps, moves in the first MAX_LAG seconds excluded)
+    valid = inject_s - start > MAX_LAG
+    lags = np.arange(0, MAX_LAG, 0.001)
+    lag_errors = [np.linalg.norm(cursor[valid] - truth_at(inject_s[valid] - lag), axis=1).mean()
+                  for lag in lags]
+    best = int(np.argmin(lag_errors))
+
+    return {
+        "moves": len(moves),
+        "frames": len(np.unique(frames)),
+        "latency_p50": np.percentile(latency_ms, 50),
+        "latency_p95": np.percentile(latency_ms, 95),
+        "latency_p99": np.percentile(latency_ms, 99),
+        "lag": lags[best] * 1000,
+        "error_now": error_now.mean(),
+        "error_now_p95": np.percentile(error_now, 95),
+        "error_frame": error_frame.mean(),
+    }
+
+
+def main():
+    """
+    Run every mode on the video and print the results table.
+    """
+    parser = argparse.ArgumentParser(description="Motion-to-photon latency benchmark")
+    parser.add_argument("--video", default=None, help="Hand video (synthetic if omitted)")
+    parser.add_argument("--truth", default=None,
+                        help="(N, 21, 2) or (N, 2) .npy of true index fingertip pixels for --video")
+    parser.add_argument("--frames", type=int, default=300, help="Synthetic video length")
+    parser.add_argument("--fps", type=int, default=30, help="Synthetic video frame rate")
+    parser.add_argument("--mode", choices=("sequential", "pipeline", "both"), default="both",
+                        help="Main loop(s) to measure")
+    parser.add_argument("--filter", default=CURSOR_FILTER,
+                        help="Cursor filter (lerp, one_euro, kalman)")
+    parser.add_argument("--max-latency", type=float, default=None,
+                        help="Fail if the p95 pipeline latency exceeds this (ms)")
+    parser.add_argument("--max-error", type=float, default=None,
+                        help="Fail if the mean cursor error exceeds this (px)")
+    args = parser.parse_args()
+
+    if args.video is not None and args.truth is None:
+        parser.error("--video needs --truth with the true fingertip positions")
+
+    # The controller creates its backend at import; it is replaced per run
+    config.MOUSE_BACKEND = "null"
+
+    if args.video is None:
+        video, truth = make_hand_video(num_frames=args.frames, width=CAMERA_WIDTH,
+                                       height=CAMERA_HEIGHT, fps=args.fps)
+    else:
+        video, truth = args.video, np.load(args.truth)
+    tips = truth[:, INDEX_TIP] if truth.ndim == 3 else truth
+
+    cap = cv2.VideoCapture(video)
+    frame_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+    frame_height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    fps = cap.get(cv2.CAP_PROP_FPS) or args.fps
+    cap.release()
+    truth_screen = truth_to_screen(tips, frame_width, frame_height)
+
+    modes = {"sequential": [False], "pipeline": [True], "both": [False, True]}[args.mode]
+    rows = []
+    failed = []
+    try:
+        for pipeline_mode in modes:
+            backend, seconds, stages = run_mode(video, pipeline_mode, args.filter)
+            name = "pipeline" if pipeline_mode else "sequential"
+            if not backend.moves:
+                rows.append((name, 0, "-", "-", "-", "-", "-", "-", "-", "-"))
+                failed.append(f"{name}: no cursor moves (hand not detected)")
+                continue
+
+            result = analyze(backend.moves, truth_screen, fps)
+            inference = stages.get("inference", {}).get("p50", 0.0)
+            rows.append((name, result["frames"], f"{result['frames'] / seconds:.1f}",
+                         f"{inference:.1f}",
+                         f"{result['latency_p50']:.1f}", f"{result['latency_p95']:.1f}",
+                         f"{result['latency_p99']:.1f}", f"{result['lag']:.0f}",
+                         f"{result['error_now']:.1f} / {result['error_now_p95']:.1f}",
+                         f"{result['error_frame']:.1f}"))
+
+            if args.max_latency is not None and result["latency_p95"] > args.max_latency:
+                failed.append(f"{name}: p95 latency {result['latency_p95']:.1f} ms > {args.max_latency} ms")
+            if args.max_error is not None and result["error_now"] > args.max_error:
+                failed.append(f"{name}: cursor error {result['error_now']:.1f} px > {args.max_error} px")
+    finally:
+        if args.video is None:
+            os.remove(video)
+
+    print_table(
+        f"Motion to cursor on {frame_width}x{frame_height} @ {fps:.0f} FPS, "
+        f"{len(truth)} frames, screen {SCREEN_WIDTH}x{SCREEN_HEIGHT}",
+        rows,
+        ("mode", "frames w/ hand", "hand FPS", "inference p50 ms", "latency p50 ms",
+         "p95 ms", "p99 ms", "motion lag ms", "error now mean/p95 px", "error vs frame px"),
+    )
+    print("latency: frame captured -> move injected; motion lag: best alignment of cursor and")
+    print(f"fingertip paths (includes the '{args.filter}' cursor filter); errors in screen pixels")
+
+    for failure in failed:
+        print(f"FAIL {failure}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+# ============================================================================
+# BENCHMARKS/BENCH_MOUSE.PY - Direct Mouse Calls vs Event Dispatcher
+# ============================================================================
+# Simulates the vision loop issuing one cursor move per frame (plus periodic
+# clicks) against a backend with a fixed injection cost, like pyautogui's
+# per-call pause. Compares calling the backend directly from the loop with
+# queueing through MouseDispatcher:
+# - time the vision loop spends blocked in mouse calls per frame
+# - number of moves actually injected (coalescing, rate cap)
+# - every click lands at the position of the last move queued before it
+#
+# Usage:
+#   python benchmarks/bench_mouse.py [--fps 120] [--inject-ms 2] [--rate 60]
+# ============================================================================
+
+# Import required libraries
+import argparse  # Command-line options
+import time  # Timing and simulated work
+
+import numpy as np  # Statistics
+
+from common import print_table  # Benchmark helpers
+from mouse_output import MouseBackend, MouseDispatcher  # Implementations under test
+
+
+class SlowBackend(MouseBackend):
+    """
+    Backend whose every call takes inject_ms, logging what was performed.
+    """
+
+    name = "slow"
+
+    def __init__(self, inject_ms):
+        self.inject_seconds = inject_ms / 1000.0
+        self.log = []
+
+    def _inject(self, entry):
+        time.sleep(self.inject_seconds)
+        self.log.append(entry)
+
+    def move_to(self, x, y):
+        self._inject(("move", (x, y)))
+
+    def click(self):
+        self._inject(("click", None))
+
+    def right_click(self):
+        self._inject(("right_click", None))
+
+    def scroll(self, amount):
+        self._inject(("scroll", amount))
+
+
+def run_loop(mouse, frames, fps, click_every):
+    """
+    Simulated vision loop: one move per frame, a click every click_every frames.
+
+    Parameters:
+        mouse: Backend or dispatcher receiving the calls
+        frames (int): Frames to simulate
+        fps (float): Frame rate of the simulated loop
+        click_every (int): Frames between clicks
+
+    Returns:
+        tuple: (per-frame blocked ms array, expected click positions)
+    """
+    blocked = []
+    expected_clicks = []
+    frame_interval = 1.0 / fps
+    next_frame = time.perf_counter()
+
+    for i in range(frames):
+        x, y = 960 + 500 * np.cos(i / 30.0), 540 + 300 * np.sin(i / 30.0)
+
+        start = time.perf_counter()
+        mouse.move_to(x, y)
+        if i % click_every == click_every - 1:
+            mouse.click()
+            expected_clicks.append((x, y))
+        blocked.append(time.perf_counter() - start)
+
+        # Rest of the frame (inference etc.) until the next frame is due
+        next_frame += frame_interval
+        time.sleep(max(0.0, next_frame - time.perf_counter()))
+
+    return np.array(blocked) * 1000, expected_clicks
+
+
+def click_positions(log):
+    """
+    Position of the last injected move before every injected click.
+    """
+    positions, last = [], None
+    for action, args in log:
+        if action == "move":
+            last = args
+        elif action == "click":
+            positions.append(last)
+    return positions
+
+
+def main():
+    """
+    Run both variants and print a comparison table.
+    """
+    parser = argparse.ArgumentParser(description="Mouse dispatcher benchmark")
+    parser.add_argument("--frames", type=int, default=600, help="Simulated frames")
+    parser.add_argument("--fps", type=float, default=120, help="Simulated vision loop FPS")
+    parser.add_argument("--inject-ms", type=float, default=2.0, help="Backend cost per call")
+    parser.add_argument("--rate", type=float, default=60, help="Dispatcher max moves per second")
+    parser.add_argument("--click-every", type=int, default=45, help="Frames between clicks")
+    args = parser.parse_args()
+
+    rows = []
+    for name in ("direct", "dispatcher"):
+        backend = SlowBackend(args.inject_ms)
+        mouse = backend if name == "direct" else MouseDispatcher(backend, args.rate).start()
+
+        start = time.perf_counter()
+        blocked, expected = run_loop(mouse, args.frames, args.fps, args.click_every)
+        elapsed = time.perf_counter() - start
+        if name == "dispatcher":
+            mouse.close(timeout=5.0)
+
+        moves = sum(1 for action, _ in backend.log if action == "move")
+        clicks_ok = click_positions(backend.log) == expected
+        rows.append((name, f"{np.mean(blocked):.3f}", f"{np.percentile(blocked, 99):.3f}",
+                     f"{args.frames / elapsed:.1f}", moves, f"{moves / elapsed:.0f}",
+                     f"{len(expected)}/{clicks_ok}"))
+
+    print_table(
+        f"Mouse output at {args.fps:.0f} FPS, {args.inject_ms} ms per injected event "
+        f"({args.frames} frames, dispatcher cap {args.rate:.0f} Hz)",
+        rows,
+        ("variant", "blocked ms/frame", "p99 blocked ms", "loop FPS",
+         "moves injected", "moves/s", "clicks/in place"),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# ============================================================================
+# BENCHMARKS/BENCH_MULTI_SESSION.PY - Throughput with Several Capture Sources
+# ============================================================================
+# Runs multi_session.run_sessions() with 1, 2, ... N synthetic hand videos
+# as stand-in cameras (one session process with its own MediaPipe each) and
+# reports how the work scales across cores:
+# - lossless: every frame of every video as fast as possible; aggregate
+#   FPS of all sessions and scaling efficiency against N x one session
+# - realtime: videos paced like cameras; per-session FPS, dropped frames
+#   and capture-to-mouse latency p50/p95/p99 (worst session)
+#
+# Scaling stops at the number of available CPU cores: more sessions than
+# cores share them, so aggregate FPS stays flat and latency grows.
+#
+# Usage:
+#   python benchmarks/bench_multi_session.py [--sessions 4] [--frames 150]
+#   python benchmarks/bench_multi_session.py --mode lossless
+# ============================================================================
+
+# Import required libraries
+import argparse  # Command-line options
+import os  # Temporary file cleanup and core count
+
+from common import make_hand_video, print_table  # Benchmark helpers
+from config import *  # Camera resolution
+from multi_session import run_sessions  # Implementation under test
+
+
+def summarize(sessions):
+    """
+    Worst per-session values of a run.
+
+    Returns:
+        dict: Lowest FPS, highest latency percentiles, inference p50,
+              total dropped frames and failed sessions
+    """
+    ok = [stats for stats in sessions if not stats["error"]]
+    latency = [stats["stages"].get("latency", {}) for stats in ok]
+    return {
+        "min_fps": min((stats["fps"] for stats in ok), default=0.0),
+        "p50": max((stage.get("p50", 0.0) for stage in latency), default=0.0),
+        "p95": max((stage.get("p95", 0.0) for stage in latency), default=0.0),
+        "p99": max((stage.get("p99", 0.0) for stage in latency), default=0.0),
+        "inference": max((stats["stages"].get("inference", {}).get("p50", 0.0) for stats in ok),
+                         default=0.0),
+        "dropped": sum(stats["dropped"] for stats in ok),
+        "failed": [stats["error"] for stats in sessions if stats["error"]],
+    }
+
+
+def main():
+    """
+    Run every session count in each mode and print the results tables.
+    """
+    parser = argparse.ArgumentParser(description="Multi-session scaling benchmark")
+    parser.add_argument("--sessions", type=int, default=4, help="Largest number of sessions")
+    parser.add_argument("--frames", type=int, default=150, help="Frames per synthetic video")
+    parser.add_argument("--mode", choices=("lossless", "realtime", "both"), default="both",
+                        help="Video pacing")
+    args = parser.parse_args()
+
+    cores = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+
+    # One file per session, like separate cameras
+    videos = [make_hand_video(num_frames=args.frames, width=CAMERA_WIDTH, height=CAMERA_HEIGHT)[0]
+              for _ in range(args.sessions)]
+    counts = sorted({1, *range(2, args.sessions + 1, 2), args.sessions})
+    modes = ["lossless", "realtime"] if args.mode == "both" else [args.mode]
+
+    try:
+        for mode in modes:
+            rows = []
+            single_fps = None
+            for count in counts:
+                sessions, aggregate = run_sessions(videos[:count], realtime=(mode == "realtime"))
+                result = summarize(sessions)
+                if single_fps is None:
+                    single_fps = aggregate["fps"]
+                efficiency = aggregate["fps"] / (count * single_fps) if single_fps else 0.0
+                rows.append((count, f"{aggregate['fps']:.1f}", f"{efficiency:.0%}",
+                             f"{result['min_fps']:.1f}", result["dropped"],
+                             f"{result['inference']:.1f}", f"{result['p50']:.1f}",
+                             f"{result['p95']:.1f}", f"{result['p99']:.1f}",
+                             len(result["failed"])))
+                for error in result["failed"]:
+                    print(f"FAILED session: {error}")
+
+            print_table(
+                f"{mode}: {args.frames}-frame {CAMERA_WIDTH}x{CAMERA_HEIGHT} hand videos, "
+                f"{cores} CPU cores",
+                rows,
+                ("sessions", "aggregate FPS", "scaling", "slowest session FPS", "dropped",
+                 "inference p50 ms", "latency p50 ms", "p95 ms", "p99 ms", "failed"),
+            )
+        print("latency: frame captured -> mouse events queued, worst session; "
+              "scaling: aggregate FPS / (sessions x one session)")
+    finally:
+        for video in videos:
+            os.remove(video)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+# ============================================================================
+# BENCHMARKS/BENCH_OVERLAY.PY - Full-Frame Copy vs In-Place ROI Blending
+# ============================================================================
+# Compares the original overlay backgrounds (copy the whole frame, draw a
+# black rectangle, addWeighted over the full frame) with blend_region(),
+# which blends only the region of interest in-place. Reports time per call,
+# peak traced memory allocated and checks both produce identical pixels.
+# Also compares cv2.putText() with the cached text layers for the HUD text.
+#
+# Usage:
+#   python benchmarks/bench_overlay.py [--calls 500]
+# ============================================================================
+
+# Import required libraries
+import argparse  # Command-line options
+import time  # Timing
+import tracemalloc  # Allocation measurement
+
+import numpy as np  # Frames and statistics
+
+from common import print_table  # Benchmark helpers
+import cv2  # Legacy implementation
+from config import *  # Panel height and colors
+from gesture_utils import blend_region, draw_cached_text, text_cache  # New implementation
+
+# Static HUD strings drawn every frame: (text, origin, scale, color, thickness)
+HUD_TEXT = [
+    ("Press 'Q' to quit | 'H' for help", (10, 90), FONT_SCALE_SMALL, COLOR_WHITE, 1),
+    ("Hand Detected", (1080, 30), FONT_SCALE_LARGE, COLOR_GREEN, FONT_THICKNESS),
+    ("DRAGGING", (560, 670), 1, COLOR_ORANGE, 2),
+    ("GESTURE CONTROLS:", (50, 80), FONT_SCALE_LARGE, COLOR_CYAN, 2),
+    ("Move Cursor: Point with index finger", (50, 160), FONT_SCALE_LARGE, COLOR_WHITE, 1),
+    ("Left Click: Pinch thumb + index finger", (50, 200), FONT_SCALE_LARGE, COLOR_WHITE, 1),
+    ("Right Click: Pinch thumb + middle finger", (50, 240), FONT_SCALE_LARGE, COLOR_WHITE, 1),
+    ("Drag & Drop: Hold left click pinch while moving", (50, 280), FONT_SCALE_LARGE, COLOR_WHITE, 1),
+    ("Scroll: Extend all 5 fingers and move up/down", (50, 320), FONT_SCALE_LARGE, COLOR_WHITE, 1),
+]
+
+
+def put_text_all(frame, frame_width, frame_height):
+    """Draw all HUD strings with cv2.putText()."""
+    for text, org, scale, color, thickness in HUD_TEXT:
+        cv2.putText(frame, text, org, cv2.FONT_HERSHEY_SIMPLEX, scale, color, thickness)
+
+
+def cached_text_all(frame, frame_width, frame_height):
+    """Draw all HUD strings from the cached text layers."""
+    for text, org, scale, color, thickness in HUD_TEXT:
+        draw_cached_text(frame, text, org, cv2.FONT_HERSHEY_SIMPLEX, scale, color, thickness)
+
+
+def legacy_panel(frame, frame_width, frame_height):
+    """Original draw_info_panel background: full copy + full blend."""
+    overlay = frame.copy()
+    cv2.rectangle(overlay, (0, 0), (frame_width, INFO_PANEL_HEIGHT), COLOR_BLACK, -1)
+    cv2.addWeighted(overlay, 0.6, frame, 0.4, 0, frame)
+
+
+def legacy_help(frame, frame_width, frame_height):
+    """Original show_help_overlay background: full copy + full blend."""
+    overlay = frame.copy()
+    cv2.rectangle(overlay, (0, 0), (frame_width, frame_height), COLOR_BLACK, -1)
+    cv2.addWeighted(overlay, 0.8, frame, 0.2, 0, frame)
+
+
+def roi_panel(frame, frame_width, frame_height):
+    """New draw_info_panel background: in-place ROI blend."""
+    blend_region(frame, 0, 0, frame_width, INFO_PANEL_HEIGHT + 1, COLOR_BLACK, 0.6)
+
+
+def roi_help(frame, frame_width, frame_height):
+    """New show_help_overlay background: in-place full-frame blend."""
+    blend_region(frame, 0, 0, frame_width, frame_height, COLOR_BLACK, 0.8)
+
+
+def measure(func, frame, calls):
+    """
+    Time func and measure the memory it allocates per call.
+
+    Parameters:
+        func (callable): Overlay function (frame, width, height)
+        frame (numpy.ndarray): Frame drawn on repeatedly
+        calls (int): Number of calls
+
+    Returns:
+        tuple: (mean microseconds per call, peak traced KiB during 10 calls)
+    """
+    height, width = frame.shape[:2]
+    func(frame, width, height)  # Warm-up (creates cached buffers)
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        func(frame, width, height)
+    elapsed = time.perf_counter() - start
+
+    # Peak traced memory over a few calls (NumPy/OpenCV arrays are traced)
+    tracemalloc.start()
+    for _ in range(10):
+        func(frame, width, height)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return 1e6 * elapsed / calls, peak / 1024
+
+
+def main():
+    """
+    Run the comparison and print the results table.
+    """
+    parser = argparse.ArgumentParser(description="Overlay blending benchmark")
+    parser.add_argument("--calls", type=int, default=500, help="Calls per variant")
+    parser.add_argument("--width", type=int, default=CAMERA_WIDTH, help="Frame width")
+    parser.add_argument("--height", type=int, default=CAMERA_HEIGHT, help="Frame height")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    base = rng.integers(0, 255, (args.height, args.width, 3), dtype=np.uint8)
+
+    rows = []
+    for name, legacy, new in (("info panel", legacy_panel, roi_panel),
+                              ("help overlay", legacy_help, roi_help)):
+        # Both implementations must produce identical pixels
+        expected, actual = base.copy(), base.copy()
+        legacy(expected, args.width, args.height)
+        new(actual, args.width, args.height)
+        identical = np.array_equal(expected, actual)
+
+        legacy_us, legacy_kib = measure(legacy, base.copy(), args.calls)
+        new_us, new_kib = measure(new, base.copy(), args.calls)
+        rows.append((name, f"{legacy_us:.1f}", f"{new_us:.1f}", f"{legacy_us / new_us:.1f}x",
+                     f"{legacy_kib:.0f}", f"{new_kib:.1f}", identical))
+
+    print_table(
+        f"Overlay background per call on {args.width}x{args.height} ({args.calls} calls)",
+        rows,
+        ("overlay", "copy us", "roi us", "speedup", "copy peak KiB", "roi peak KiB", "identical"),
+    )
+
+    # Static HUD text: rasterize every frame vs composite cached tiles
+    expected, actual = base.copy(), base.copy()
+    put_text_all(expected, args.width, args.height)
+    cached_text_all(actual, args.width, args.height)
+    identical = np.array_equal(expected, actual)
+
+    put_us, _ = measure(put_text_all, base.copy(), args.calls)
+    cached_us, _ = measure(cached_text_all, base.copy(), args.calls)
+    stats = text_cache.get_stats()
+    print_table(
+        f"Static HUD text per frame ({len(HUD_TEXT)} strings, {args.calls} frames)",
+        [(f"{put_us:.1f}", f"{cached_us:.1f}", f"{put_us / cached_us:.1f}x",
+          f"{stats['hits']}/{stats['misses']}", identical)],
+        ("putText us", "cached us", "speedup", "cache hits/misses", "identical"),
+    )
+
+
+if __name__ == "__main__":
+    main()
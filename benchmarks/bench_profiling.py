@@ -0,0 +1,144 @@
+# ============================================================================
+# BENCHMARKS/BENCH_PROFILING.PY - Profiler Overhead and Stage Latency Report
+# ============================================================================
+# Three measurements:
+# - the original FPS averaging (list.append + pop(0) + sum() every frame)
+#   against RollingFPS (bounded deque of timestamps, O(1) per frame), for
+#   the configured window and a long window
+# - the cost of one StageProfiler.record() call on the hot path
+# - a headless run of the full application (gesture_controller.main) on a
+#   synthetic video with a null mouse backend, printing the per-stage
+#   p50/p95/p99 table the HUD shows and optionally exporting it as JSON
+#
+# Usage:
+#   python benchmarks/bench_profiling.py [--calls 100000] [--video clip.mp4]
+#                                        [--export profile.json]
+# ============================================================================
+
+# Import required libraries
+import argparse  # Command-line options
+import os  # Temporary file cleanup
+import time  # Timing
+
+from common import make_test_video, print_table  # Benchmark helpers
+import config  # Mouse backend override for the application run
+from config import *  # Window sizes
+from profiling import StageProfiler, RollingFPS, now_ns  # Implementation under test
+
+
+class LegacyFPS:
+    """The original update_fps(): list of per-frame FPS values."""
+
+    def __init__(self, window):
+        self.window = window
+        self.prev_frame_time = 0
+        self.fps_history = []
+
+    def tick(self, current_time):
+        if self.prev_frame_time != 0:
+            fps = 1 / (current_time - self.prev_frame_time)
+        else:
+            fps = 0
+        self.prev_frame_time = current_time
+        self.fps_history.append(fps)
+        if len(self.fps_history) > self.window:
+            self.fps_history.pop(0)
+        return sum(self.fps_history) / len(self.fps_history) if self.fps_history else 0
+
+
+def time_calls(func, calls):
+    """
+    Time func(i) for i in range(calls).
+
+    Returns:
+        float: Mean nanoseconds per call
+    """
+    start = time.perf_counter_ns()
+    for i in range(calls):
+        func(i)
+    return (time.perf_counter_ns() - start) / calls
+
+
+def run_application(video, export):
+    """
+    Run gesture_controller.main() headless on a video and print the stage table.
+
+    Parameters:
+        video (str): Video file to process
+        export (str or None): JSON file for the latency export
+    """
+    # Events are discarded; the dispatcher still runs so "mouse" is timed
+    config.MOUSE_BACKEND = "null"
+    import gesture_controller
+    from profiling import profiler
+
+    profiler.reset()
+    start = time.perf_counter()
+    gesture_controller.main(source=video, headless=True, profile=export)
+    elapsed = time.perf_counter() - start
+
+    rows = [(stage, stats["count"], f"{stats['p50']:.3f}", f"{stats['p95']:.3f}",
+             f"{stats['p99']:.3f}") for stage, stats in profiler.summary().items()]
+    print_table(
+        f"Per-stage latency, headless run ({elapsed:.1f} s, last {profiler.window} samples)",
+        rows,
+        ("stage", "samples", "p50 ms", "p95 ms", "p99 ms"),
+    )
+    print("(\"latency\" is only recorded for frames with a hand; the synthetic video has none)")
+
+
+def main():
+    """
+    Run the measurements and print the results tables.
+    """
+    parser = argparse.ArgumentParser(description="Profiling overhead benchmark")
+    parser.add_argument("--calls", type=int, default=100000, help="Calls per variant")
+    parser.add_argument("--video", default=None, help="Video for the application run")
+    parser.add_argument("--frames", type=int, default=150, help="Synthetic video length")
+    parser.add_argument("--export", default=None, help="JSON file for the latency export")
+    parser.add_argument("--skip-app", action="store_true", help="Skip the application run")
+    args = parser.parse_args()
+
+    # FPS averaging: per-frame cost with synthetic 30 FPS timestamps
+    rows = []
+    for window in (FPS_HISTORY_SIZE, 300):
+        legacy, rolling = LegacyFPS(window), RollingFPS(window)
+        legacy_ns = time_calls(lambda i: legacy.tick(1.0 + i / 30.0), args.calls)
+        rolling_ns = time_calls(lambda i: rolling.tick(1.0 + i / 30.0), args.calls)
+        rows.append((window, f"{legacy_ns:.0f}", f"{rolling_ns:.0f}",
+                     f"{legacy_ns / rolling_ns:.1f}x",
+                     f"{legacy.tick(1.0 + args.calls / 30.0):.2f}",
+                     f"{rolling.tick(1.0 + args.calls / 30.0):.2f}"))
+    print_table(
+        f"FPS averaging per frame ({args.calls} frames)",
+        rows,
+        ("window", "list ns", "deque ns", "speedup", "list FPS", "deque FPS"),
+    )
+
+    # Cost of instrumenting one stage
+    profiler = StageProfiler()
+    bare_ns = time_calls(lambda i: now_ns(), args.calls)
+    record_ns = time_calls(lambda i: profiler.record("stage", now_ns()), args.calls)
+    summary_start = now_ns()
+    profiler.summary()
+    summary_us = (now_ns() - summary_start) / 1000
+    print_table(
+        "Instrumentation cost",
+        [(f"{bare_ns:.0f}", f"{record_ns:.0f}", f"{summary_us:.0f}")],
+        ("perf_counter_ns() ns", "now_ns() + record() ns", "summary() us"),
+    )
+
+    if args.skip_app:
+        return
+
+    video = args.video or make_test_video(num_frames=args.frames,
+                                          width=CAMERA_WIDTH, height=CAMERA_HEIGHT)
+    try:
+        run_application(video, args.export)
+    finally:
+        if args.video is None:
+            os.remove(video)
+
+
+if __name__ == "__main__":
+    main()
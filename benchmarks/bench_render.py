@@ -0,0 +1,98 @@
+# ============================================================================
+# BENCHMARKS/BENCH_RENDER.PY - Preview Rendering vs Headless Cost
+# ============================================================================
+# Measures the per-frame cost of the visualization path that headless mode
+# skips: render_frame() (hand skeleton, finger markers, info panel, help
+# overlay) and, when a display is available, cv2.imshow() + cv2.waitKey().
+#
+# Usage:
+#   python benchmarks/bench_render.py [--frames 300] [--width 1280 --height 720]
+# ============================================================================
+
+# Import required libraries
+import argparse  # Command-line options
+import os  # DISPLAY detection
+import time  # Timing
+
+import numpy as np  # Statistics
+
+from common import make_hand_results, print_table  # Benchmark helpers
+from config import *  # Window title and modes
+import cv2  # OpenCV window functions
+from rendering import render_frame  # Preview renderer
+from gesture_logic import process_hand  # Genuine gesture descriptions
+from mouse_output import NullBackend  # Discards mouse events
+
+
+def time_per_frame(func, base_frame, frames):
+    """
+    Time func(frame) on fresh copies of base_frame.
+
+    Parameters:
+        func (callable): Function to time
+        base_frame (numpy.ndarray): Frame copied before every call (not timed)
+        frames (int): Number of calls
+
+    Returns:
+        numpy.ndarray: Per-call durations in milliseconds
+    """
+    durations = []
+    for _ in range(frames):
+        frame = base_frame.copy()  # Fresh frame, like a new camera frame
+        start = time.perf_counter()
+        func(frame)
+        durations.append(time.perf_counter() - start)
+    return np.array(durations) * 1000
+
+
+def main():
+    """
+    Time each visualization variant and print a comparison table.
+    """
+    parser = argparse.ArgumentParser(description="Preview rendering cost benchmark")
+    parser.add_argument("--frames", type=int, default=300, help="Frames per variant")
+    parser.add_argument("--width", type=int, default=CAMERA_WIDTH, help="Frame width")
+    parser.add_argument("--height", type=int, default=CAMERA_HEIGHT, help="Frame height")
+    args = parser.parse_args()
+
+    # Random-noise frame and one detected hand
+    rng = np.random.default_rng(0)
+    base_frame = rng.integers(0, 255, (args.height, args.width, 3), dtype=np.uint8)
+    results = make_hand_results()
+    gestures = [process_hand(results.multi_hand_landmarks[0], args.width, args.height,
+                             1920, 1080, NullBackend())]
+
+    variants = [
+        ("headless (nothing drawn)", lambda frame: None),
+        ("render_frame", lambda frame: render_frame(frame, results, gestures, 30.0, False)),
+        ("render_frame + help", lambda frame: render_frame(frame, results, gestures, 30.0, True)),
+    ]
+
+    # imshow/waitKey can only be measured with a display
+    if os.environ.get("DISPLAY") or os.name == "nt":
+        def render_and_show(frame):
+            render_frame(frame, results, gestures, 30.0, False)
+            cv2.imshow(WINDOW_TITLE, frame)
+            cv2.waitKey(1)
+        variants.append(("render_frame + imshow/waitKey", render_and_show))
+
+    rows = []
+    headless_ms = None
+    for name, func in variants:
+        ms = time_per_frame(func, base_frame, args.frames)
+        if headless_ms is None:
+            headless_ms = np.mean(ms)
+        rows.append((name, f"{np.mean(ms):.3f}", f"{np.percentile(ms, 95):.3f}",
+                     f"{np.mean(ms) - headless_ms:.3f}"))
+
+    print_table(
+        f"Visualization cost per {args.width}x{args.height} frame ({args.frames} frames)",
+        rows,
+        ("variant", "mean ms", "p95 ms", "saved by headless ms"),
+    )
+    if not (os.environ.get("DISPLAY") or os.name == "nt"):
+        print("(no display: imshow/waitKey not measured; headless mode skips them as well)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# ============================================================================
+# BENCHMARKS/BENCH_REPLAY.PY - Gesture Logic Throughput from Recordings
+# ============================================================================
+# Replays a landmark recording through process_hand() at maximum speed
+# (replay.py) and reports throughput and the emitted mouse events. Without
+# --recording a synthetic session is generated, so this runs on CI hosts
+# without a webcam or display.
+#
+# Also checks that the recording format round-trips and that replays are
+# deterministic (the basis for diffing event logs between versions).
+#
+# Usage:
+#   python benchmarks/bench_replay.py [--recording session.vmlm] [--repeat 5]
+# ============================================================================
+
+# Import required libraries
+import argparse  # Command-line options
+import os  # Temporary file cleanup
+
+import numpy as np  # Statistics
+
+from common import make_landmark_recording, print_table  # Benchmark helpers
+from landmark_recorder import load_recording  # Recording files
+from replay import replay  # Replay driver
+
+
+def main():
+    """
+    Replay the recording several times and print a results table.
+    """
+    parser = argparse.ArgumentParser(description="Landmark replay benchmark")
+    parser.add_argument("--recording", help="Recording file (synthetic if omitted)")
+    parser.add_argument("--frames", type=int, default=6000, help="Synthetic recording length")
+    parser.add_argument("--repeat", type=int, default=5, help="Replays to time")
+    args = parser.parse_args()
+
+    path = args.recording or make_landmark_recording(num_frames=args.frames)
+    try:
+        header, records = load_recording(path)
+        width, height = header["frame_width"], header["frame_height"]
+
+        runs = [replay(records, width, height) for _ in range(args.repeat)]
+        events = runs[0]["mouse"].events
+        deterministic = all(run["mouse"].events == events for run in runs)
+
+        us_per_frame = np.array([1e6 * run["seconds"] / max(run["frames"], 1) for run in runs])
+        counts = {}
+        for _, action, _ in events:
+            counts[action] = counts.get(action, 0) + 1
+
+        print_table(
+            f"Replay of {len(records)} frames ({runs[0]['hands']} with a hand, {width}x{height})",
+            [(f"{np.median(us_per_frame):.1f}", f"{us_per_frame.min():.1f}",
+              f"{1e6 / np.median(us_per_frame):.0f}", len(events), deterministic)],
+            ("median us/frame", "best us/frame", "frames/s", "mouse events", "deterministic"),
+        )
+        print(f"Events by action: {counts}")
+        print(f"Recording size: {os.path.getsize(path) / 1024:.0f} KiB "
+              f"({records.dtype.itemsize} bytes per frame)")
+    finally:
+        if not args.recording:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
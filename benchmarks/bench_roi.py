@@ -0,0 +1,203 @@
+# ============================================================================
+# BENCHMARKS/BENCH_ROI.PY - Hand-ROI Tracking vs Full-Frame Inference
+# ============================================================================
+# Two measurements:
+#
+# 1. Crop geometry (always, no MediaPipe needed): replays a landmark
+#    recording through predict_roi() and reports the frame pixels per crop
+#    vs the full frame, and how often the hand would fall outside the
+#    motion-predicted crop (each would trigger a full-frame re-detection).
+#    Compared with and without the motion prediction, on the recording and
+#    on synthetic side-to-side sweeps of increasing speed (fast enough that
+#    a crop centered on the last position loses the hand).
+#
+# 2. Live inference (with --video showing a hand): HandTracker with and
+#    without ROI_TRACKING: time per frame, pixels converted per frame,
+#    full-frame detections and the landmark offset between the two modes.
+#
+# Usage:
+#   python benchmarks/bench_roi.py [--recording session.vmlm] [--video hand.mp4]
+# ============================================================================
+
+# Import required libraries
+import argparse  # Command-line options
+import os  # Temporary file cleanup
+import time  # Timing
+
+import numpy as np  # Statistics
+
+from common import HAND_TEMPLATE, make_landmark_recording, print_table  # Benchmark helpers
+import cv2  # Video decoding
+from config import *  # ROI settings
+from gesture_utils import landmarks_to_array  # Full-frame pixel landmarks
+from hand_tracker import HandTracker, predict_roi  # Implementation under test
+from landmark_recorder import load_recording  # Recorded landmark streams
+
+
+def crop_geometry(records, width, height, predict):
+    """
+    Simulate ROI tracking on recorded landmarks.
+
+    Parameters:
+        records (numpy.ndarray): Landmark recording records
+        width (int): Frame width in pixels
+        height (int): Frame height in pixels
+        predict (bool): Use the motion prediction (False = center on last frame)
+
+    Returns:
+        tuple: (mean pixels per frame, full-frame detections, crop frames, misses)
+    """
+    roi, prev_center = None, None
+    pixels, full, crops, misses = 0, 0, 0, 0
+    for record in records:
+        if not record["present"]:
+            roi, prev_center = None, None
+            full += 1
+            pixels += width * height
+            continue
+
+        xs = record["landmarks"][:, 0] * width
+        ys = record["landmarks"][:, 1] * height
+
+        if roi is None:
+            full += 1
+            pixels += width * height
+        else:
+            crops += 1
+            x1, y1, x2, y2 = roi
+            pixels += (x2 - x1) * (y2 - y1)
+            # Hand not entirely inside the crop: MediaPipe would lose it
+            if xs.min() < x1 or xs.max() > x2 or ys.min() < y1 or ys.max() > y2:
+                misses += 1
+                full += 1
+                pixels += width * height
+
+        roi, prev_center = predict_roi(xs, ys, prev_center if predict else None, width, height)
+
+    return pixels / max(len(records), 1), full, crops, misses
+
+
+def sweep_records(num_frames, width, peak_speed):
+    """
+    Landmarks of a hand sweeping side to side (sinusoidal, like waving).
+
+    Parameters:
+        num_frames (int): Number of frames
+        width (int): Frame width in pixels
+        peak_speed (float): Fastest hand speed in pixels per frame
+
+    Returns:
+        list: Records with "present" and "landmarks" ((21, 3) normalized)
+    """
+    amplitude = 0.3 * width  # Keeps the hand inside the frame
+    frames = np.arange(num_frames)
+    offsets = amplitude * np.sin(frames * peak_speed / amplitude) / width
+    records = []
+    for offset in offsets:
+        landmarks = np.zeros((21, 3), dtype=np.float32)
+        landmarks[:, :2] = HAND_TEMPLATE
+        landmarks[:, 0] += offset
+        records.append({"present": 1, "landmarks": landmarks})
+    return records
+
+
+def run_video(path, frames_limit, roi_tracking):
+    """
+    Run HandTracker over a video.
+
+    Returns:
+        tuple: (mean ms, stats dict, list of landmark arrays or None)
+    """
+    cap = cv2.VideoCapture(path)
+    landmarks, times = [], []
+    with HandTracker(roi_tracking=roi_tracking) as tracker:
+        while len(times) < frames_limit:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            start = time.perf_counter()
+            results = tracker.process(frame)
+            times.append(time.perf_counter() - start)
+            height, width = frame.shape[:2]
+            landmarks.append(landmarks_to_array(results.multi_hand_landmarks[0], width, height)
+                             if results.multi_hand_landmarks else None)
+        stats = tracker.get_stats()
+    cap.release()
+    return 1000 * np.mean(times), stats, landmarks
+
+
+def main():
+    """
+    Run the geometry simulation and, with --video, the live comparison.
+    """
+    parser = argparse.ArgumentParser(description="Hand-ROI tracking benchmark")
+    parser.add_argument("--recording", help="Landmark recording (synthetic if omitted)")
+    parser.add_argument("--video", help="Video with a hand for the live comparison")
+    parser.add_argument("--frames", type=int, default=3000, help="Frames to process")
+    args = parser.parse_args()
+
+    # ------------------------------------------------------------------------
+    # 1. Crop geometry on recorded landmarks
+    # ------------------------------------------------------------------------
+    path = args.recording or make_landmark_recording(num_frames=args.frames)
+    try:
+        header, records = load_recording(path)
+        width, height = header["frame_width"], header["frame_height"]
+        rows = [("full frame", f"{width * height / 1000:.0f}", "1.0x", len(records), 0, "-")]
+        for name, predict in (("ROI, no prediction", False), ("ROI, motion-predicted", True)):
+            pixels, full, crops, misses = crop_geometry(records, width, height, predict)
+            rows.append((name, f"{pixels / 1000:.0f}", f"{width * height / pixels:.1f}x",
+                         full, crops, misses))
+    finally:
+        if not args.recording:
+            os.remove(path)
+
+    print_table(
+        f"Crop geometry over {len(records)} recorded frames ({width}x{height}, "
+        f"padding {ROI_PADDING}, min {ROI_MIN_SIZE}px)",
+        rows,
+        ("mode", "k pixels/frame", "reduction", "full-frame runs", "crop runs", "hand left crop"),
+    )
+
+    # Fast sweeps: where the motion prediction matters
+    rows = []
+    for speed in (20, 40, 80, 120, 160):
+        records = sweep_records(args.frames, width, speed)
+        misses = [crop_geometry(records, width, height, predict)[3] for predict in (False, True)]
+        rows.append((speed, f"{speed * 30 / width:.1f}",
+                     *(f"{count} ({count / len(records):.0%})" for count in misses)))
+    print_table(
+        f"Hand left the crop during side-to-side sweeps ({args.frames} frames)",
+        rows,
+        ("peak px/frame", "frame widths/s at 30 FPS", "no prediction", "motion-predicted"),
+    )
+
+    # ------------------------------------------------------------------------
+    # 2. Live inference on a video with a hand
+    # ------------------------------------------------------------------------
+    if not args.video:
+        print("\n(pass --video with a hand to compare live inference time and landmarks)")
+        return
+
+    full_ms, full_stats, full_landmarks = run_video(args.video, args.frames, False)
+    roi_ms, roi_stats, roi_landmarks = run_video(args.video, args.frames, True)
+    offsets = [np.mean(np.hypot(*(a[:, :2] - b[:, :2]).T))
+               for a, b in zip(full_landmarks, roi_landmarks) if a is not None and b is not None]
+
+    print_table(
+        f"HandTracker on {args.video} ({full_stats['frames']} frames, crop {ROI_CROP_SIZE}px)",
+        [
+            ("full frame", f"{full_ms:.1f}", f"{full_stats['mean_pixels'] / 1000:.0f}",
+             full_stats["full_frames"], 0, sum(lm is not None for lm in full_landmarks), "-"),
+            ("ROI tracking", f"{roi_ms:.1f}", f"{roi_stats['mean_pixels'] / 1000:.0f}",
+             roi_stats["full_frames"], roi_stats["redetections"],
+             sum(lm is not None for lm in roi_landmarks),
+             f"{np.mean(offsets):.2f}" if offsets else "n/a"),
+        ],
+        ("mode", "mean ms", "k pixels/frame", "full-frame runs", "re-detections",
+         "detected", "offset px"),
+    )
+
+
+if __name__ == "__main__":
+    main()
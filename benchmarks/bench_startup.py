@@ -0,0 +1,160 @@
+# ============================================================================
+# BENCHMARKS/BENCH_STARTUP.PY - Time to First Frame and First Landmark
+# ============================================================================
+# Starts the complete application (gesture_controller.main, headless) on a
+# short video of a synthetic hand, each run in a fresh interpreter so the
+# MediaPipe graph is built from scratch like on a real launch. The camera is
+# replaced by the video file; --camera-delay adds the time a real webcam
+# takes to open and negotiate its format (typically 0.3-1.5 s).
+#
+# Variants (startup.py):
+# - sequential:          open camera, then build the model, no warm-up
+# - sequential + warm-up: the same with WARMUP_FRAMES synthetic inferences
+# - concurrent + warm-up: model built and warmed up while the camera opens
+#
+# Per variant it reports the startup milestones (median of --repeat runs):
+# camera open, model ready, first frame and first landmark (the first frame
+# with a detected hand, i.e. the first frame that can move the cursor).
+#
+# Usage:
+#   python benchmarks/bench_startup.py [--repeat 3] [--camera-delay 0.5]
+# ============================================================================
+
+# Import required libraries
+import argparse  # Command-line options
+import json  # Milestones from the child interpreters
+import os  # Temporary file cleanup
+import subprocess  # Fresh interpreter per run
+import sys  # Interpreter path
+import time  # Simulated camera open time
+
+import numpy as np  # Medians
+
+from common import PROJECT_ROOT, make_hand_video, print_table  # Benchmark helpers
+
+# (name, STARTUP_CONCURRENT, WARMUP_FRAMES or None for the configured count)
+VARIANTS = (
+    ("sequential", False, 0),
+    ("sequential + warm-up", False, None),
+    ("concurrent + warm-up", True, None),
+)
+
+# Milestones reported, in order
+MILESTONES = ("camera_open", "model_ready", "first_frame", "first_landmark")
+
+# Prefix of the result line printed by a child run
+RESULT_PREFIX = "STARTUP_RESULT "
+
+
+def run_child(video, concurrent, warmup_frames, camera_delay):
+    """
+    Run gesture_controller.main() once in this interpreter and print the milestones.
+
+    Parameters:
+        video (str): Video file path
+        concurrent (bool): STARTUP_CONCURRENT for this run
+        warmup_frames (int or None): WARMUP_FRAMES for this run (None = configured)
+        camera_delay (float): Seconds added to opening the capture source
+    """
+    # Settings are copied by "from config import *", so set them first
+    import config
+    config.MOUSE_BACKEND = "null"
+    config.STARTUP_CONCURRENT = concurrent
+    if warmup_frames is not None:
+        config.WARMUP_FRAMES = warmup_frames
+
+    import gesture_controller
+    from mouse_output import RecordingBackend
+    from startup import startup_timer
+
+    # A webcam blocks in its constructor while it opens
+    original_grabber, original_open = gesture_controller.FrameGrabber, gesture_controller.open_capture
+
+    class SlowGrabber(original_grabber):
+        def __init__(self, *args, **kwargs):
+            time.sleep(camera_delay)
+            super().__init__(*args, **kwargs)
+
+    def slow_open(*args, **kwargs):
+        time.sleep(camera_delay)
+        return original_open(*args, **kwargs)
+
+    gesture_controller.FrameGrabber = SlowGrabber
+    gesture_controller.open_capture = slow_open
+
+    gesture_controller.init(RecordingBackend(1920, 1080))
+    gesture_controller.main(source=video, headless=True)
+    print(RESULT_PREFIX + json.dumps(startup_timer.get_stats()))
+
+
+def run_variant(video, concurrent, warmup_frames, camera_delay):
+    """
+    Start the application in a fresh interpreter.
+
+    Returns:
+        dict or None: Startup milestones, None if the run failed
+    """
+    command = [sys.executable, os.path.abspath(__file__), "--child", video,
+               "--camera-delay", str(camera_delay)]
+    if concurrent:
+        command.append("--concurrent")
+    if warmup_frames is not None:
+        command += ["--warmup", str(warmup_frames)]
+    result = subprocess.run(command, cwd=PROJECT_ROOT, capture_output=True, text=True)
+    for line in result.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):])
+    print(result.stderr[-2000:], file=sys.stderr)
+    return None
+
+
+def main():
+    """
+    Start the application once per variant and repeat, then print the table.
+    """
+    parser = argparse.ArgumentParser(description="Startup time benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per variant (median is reported)")
+    parser.add_argument("--frames", type=int, default=90, help="Synthetic video length")
+    parser.add_argument("--camera-delay", type=float, default=0.5,
+                        help="Simulated camera open time (seconds)")
+    parser.add_argument("--child", metavar="VIDEO", help=argparse.SUPPRESS)
+    parser.add_argument("--concurrent", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--warmup", type=int, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        run_child(args.child, args.concurrent, args.warmup, args.camera_delay)
+        return
+
+    from config import CAMERA_WIDTH, CAMERA_HEIGHT, WARMUP_FRAMES  # Video size and warm-up count
+
+    video, _ = make_hand_video(num_frames=args.frames, width=CAMERA_WIDTH, height=CAMERA_HEIGHT)
+    try:
+        rows = []
+        for name, concurrent, warmup_frames in VARIANTS:
+            runs = [run_variant(video, concurrent, warmup_frames, args.camera_delay)
+                    for _ in range(args.repeat)]
+            runs = [run for run in runs if run is not None]
+            if not runs:
+                rows.append((name, *["failed"] * (len(MILESTONES) + 1)))
+                continue
+            cells = []
+            for milestone in MILESTONES:
+                values = [run[milestone] for run in runs if milestone in run]
+                cells.append(f"{np.median(values):.0f}" if values else "-")
+            warmup = [run["warmup_ms"][0] for run in runs if run["warmup_ms"]]
+            cells.append(f"{np.median(warmup):.0f}" if warmup else "-")
+            rows.append((name, *cells))
+    finally:
+        os.remove(video)
+
+    print_table(f"Startup milestones, ms after main() (median of {args.repeat}, "
+                f"camera open +{args.camera_delay:g} s, {WARMUP_FRAMES} warm-up frames)",
+                rows, ("variant", "camera open", "model ready", "first frame",
+                       "first landmark", "1st warm-up ms"))
+    print("Warm-up moves the slow first inferences before the first frame; "
+          "concurrent startup overlaps them with opening the camera.")
+
+
+if __name__ == "__main__":
+    main()
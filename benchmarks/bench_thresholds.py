@@ -0,0 +1,147 @@
+# ============================================================================
+# BENCHMARKS/BENCH_THRESHOLDS.PY - Pinch Detection vs Hand Size on Screen
+# ============================================================================
+# The labeled gesture stream of bench_gestures.py is scaled about the wrist
+# to simulate a hand further from (scale < 1) or closer to (scale > 1) the
+# camera, or a camera of lower / higher resolution. Landmark noise is added
+# after scaling (it is a property of the tracker, in pixels). Per scale:
+#
+# - pixel thresholds (CLICK_THRESHOLD / CLICK_RELEASE_THRESHOLD)
+# - palm thresholds (CLICK_THRESHOLD_RATIO / CLICK_RELEASE_RATIO)
+# - palm thresholds from a simulated calibration (calibration.py) of the
+#   stream's own pointing and pinch poses
+#
+# report clicks vs intended, false clicks (e.g. a near miss turning into a
+# click on a small hand) and missed clicks (e.g. a pinch never getting
+# below the pixel threshold on a large hand).
+#
+# The exit code is 1 when the calibrated thresholds give more false or
+# missed clicks than the default palm thresholds at any scale: calibrating
+# must never make pinch detection worse.
+#
+# Usage:
+#   python benchmarks/bench_thresholds.py [--noise 2] [--scales 0.4 0.6 1 1.5 2]
+# ============================================================================
+
+# Import required libraries
+import argparse  # Command-line options
+import sys  # Exit code
+
+import numpy as np  # Stream scaling
+
+from bench_gestures import make_labeled_stream, run_stream, score  # Labeled stream and scoring
+from common import print_table  # Benchmark helpers
+from config import *  # Threshold settings
+from calibration import compute_thresholds  # Implementation under test
+from gesture_features import FeatureEngine, FINGER_THUMB, FINGER_INDEX  # Pose measurement
+from gesture_state import GestureStateMachine, EVENT_PRESS  # Implementation under test
+
+
+class Variant:
+    """
+    GestureStateMachine with fixed thresholds, in the interface of run_stream().
+    """
+
+    def __init__(self, units, enter=None, release=None):
+        self.machine = GestureStateMachine(enter, release, units=units)
+
+    @property
+    def mode(self):
+        return self.machine.mode
+
+    def update(self, features, now):
+        return self.machine.update(features, now)
+
+
+def scale_stream(points, scale, noise, seed=0):
+    """
+    Scale every hand of a noise-free stream about its wrist and add noise.
+
+    Returns:
+        numpy.ndarray: (N, 21, 3) scaled, noisy landmark stream
+    """
+    rng = np.random.default_rng(seed)
+    wrists = points[:, WRIST:WRIST + 1, :2]
+    scaled = points.copy()
+    scaled[..., :2] = wrists + (points[..., :2] - wrists) * scale
+    scaled[..., :2] += rng.normal(0, noise, scaled[..., :2].shape).astype(np.float32)
+    return scaled
+
+
+def calibrate_stream(points, segments):
+    """
+    Simulate calibration.calibrate() on the stream's own poses.
+
+    Returns:
+        dict: Calibration entry from the "point" and pinched "drag" frames
+    """
+    engine = FeatureEngine()
+
+    def ratios(kind, middle_only):
+        values = []
+        for segment_kind, first, end, _ in segments:
+            if segment_kind != kind:
+                continue
+            # The held middle part of a pinch (not the closing/opening ramp)
+            if middle_only:
+                first, end = first + (end - first) // 3, end - (end - first) // 3
+            for i in range(first, end):
+                values.append(float(engine.compute(points[i]).ratios[FINGER_THUMB, FINGER_INDEX]))
+        return values
+
+    return compute_thresholds(ratios("point", False), ratios("drag", True))
+
+
+def main():
+    """
+    Run every threshold variant at every scale and print the results table.
+    """
+    parser = argparse.ArgumentParser(description="Pinch detection vs hand scale")
+    parser.add_argument("--noise", type=float, default=2.0, help="Landmark noise (pixels, std)")
+    parser.add_argument("--seconds", type=float, default=60, help="Stream duration")
+    parser.add_argument("--fps", type=float, default=30, help="Stream frame rate")
+    parser.add_argument("--scales", type=float, nargs="+", default=[0.4, 0.6, 1.0, 1.5, 2.0],
+                        help="Hand scales relative to a 150 pixel palm")
+    args = parser.parse_args()
+
+    base, times, segments = make_labeled_stream(args.seconds, args.fps, noise=0.0)
+
+    rows = []
+    failures = []
+    for scale in args.scales:
+        points = scale_stream(base, scale, args.noise)
+        palm = float(np.median(np.hypot(*(points[:, MIDDLE_MCP, :2] - points[:, WRIST, :2]).T)))
+        calibration = calibrate_stream(points, segments)
+        variants = (
+            ("pixels", Variant("pixels")),
+            ("palm", Variant("palm")),
+            ("palm, calibrated", Variant("palm", calibration["enter"], calibration["release"])),
+        )
+        errors = {}  # Variant -> (false clicks, missed clicks)
+        for name, variant in variants:
+            events, _ = run_stream(variant, points, times)
+            clicks = score(events, segments, ("tap", "drag"), EVENT_PRESS, args.fps)
+            errors[name] = (clicks[2], clicks[3])
+            rows.append((f"{scale:g}", f"{palm:.0f}", name, f"{clicks[0]} / {clicks[1]}",
+                         clicks[2], clicks[3]))
+        if any(calibrated > default
+               for calibrated, default in zip(errors["palm, calibrated"], errors["palm"])):
+            failures.append(f"{scale:g}")
+
+    print_table(
+        f"Labeled stream: {args.seconds:.0f} s at {args.fps:.0f} FPS, noise {args.noise:g} px; "
+        f"pixels {CLICK_THRESHOLD}-{CLICK_RELEASE_THRESHOLD} px, "
+        f"palm {CLICK_THRESHOLD_RATIO}-{CLICK_RELEASE_RATIO} palm lengths",
+        rows,
+        ("scale", "palm px", "thresholds", "clicks / intended", "false clicks", "missed"),
+    )
+    print("Pixel thresholds fit one hand size; at small scales the landmark noise "
+          "(pixels) grows relative to the palm.")
+
+    if failures:
+        print(f"FAILED: calibrated thresholds worse than the defaults at scale(s) {', '.join(failures)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+# ============================================================================
+# BENCHMARKS/COMMON.PY - Shared Benchmark Helpers
+# ============================================================================
+# Helpers shared by the benchmark scripts: making the project modules
+# importable when a script is run directly, and generating synthetic test
+# videos (including a hand on a known trajectory) so benchmarks run on
+# machines without a webcam.
+# ============================================================================
+
+# Import required libraries
+import os  # Path handling
+import sys  # Module search path
+import tempfile  # Temporary files for generated videos
+
+# Make the project root importable when running "python benchmarks/<script>.py"
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import cv2  # OpenCV for video writing
+import numpy as np  # NumPy for frame generation
+
+
+# ============================================================================
+# SYNTHETIC VIDEO GENERATION
+# ============================================================================
+
+def make_test_video(path=None, num_frames=300, width=1280, height=720, fps=30):
+    """
+    Write a synthetic test video with a moving marker to disk.
+
+    The content is not a hand; it only provides realistic frame sizes and
+    decode cost for capture and rendering benchmarks.
+
+    Parameters:
+        path (str): Output file path (a temporary .avi file if None)
+        num_frames (int): Number of frames to write
+        width (int): Frame width in pixels
+        height (int): Frame height in pixels
+        fps (int): Frame rate stored in the file
+
+    Returns:
+        str: Path to the written video file
+    """
+    # Default to a temporary file that the caller may delete
+    if path is None:
+        handle, path = tempfile.mkstemp(suffix=".avi", prefix="vm_bench_")
+        os.close(handle)
+
+    # MJPG in AVI is available in every OpenCV build
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), fps, (width, height))
+
+    # Static gradient background
+    gradient = np.linspace(40, 200, width, dtype=np.uint8)
+    background = np.dstack([np.tile(gradient, (height, 1))] * 3)
+
+    for i in range(num_frames):
+        frame = background.copy()
+
+        # Marker moving on a circle, plus the frame number
+        angle = 2 * np.pi * i / max(num_frames, 1)
+        center = (int(width / 2 + width / 4 * np.cos(angle)),
+                  int(height / 2 + height / 4 * np.sin(angle)))
+        cv2.circle(frame, center, 40, (0, 200, 255), -1)
+        cv2.putText(frame, str(i), (20, height - 20),
+                    cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+
+        writer.write(frame)
+
+    writer.release()
+    return path
+
+
+# ============================================================================
+# SYNTHETIC HAND LANDMARKS
+# ============================================================================
+
+# Normalized (x, y) positions of the 21 MediaPipe hand landmarks for an open
+# right hand facing the camera in the mirrored preview (all fingers extended)
+HAND_TEMPLATE = np.array([
+    (0.50, 0.80),                                               # 0 wrist
+    (0.44, 0.76), (0.40, 0.70), (0.37, 0.64), (0.35, 0.59),     # 1-4 thumb
+    (0.46, 0.60), (0.45, 0.52), (0.45, 0.47), (0.45, 0.42),     # 5-8 index
+    (0.50, 0.59), (0.50, 0.50), (0.50, 0.45), (0.50, 0.40),     # 9-12 middle
+    (0.54, 0.60), (0.55, 0.52), (0.55, 0.47), (0.55, 0.43),     # 13-16 ring
+    (0.58, 0.63), (0.59, 0.57), (0.60, 0.53), (0.60, 0.50),     # 17-20 pinky
+], dtype=np.float32)
+
+
+def make_hand_results(points=HAND_TEMPLATE):
+    """
+    Build a MediaPipe-style hands.process() result for one hand.
+
+    Parameters:
+        points (numpy.ndarray): (21, 2) normalized landmark positions
+
+    Returns:
+        object: Object with a multi_hand_landmarks list holding one
+                NormalizedLandmarkList (requires mediapipe)
+    """
+    from types import SimpleNamespace
+    from mediapipe.framework.formats import landmark_pb2
+
+    hand = landmark_pb2.NormalizedLandmarkList()
+    for x, y in points:
+        hand.landmark.add(x=float(x), y=float(y), z=0.0)
+    return SimpleNamespace(multi_hand_landmarks=[hand])
+
+
+def make_landmark_recording(path=None, num_frames=3000, width=1280, height=720, fps=30, seed=0):
+    """
+    Write a synthetic landmark recording (landmark_recorder.py format).
+
+    The hand drifts around the control area with tracking noise and cycles
+    through pointing, thumb-index pinches, thumb-middle pinches, an open
+    hand moving up and down (scroll) and short periods without a hand.
+
+    Parameters:
+        path (str): Output file path (a temporary .vmlm file if None)
+        num_frames (int): Number of frames to write
+        width (int): Recorded frame width in pixels
+        height (int): Recorded frame height in pixels
+        fps (int): Frame rate used for the timestamps
+        seed (int): Random seed
+
+    Returns:
+        str: Path to the written recording
+    """
+    from types import SimpleNamespace
+    from landmark_recorder import LandmarkRecorder
+
+    if path is None:
+        handle, path = tempfile.mkstemp(suffix=".vmlm", prefix="vm_bench_")
+        os.close(handle)
+
+    rng = np.random.default_rng(seed)
+
+    # Closed fist for pointing/pinching: fold the middle, ring and pinky
+    # tips below their PIP joints (the index stays up)
+    fist = HAND_TEMPLATE.copy()
+    for tip, pip in ((12, 10), (16, 14), (20, 18)):
+        fist[tip, 1] = fist[pip, 1] + 0.03
+
+    start_ns = 1_700_000_000 * 10**9
+    with LandmarkRecorder(path, width, height) as recorder:
+        for i in range(num_frames):
+            # 4-second gesture cycle: point, left pinch, point, right pinch,
+            # open hand (scroll), no hand
+            phase = (i % (4 * fps)) / (4 * fps)
+            offset = np.array([0.12 * np.sin(i / 40.0), 0.08 * np.sin(i / 55.0)], dtype=np.float32)
+            if phase < 0.25:
+                points = fist + offset
+            elif phase < 0.35:
+                points = fist + offset
+                points[4] = points[8]
+            elif phase < 0.5:
+                points = fist + offset
+            elif phase < 0.6:
+                points = fist + offset
+                points[4] = points[12]
+            elif phase < 0.9:
+                points = HAND_TEMPLATE + offset
+                points[:, 1] += 0.1 * np.sin(i / 6.0)
+            else:
+                points = None
+
+            if points is None:
+                results = SimpleNamespace(multi_hand_landmarks=None)
+            else:
+                points = points + rng.normal(0, 0.002, points.shape).astype(np.float32)
+                results = make_hand_results(points)
+            recorder.write(results, start_ns + i * 10**9 // fps)
+
+    return path
+
+
+# ============================================================================
+# SYNTHETIC HAND VIDEO
+# ============================================================================
+
+# Landmark layout of an open right hand (palm towards the camera, as
+# captured, before mirroring) relative to the wrist, in palm lengths;
+# image axes (y grows downwards)
+HAND_SHAPE = np.array([
+    (0.00, 0.00),                                               # 0 wrist
+    (-0.35, -0.15), (-0.60, -0.35), (-0.80, -0.55), (-0.95, -0.70),  # 1-4 thumb
+    (-0.30, -0.95), (-0.42, -1.35), (-0.54, -1.62), (-0.66, -1.85),  # 5-8 index
+    (-0.05, -1.00), (-0.07, -1.45), (-0.09, -1.75), (-0.11, -2.00),  # 9-12 middle
+    (0.20, -0.95), (0.27, -1.38), (0.34, -1.66), (0.41, -1.90),      # 13-16 ring
+    (0.42, -0.85), (0.58, -1.18), (0.74, -1.40), (0.90, -1.58),      # 17-20 pinky
+], dtype=np.float32)
+
+# Finger widths in palm lengths (thumb, index, middle, ring, pinky)
+FINGER_WIDTHS = (0.24, 0.20, 0.21, 0.19, 0.16)
+
+# Skin and background colors (BGR)
+SKIN_COLOR = np.array((120, 150, 205), dtype=np.float32)
+BACKGROUND_COLOR = (70, 70, 70)
+
+
+def draw_synthetic_hand(frame, wrist, size):
+    """
+    Draw a shaded open hand with forearm that MediaPipe detects reliably.
+
+    Parameters:
+        frame (numpy.ndarray): BGR frame to draw on (modified in-place)
+        wrist (tuple): Wrist position (x, y) in pixels
+        size (float): Palm length (wrist to middle knuckle) in pixels
+
+    Returns:
+        numpy.ndarray: (21, 2) drawn landmark positions in pixels
+    """
+    points = HAND_SHAPE * size + np.asarray(wrist, dtype=np.float32)
+    pixels = points.astype(int)
+    wrist = points[0]
+    skin = tuple(int(v) for v in SKIN_COLOR)
+    crease = tuple(int(v) for v in SKIN_COLOR * 0.8)
+    nail = tuple(int(v) for v in np.minimum(SKIN_COLOR * 1.1, 255))
+
+    # Forearm below the wrist, slightly darker than the hand
+    arm = np.array([wrist + (-0.45 * size, 0), wrist + (0.50 * size, 0),
+                    wrist + (0.55 * size, 1.6 * size), wrist + (-0.50 * size, 1.6 * size)], dtype=int)
+    cv2.fillConvexPoly(frame, arm, tuple(int(v) for v in SKIN_COLOR * 0.9), cv2.LINE_AA)
+
+    # Palm polygon through the wrist, the thumb base and the knuckles
+    palm = np.array([wrist + (-0.42 * size, 0), points[1], points[5] + (-0.12 * size, 0),
+                     points[9], points[13], points[17] + (0.12 * size, 0.05 * size),
+                     wrist + (0.45 * size, 0)], dtype=int)
+    cv2.fillPoly(frame, [palm], skin, cv2.LINE_AA)
+
+    # Fingers: thick segments with rounded joints, creases and a nail
+    for finger, width in enumerate(FINGER_WIDTHS):
+        chain = pixels[1 + 4 * finger:5 + 4 * finger]
+        width = int(width * size)
+        for start, end in zip(chain[:-1], chain[1:]):
+            cv2.line(frame, tuple(start), tuple(end), skin, width, cv2.LINE_AA)
+        for joint in chain[1:]:
+            cv2.circle(frame, tuple(joint), width // 2, skin, -1, cv2.LINE_AA)
+        for joint in chain[1:-1]:
+            cv2.circle(frame, tuple(joint), max(2, width // 6), crease, 1, cv2.LINE_AA)
+        cv2.circle(frame, tuple(chain[-1]), max(2, width // 4), nail, -1, cv2.LINE_AA)
+
+    return points
+
+
+def hand_trajectory(times, width, height):
+    """
+    Wrist position of the synthetic hand over time (a Lissajous curve).
+
+    The index fingertip stays inside the control area (CONTROL_AREA_START
+    to CONTROL_AREA_END), so cursor positions are never clipped.
+
+    Parameters:
+        times (numpy.ndarray): Times in seconds
+        width (int): Frame width in pixels
+        height (int): Frame height in pixels
+
+    Returns:
+        numpy.ndarray: (N, 2) wrist positions in pixels
+    """
+    times = np.asarray(times, dtype=np.float64)
+    x = width / 2 + 0.22 * width * np.sin(2 * np.pi * 0.25 * times)
+    y = 0.72 * height + 0.10 * height * np.sin(2 * np.pi * 0.4 * times)
+    return np.stack([x, y], axis=-1)
+
+
+def make_hand_video(path=None, num_frames=300, width=1280, height=720, fps=30):
+    """
+    Write a video of a synthetic hand moving on a known trajectory.
+
+    Parameters:
+        path (str): Output file path (a temporary .avi file if None)
+        num_frames (int): Number of frames to write
+        width (int): Frame width in pixels
+        height (int): Frame height in pixels
+        fps (int): Frame rate stored in the file
+
+    Returns:
+        tuple: (path, truth) where truth is a (num_frames, 21, 2) array of
+               the drawn landmark positions in pixels (unmirrored frames)
+    """
+    if path is None:
+        handle, path = tempfile.mkstemp(suffix=".avi", prefix="vm_bench_hand_")
+        os.close(handle)
+
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), fps, (width, height))
+
+    # Static sensor noise on a plain background
+    rng = np.random.default_rng(0)
+    background = np.full((height, width, 3), BACKGROUND_COLOR, dtype=np.uint8)
+    noise = rng.normal(0, 4, background.shape)
+
+    size = 0.15 * height
+    wrists = hand_trajectory(np.arange(num_frames) / fps, width, height)
+    truth = np.zeros((num_frames, 21, 2), dtype=np.float32)
+    for i, wrist in enumerate(wrists):
+        frame = background.copy()
+        truth[i] = draw_synthetic_hand(frame, wrist, size)
+        frame = cv2.GaussianBlur(frame, (5, 5), 0)
+        writer.write(np.clip(frame + noise, 0, 255).astype(np.uint8))
+
+    writer.release()
+    return path, truth
+
+
+def print_table(title, rows, headers):
+    """
+    Print benchmark results as an aligned text table.
+
+    Parameters:
+        title (str): Table title
+        rows (list): List of row tuples
+        headers (tuple): Column headers
+    """
+    # Convert everything to strings and compute column widths
+    text_rows = [[str(cell) for cell in row] for row in rows]
+    widths = [max(len(str(h)), *(len(r[i]) for r in text_rows)) if text_rows else len(str(h))
+              for i, h in enumerate(headers)]
+
+    print("\n" + title)
+    print("-" * (sum(widths) + 3 * (len(widths) - 1)))
+    print(" | ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    print("-" * (sum(widths) + 3 * (len(widths) - 1)))
+    for row in text_rows:
+        print(" | ".join(cell.ljust(w) for cell, w in zip(row, widths)))
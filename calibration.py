@@ -0,0 +1,266 @@
+# ============================================================================
+# CALIBRATION.PY - Per-User Pinch Calibration and Cache
+# ============================================================================
+# The default pinch thresholds (CLICK_THRESHOLD_RATIO / CLICK_RELEASE_RATIO)
+# fit an average hand. Finger lengths and how tightly a user closes a pinch
+# differ, so calibrate() measures the thumb-index distance of one user in
+# two poses, both in palm lengths (independent of camera and distance):
+#
+#   1. pointing  - index finger extended, thumb relaxed (cursor pose)
+#   2. pinching  - thumb and index finger touching (click pose)
+#
+# The pinch start threshold is placed just above the pinch pose: its median
+# plus a noise margin from the spread of the pinch samples
+# (CALIBRATION_NOISE_SIGMAS, at least CALIBRATION_MIN_MARGIN), but never
+# above the default CLICK_THRESHOLD_RATIO. The release threshold keeps the
+# default hysteresis band above it. Placing them further
+# towards the pointing pose would turn near misses (fingers approaching
+# without touching) into clicks. The thresholds are stored in
+# CALIBRATION_FILE under the user's name. gesture_controller.py loads them
+# at startup (--user), so a user calibrates once, not every session.
+#
+# Cache file (JSON):
+#   {"alice": {"units": "palm", "enter": 0.2, "release": 0.3,
+#              "pinch": 0.12, "pointing": 0.71, "created": 1760000000.0}}
+# ============================================================================
+
+# Import required libraries
+import os  # Cache directory
+import json  # Cache file format
+import time  # Pose timing
+import tempfile  # Atomic cache writes
+import cv2  # Calibration prompts in the preview
+import numpy as np  # Medians of the recorded poses
+from config import *  # Import all configuration constants
+from gesture_utils import create_landmark_array, landmarks_to_array  # Landmark conversion
+from gesture_features import FeatureEngine, FINGER_THUMB, FINGER_INDEX  # Pinch distance and palm size
+
+# Poses recorded by calibrate(), in order: (name, prompt)
+CALIBRATION_POSES = [
+    ("pointing", "Point with your index finger, thumb relaxed"),
+    ("pinch", "Touch thumb and index finger together"),
+]
+
+
+# ============================================================================
+# THRESHOLDS FROM MEASUREMENTS
+# ============================================================================
+
+def compute_thresholds(pointing_ratios, pinch_ratios, sigmas=CALIBRATION_NOISE_SIGMAS,
+                       min_margin=CALIBRATION_MIN_MARGIN):
+    """
+    Place the pinch thresholds just above a user's pinch pose.
+
+    Parameters:
+        pointing_ratios (array-like): Thumb-index distances (palm lengths)
+                                      recorded while pointing
+        pinch_ratios (array-like): Thumb-index distances (palm lengths)
+                                   recorded while pinching
+        sigmas (float): Pinch start threshold above the pinch median, in
+                        standard deviations of the pinch samples
+        min_margin (float): Smallest distance (palm lengths) between the
+                            pinch median and the pinch start threshold
+
+    Returns:
+        dict: Calibration entry ("units", "enter", "release", "pinch",
+              "pointing")
+
+    Raises:
+        ValueError: If the pinch pose is not clearly closer than the
+                    pointing pose
+    """
+    pointing_ratios = np.asarray(pointing_ratios, dtype=np.float64)
+    pinch_ratios = np.asarray(pinch_ratios, dtype=np.float64)
+    pointing = float(np.median(pointing_ratios))
+    pinch = float(np.median(pinch_ratios))
+
+    # Noise of the held pinch; the median absolute deviation ignores the
+    # frames where the fingers were still closing
+    spread = 1.4826 * float(np.median(np.abs(pinch_ratios - pinch)))
+    # Never looser than the defaults: noisy tracking widens the margin,
+    # and a wider margin reaches the near misses
+    enter = min(pinch + max(sigmas * spread, min_margin), CLICK_THRESHOLD_RATIO)
+    release = enter + (CLICK_RELEASE_RATIO - CLICK_THRESHOLD_RATIO)
+
+    # The hysteresis band must stay well below the pointing pose
+    if release > (pinch + pointing) / 2:
+        raise ValueError(f"Pinch ({pinch:.2f}) and pointing ({pointing:.2f}) poses "
+                         "are too similar; pinch tighter or open the thumb more")
+
+    return {
+        "units": "palm",
+        "enter": round(enter, 4),
+        "release": round(release, 4),
+        "pinch": round(pinch, 4),
+        "pointing": round(pointing, 4),
+    }
+
+
+# ============================================================================
+# CACHE FILE
+# ============================================================================
+
+def load_calibrations(path=CALIBRATION_FILE):
+    """
+    Read all cached calibrations.
+
+    Parameters:
+        path (str): Cache file
+
+    Returns:
+        dict: User name -> calibration entry (empty if there is no cache or
+              it cannot be read)
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"[CALIBRATION] ⚠ Ignoring unreadable calibration cache {path}: {e}")
+        return {}
+    return entries if isinstance(entries, dict) else {}
+
+
+def load_calibration(user=CALIBRATION_USER, path=CALIBRATION_FILE):
+    """
+    Read one user's cached calibration.
+
+    Parameters:
+        user (str): User name
+        path (str): Cache file
+
+    Returns:
+        dict or None: Calibration entry, None if the user has none
+    """
+    return load_calibrations(path).get(user)
+
+
+def save_calibration(entry, user=CALIBRATION_USER, path=CALIBRATION_FILE):
+    """
+    Store a user's calibration, keeping the other users' entries.
+
+    The file is written to a temporary file and renamed, so a crash never
+    leaves a truncated cache behind.
+
+    Parameters:
+        entry (dict): Calibration entry from compute_thresholds()
+        user (str): User name
+        path (str): Cache file
+    """
+    entries = load_calibrations(path)
+    entries[user] = dict(entry, created=time.time())
+
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entries, f, indent=2, sort_keys=True)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def apply_calibration(state_machine, entry):
+    """
+    Switch a gesture state machine to a user's calibrated thresholds.
+
+    The scroll step keeps its default (calibration only measures pinches).
+
+    Parameters:
+        state_machine (GestureStateMachine): Machine to configure
+        entry (dict): Calibration entry (see load_calibration)
+    """
+    state_machine.set_thresholds(entry["enter"], entry["release"], units=entry.get("units", "palm"))
+
+
+# ============================================================================
+# CALIBRATION ROUTINE
+# ============================================================================
+
+def record_pose(cap, hands, prompt, headless=False, seconds=CALIBRATION_SECONDS,
+                settle=CALIBRATION_SETTLE_SECONDS):
+    """
+    Record the thumb-index distance (palm lengths) of one held pose.
+
+    Parameters:
+        cap: FrameGrabber or cv2.VideoCapture
+        hands (HandTracker): MediaPipe hand tracker
+        prompt (str): Instruction shown to the user
+        headless (bool): Print the prompt instead of drawing it
+        seconds (float): Total time of the pose
+        settle (float): Leading seconds that are not recorded
+
+    Returns:
+        list: One ratio per frame with a hand (after the settle time)
+    """
+    engine = FeatureEngine()
+    points = create_landmark_array()
+    ratios = []
+
+    print(f"[CALIBRATION] {prompt} ({seconds:.0f} s)")
+    start = time.time()
+    while True:
+        elapsed = time.time() - start
+        if elapsed >= seconds:
+            break
+
+        ret, frame = cap.read()
+        if not ret or frame is None:
+            continue
+        frame_height, frame_width = frame.shape[:2]
+        results = hands.process(frame)
+
+        hand = bool(results.multi_hand_landmarks)
+        if hand and elapsed >= settle:
+            landmarks_to_array(results.multi_hand_landmarks[0], frame_width, frame_height, out=points)
+            engine.compute(points)
+            if engine.palm_size > 1.0:
+                ratios.append(float(engine.ratios[FINGER_THUMB, FINGER_INDEX]))
+
+        if not headless:
+            # Show the pose prompt, a countdown and whether a hand is seen
+            preview = cv2.flip(frame, 1)
+            status = "recording" if elapsed >= settle else "get ready"
+            color = COLOR_GREEN if hand else COLOR_RED
+            cv2.putText(preview, prompt, (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.8, COLOR_WHITE, 2, cv2.LINE_AA)
+            cv2.putText(preview, f"{status}: {seconds - elapsed:.1f} s  ({len(ratios)} frames)",
+                        (20, 80), cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2, cv2.LINE_AA)
+            cv2.imshow(WINDOW_TITLE, preview)
+            cv2.waitKey(1)
+
+    return ratios
+
+
+def calibrate(cap, hands, headless=False, min_frames=CALIBRATION_MIN_FRAMES):
+    """
+    Measure a user's pointing and pinch poses and compute pinch thresholds.
+
+    Parameters:
+        cap: FrameGrabber or cv2.VideoCapture (already opened)
+        hands (HandTracker): MediaPipe hand tracker
+        headless (bool): Prompt on the console only
+        min_frames (int): Minimum frames with a hand per pose
+
+    Returns:
+        dict: Calibration entry (see compute_thresholds)
+
+    Raises:
+        RuntimeError: If a pose had too few frames with a hand
+        ValueError: If the two poses could not be told apart
+    """
+    recorded = {}
+    for name, prompt in CALIBRATION_POSES:
+        ratios = record_pose(cap, hands, prompt, headless)
+        if len(ratios) < min_frames:
+            raise RuntimeError(f"Only {len(ratios)} frames with a hand in the {name} pose "
+                               f"(need {min_frames}); keep the hand in view")
+        recorded[name] = ratios
+        print(f"[CALIBRATION] ✓ {name}: {len(ratios)} frames, "
+              f"median {np.median(ratios):.2f} palm lengths")
+
+    entry = compute_thresholds(recorded["pointing"], recorded["pinch"])
+    print(f"[CALIBRATION] ✓ Pinch thresholds: {entry['enter']:.2f}-{entry['release']:.2f} palm lengths")
+    return entry
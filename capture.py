@@ -0,0 +1,350 @@
+# ============================================================================
+# CAPTURE.PY - Threaded Frame Capture Module
+# ============================================================================
+# This module decouples frame acquisition from hand inference. A producer
+# thread reads frames from a camera (or a recorded video file) as fast as the
+# device delivers them and keeps ONLY the newest one in a single-slot buffer.
+# The processing loop therefore always works on the freshest image instead of
+# draining a backlog of stale frames from the camera driver.
+#
+# Frames are read into a small set of reused buffers (CAPTURE_BUFFERS, triple
+# buffering by default) instead of a newly allocated array per frame.
+# ============================================================================
+
+# Import required libraries
+import collections  # Recently delivered buffers
+import threading  # Producer thread and slot synchronization
+import time  # Timestamps and video-file pacing
+import cv2  # OpenCV for video capture
+from config import *  # Import all configuration constants
+
+# ============================================================================
+# CAPTURE SOURCE HELPERS
+# ============================================================================
+
+def is_file_source(source):
+    """
+    Check whether a capture source refers to a recorded video file.
+
+    Parameters:
+        source (int or str): Camera index or path to a video file
+
+    Returns:
+        bool: True for a video file path, False for a camera index
+
+    Example:
+        >>> is_file_source(0)
+        False
+        >>> is_file_source("hand_demo.mp4")
+        True
+    """
+    # Camera indices may also arrive as strings from the command line ("0")
+    return isinstance(source, str) and not source.isdigit()
+
+
+def open_capture(source):
+    """
+    Open a cv2.VideoCapture for a camera index or a video file.
+
+    Cameras are configured with the resolution and FPS from config.py.
+    Video files are opened as-is (their resolution cannot be changed).
+
+    Parameters:
+        source (int or str): Camera index or path to a video file
+
+    Returns:
+        cv2.VideoCapture: The opened capture object (check isOpened())
+    """
+    # Video files are opened directly by path
+    if is_file_source(source):
+        return cv2.VideoCapture(source)
+
+    # Camera index (accept "0", "1", ... from the command line as well)
+    cap = cv2.VideoCapture(int(source))
+
+    # Request camera resolution and frame rate
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, CAMERA_WIDTH)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, CAMERA_HEIGHT)
+    cap.set(cv2.CAP_PROP_FPS, TARGET_FPS)
+
+    # Keep the driver queue as short as possible (not supported by every backend)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+    return cap
+
+
+# ============================================================================
+# THREADED FRAME GRABBER
+# ============================================================================
+
+class FrameGrabber:
+    """
+    Background frame reader with a latest-wins single-slot buffer.
+
+    A producer thread calls cap.read() in a loop and stores each frame in a
+    single slot, overwriting any frame the consumer has not picked up yet.
+    Overwritten frames are counted as dropped. The consumer calls read() and
+    always receives the newest frame available.
+
+    For video files two behaviours are supported:
+    - realtime=True: frames are paced at the file's FPS and dropped like a
+      live camera would drop them (simulates a webcam for benchmarking)
+    - realtime=False: lossless hand-off, the producer waits until the
+      consumer took the previous frame (process every frame at max speed)
+
+    Frames are read into buffer_count reused buffers. A frame returned by
+    read() stays valid until buffer_count - 2 further frames have been read
+    (1 with triple buffering: the frame being processed is never written).
+
+    Attributes:
+        frames_captured (int): Frames successfully read from the source
+        frames_delivered (int): Frames handed to the consumer
+        frames_dropped (int): Frames overwritten before being consumed
+        frame_width (int): Width of the captured frames in pixels
+        frame_height (int): Height of the captured frames in pixels
+        source_fps (float): FPS reported by the source (0 if unknown)
+        buffer_allocations (int): Frame arrays allocated by cap.read()
+    """
+
+    def __init__(self, source=CAMERA_INDEX, realtime=True, buffer_count=CAPTURE_BUFFERS):
+        """
+        Open the capture source (the producer thread starts with start()).
+
+        Parameters:
+            source (int or str): Camera index or path to a video file
+            realtime (bool): Pace video files at their native FPS and drop
+                frames like a camera (ignored for cameras, always realtime)
+            buffer_count (int): Reused frame buffers (at least 3; more keep
+                delivered frames valid longer, e.g. for pipelined stages;
+                0 = allocate a new array per frame)
+        """
+        # Remember the source and open it
+        self.source = source
+        self.is_file = is_file_source(source)
+        self.cap = open_capture(source)
+
+        # Cameras always run in realtime, files only when requested
+        self.realtime = realtime or not self.is_file
+
+        # Query source properties (cameras may not honour the requested values)
+        self.frame_width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        self.frame_height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        self.source_fps = self.cap.get(cv2.CAP_PROP_FPS) or 0.0
+
+        # Single-slot buffer shared between producer and consumer
+        self._condition = threading.Condition()
+        self._frame = None  # Newest frame not yet consumed
+        self._frame_time = 0.0  # perf_counter() timestamp of that frame
+        self._finished = False  # True when the source is exhausted or failed
+        self._running = False  # Producer loop flag
+
+        # Reused frame buffers: one being filled, one published in the slot,
+        # and the most recently delivered ones (still used by the consumer)
+        self._buffers = [None] * (max(buffer_count, 3) if buffer_count else 0)
+        self._frame_index = None  # Buffer index of the published frame
+        self._delivered = collections.deque(maxlen=max(len(self._buffers) - 2, 1))
+        self._last_index = -1
+        self.buffer_allocations = 0
+
+        # Statistics counters
+        self.frames_captured = 0
+        self.frames_delivered = 0
+        self.frames_dropped = 0
+
+        self._thread = None
+
+    def isOpened(self):
+        """
+        Check whether the underlying capture source was opened successfully.
+
+        Returns:
+            bool: True if frames can be read from the source
+        """
+        return self.cap.isOpened()
+
+    def start(self):
+        """
+        Start the producer thread.
+
+        Returns:
+            FrameGrabber: self, to allow grabber = FrameGrabber(0).start()
+        """
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._producer_loop,
+            name="FrameGrabber",
+            daemon=True  # Never keep the interpreter alive on exit
+        )
+        self._thread.start()
+        return self
+
+    def _producer_loop(self):
+        """
+        Producer thread body: read frames and publish them to the slot.
+        """
+        # Interval between frames when pacing a video file
+        frame_interval = 1.0 / self.source_fps if self.source_fps > 0 else 0.0
+        next_frame_time = time.perf_counter()
+
+        while self._running:
+            # Pace recorded video like a live camera would deliver it
+            if self.is_file and self.realtime and frame_interval:
+                delay = next_frame_time - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                next_frame_time += frame_interval
+
+            # Read the next frame into a free buffer
+            # (blocks for cameras until one is available)
+            index = self._free_buffer()
+            if index is None:
+                ret, frame = self.cap.read()
+                self.buffer_allocations += 1
+            else:
+                buffer = self._buffers[index]
+                ret, frame = self.cap.read(buffer)
+                if ret and frame is not buffer:
+                    # First frame or resolution change: OpenCV allocated it
+                    self._buffers[index] = frame
+                    self.buffer_allocations += 1
+            if not ret:
+                break
+
+            capture_time = time.perf_counter()
+            self.frames_captured += 1
+
+            with self._condition:
+                # Lossless mode: wait until the consumer took the last frame
+                if not self.realtime:
+                    while self._frame is not None and self._running:
+                        self._condition.wait()
+
+                # Latest wins: an unconsumed frame is overwritten and dropped
+                if self._frame is not None:
+                    self.frames_dropped += 1
+
+                self._frame = frame
+                self._frame_index = index
+                self._frame_time = capture_time
+                self._condition.notify_all()
+
+        # Signal the consumer that no more frames will arrive
+        with self._condition:
+            self._finished = True
+            self._condition.notify_all()
+
+    def _free_buffer(self):
+        """
+        Pick the next buffer that is neither published nor still in use.
+
+        Returns:
+            int or None: Buffer index (None when buffering is disabled)
+        """
+        if not self._buffers:
+            return None
+
+        with self._condition:
+            busy = set(self._delivered)
+            if self._frame is not None:
+                busy.add(self._frame_index)
+
+            # Round-robin over the buffers, skipping busy ones
+            for step in range(1, len(self._buffers) + 1):
+                index = (self._last_index + step) % len(self._buffers)
+                if index not in busy:
+                    self._last_index = index
+                    return index
+
+        # Unreachable with at least len(delivered) + 2 buffers
+        return None
+
+    def read(self, timeout=None):
+        """
+        Return the newest captured frame, waiting for one if necessary.
+
+        Mirrors cv2.VideoCapture.read() so it can replace it in the main loop.
+
+        Parameters:
+            timeout (float): Maximum seconds to wait for a new frame
+                             (None = until a frame arrives or the source ends)
+
+        Returns:
+            tuple: (ret, frame) where ret is False when the source ended,
+                   failed, was released or no frame arrived within the timeout
+        """
+        ret, frame, _ = self.read_with_timestamp(timeout)
+        return ret, frame
+
+    def read_with_timestamp(self, timeout=None):
+        """
+        Return the newest frame together with its capture timestamp.
+
+        Like a blocking cv2.VideoCapture.read(), a live source that stalls
+        (a USB camera re-negotiating, a long exposure change) is waited for
+        by default instead of being reported as failed.
+
+        Parameters:
+            timeout (float): Maximum seconds to wait for a new frame
+                             (None = until a frame arrives or the source ends)
+
+        Returns:
+            tuple: (ret, frame, capture_time) with capture_time taken from
+                   time.perf_counter() right after the frame was read
+        """
+        with self._condition:
+            # Wait until a new frame is published, the source is finished or
+            # release() was called
+            self._condition.wait_for(
+                lambda: self._frame is not None or self._finished or not self._running,
+                timeout
+            )
+
+            # No new frame: source ended, released or timed out
+            if self._frame is None:
+                return False, None, 0.0
+
+            # Take ownership of the frame and empty the slot
+            frame, capture_time = self._frame, self._frame_time
+            self._frame = None
+            self.frames_delivered += 1
+
+            # Protect its buffer until enough newer frames were delivered
+            if self._frame_index is not None:
+                self._delivered.append(self._frame_index)
+
+            # Wake the producer if it waits in lossless mode
+            self._condition.notify_all()
+
+        return True, frame, capture_time
+
+    def get_stats(self):
+        """
+        Return the capture statistics as a dictionary.
+
+        Returns:
+            dict: captured, delivered and dropped frame counts, drop rate and
+                  the number of frame arrays allocated
+        """
+        captured = self.frames_captured
+        return {
+            "captured": captured,
+            "delivered": self.frames_delivered,
+            "dropped": self.frames_dropped,
+            "drop_rate": self.frames_dropped / captured if captured else 0.0,
+            "allocations": self.buffer_allocations,
+        }
+
+    def release(self):
+        """
+        Stop the producer thread and release the capture source.
+        """
+        # Stop the producer and wake it if it waits for the consumer
+        self._running = False
+        with self._condition:
+            self._condition.notify_all()
+
+        # Wait for the producer to exit before releasing the device
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+
+        self.cap.release()
@@ -13,41 +13,54 @@ import warnings  # Warning control for suppressing unnecessary messages
 import logging  # Logging framework for error handling
 
 # ============================================================================
-# SUPPRESS WARNINGS AND LOGGING
+# STARTUP API
 # ============================================================================
-# TensorFlow and MediaPipe generate many info/warning messages that clutter
-# the console. We suppress these to provide clean output for users.
+# Importing this module only defines constants: no output, no environment
+# changes. The application calls configure_environment() and
+# print_summary() from gesture_controller.init(); tools and tests that only
+# need the constants skip both.
 
-print("\n[CONFIG] Suppressing TensorFlow and MediaPipe warnings...")
+_environment_configured = False
 
-# Set TensorFlow logging level to ERROR only (suppresses INFO and WARNING)
-# Level 3 = ERROR, 2 = WARNING, 1 = INFO, 0 = DEBUG
-os.environ['TF_CPP_MIN_LOG_LEVEL'] = '3'
 
-# Disable oneDNN custom operations to prevent optimization warnings
-os.environ['TF_ENABLE_ONEDNN_OPTS'] = '0'
+def configure_environment():
+    """
+    Silence TensorFlow and MediaPipe log output and warnings.
 
-# Filter out UserWarning from google.protobuf module
-# This prevents deprecation warnings from protobuf library
-warnings.filterwarnings('ignore', category=UserWarning, module='google.protobuf')
+    Must run before mediapipe is imported (the TF_* variables are read when
+    its native library loads); hand_tracker.load_mediapipe() calls it.
+    Repeated calls do nothing.
+    """
+    global _environment_configured
+    if _environment_configured:
+        return
+    _environment_configured = True
 
-# Filter out all DeprecationWarning messages
-warnings.filterwarnings('ignore', category=DeprecationWarning)
+    # Set TensorFlow logging level to ERROR only (suppresses INFO and WARNING)
+    # Level 3 = ERROR, 2 = WARNING, 1 = INFO, 0 = DEBUG
+    os.environ.setdefault('TF_CPP_MIN_LOG_LEVEL', '3')
 
-# Configure logging levels for TensorFlow and MediaPipe
-# Only ERROR level messages will be shown
-logging.getLogger('tensorflow').setLevel(logging.ERROR)
-logging.getLogger('mediapipe').setLevel(logging.ERROR)
+    # Disable oneDNN custom operations to prevent optimization warnings
+    os.environ.setdefault('TF_ENABLE_ONEDNN_OPTS', '0')
+
+    # Filter out UserWarning from google.protobuf module
+    # This prevents deprecation warnings from protobuf library
+    warnings.filterwarnings('ignore', category=UserWarning, module='google.protobuf')
+
+    # Filter out all DeprecationWarning messages
+    warnings.filterwarnings('ignore', category=DeprecationWarning)
+
+    # Configure logging levels for TensorFlow and MediaPipe
+    # Only ERROR level messages will be shown
+    logging.getLogger('tensorflow').setLevel(logging.ERROR)
+    logging.getLogger('mediapipe').setLevel(logging.ERROR)
 
-print("[CONFIG] ✓ Warnings suppressed successfully")
 
 # ============================================================================
 # VIDEO CAPTURE CONFIGURATION
 # ============================================================================
 # Settings for webcam video capture and processing
 
-print("\n[CONFIG] Loading video capture settings...")
-
 # Camera resolution settings
 CAMERA_WIDTH = 1280  # Horizontal resolution in pixels
 CAMERA_HEIGHT = 720  # Vertical resolution in pixels
@@ -59,16 +72,46 @@ TARGET_FPS = 60  # Request 60 FPS from camera (actual FPS may vary by hardware)
 # Camera device index
 CAMERA_INDEX = 0  # 0 = default/built-in camera, 1 = first external camera, etc.
 
-print(f"[CONFIG] ✓ Camera resolution: {CAMERA_WIDTH}x{CAMERA_HEIGHT}")
-print(f"[CONFIG] ✓ Target FPS: {TARGET_FPS}")
+# Optional recorded video file used instead of the camera (None = use camera)
+# Useful for benchmarking on machines without a webcam
+VIDEO_SOURCE = None  # e.g. "recordings/hand_demo.mp4"
+
+# Threaded capture: read frames on a background thread, keep only the newest
+# False = read synchronously in the main loop (original behaviour)
+THREADED_CAPTURE = True
+
+# Frame buffers the capture thread reads into and reuses (3 = triple
+# buffering: one being filled, one waiting, one being processed)
+# 0 = allocate a new array for every frame
+CAPTURE_BUFFERS = 3
+
+# Fold the preview mirror into the landmark coordinates: MediaPipe processes
+# the frame as captured and landmark x is mirrored instead (x -> 1 - x), so
+# no flipped copy is made for inference (and none at all in headless mode)
+MIRROR_LANDMARKS = True
+
+# ============================================================================
+# PIPELINE CONFIGURATION
+# ============================================================================
+# Settings for pipelined execution (capture, inference, gesture logic and
+# rendering on separate workers connected by bounded queues)
+
+# Pipelined execution: overlap rendering and mouse control with inference
+# False = run every step one after another in the main loop
+PIPELINE_MODE = False
+
+# Capacity of each queue between pipeline stages
+# Small queues keep latency low (frames never wait long between stages)
+PIPELINE_QUEUE_SIZE = 2
+
+# Seconds between per-stage throughput reports printed to the console
+PIPELINE_REPORT_INTERVAL = 5.0
 
 # ============================================================================
 # MEDIAPIPE HAND TRACKING CONFIGURATION
 # ============================================================================
 # Settings for MediaPipe hand landmark detection
 
-print("\n[CONFIG] Loading MediaPipe settings...")
-
 # Detection confidence threshold (0.0 to 1.0)
 # Higher values = more accurate but may miss some hands
 MIN_DETECTION_CONFIDENCE = 0.8  # 80% confidence required for initial hand detection
@@ -87,18 +130,134 @@ MODEL_COMPLEXITY = 1  # Use full model for better accuracy
 # Static image mode: False = video stream (optimized for continuous frames)
 STATIC_IMAGE_MODE = False  # Optimized for real-time video processing
 
-print(f"[CONFIG] ✓ Detection confidence: {MIN_DETECTION_CONFIDENCE}")
-print(f"[CONFIG] ✓ Tracking confidence: {MIN_TRACKING_CONFIDENCE}")
-print(f"[CONFIG] ✓ Max hands to track: {MAX_NUM_HANDS}")
-print(f"[CONFIG] ✓ Model complexity: {MODEL_COMPLEXITY}")
+# ============================================================================
+# STARTUP CONFIGURATION
+# ============================================================================
+# Settings for getting from program start to the first cursor move quickly
+# (startup.py)
+
+# Open the camera and build the MediaPipe graph at the same time
+# False = one after the other (original behaviour)
+STARTUP_CONCURRENT = True
+
+# Inferences on a synthetic frame while the camera opens: the first
+# hands.process() calls initialize the graph and are much slower than the
+# following ones (0 = no warm-up)
+WARMUP_FRAMES = 2
+
+# ============================================================================
+# INFERENCE RESOLUTION CONFIGURATION
+# ============================================================================
+# MediaPipe can run on a smaller copy of the frame (hand_tracker.py).
+# Display, drawing and cursor mapping always stay at full resolution:
+# landmarks are re-projected into full-frame coordinates.
+
+# Scale of the image sent to MediaPipe (1.0 = full resolution)
+INFERENCE_SCALE = 1.0  # e.g. 0.5 = 640x360 for a 1280x720 camera
+
+# Optional fixed crop sent to MediaPipe, as frame fractions (x1, y1, x2, y2)
+# None = whole frame. The control area only uses the middle 60% of the frame,
+# so a crop slightly larger than it still sees every usable hand position
+INFERENCE_CROP = None  # e.g. (0.1, 0.1, 0.9, 0.9)
+
+# Automatic scale: step through INFERENCE_SCALES to keep inference within
+# the frame budget of INFERENCE_TARGET_FPS (overrides INFERENCE_SCALE)
+INFERENCE_AUTO_SCALE = False
+INFERENCE_TARGET_FPS = 30
+INFERENCE_SCALES = (1.0, 0.75, 0.5, 0.35)
+
+# Frames between automatic scale decisions
+INFERENCE_ADAPT_INTERVAL = 30
+
+# Hand-ROI tracking: once a hand is found, send MediaPipe only a square crop
+# around where the hand is predicted to be in the next frame, resized to a
+# fixed ROI_CROP_SIZE. Falls back to the full frame when the hand is lost
+ROI_TRACKING = False
+
+# Padding added on every side of the hand bounding box (fraction of its size)
+ROI_PADDING = 0.35
+
+# Smallest crop side in frame pixels (keeps small/distant hands in context)
+ROI_MIN_SIZE = 200
+
+# Side of the fixed-size square image the crop is resized to
+ROI_CROP_SIZE = 256
+
+# Minimum handedness score to keep tracking in the crop
+# (below it, the frame is processed again at full size)
+ROI_MIN_CONFIDENCE = 0.8
+
+# ============================================================================
+# QUALITY GOVERNOR CONFIGURATION
+# ============================================================================
+# The governor (governor.py) keeps the hand-detection time within a budget
+# by stepping through quality levels: full model at full resolution down
+# to the lite model at half resolution with lower confidences
+
+# Enable the governor (replaces INFERENCE_AUTO_SCALE, which only changes
+# the scale and uses the mean instead of a percentile)
+GOVERNOR_ENABLED = False
+
+# Budget for the detection-time percentile, in milliseconds
+GOVERNOR_BUDGET_MS = 1000.0 / INFERENCE_TARGET_FPS
+
+# Percentile of the window compared with the budget
+GOVERNOR_PERCENTILE = 95
+
+# Frames per decision (measured at the current level only)
+GOVERNOR_WINDOW = 60
+
+# Seconds at a level before a better one is tried (doubles, up to 8x,
+# every time an upgrade has to be undone)
+GOVERNOR_HOLD_SECONDS = 3.0
+
+# A better level is tried only while its predicted percentile (from the
+# measured cost ratio of the two levels) is below this fraction of the budget
+GOVERNOR_UPGRADE_MARGIN = 0.85
+
+# Quality levels, best first: runtime settings (runtime_config.py) of each
+GOVERNOR_LEVELS = (
+    {"model_complexity": MODEL_COMPLEXITY, "inference_scale": INFERENCE_SCALE,
+     "min_detection_confidence": MIN_DETECTION_CONFIDENCE,
+     "min_tracking_confidence": MIN_TRACKING_CONFIDENCE},
+    {"model_complexity": 1, "inference_scale": 0.75,
+     "min_detection_confidence": 0.8, "min_tracking_confidence": 0.8},
+    {"model_complexity": 0, "inference_scale": 0.75,
+     "min_detection_confidence": 0.7, "min_tracking_confidence": 0.6},
+    {"model_complexity": 0, "inference_scale": 0.5,
+     "min_detection_confidence": 0.6, "min_tracking_confidence": 0.5},
+)
+
+# ============================================================================
+# FRAME SKIPPING CONFIGURATION
+# ============================================================================
+# Frames on which the hand barely moved can skip MediaPipe; they reuse the
+# last inferred landmarks, or extrapolate them with FRAME_SKIP_EXTRAPOLATE
+# (frame_skip.py)
+
+# Inference runs at least every FRAME_SKIP frames (1 = every frame, off)
+FRAME_SKIP = 1  # e.g. 4-8 on slow CPUs (benchmarks/bench_frame_skip.py)
+
+# Motion energy (percent of pixels that changed visibly since the last
+# inferred frame) above which a frame is inferred even within FRAME_SKIP
+# (100 = never: a fixed interval)
+FRAME_SKIP_MOTION_THRESHOLD = 0.5
+
+# Pixel step of the thumbnail the motion energy is computed on
+# (8 = 160x90 pixels of a 1280x720 frame)
+FRAME_SKIP_STRIDE = 8
+
+# Skipped frames: extrapolate the landmarks at constant velocity
+# (False = repeat the last inferred landmarks). With the motion trigger a
+# skipped frame shows a still hand, and extrapolating overshoots where the
+# hand stopped; it pays off with a fixed interval.
+FRAME_SKIP_EXTRAPOLATE = False
 
 # ============================================================================
 # CURSOR CONTROL CONFIGURATION
 # ============================================================================
 # Settings for cursor movement and coordinate mapping
 
-print("\n[CONFIG] Loading cursor control settings...")
-
 # Smoothing factor for cursor movement (1-20)
 # Higher values = smoother but slower cursor movement
 # Lower values = faster but jerkier cursor movement
@@ -117,22 +276,92 @@ PYAUTOGUI_PAUSE = 0.001  # 1 millisecond pause
 # Disable PyAutoGUI failsafe (moving mouse to corner won't stop program)
 PYAUTOGUI_FAILSAFE = False
 
-print(f"[CONFIG] ✓ Cursor smoothing factor: {SMOOTHING_FACTOR}")
-print(f"[CONFIG] ✓ Active control area: {CONTROL_AREA_START:.0%} to {CONTROL_AREA_END:.0%}")
+# ============================================================================
+# CURSOR FILTER CONFIGURATION
+# ============================================================================
+# Filter applied to the fingertip position before the cursor moves
+# (cursor_filters.py)
+
+# Cursor filter:
+#   "lerp"     - original fixed smoothing with SMOOTHING_FACTOR
+#   "one_euro" - smoothing that adapts to hand speed: steady when still,
+#                little lag when moving fast, but about 2.4x the jitter of
+#                lerp during movement (benchmarks/bench_filters.py)
+#   "kalman"   - constant-velocity prediction, extrapolates ahead in time
+CURSOR_FILTER = "lerp"
+
+# One Euro filter
+ONE_EURO_MIN_CUTOFF = 0.3   # Cutoff at rest in Hz (lower = steadier when still)
+ONE_EURO_BETA = 0.005       # Cutoff increase per px/s (higher = less lag when fast)
+ONE_EURO_D_CUTOFF = 1.0     # Cutoff of the speed estimate in Hz
+
+# Kalman filter
+KALMAN_PROCESS_NOISE = 1e5      # Acceleration noise (px^2/s^3, higher = more agile)
+KALMAN_MEASUREMENT_NOISE = 100  # Fingertip position variance (px^2, higher = smoother)
+KALMAN_PREDICTION = 0.03        # Look-ahead in seconds (about the capture-to-cursor latency)
+
+# Filter state is reset when no hand was seen for this many seconds,
+# so the cursor jumps to a new hand instead of sliding to it
+CURSOR_FILTER_RESET = 0.5
+
+# ============================================================================
+# MOUSE OUTPUT CONFIGURATION
+# ============================================================================
+# Settings for how mouse events reach the operating system (mouse_output.py)
+
+# Output backend:
+#   "pyautogui" - cross-platform (default)
+#   "xlib"      - X11 XTest extension directly (requires python-xlib)
+#   "uinput"    - Linux virtual input device (requires evdev and /dev/uinput access)
+#   "null"      - discard all events (benchmarks, dry runs)
+MOUSE_BACKEND = "pyautogui"
+
+# Dispatcher thread: the vision loop only queues events; a background thread
+# injects them, so OS injection latency never blocks frame processing
+# False = call the backend directly from the vision loop (original behaviour)
+MOUSE_DISPATCHER = True
+
+# Maximum cursor moves injected per second (display refresh rate)
+# Moves arriving faster are coalesced: only the newest position is sent
+MOUSE_MAX_RATE_HZ = 60
+
+# Screen size for the uinput backend, which cannot query the display
+UINPUT_SCREEN_SIZE = (1920, 1080)
+
+# Move the cursor from its own thread at the display refresh rate,
+# interpolating between the positions of processed frames
+# (cursor_interpolator.py); False = one move per processed frame
+# Use it with CURSOR_OUTPUT_DELAY = 0 (extrapolation); the delayed
+# interpolate mode is not recommended (see CURSOR_OUTPUT_DELAY)
+# Always runs on the dispatcher thread, even with MOUSE_DISPATCHER = False
+CURSOR_INTERPOLATION = False
+
+# Cursor moves per second sent by the interpolator (about the display rate)
+CURSOR_OUTPUT_RATE_HZ = 144
+
+# Seconds the interpolated cursor runs behind the newest hand position
+# 0 = extrapolate along the hand's movement (no added lag, recommended)
+# about 1 / FPS = interpolate between known positions (smoothest steps, but
+# not recommended: the added frame of lag makes the cursor error larger than
+# one move per frame, 65 px vs 42 px mean in benchmarks/bench_interpolator.py)
+CURSOR_OUTPUT_DELAY = 0.0
+
+# Longest time a position is extrapolated past the newest frame (seconds)
+CURSOR_MAX_EXTRAPOLATION = 0.05
 
 # ============================================================================
 # GESTURE DETECTION CONFIGURATION
 # ============================================================================
 # Thresholds and parameters for gesture recognition
 
-print("\n[CONFIG] Loading gesture detection settings...")
-
 # Click threshold: maximum distance (in pixels) between fingers for pinch detection
 # When thumb and index/middle finger are closer than this, it's considered a pinch
+# (used with GESTURE_THRESHOLD_UNITS = "pixels", see CLICK_THRESHOLD_RATIO)
 CLICK_THRESHOLD = 40  # 40 pixels - adjust based on camera distance and resolution
 
 # Scroll threshold: minimum vertical movement (in pixels) to trigger scroll
 # Hand must move this many pixels up/down before scroll activates
+# (used with GESTURE_THRESHOLD_UNITS = "pixels", see SCROLL_THRESHOLD_RATIO)
 SCROLL_THRESHOLD = 30  # 30 pixels of vertical movement required
 
 # Click cooldown period (in seconds)
@@ -143,30 +372,116 @@ CLICK_COOLDOWN = 0.3  # 300 milliseconds between clicks
 # Maximum time between two clicks to be considered a double-click (future feature)
 DOUBLE_CLICK_TIME = 0.5  # 500 milliseconds
 
-print(f"[CONFIG] ✓ Click threshold: {CLICK_THRESHOLD} pixels")
-print(f"[CONFIG] ✓ Scroll threshold: {SCROLL_THRESHOLD} pixels")
-print(f"[CONFIG] ✓ Click cooldown: {CLICK_COOLDOWN} seconds")
+# ============================================================================
+# GESTURE STATE MACHINE CONFIGURATION
+# ============================================================================
+# Hysteresis and dwell settings of the gesture state machine (gesture_state.py)
+
+# Pinch release threshold (pixels): a pinch starts below CLICK_THRESHOLD and
+# ends only above this distance, so landmark noise around the threshold
+# cannot toggle it
+CLICK_RELEASE_THRESHOLD = 55
+
+# Consecutive frames a gesture must be seen before it starts (debouncing)
+GESTURE_ENTER_FRAMES = 2
+
+# Consecutive frames a gesture must be gone before it ends
+GESTURE_EXIT_FRAMES = 2
+
+# Frames a left pinch must be held after its click before it becomes a drag
+DRAG_HOLD_FRAMES = 8  # About 0.25 s at 30 FPS
+
+# Scrolling ends when fewer than this many fingers are extended
+# (it starts with all 5 extended)
+SCROLL_EXIT_FINGERS = 4
+
+# ============================================================================
+# HAND-SCALE THRESHOLD CONFIGURATION
+# ============================================================================
+# Pixel thresholds depend on camera resolution and on how far the hand is
+# from the camera: a hand at the back of the room is small in the image, a
+# hand close to a 1080p camera is large. With palm units the pinch and
+# scroll thresholds are fractions of the hand's palm length (wrist to
+# middle finger knuckle, measured every frame), so they scale with the hand.
+
+# Threshold units:
+#   "palm"   - CLICK_THRESHOLD_RATIO etc. times the palm length
+#   "pixels" - CLICK_THRESHOLD, CLICK_RELEASE_THRESHOLD and SCROLL_THRESHOLD
+#              as absolute pixels (original behaviour)
+GESTURE_THRESHOLD_UNITS = "palm"
+
+# Palm-relative pinch start / release and scroll step distances
+# (the defaults match the pixel values for a palm of about 150 pixels,
+# a hand at arm's length in a 1280x720 frame)
+CLICK_THRESHOLD_RATIO = 0.26
+CLICK_RELEASE_RATIO = 0.36
+SCROLL_THRESHOLD_RATIO = 0.20
+
+# Weight of the newest palm length in its running average (0-1); the palm
+# length is smoothed because its own landmark noise would otherwise make
+# the thresholds jitter
+PALM_SCALE_SMOOTHING = 0.2
+
+# ============================================================================
+# CALIBRATION CONFIGURATION
+# ============================================================================
+# Per-user pinch thresholds measured by calibration.py (--calibrate) and
+# cached on disk, so a user calibrates once instead of every session
+
+# Calibration cache file (JSON, one entry per user)
+CALIBRATION_FILE = os.path.join(os.path.expanduser("~"), ".virtual_mouse", "calibration.json")
+
+# User whose calibration is loaded at startup (--user)
+CALIBRATION_USER = "default"
+
+# Seconds each calibration pose (pointing, pinching) is recorded
+CALIBRATION_SECONDS = 3.0
+
+# Seconds at the start of each pose that are not recorded (time to move
+# the fingers into the pose)
+CALIBRATION_SETTLE_SECONDS = 1.0
+
+# Minimum hand frames per pose for a valid calibration
+CALIBRATION_MIN_FRAMES = 20
+
+# The calibrated pinch start threshold sits just above the user's pinch:
+# the pinch median plus CALIBRATION_NOISE_SIGMAS standard deviations of the
+# pinch samples, and at least CALIBRATION_MIN_MARGIN palm lengths, but
+# never above CLICK_THRESHOLD_RATIO. The release threshold keeps the
+# default hysteresis band above it
+# (CLICK_RELEASE_RATIO - CLICK_THRESHOLD_RATIO). Thresholds further towards
+# the pointing pose turn near misses into clicks.
+CALIBRATION_NOISE_SIGMAS = 3.0
+CALIBRATION_MIN_MARGIN = 0.08
 
 # ============================================================================
 # PERFORMANCE MONITORING CONFIGURATION
 # ============================================================================
 # Settings for FPS tracking and performance monitoring
 
-print("\n[CONFIG] Loading performance monitoring settings...")
-
 # Number of frames to keep in FPS history for averaging
 # Larger buffer = smoother FPS display but slower to react to changes
 FPS_HISTORY_SIZE = 30  # Average FPS over last 30 frames
 
-print(f"[CONFIG] ✓ FPS averaging window: {FPS_HISTORY_SIZE} frames")
+# Samples kept per profiled stage (capture, inference, gesture, ...)
+# p50/p95/p99 are computed over this many most recent frames
+PROFILE_WINDOW = 300
+
+# Show the per-stage latency table in the preview (toggle with 'P')
+PROFILE_HUD = False
+
+# Seconds between refreshes of the latency table in the HUD
+PROFILE_HUD_REFRESH = 0.5
+
+# JSON file the latency summary and samples are written to at exit
+# None = do not export
+PROFILE_EXPORT = None  # e.g. "profile.json"
 
 # ============================================================================
 # USER INTERFACE CONFIGURATION
 # ============================================================================
 # Settings for visual feedback and on-screen display
 
-print("\n[CONFIG] Loading UI settings...")
-
 # Info panel dimensions
 INFO_PANEL_HEIGHT = 120  # Height of top info panel in pixels
 
@@ -189,21 +504,19 @@ COLOR_BLACK = (0, 0, 0)        # Backgrounds, overlays
 LANDMARK_CIRCLE_RADIUS = 12    # Radius of finger tip circles
 CONNECTION_LINE_THICKNESS = 2  # Thickness of lines between fingers
 
-print("[CONFIG] ✓ UI color scheme loaded")
-print("[CONFIG] ✓ Font settings configured")
+# Maximum number of pre-rendered static text tiles kept in memory
+# (help lines, shortcuts, indicators are rendered once and reused)
+TEXT_CACHE_SIZE = 64
 
 # ============================================================================
 # KEYBOARD SHORTCUTS CONFIGURATION
 # ============================================================================
 # Keyboard control keys for the application
 
-print("\n[CONFIG] Loading keyboard shortcuts...")
-
 # Key codes for application control
 KEY_QUIT = ord('q')     # Press 'q' to quit application
 KEY_HELP = ord('h')     # Press 'h' to toggle help overlay
-
-print("[CONFIG] ✓ Keyboard shortcuts: 'Q' to quit, 'H' for help")
+KEY_PROFILE = ord('p')  # Press 'p' to toggle the latency profile overlay
 
 # ============================================================================
 # HAND LANDMARK INDICES
@@ -211,7 +524,12 @@ print("[CONFIG] ✓ Keyboard shortcuts: 'Q' to quit, 'H' for help")
 # MediaPipe hand landmark point indices (21 total landmarks)
 # These constants make code more readable than using numbers
 
-print("\n[CONFIG] Loading hand landmark indices...")
+# Total number of landmarks MediaPipe reports per hand
+NUM_LANDMARKS = 21
+
+# Palm landmarks (used to measure hand size)
+WRIST = 0              # Landmark index for the wrist
+MIDDLE_MCP = 9         # Middle finger metacarpophalangeal (knuckle) joint
 
 # Finger tip landmarks
 THUMB_TIP = 4          # Landmark index for thumb tip
@@ -231,8 +549,6 @@ PINKY_PIP = 18         # Pinky finger PIP joint
 FINGER_TIPS = [INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP]  # All finger tips except thumb
 FINGER_PIPS = [INDEX_PIP, MIDDLE_PIP, RING_PIP, PINKY_PIP]  # Corresponding PIP joints
 
-print("[CONFIG] ✓ Hand landmark indices configured")
-
 # ============================================================================
 # GESTURE MODE CONSTANTS
 # ============================================================================
@@ -245,8 +561,6 @@ MODE_RIGHT_CLICK = "RIGHT CLICK" # Right mouse button click mode
 MODE_SCROLL = "SCROLL"           # Scroll wheel mode
 MODE_DRAG = "DRAG"               # Drag and drop mode
 
-print("[CONFIG] ✓ Gesture modes defined")
-
 # ============================================================================
 # WINDOW CONFIGURATION
 # ============================================================================
@@ -255,32 +569,178 @@ print("[CONFIG] ✓ Gesture modes defined")
 # Window title
 WINDOW_TITLE = "Gesture Mouse Control - Enhanced"
 
-print(f"[CONFIG] ✓ Window title: {WINDOW_TITLE}")
+# ============================================================================
+# HEADLESS MODE CONFIGURATION
+# ============================================================================
+# Settings for running without a preview window (e.g. on kiosks)
+
+# Headless mode: skip all overlay drawing, the preview window and waitKey
+# Quit/help commands then come from signals or the control socket
+HEADLESS_MODE = False
+
+# UDP port on 127.0.0.1 that accepts "quit" and "help" commands
+# None = no control socket (signals still work: SIGINT/SIGTERM quit, SIGUSR1 help)
+CONTROL_PORT = None  # e.g. 8765
+
+# ============================================================================
+# RUNTIME SETTINGS CONFIGURATION
+# ============================================================================
+# Live-tunable settings (runtime_config.py): cursor smoothing and control
+# area, gesture thresholds, model complexity, confidences and inference
+# scale can be changed in a JSON file while the application runs
+
+# JSON file of settings to override, re-read when it changes or on the
+# "reload" command (SIGHUP or the control socket); None = no hot reload
+RUNTIME_CONFIG_FILE = None  # e.g. "~/.virtual_mouse/settings.json"
+
+# Seconds between checks of the file's modification time
+RUNTIME_CONFIG_POLL_INTERVAL = 1.0
+
+# ============================================================================
+# LANDMARK RECORDING CONFIGURATION
+# ============================================================================
+# Settings for recording landmark streams that replay.py can feed back into
+# the gesture logic without a webcam or MediaPipe
+
+# File that every frame's timestamp and hand landmarks are appended to
+# None = do not record
+RECORD_PATH = None  # e.g. "recordings/session.vmlm"
+
+# ============================================================================
+# MULTI-SESSION CONFIGURATION
+# ============================================================================
+# Settings for serving several cameras / users from one machine
+# (multi_session.py: one process with its own MediaPipe per source)
+
+# Mouse backend of every session
+# "null" discards events (throughput tests); "uinput" gives every session
+# its own virtual input device
+MULTI_SESSION_BACKEND = "null"
+
+# Pin session i to CPU core i (modulo the available cores), so the
+# MediaPipe instances do not migrate between cores and compete for caches
+MULTI_SESSION_PIN_CORES = True
+
+# OpenCV worker threads per session process (1 = one core per session;
+# OpenCV's own thread pool would otherwise spread every session over all cores)
+MULTI_SESSION_OPENCV_THREADS = 1
+
+# Seconds to wait at the common start for the other sessions to finish
+# loading, and for a session process to report its results after its
+# source ended
+MULTI_SESSION_TIMEOUT = 30.0
 
 # ============================================================================
 # CONFIGURATION VALIDATION
 # ============================================================================
 # Validate configuration values are within acceptable ranges
 
-print("\n[CONFIG] Validating configuration values...")
+def validate():
+    """
+    Check the configuration values.
+
+    Returns:
+        list: Warning messages (empty if every value is valid)
+    """
+    problems = []
+
+    # Validate smoothing factor
+    if SMOOTHING_FACTOR < 1 or SMOOTHING_FACTOR > 20:
+        problems.append(f"SMOOTHING_FACTOR ({SMOOTHING_FACTOR}) outside recommended range (1-20)")
+
+    # Validate confidence thresholds
+    if not (0.0 <= MIN_DETECTION_CONFIDENCE <= 1.0):
+        problems.append(f"MIN_DETECTION_CONFIDENCE ({MIN_DETECTION_CONFIDENCE}) must be 0.0-1.0")
+    if not (0.0 <= MIN_TRACKING_CONFIDENCE <= 1.0):
+        problems.append(f"MIN_TRACKING_CONFIDENCE ({MIN_TRACKING_CONFIDENCE}) must be 0.0-1.0")
+
+    # Validate control area
+    if not (0.0 <= CONTROL_AREA_START < CONTROL_AREA_END <= 1.0):
+        problems.append(f"Invalid control area: {CONTROL_AREA_START}-{CONTROL_AREA_END}")
+
+    # Validate inference resolution
+    if not (0.0 < INFERENCE_SCALE <= 1.0):
+        problems.append(f"INFERENCE_SCALE ({INFERENCE_SCALE}) must be in (0.0, 1.0]")
+    if FRAME_SKIP < 1 or FRAME_SKIP_STRIDE < 1:
+        problems.append(f"FRAME_SKIP ({FRAME_SKIP}) and FRAME_SKIP_STRIDE ({FRAME_SKIP_STRIDE}) "
+                        "must be at least 1")
+    if INFERENCE_CROP is not None and not (0.0 <= INFERENCE_CROP[0] < INFERENCE_CROP[2] <= 1.0
+                                           and 0.0 <= INFERENCE_CROP[1] < INFERENCE_CROP[3] <= 1.0):
+        problems.append(f"Invalid inference crop: {INFERENCE_CROP}")
+    if GOVERNOR_ENABLED and INFERENCE_AUTO_SCALE:
+        problems.append("GOVERNOR_ENABLED and INFERENCE_AUTO_SCALE both set: "
+                        "the automatic scale ignores the governor's inference_scale")
+    if not (0 < GOVERNOR_UPGRADE_MARGIN < 1):
+        problems.append(f"GOVERNOR_UPGRADE_MARGIN ({GOVERNOR_UPGRADE_MARGIN}) must be in (0, 1)")
+    if RUNTIME_CONFIG_POLL_INTERVAL <= 0:
+        problems.append(f"RUNTIME_CONFIG_POLL_INTERVAL ({RUNTIME_CONFIG_POLL_INTERVAL}) must be positive")
+    if WARMUP_FRAMES < 0:
+        problems.append(f"WARMUP_FRAMES ({WARMUP_FRAMES}) must not be negative")
+
+    # Validate gesture hysteresis
+    if CLICK_RELEASE_THRESHOLD < CLICK_THRESHOLD:
+        problems.append(f"CLICK_RELEASE_THRESHOLD ({CLICK_RELEASE_THRESHOLD}) "
+                        f"below CLICK_THRESHOLD ({CLICK_THRESHOLD})")
+    if GESTURE_ENTER_FRAMES < 1 or GESTURE_EXIT_FRAMES < 1:
+        problems.append("GESTURE_ENTER_FRAMES and GESTURE_EXIT_FRAMES must be at least 1")
+
+    # Validate hand-scale thresholds and calibration
+    if GESTURE_THRESHOLD_UNITS not in ("palm", "pixels"):
+        problems.append(f"Unknown GESTURE_THRESHOLD_UNITS '{GESTURE_THRESHOLD_UNITS}' (palm, pixels)")
+    if CLICK_RELEASE_RATIO < CLICK_THRESHOLD_RATIO:
+        problems.append(f"CLICK_RELEASE_RATIO ({CLICK_RELEASE_RATIO}) "
+                        f"below CLICK_THRESHOLD_RATIO ({CLICK_THRESHOLD_RATIO})")
+    if not (0.0 < PALM_SCALE_SMOOTHING <= 1.0):
+        problems.append(f"PALM_SCALE_SMOOTHING ({PALM_SCALE_SMOOTHING}) must be in (0.0, 1.0]")
+    if CALIBRATION_NOISE_SIGMAS < 0 or CALIBRATION_MIN_MARGIN <= 0:
+        problems.append("CALIBRATION_NOISE_SIGMAS must not be negative and "
+                        "CALIBRATION_MIN_MARGIN must be positive")
+    if CALIBRATION_SETTLE_SECONDS >= CALIBRATION_SECONDS:
+        problems.append("CALIBRATION_SETTLE_SECONDS leaves no time to record a pose")
+
+    # Validate cursor filter
+    if CURSOR_FILTER not in ("lerp", "one_euro", "kalman"):
+        problems.append(f"Unknown CURSOR_FILTER '{CURSOR_FILTER}' (lerp, one_euro, kalman)")
+    if ONE_EURO_MIN_CUTOFF <= 0 or ONE_EURO_D_CUTOFF <= 0:
+        problems.append("One Euro cutoff frequencies must be positive")
+
+    return problems
+
+
+def print_summary():
+    """
+    Print the main settings and any validation warnings (application startup).
+    """
+    print("\n[CONFIG] Configuration:")
+    print(f"[CONFIG] ✓ Camera: {CAMERA_WIDTH}x{CAMERA_HEIGHT} at {TARGET_FPS} FPS, "
+          f"threaded capture: {THREADED_CAPTURE}, pipeline: {PIPELINE_MODE}")
+    print(f"[CONFIG] ✓ MediaPipe: model complexity {MODEL_COMPLEXITY}, confidence "
+          f"{MIN_DETECTION_CONFIDENCE}/{MIN_TRACKING_CONFIDENCE}, max hands {MAX_NUM_HANDS}")
+    print(f"[CONFIG] ✓ Inference scale: {'auto' if INFERENCE_AUTO_SCALE else INFERENCE_SCALE}, "
+          f"hand-ROI tracking: {ROI_TRACKING}")
+    if FRAME_SKIP > 1:
+        print(f"[CONFIG] ✓ Frame skipping: inference at least every {FRAME_SKIP} frames, "
+              f"motion threshold {FRAME_SKIP_MOTION_THRESHOLD}, "
+              f"{'extrapolated' if FRAME_SKIP_EXTRAPOLATE else 'held'} landmarks in between")
+    print(f"[CONFIG] ✓ Cursor filter: {CURSOR_FILTER}, control area "
+          f"{CONTROL_AREA_START:.0%}-{CONTROL_AREA_END:.0%}")
+    print(f"[CONFIG] ✓ Mouse: {MOUSE_BACKEND} backend, dispatcher: {MOUSE_DISPATCHER} "
+          f"(max {MOUSE_MAX_RATE_HZ} moves/s), interpolation: {CURSOR_INTERPOLATION}")
+    if GESTURE_THRESHOLD_UNITS == "palm":
+        print(f"[CONFIG] ✓ Pinch hysteresis: {CLICK_THRESHOLD_RATIO}-{CLICK_RELEASE_RATIO} palm lengths")
+    else:
+        print(f"[CONFIG] ✓ Pinch hysteresis: {CLICK_THRESHOLD}-{CLICK_RELEASE_THRESHOLD} pixels")
+    print(f"[CONFIG] ✓ Gesture dwell: {GESTURE_ENTER_FRAMES} frames in, "
+          f"{GESTURE_EXIT_FRAMES} frames out, click cooldown {CLICK_COOLDOWN} s")
+
+    for problem in validate():
+        print(f"[CONFIG] ⚠ WARNING: {problem}")
 
-# Validate smoothing factor
-if SMOOTHING_FACTOR < 1 or SMOOTHING_FACTOR > 20:
-    print(f"[CONFIG] ⚠ WARNING: SMOOTHING_FACTOR ({SMOOTHING_FACTOR}) outside recommended range (1-20)")
-else:
-    print(f"[CONFIG] ✓ Smoothing factor valid: {SMOOTHING_FACTOR}")
 
-# Validate confidence thresholds
-if not (0.0 <= MIN_DETECTION_CONFIDENCE <= 1.0):
-    print(f"[CONFIG] ⚠ WARNING: MIN_DETECTION_CONFIDENCE ({MIN_DETECTION_CONFIDENCE}) must be 0.0-1.0")
-if not (0.0 <= MIN_TRACKING_CONFIDENCE <= 1.0):
-    print(f"[CONFIG] ⚠ WARNING: MIN_TRACKING_CONFIDENCE ({MIN_TRACKING_CONFIDENCE}) must be 0.0-1.0")
-
-# Validate control area
-if not (0.0 <= CONTROL_AREA_START < CONTROL_AREA_END <= 1.0):
-    print(f"[CONFIG] ⚠ WARNING: Invalid control area: {CONTROL_AREA_START}-{CONTROL_AREA_END}")
-else:
-    print(f"[CONFIG] ✓ Control area valid: {CONTROL_AREA_START:.0%}-{CONTROL_AREA_END:.0%}")
+# ============================================================================
+# EXPORTS
+# ============================================================================
+# "from config import *" only brings in the settings (upper-case names),
+# not os/warnings/logging or the startup functions
 
-print("\n[CONFIG] ✓ Configuration module loaded successfully")
-print("=" * 70)
\ No newline at end of file
+__all__ = [name for name in dir() if name.isupper()]
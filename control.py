@@ -0,0 +1,160 @@
+# ============================================================================
+# CONTROL.PY - Runtime Control Commands
+# ============================================================================
+# In headless mode there is no preview window, so cv2.waitKey() cannot be
+# used to quit or toggle help. This module collects control commands from
+# POSIX signals and from an optional localhost UDP control socket and hands
+# them to the main loop through a thread-safe queue.
+#
+# Signals:
+#   SIGINT / SIGTERM  -> "quit"
+#   SIGUSR1           -> "help"   (POSIX only)
+#   SIGUSR2           -> "profile" (POSIX only, prints per-stage latency)
+#   SIGHUP            -> "reload"  (POSIX only, re-reads RUNTIME_CONFIG_FILE)
+#
+# Control socket (when CONTROL_PORT is set):
+#   echo quit | nc -u -w1 127.0.0.1 <CONTROL_PORT>
+# ============================================================================
+
+# Import required libraries
+import queue  # Thread-safe command queue
+import signal  # POSIX signal handlers
+import socket  # UDP control socket
+import threading  # Socket listener thread
+from config import *  # Import all configuration constants
+
+# Commands understood by the main loop
+COMMAND_QUIT = "quit"
+COMMAND_HELP = "help"
+COMMAND_PROFILE = "profile"
+COMMAND_RELOAD = "reload"
+KNOWN_COMMANDS = (COMMAND_QUIT, COMMAND_HELP, COMMAND_PROFILE, COMMAND_RELOAD)
+
+
+# ============================================================================
+# CONTROL CHANNEL
+# ============================================================================
+
+class ControlChannel:
+    """
+    Collects control commands from signals and a UDP socket.
+
+    The main loop calls poll() once per frame; it never blocks.
+
+    Example:
+        control = ControlChannel(port=CONTROL_PORT).start()
+        while True:
+            command = control.poll()
+            if command == COMMAND_QUIT:
+                break
+        control.close()
+    """
+
+    def __init__(self, port=CONTROL_PORT, handle_signals=True):
+        """
+        Create the channel (signal handlers and socket start with start()).
+
+        Parameters:
+            port (int or None): UDP port on 127.0.0.1 to listen on
+                                (None = no control socket)
+            handle_signals (bool): Install SIGINT/SIGTERM/SIGUSR1/SIGUSR2/SIGHUP handlers
+        """
+        self.port = port
+        self.handle_signals = handle_signals
+        self._commands = queue.Queue()
+        self._socket = None
+        self._thread = None
+        self._previous_handlers = {}
+
+    def start(self):
+        """
+        Install signal handlers and open the control socket.
+
+        Returns:
+            ControlChannel: self
+        """
+        # Signal handlers can only be installed from the main thread
+        if self.handle_signals and threading.current_thread() is threading.main_thread():
+            self._install_signal(signal.SIGINT, COMMAND_QUIT)
+            self._install_signal(signal.SIGTERM, COMMAND_QUIT)
+            # SIGUSR1/SIGUSR2 do not exist on Windows
+            if hasattr(signal, "SIGUSR1"):
+                self._install_signal(signal.SIGUSR1, COMMAND_HELP)
+            if hasattr(signal, "SIGUSR2"):
+                self._install_signal(signal.SIGUSR2, COMMAND_PROFILE)
+            if hasattr(signal, "SIGHUP"):
+                self._install_signal(signal.SIGHUP, COMMAND_RELOAD)
+
+        # Optional UDP control socket bound to localhost only
+        if self.port is not None:
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self._socket.bind(("127.0.0.1", self.port))
+            self._socket.settimeout(0.5)  # Lets the listener notice close()
+            self._thread = threading.Thread(
+                target=self._listen, name="ControlSocket", daemon=True
+            )
+            self._thread.start()
+            print(f"[CONTROL] ✓ Listening for commands on udp://127.0.0.1:{self.port}")
+
+        return self
+
+    def _install_signal(self, signum, command):
+        """
+        Map a signal to a command, remembering the previous handler.
+        """
+        self._previous_handlers[signum] = signal.signal(
+            signum, lambda *_: self.send(command)
+        )
+
+    def _listen(self):
+        """
+        Socket listener thread body: one command per datagram.
+        """
+        while self._socket is not None:
+            try:
+                data, _ = self._socket.recvfrom(64)
+            except socket.timeout:
+                continue
+            except OSError:
+                break  # Socket closed
+
+            command = data.decode("utf-8", "ignore").strip().lower()
+            if command in KNOWN_COMMANDS:
+                self.send(command)
+            else:
+                print(f"[CONTROL] ⚠ Unknown command ignored: {command!r}")
+
+    def send(self, command):
+        """
+        Queue a command for the main loop (safe from any thread or signal).
+
+        Parameters:
+            command (str): One of KNOWN_COMMANDS
+        """
+        self._commands.put(command)
+
+    def poll(self):
+        """
+        Return the next pending command without blocking.
+
+        Returns:
+            str or None: The next command, or None if nothing is pending
+        """
+        try:
+            return self._commands.get_nowait()
+        except queue.Empty:
+            return None
+
+    def close(self):
+        """
+        Restore the previous signal handlers and close the control socket.
+        """
+        for signum, handler in self._previous_handlers.items():
+            signal.signal(signum, handler)
+        self._previous_handlers = {}
+
+        if self._socket is not None:
+            sock, self._socket = self._socket, None
+            sock.close()
+            if self._thread is not None:
+                self._thread.join(timeout=1.0)
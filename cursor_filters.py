@@ -0,0 +1,283 @@
+# ============================================================================
+# CURSOR_FILTERS.PY - Cursor Smoothing and Prediction Filters
+# ============================================================================
+# The raw index fingertip position jitters by a few pixels every frame, so
+# the cursor is filtered before it is moved. This module provides the
+# filters the gesture logic can use (selected with CURSOR_FILTER):
+#
+#   lerp      - the original fixed exponential smoothing:
+#               new = old + (target - old) / SMOOTHING_FACTOR
+#               Same lag for slow and fast movements.
+#   one_euro  - One Euro filter: a low-pass filter whose cutoff frequency
+#               rises with the hand speed. Slow movements are smoothed
+#               strongly (no jitter), fast movements pass with little lag.
+#   kalman    - Constant-velocity Kalman filter per axis. Estimates position
+#               and velocity and extrapolates KALMAN_PREDICTION seconds
+#               ahead, to where the finger will be when the cursor moves.
+#
+# Every filter works in screen pixels with timestamps in seconds:
+#   cursor_filter = create_filter("one_euro")
+#   x, y = cursor_filter.update(screen_x, screen_y, timestamp)
+# ============================================================================
+
+# Import required libraries
+import math  # Scalar math (faster than NumPy for two values)
+from config import *  # Import all configuration constants
+
+# Time step used when two updates carry the same timestamp
+DEFAULT_DT = 1.0 / 30.0
+
+
+# ============================================================================
+# BASE CLASS
+# ============================================================================
+
+class CursorFilter:
+    """
+    Base class of all cursor filters.
+
+    Subclasses implement update() and reset().
+    """
+
+    name = "base"
+
+    def update(self, x, y, timestamp):
+        """
+        Filter one measured cursor position.
+
+        Parameters:
+            x (float): Measured X screen position in pixels
+            y (float): Measured Y screen position in pixels
+            timestamp (float): Time of the measurement in seconds
+
+        Returns:
+            tuple: (x, y) filtered screen position
+        """
+        return x, y
+
+    def reset(self):
+        """Forget the filter state (e.g. when replaying from the start)."""
+
+
+# ============================================================================
+# FIXED EXPONENTIAL SMOOTHING (ORIGINAL BEHAVIOR)
+# ============================================================================
+
+class LerpFilter(CursorFilter):
+    """
+    Moves 1/factor of the way to the measurement every update.
+
+    Starts at (0, 0) like the original gesture logic, so replays of old
+    recordings produce the same cursor positions.
+    """
+
+    name = "lerp"
+
+    def __init__(self, factor=SMOOTHING_FACTOR):
+        """
+        Parameters:
+            factor (float): Smoothing factor (1 = no smoothing)
+        """
+        self.factor = factor
+        self.reset()
+
+    def update(self, x, y, timestamp):
+        # Formula: new = old + (target - old) / smoothing_factor
+        self.x += (x - self.x) / self.factor
+        self.y += (y - self.y) / self.factor
+        return self.x, self.y
+
+    def reset(self):
+        self.x = 0.0
+        self.y = 0.0
+
+
+# ============================================================================
+# ONE EURO FILTER
+# ============================================================================
+
+def smoothing_alpha(cutoff, dt):
+    """
+    Weight of a new sample for a first-order low-pass filter.
+
+    Parameters:
+        cutoff (float): Cutoff frequency in Hz
+        dt (float): Time since the previous sample in seconds
+
+    Returns:
+        float: Alpha in (0, 1]
+    """
+    tau = 1.0 / (2.0 * math.pi * cutoff)
+    return 1.0 / (1.0 + tau / dt)
+
+
+class OneEuroFilter(CursorFilter):
+    """
+    Speed-adaptive low-pass filter (Casiez et al., CHI 2012).
+
+    cutoff = min_cutoff + beta * |speed|, per axis: a still hand is
+    filtered at min_cutoff Hz, a fast hand at a much higher cutoff.
+    """
+
+    name = "one_euro"
+
+    def __init__(self, min_cutoff=ONE_EURO_MIN_CUTOFF, beta=ONE_EURO_BETA,
+                 d_cutoff=ONE_EURO_D_CUTOFF):
+        """
+        Parameters:
+            min_cutoff (float): Cutoff frequency at rest in Hz (lower = less jitter)
+            beta (float): Cutoff increase per pixel/second of speed (higher = less lag)
+            d_cutoff (float): Cutoff frequency of the speed estimate in Hz
+        """
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset()
+
+    def update(self, x, y, timestamp):
+        # First sample (or after a long gap): start at the measurement
+        if self.last_time is None or timestamp - self.last_time > CURSOR_FILTER_RESET:
+            self.x, self.y = x, y
+            self.dx = self.dy = 0.0
+            self.last_time = timestamp
+            return x, y
+
+        dt = timestamp - self.last_time
+        if dt <= 0:
+            dt = DEFAULT_DT
+        self.last_time = timestamp
+
+        # Smoothed speed per axis (pixels per second)
+        alpha_d = smoothing_alpha(self.d_cutoff, dt)
+        self.dx += alpha_d * ((x - self.x) / dt - self.dx)
+        self.dy += alpha_d * ((y - self.y) / dt - self.dy)
+
+        # Position low-pass with a speed-dependent cutoff
+        self.x += smoothing_alpha(self.min_cutoff + self.beta * abs(self.dx), dt) * (x - self.x)
+        self.y += smoothing_alpha(self.min_cutoff + self.beta * abs(self.dy), dt) * (y - self.y)
+        return self.x, self.y
+
+    def reset(self):
+        self.x = self.y = 0.0
+        self.dx = self.dy = 0.0
+        self.last_time = None
+
+
+# ============================================================================
+# CONSTANT-VELOCITY KALMAN FILTER
+# ============================================================================
+
+class KalmanFilter(CursorFilter):
+    """
+    Constant-velocity Kalman filter per axis with look-ahead prediction.
+
+    State per axis: position p and velocity v, with covariance
+    [[P00, P01], [P01, P11]]. Velocity changes are modeled as white-noise
+    acceleration of strength process_noise; measurements have variance
+    measurement_noise. The output is the filtered position extrapolated by
+    prediction seconds (p + v * prediction), compensating the time until
+    the cursor is actually drawn.
+    """
+
+    name = "kalman"
+
+    def __init__(self, process_noise=KALMAN_PROCESS_NOISE,
+                 measurement_noise=KALMAN_MEASUREMENT_NOISE, prediction=KALMAN_PREDICTION):
+        """
+        Parameters:
+            process_noise (float): Acceleration noise density (pixels^2/s^3);
+                                   higher = follows direction changes faster
+            measurement_noise (float): Measurement variance (pixels^2);
+                                       higher = smoother
+            prediction (float): Look-ahead in seconds (0 = no extrapolation)
+        """
+        self.process_noise = process_noise
+        self.measurement_noise = measurement_noise
+        self.prediction = prediction
+        self.reset()
+
+    def _update_axis(self, state, measurement, dt):
+        """
+        Predict one axis forward by dt and correct it with a measurement.
+
+        Parameters:
+            state (list): [p, v, P00, P01, P11] (updated in-place)
+            measurement (float): Measured position in pixels
+            dt (float): Time step in seconds
+
+        Returns:
+            float: Filtered position extrapolated by self.prediction
+        """
+        p, v, p00, p01, p11 = state
+        q = self.process_noise
+
+        # Predict: x = F x, P = F P F' + Q (F = [[1, dt], [0, 1]])
+        p += v * dt
+        p00 += dt * (2 * p01 + dt * p11) + q * dt ** 3 / 3
+        p01 += dt * p11 + q * dt ** 2 / 2
+        p11 += q * dt
+
+        # Correct with the position measurement (H = [1, 0])
+        s = p00 + self.measurement_noise
+        k0, k1 = p00 / s, p01 / s
+        residual = measurement - p
+        p += k0 * residual
+        v += k1 * residual
+        p11 -= k1 * p01
+        p01 -= k0 * p01
+        p00 -= k0 * p00
+
+        state[:] = (p, v, p00, p01, p11)
+        return p + v * self.prediction
+
+    def update(self, x, y, timestamp):
+        # First sample (or after a long gap): start at rest at the measurement
+        if self.last_time is None or timestamp - self.last_time > CURSOR_FILTER_RESET:
+            variance = self.measurement_noise
+            self.state_x = [x, 0.0, variance, 0.0, variance * 100]
+            self.state_y = [y, 0.0, variance, 0.0, variance * 100]
+            self.last_time = timestamp
+            return x, y
+
+        dt = timestamp - self.last_time
+        if dt <= 0:
+            dt = DEFAULT_DT
+        self.last_time = timestamp
+
+        return (self._update_axis(self.state_x, x, dt),
+                self._update_axis(self.state_y, y, dt))
+
+    def reset(self):
+        self.state_x = None
+        self.state_y = None
+        self.last_time = None
+
+
+# ============================================================================
+# FILTER FACTORY
+# ============================================================================
+
+# Filter classes by CURSOR_FILTER name
+FILTERS = {
+    LerpFilter.name: LerpFilter,
+    OneEuroFilter.name: OneEuroFilter,
+    KalmanFilter.name: KalmanFilter,
+}
+
+
+def create_filter(name=CURSOR_FILTER):
+    """
+    Create a cursor filter with its configured parameters.
+
+    Parameters:
+        name (str): One of FILTERS ("lerp", "one_euro", "kalman")
+
+    Returns:
+        CursorFilter: New filter instance
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    if name not in FILTERS:
+        raise ValueError(f"Unknown cursor filter '{name}' (choose from {', '.join(FILTERS)})")
+    return FILTERS[name]()
@@ -0,0 +1,267 @@
+# ============================================================================
+# CURSOR_INTERPOLATOR.PY - Display-Rate Cursor Output
+# ============================================================================
+# The gesture logic produces one cursor position per processed camera frame
+# (20-30 per second). On a 60-144 Hz display the pointer visibly jumps
+# between those positions. CursorInterpolator sits between the gesture logic
+# and the mouse (MouseDispatcher or backend) and moves the cursor from its
+# own thread at CURSOR_OUTPUT_RATE_HZ:
+#
+#   - between two frames the cursor moves along the line through the last
+#     two filtered positions (extrapolated at their velocity for at most
+#     CURSOR_MAX_EXTRAPOLATION seconds)
+#   - with CURSOR_OUTPUT_DELAY > 0 the output runs that far behind and
+#     interpolates between known positions instead (smoother, more lag)
+#   - when a new position arrives that differs from the extrapolation, the
+#     difference is blended out over one frame interval instead of jumping
+#
+# Clicks, button presses/releases and scrolls are passed through in order;
+# before each of them except scrolls the cursor is moved to the latest
+# position from the hand, so clicks land and drags start and end where the
+# user pointed.
+#
+# Every event is sent with the lock held, so a move computed by the output
+# thread can never reach the mouse after a newer snap or click. The wrapped
+# mouse must therefore not block: CURSOR_INTERPOLATION always runs on a
+# MouseDispatcher (gesture_controller.py starts one even with
+# MOUSE_DISPATCHER off).
+# ============================================================================
+
+# Import required libraries
+import threading  # Output thread
+import time  # Output timing
+from config import *  # Import all configuration constants
+
+# Smallest cursor change (pixels) that is sent as a move
+MIN_MOVE_PIXELS = 0.5
+
+
+# ============================================================================
+# CURSOR INTERPOLATOR
+# ============================================================================
+
+class CursorInterpolator:
+    """
+    Sends interpolated cursor moves at a fixed rate from a background thread.
+
+    Has the same methods as a mouse backend: move_to() only stores the new
+    target position, click/right_click/scroll/mouse_down/mouse_up are
+    forwarded.
+
+    Example:
+        mouse = CursorInterpolator(MouseDispatcher(backend).start()).start()
+        mouse.move_to(100, 200)   # New position from the gesture logic
+        mouse.close()             # Stops the thread (not the wrapped mouse)
+    """
+
+    def __init__(self, mouse, rate_hz=CURSOR_OUTPUT_RATE_HZ, delay=CURSOR_OUTPUT_DELAY,
+                 max_extrapolation=CURSOR_MAX_EXTRAPOLATION):
+        """
+        Create the interpolator (the thread starts with start()).
+
+        Parameters:
+            mouse: MouseDispatcher or backend that performs the events
+            rate_hz (float): Cursor moves per second
+            delay (float): Seconds the output runs behind the newest
+                           position (0 = extrapolate, about one frame
+                           interval = interpolate)
+            max_extrapolation (float): Longest time in seconds a position is
+                                       extrapolated past the newest sample
+        """
+        self.mouse = mouse
+        self.interval = 1.0 / rate_hz
+        self.delay = delay
+        self.max_extrapolation = max_extrapolation
+
+        self._lock = threading.Lock()
+        self._running = False
+        self._thread = None
+        self.frame = None  # Frame tag passed on with the output moves
+
+        # Last two positions from the gesture logic: (time, x, y)
+        self._previous = None
+        self._latest = None
+
+        # Correction blended out after a new position arrived
+        self._offset = (0.0, 0.0)
+        self._offset_time = 0.0
+        self._blend_time = 0.0
+
+        # Last position sent to the mouse
+        self._output = None
+
+        # Statistics
+        self.positions_received = 0
+        self.moves_sent = 0
+
+    def start(self):
+        """
+        Start the output thread.
+
+        Returns:
+            CursorInterpolator: self
+        """
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="CursorInterpolator", daemon=True)
+        self._thread.start()
+        return self
+
+    # ------------------------------------------------------------------------
+    # Mouse interface (called from the vision loop)
+    # ------------------------------------------------------------------------
+
+    def move_to(self, x, y):
+        now = time.perf_counter()
+        with self._lock:
+            # Where the output would have been without the new position
+            before = self._position_at(now) if self._latest is not None else None
+
+            self._previous, self._latest = self._latest, (now, float(x), float(y))
+            self.positions_received += 1
+
+            # Blend from the old path to the new one over one frame interval
+            # (a long pause, e.g. a new hand, moves to it directly)
+            if before is not None and now - self._previous[0] <= CURSOR_FILTER_RESET:
+                after = self._position_at(now, blend=False)
+                self._offset = (before[0] - after[0], before[1] - after[1])
+                self._offset_time = now
+                self._blend_time = now - self._previous[0]
+            else:
+                self._previous = None
+                self._offset = (0.0, 0.0)
+
+    def click(self):
+        with self._lock:
+            self._snap()
+            self.mouse.click()
+
+    def right_click(self):
+        with self._lock:
+            self._snap()
+            self.mouse.right_click()
+
+    def scroll(self, amount):
+        with self._lock:
+            self.mouse.scroll(amount)
+
+    def mouse_down(self):
+        with self._lock:
+            self._snap()
+            self.mouse.mouse_down()
+
+    def mouse_up(self):
+        with self._lock:
+            self._snap()
+            self.mouse.mouse_up()
+
+    def screen_size(self):
+        return self.mouse.screen_size()
+
+    def _snap(self):
+        """
+        Move the cursor to the newest position before a click or button
+        change (call with the lock held).
+        """
+        if self._latest is None:
+            return
+        _, x, y = self._latest
+        self._previous = None  # Hold there until the next position
+        self._offset = (0.0, 0.0)
+        self._output = (x, y)
+        self._send(x, y)
+
+    def _send(self, x, y):
+        """
+        Send one cursor move (call with the lock held).
+        """
+        self.mouse.frame = self.frame
+        self.mouse.move_to(x, y)
+        self.moves_sent += 1
+
+    # ------------------------------------------------------------------------
+    # Output thread
+    # ------------------------------------------------------------------------
+
+    def _position_at(self, now, blend=True):
+        """
+        Cursor position for the given time (call with the lock held).
+
+        Parameters:
+            now (float): perf_counter() time
+            blend (bool): Add the remaining correction offset
+
+        Returns:
+            tuple: (x, y) in screen pixels
+        """
+        t1, x1, y1 = self._latest
+        if self._previous is None:
+            x, y = x1, y1
+        else:
+            t0, x0, y0 = self._previous
+            # Position on the line through the last two samples at the
+            # output time, at most max_extrapolation past the newest one
+            target = min(now - self.delay, t1 + self.max_extrapolation)
+            progress = max((target - t0) / max(t1 - t0, 1e-6), 0.0)
+            x = x0 + (x1 - x0) * progress
+            y = y0 + (y1 - y0) * progress
+
+        if blend and self._blend_time > 0:
+            remaining = 1.0 - (now - self._offset_time) / self._blend_time
+            if remaining > 0:
+                x += self._offset[0] * remaining
+                y += self._offset[1] * remaining
+        return x, y
+
+    def _run(self):
+        """
+        Thread body: send the current position every interval.
+        """
+        next_time = time.perf_counter()
+        while self._running:
+            next_time += self.interval
+            delay = next_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_time = time.perf_counter()  # Fell behind: do not catch up
+
+            with self._lock:
+                if self._latest is None:
+                    continue
+                now = time.perf_counter()
+                # The hand is gone: hold the cursor where it is
+                if now - self._latest[0] > CURSOR_FILTER_RESET:
+                    continue
+                x, y = self._position_at(now)
+                if self._output is not None and (abs(x - self._output[0]) < MIN_MOVE_PIXELS
+                                                 and abs(y - self._output[1]) < MIN_MOVE_PIXELS):
+                    continue
+                self._output = (x, y)
+                self._send(x, y)
+
+    # ------------------------------------------------------------------------
+    # Shutdown and statistics
+    # ------------------------------------------------------------------------
+
+    def close(self, timeout=1.0):
+        """
+        Stop the output thread (the wrapped mouse stays open).
+
+        Parameters:
+            timeout (float): Seconds to wait for the thread
+        """
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: "positions_received", "moves_sent" and "moves_per_position"
+        """
+        return {
+            "positions_received": self.positions_received,
+            "moves_sent": self.moves_sent,
+            "moves_per_position": self.moves_sent / max(self.positions_received, 1),
+        }
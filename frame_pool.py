@@ -0,0 +1,62 @@
+# ============================================================================
+# FRAME_POOL.PY - Reusable Frame Buffers
+# ============================================================================
+# OpenCV functions accept a destination array (dst=...) and write into it
+# instead of allocating a new image. FramePool hands out a fixed set of
+# preallocated buffers in rotation, so steady-state frame processing does not
+# allocate full-size arrays at all.
+#
+# A buffer returned by get() stays untouched until <count> further get()
+# calls have been made, so count must cover every frame still in use (1 for
+# the sequential loop, more for pipelined stages).
+# ============================================================================
+
+# Import required libraries
+import numpy as np  # Buffer allocation
+
+# ============================================================================
+# FRAME POOL
+# ============================================================================
+
+class FramePool:
+    """
+    Fixed-size rotation of preallocated frame buffers.
+
+    Example:
+        pool = FramePool(count=1)
+        mirrored = cv2.flip(frame, 1, dst=pool.get(frame.shape))
+    """
+
+    def __init__(self, count=1):
+        """
+        Create an empty pool (buffers are allocated on first use).
+
+        Parameters:
+            count (int): Number of buffers in the rotation
+        """
+        self.count = max(1, count)
+        self._buffers = [None] * self.count
+        self._next = 0
+        self.allocations = 0  # Buffers allocated (stays at count in steady state)
+
+    def get(self, shape, dtype=np.uint8):
+        """
+        Get the next buffer in the rotation.
+
+        A buffer with a different shape or dtype (e.g. after a resolution
+        change) is reallocated.
+
+        Parameters:
+            shape (tuple): Required array shape, e.g. frame.shape
+            dtype: Required NumPy dtype
+
+        Returns:
+            numpy.ndarray: Buffer with undefined contents
+        """
+        buffer = self._buffers[self._next]
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype=dtype)
+            self._buffers[self._next] = buffer
+            self.allocations += 1
+        self._next = (self._next + 1) % self.count
+        return buffer
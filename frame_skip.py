@@ -0,0 +1,197 @@
+# ============================================================================
+# FRAME_SKIP.PY - Adaptive Frame Skipping with Landmark Extrapolation
+# ============================================================================
+# Every captured frame used to go through hands.process(), even while the
+# hand was nearly still. FrameSkipper decides per frame whether inference
+# is needed:
+#
+#   - at least every FRAME_SKIP frames (FRAME_SKIP = 1: every frame)
+#   - whenever the motion energy of the frame exceeds
+#     FRAME_SKIP_MOTION_THRESHOLD: the percentage of pixels of a strided
+#     thumbnail (every FRAME_SKIP_STRIDE-th pixel) that changed by more than
+#     MOTION_PIXEL_DELTA gray levels since the last inferred frame
+#
+# Counting changed pixels instead of averaging the difference keeps sensor
+# noise (a few gray levels on every pixel) from hiding a hand that covers
+# a few percent of the frame.
+#
+# Comparing with the last *inferred* frame (not the previous one) makes
+# slow drifts add up until they trigger an inference. On skipped frames the
+# last inferred landmarks are held, or extrapolated at constant velocity
+# from the last two inferred frames (FRAME_SKIP_EXTRAPOLATE). Holding is
+# the better choice with the motion trigger, as a skipped frame then shows
+# a hand that (nearly) stopped; extrapolation suits a fixed interval.
+#
+# The motion energy costs one subtraction over a few thousand pixels,
+# well under 1% of an inference.
+# ============================================================================
+
+# Import required libraries
+import numpy as np  # Thumbnails and landmark extrapolation
+from config import *  # Import all configuration constants
+
+# Change of a thumbnail pixel (gray levels) that counts as motion, well
+# above webcam sensor noise
+MOTION_PIXEL_DELTA = 24
+
+
+def motion_energy(thumbnail, reference, out):
+    """
+    Percentage of pixels that changed between two thumbnails.
+
+    Parameters:
+        thumbnail (numpy.ndarray): Strided view of the current frame (uint8)
+        reference (numpy.ndarray): Thumbnail of the last inferred frame
+        out (numpy.ndarray): int16 buffer of the same shape (reused)
+
+    Returns:
+        float: Percentage (0-100) of pixel values that differ by more than
+               MOTION_PIXEL_DELTA
+    """
+    np.subtract(thumbnail, reference, out=out, dtype=np.int16)
+    np.abs(out, out=out)
+    return 100.0 * np.count_nonzero(out > MOTION_PIXEL_DELTA) / out.size
+
+
+class FrameSkipper:
+    """
+    Decides which frames need inference and predicts landmarks for the rest.
+
+    Example:
+        skipper = FrameSkipper(max_skip=4)
+        if skipper.should_infer(frame):
+            points = run_inference(frame)  # (hands, 21, 3) array or None
+            skipper.observe(points)
+        else:
+            points = skipper.predict()
+    """
+
+    def __init__(self, max_skip=FRAME_SKIP, motion_threshold=FRAME_SKIP_MOTION_THRESHOLD,
+                 stride=FRAME_SKIP_STRIDE, extrapolate=FRAME_SKIP_EXTRAPOLATE):
+        """
+        Parameters:
+            max_skip (int): Inference runs at least every max_skip frames
+                            (1 = every frame)
+            motion_threshold (float or None): Motion energy (percent of
+                                              changed pixels) that forces
+                                              an inference
+                                              (None = fixed interval only)
+            stride (int): Pixel step of the motion thumbnail
+            extrapolate (bool): Extrapolate landmarks on skipped frames
+                                (False = repeat the last ones)
+        """
+        self.max_skip = max_skip
+        self.motion_threshold = motion_threshold
+        self.stride = stride
+        self.extrapolate = extrapolate
+
+        # Thumbnail of the last inferred frame and the difference buffer
+        self._reference = None
+        self._diff = None
+
+        # Statistics
+        self.inferred = 0
+        self.skipped = 0
+        self.motion_triggers = 0  # Inferences forced by motion energy
+        self.last_energy = 0.0
+
+        self.reset()
+
+    def reset(self):
+        """
+        Forget the tracked hand; the next frame is always inferred.
+        """
+        self._frame = 0  # Frames seen
+        self._since = 0  # Frames skipped since the last inference
+        self._history = []  # Last two (frame, landmarks or None) inferences
+        self._predicted = None  # Reused extrapolation buffer
+        self._reference = None
+
+    def should_infer(self, frame):
+        """
+        Decide whether a frame needs inference.
+
+        Parameters:
+            frame (numpy.ndarray): Frame as captured (BGR)
+
+        Returns:
+            bool: True to run inference (then call observe()), False to
+                  use predict()
+        """
+        self._frame += 1
+        thumbnail = frame[::self.stride, ::self.stride]
+
+        infer = (self.max_skip <= 1 or self._reference is None
+                 or self._reference.shape != thumbnail.shape
+                 or self._since >= self.max_skip - 1)
+        if not infer and self.motion_threshold is not None:
+            self.last_energy = motion_energy(thumbnail, self._reference, self._diff)
+            if self.last_energy > self.motion_threshold:
+                self.motion_triggers += 1
+                infer = True
+
+        if not infer:
+            self._since += 1
+            self.skipped += 1
+            return False
+
+        # Keep this frame's thumbnail as the motion reference
+        if self.max_skip > 1:
+            if self._reference is None or self._reference.shape != thumbnail.shape:
+                self._reference = np.empty(thumbnail.shape, dtype=np.uint8)
+                self._diff = np.empty(thumbnail.shape, dtype=np.int16)
+            np.copyto(self._reference, thumbnail)
+        self._since = 0
+        self.inferred += 1
+        return True
+
+    def observe(self, points):
+        """
+        Record the landmarks of an inferred frame.
+
+        Parameters:
+            points (numpy.ndarray or None): (hands, 21, 3) landmarks, None
+                                            if no hand was found
+        """
+        entry = (self._frame, None if points is None else np.array(points, dtype=np.float32))
+        self._history = [self._history[-1], entry] if self._history else [entry]
+
+    def predict(self):
+        """
+        Landmarks for a skipped frame.
+
+        Returns:
+            numpy.ndarray or None: (hands, 21, 3) landmarks (a reused
+                                   buffer), None if the last inference
+                                   found no hand
+        """
+        if not self._history or self._history[-1][1] is None:
+            return None
+        last_frame, last = self._history[-1]
+
+        if self._predicted is None or self._predicted.shape != last.shape:
+            self._predicted = np.empty_like(last)
+        np.copyto(self._predicted, last)
+
+        # Constant velocity from the last two inferences with the same hands
+        if self.extrapolate and len(self._history) == 2:
+            previous_frame, previous = self._history[0]
+            if previous is not None and previous.shape == last.shape:
+                velocity = (last - previous) / (last_frame - previous_frame)
+                self._predicted += velocity * (self._frame - last_frame)
+        return self._predicted
+
+    def get_stats(self):
+        """
+        Get skipping statistics.
+
+        Returns:
+            dict: inferred, skipped, motion_triggers and skip_ratio
+        """
+        total = self.inferred + self.skipped
+        return {
+            "inferred": self.inferred,
+            "skipped": self.skipped,
+            "motion_triggers": self.motion_triggers,
+            "skip_ratio": self.skipped / total if total else 0.0,
+        }
@@ -8,90 +8,664 @@
 
 # Import required libraries
 import cv2  # OpenCV for video capture and display
-import mediapipe as mp  # MediaPipe for hand tracking
-import pyautogui  # PyAutoGUI for mouse control
-import numpy as np  # NumPy for numerical operations
 import time  # Time module for FPS calculation and cooldowns
+import argparse  # Command-line options
+import contextlib  # Caller-owned hand tracker (main(tracker=...))
 
 # Import our custom modules
+import config  # Startup functions (configure_environment, print_summary)
 from config import *  # Import all configuration constants
 from gesture_utils import *  # Import all utility functions
+from capture import FrameGrabber, open_capture  # Threaded frame capture
+from gesture_logic import process_hand, hand_missing, release, default_session  # Gesture recognition and mouse actions
+from calibration import calibrate, load_calibration, save_calibration, apply_calibration  # Per-user pinch thresholds
+from pipeline import Pipeline  # Multi-stage pipelined execution
+from rendering import render_frame  # Preview overlays (skipped in headless mode)
+from control import ControlChannel, COMMAND_QUIT, COMMAND_HELP, COMMAND_PROFILE, COMMAND_RELOAD  # Signal/socket commands
+from landmark_recorder import LandmarkRecorder  # Landmark stream recording (--record)
+from mouse_output import create_backend, MouseDispatcher  # Mouse event injection
+from cursor_interpolator import CursorInterpolator  # Display-rate cursor output
+from hand_tracker import HandTracker  # MediaPipe at a reduced inference resolution
+from frame_pool import FramePool  # Reused frame buffers
+from profiling import profiler, now_ns, RollingFPS  # Per-stage latency and FPS
+import startup  # Concurrent camera/model startup
+from startup import startup_timer  # Time to first frame / first landmark
+from runtime_config import ConfigWatcher  # Hot reload of the live-tunable settings
+from governor import QualityGovernor  # Model / resolution levels within a frame-time budget
 
-# Print module initialization message
-print("\n[CONTROLLER] Initializing Gesture Controller module...")
+# ============================================================================
+# MOUSE OUTPUT
+# ============================================================================
+# Importing this module has no side effects: the mouse backend (pyautogui
+# by default, which connects to the display) is created by init(), which
+# main() calls on first use.
+
+# Backend that injects mouse events into the OS (see MOUSE_BACKEND)
+mouse_backend = None
+
+# Screen dimensions for coordinate mapping (queried by init())
+screen_width, screen_height = 0, 0
+
+# Object the gesture logic sends events to; main() replaces it with a
+# MouseDispatcher when MOUSE_DISPATCHER is enabled, wrapped in a
+# CursorInterpolator when CURSOR_INTERPOLATION is enabled
+mouse = None
 
 # ============================================================================
-# INITIALIZE MEDIAPIPE HAND TRACKING
+# GLOBAL STATE VARIABLES
 # ============================================================================
 
-print("\n[CONTROLLER] Setting up MediaPipe Hand Tracking...")
+# Cursor and gesture state live in gesture_logic.default_session (a
+# GestureSession; multi_session.py creates one per capture source).
+# Only that state is per session: the mouse, FPS counter, recorder,
+# settings watcher and governor below (and the mouse globals above) belong
+# to the single session main() runs in this process. multi_session.py does
+# not use them; each of its processes builds its own mouse and tracker.
+
+# Performance monitoring variables
+fps_counter = RollingFPS(FPS_HISTORY_SIZE)  # Frame timestamps of the last frames
+show_profile = PROFILE_HUD  # Latency table shown in the preview ('P' toggles)
+profile_lines = []  # Latency table text, refreshed every PROFILE_HUD_REFRESH s
+profile_refresh_time = 0.0  # When profile_lines was last refreshed
+
+# Landmark recorder (created by main() when recording is enabled)
+recorder = None
+
+# Settings file watcher (created by main() when a settings file is given)
+config_watcher = None
 
-# Access MediaPipe's hands solution
-# This provides pre-trained models for hand landmark detection
-mp_hands = mp.solutions.hands
-print("[CONTROLLER] ✓ MediaPipe hands solution loaded")
+# Quality governor (created by main() when enabled)
+governor = None
 
-# Access MediaPipe's drawing utilities
-# This helps us draw hand landmarks and connections on the video frame
-mp_drawing = mp.solutions.drawing_utils
-print("[CONTROLLER] ✓ MediaPipe drawing utilities loaded")
 
 # ============================================================================
-# CONFIGURE PYAUTOGUI
+# INITIALIZATION
 # ============================================================================
 
-print("\n[CONTROLLER] Configuring PyAutoGUI for mouse control...")
+def init(backend=None):
+    """
+    Prepare the application: quiet the ML libraries, report the
+    configuration and open the mouse backend.
+
+    main() calls this when it was not called before; embedders and
+    benchmarks call it first to pass their own backend.
+
+    Parameters:
+        backend: Mouse backend (mouse_output.py) to use
+                 (None = create_backend(MOUSE_BACKEND))
+
+    Returns:
+        The mouse backend in use
+    """
+    global mouse_backend, mouse, screen_width, screen_height
+
+    config.configure_environment()
+    config.print_summary()
 
-# Disable PyAutoGUI failsafe
-# Failsafe: moving mouse to screen corner aborts program (we disable this)
-pyautogui.FAILSAFE = PYAUTOGUI_FAILSAFE
-print(f"[CONTROLLER] ✓ PyAutoGUI failsafe: {PYAUTOGUI_FAILSAFE}")
+    # Create the backend that injects mouse events into the OS
+    # (pyautogui by default; see MOUSE_BACKEND in config.py)
+    print("\n[CONTROLLER] Configuring mouse output backend...")
+    mouse_backend = create_backend(MOUSE_BACKEND) if backend is None else backend
+    mouse = mouse_backend
+    print(f"[CONTROLLER] ✓ Mouse backend ready: {mouse_backend.name}")
 
-# Set minimal pause between PyAutoGUI commands for smooth operation
-pyautogui.PAUSE = PYAUTOGUI_PAUSE
-print(f"[CONTROLLER] ✓ PyAutoGUI pause: {PYAUTOGUI_PAUSE}s")
+    screen_width, screen_height = mouse_backend.screen_size()
+    print(f"[CONTROLLER] ✓ Screen resolution detected: {screen_width}x{screen_height}")
+    return mouse_backend
 
-# Get screen dimensions for coordinate mapping
-screen_width, screen_height = pyautogui.size()
-print(f"[CONTROLLER] ✓ Screen resolution detected: {screen_width}x{screen_height}")
 
 # ============================================================================
-# INITIALIZE GLOBAL STATE VARIABLES
+# FPS CALCULATION
 # ============================================================================
 
-print("\n[CONTROLLER] Initializing state variables...")
+def update_fps():
+    """
+    Record the time of the current frame and return the averaged FPS.
 
-# Cursor smoothing variables
-# These store the previous cursor position for smooth movement
-prev_cursor_x = 0  # Previous X coordinate of cursor
-prev_cursor_y = 0  # Previous Y coordinate of cursor
-print("[CONTROLLER] ✓ Cursor position initialized: (0, 0)")
+    The frame timestamps are kept in a bounded deque, so this is O(1) per
+    frame: frames in the window divided by the time they span.
 
-# Gesture state variables
-drag_mode = False  # Boolean: True when dragging, False otherwise
-last_click_time = 0  # Timestamp of last click (for cooldown)
-gesture_mode = MODE_CURSOR  # Current gesture mode (starts with CURSOR)
-scroll_start_y = 0  # Y position when scroll started (for delta calculation)
-print(f"[CONTROLLER] ✓ Initial gesture mode: {gesture_mode}")
+    Returns:
+        float: Average FPS over the last FPS_HISTORY_SIZE frames
+    """
+    return fps_counter.tick()
 
-# Performance monitoring variables
-prev_frame_time = 0  # Timestamp of previous frame (for FPS calculation)
-fps_history = []  # List storing recent FPS values for averaging
-print("[CONTROLLER] ✓ Performance monitoring initialized")
 
-print("\n[CONTROLLER] ✓ All state variables initialized")
+def get_profile_lines():
+    """
+    Return the latency table for the HUD, refreshed every PROFILE_HUD_REFRESH s.
+
+    Percentiles are computed over PROFILE_WINDOW samples per stage, so the
+    table is cached between refreshes instead of recomputed every frame.
+
+    Returns:
+        list: Text lines, or None when the table is hidden
+    """
+    global profile_lines, profile_refresh_time
+
+    if not show_profile:
+        return None
+
+    current_time = time.perf_counter()
+    if current_time - profile_refresh_time >= PROFILE_HUD_REFRESH:
+        profile_lines = profiler.format_report()
+        profile_refresh_time = current_time
+    return profile_lines
+
+
+def print_profile_report(prefix="    "):
+    """
+    Print p50/p95/p99 of every profiled stage to the console.
+
+    Parameters:
+        prefix (str): Text put before every line
+    """
+    for line in profiler.format_report():
+        print(f"{prefix}{line}")
+
+
+# ============================================================================
+# HELP TEXT
+# ============================================================================
+
+def print_gesture_help():
+    """
+    Print the available gestures and controls to the console.
+    """
+    print("\n✨ AVAILABLE GESTURES:")
+    print("  🖱️  Move Cursor      → Point with index finger")
+    print("  👆 Left Click       → Pinch thumb + index finger")
+    print("  🖱️  Right Click      → Pinch thumb + middle finger")
+    print("  ✊ Drag & Drop      → Hold left click pinch while moving")
+    print("  🖐️  Scroll          → Extend all 5 fingers and move up/down")
+
+    print("\n⌨️  KEYBOARD CONTROLS:")
+    print("  Q → Quit program")
+    print("  H → Show/Hide help overlay")
+    print("  P → Show/Hide per-stage latency (p50/p95/p99)")
+    print("=" * 70 + "\n")
+
+
+# ============================================================================
+# FRAME PROCESSING STEPS
+# ============================================================================
+# Each step is a separate function so it can run either inline in the main
+# loop or as its own stage of the pipeline (see pipeline.py).
+# Every step records its duration in the shared profiler (profiling.py).
+
+def read_frame(cap):
+    """
+    Read the next frame and record the capture stage.
+
+    Parameters:
+        cap: FrameGrabber or cv2.VideoCapture to read frames from
+
+    Returns:
+        tuple: (ret, frame, capture_ns) where capture_ns is the
+               perf_counter_ns() time the frame was captured
+    """
+    start_ns = now_ns()
+    if isinstance(cap, FrameGrabber):
+        ret, frame, capture_time = cap.read_with_timestamp()
+        capture_ns = int(capture_time * 1e9)
+    else:
+        ret, frame = cap.read()
+        capture_ns = now_ns()
+    profiler.record("capture", start_ns)
+    if ret:
+        startup_timer.mark("first_frame")
+    return ret, frame, capture_ns
+
+
+def preprocess_frame(frame, out=None):
+    """
+    Mirror the camera frame for display.
+
+    Resizing and RGB conversion for MediaPipe happen in HandTracker, on a
+    copy at the inference resolution; the mirrored frame stays full size
+    for display and coordinate mapping.
+
+    Parameters:
+        frame (numpy.ndarray): BGR frame from the camera
+        out (numpy.ndarray): Reused destination buffer (None = allocate)
+
+    Returns:
+        numpy.ndarray: Mirrored BGR frame
+    """
+    # Flip frame horizontally (mirror effect)
+    # This makes the interaction more intuitive: moving hand right moves cursor right
+    return cv2.flip(frame, 1, dst=out)
+
+
+def detect_hands(frame, hands, headless, pool):
+    """
+    Detect hands and produce the mirrored frame for display.
+
+    With MIRROR_LANDMARKS, MediaPipe processes the frame as captured and
+    returns mirrored landmarks, so the flip is only made when a preview is
+    shown. Otherwise the frame is flipped first and MediaPipe processes the
+    flipped frame.
+
+    Parameters:
+        frame (numpy.ndarray): BGR frame from the camera
+        hands (HandTracker): MediaPipe hand tracker
+        headless (bool): No preview is shown
+        pool (FramePool): Reused buffers for the mirrored frame
+
+    Returns:
+        tuple: (frame for display, MediaPipe results). In headless mode
+               with MIRROR_LANDMARKS the frame is returned unflipped
+               (only its size is used).
+    """
+    if MIRROR_LANDMARKS:
+        results = track_hands(frame, hands)
+        if not headless:
+            start_ns = now_ns()
+            frame = preprocess_frame(frame, pool.get(frame.shape))
+            profiler.record("mirror", start_ns)
+        return frame, results
+
+    start_ns = now_ns()
+    frame = preprocess_frame(frame, pool.get(frame.shape))
+    profiler.record("mirror", start_ns)
+    return frame, track_hands(frame, hands)
+
+
+def track_hands(frame, hands):
+    """
+    Run the hand tracker and report its time to the quality governor.
+
+    Frames skipped by the tracker (frame_skip.py) are not reported: their
+    near-zero time would hide the inference cost from the governor.
+
+    Parameters:
+        frame (numpy.ndarray): Frame for HandTracker.process()
+        hands (HandTracker): MediaPipe hand tracker
+
+    Returns:
+        MediaPipe results
+    """
+    if governor is None:
+        return hands.process(frame)
+    start_ns = now_ns()
+    results = hands.process(frame)
+    if not hands.last_skipped:
+        governor.update((now_ns() - start_ns) / 1e6, pending=hands.rebuilding)
+    return results
+
+
+def recognize_gestures(results, frame_width, frame_height, now=None, capture_ns=None):
+    """
+    Run gesture recognition and mouse control for every detected hand.
+
+    Parameters:
+        results: MediaPipe hands.process() results
+        frame_width (int): Width of the video frame in pixels
+        frame_height (int): Height of the video frame in pixels
+        now (float): Current time in seconds (defaults to time.time())
+        capture_ns (int): perf_counter_ns() capture time of the frame, to
+                          record the capture-to-mouse latency
+
+    Returns:
+        list: One gesture description (see process_hand) per detected hand
+    """
+    # Record every frame, with or without a hand, for offline replay
+    if recorder is not None:
+        recorder.write(results, None if now is None else int(now * 1e9))
+
+    # No hand detected: a gesture in progress ends after a few such frames
+    # (never leaves the mouse button held)
+    if not results.multi_hand_landmarks:
+        hand_missing(mouse)
+        return []
+
+    startup_timer.mark("first_landmark")
+
+    # Tag the mouse events with the frame they come from (the dispatcher
+    # carries the tag to the backend, e.g. for latency measurements)
+    if capture_ns is not None:
+        mouse.frame = capture_ns
+
+    # Iterate through each detected hand
+    # (In our case, usually just one since MAX_NUM_HANDS=1)
+    start_ns = now_ns()
+    gestures = [
+        process_hand(
+            hand_landmarks, frame_width, frame_height,
+            screen_width, screen_height, mouse, now
+        )
+        for hand_landmarks in results.multi_hand_landmarks
+    ]
+    end_ns = profiler.record("gesture", start_ns)
+
+    # End to end: camera frame captured -> mouse events issued for it
+    if capture_ns is not None:
+        profiler.record("latency", capture_ns, end_ns)
+    return gestures
+
+
+def handle_key(key, show_help):
+    """
+    React to a key pressed in the preview window.
+
+    Parameters:
+        key (int): Key code from cv2.waitKey() & 0xFF
+        show_help (bool): Current help overlay state
+
+    Returns:
+        tuple: (quit_requested, new show_help state)
+    """
+    global show_profile
+
+    # Check if 'Q' key was pressed (quit)
+    if key == KEY_QUIT:
+        print("\n" + "=" * 70)
+        print("EXITING PROGRAM - User pressed 'Q'")
+        print("=" * 70)
+        return True, show_help
+
+    # Check if 'H' key was pressed (toggle help)
+    if key == KEY_HELP:
+        # Toggle help overlay state
+        show_help = not show_help
+        # Log the state change
+        status = "ON" if show_help else "OFF"
+        print(f"[{time.strftime('%H:%M:%S')}] Help overlay: {status}")
+
+    # Check if 'P' key was pressed (toggle latency table)
+    if key == KEY_PROFILE:
+        show_profile = not show_profile
+        status = "ON" if show_profile else "OFF"
+        print(f"[{time.strftime('%H:%M:%S')}] Latency profile overlay: {status}")
+
+    return False, show_help
+
+
+def handle_command(command, show_help, headless):
+    """
+    React to a command from a signal or the control socket.
+
+    Parameters:
+        command (str or None): Command from ControlChannel.poll()
+        show_help (bool): Current help overlay state
+        headless (bool): True when no preview window is shown
+
+    Returns:
+        tuple: (quit_requested, new show_help state)
+    """
+    if command == COMMAND_QUIT:
+        print("\n" + "=" * 70)
+        print("EXITING PROGRAM - Quit command received")
+        print("=" * 70)
+        return True, show_help
+
+    if command == COMMAND_HELP:
+        # Without a window the help text goes to the console
+        if headless:
+            print_gesture_help()
+        else:
+            show_help = not show_help
+            status = "ON" if show_help else "OFF"
+            print(f"[{time.strftime('%H:%M:%S')}] Help overlay: {status}")
+
+    if command == COMMAND_PROFILE:
+        # Per-stage latency percentiles go to the console in every mode
+        print(f"[{time.strftime('%H:%M:%S')}] Stage latency:")
+        print_profile_report()
+
+    if command == COMMAND_RELOAD:
+        # Re-read the settings file now, even if it looks unchanged
+        if config_watcher is not None:
+            config_watcher.poll(force=True)
+        else:
+            print(f"[{time.strftime('%H:%M:%S')}] No settings file to reload (see RUNTIME_CONFIG_FILE)")
+
+    return False, show_help
+
+
+def present_frame(frame, results, gestures, avg_fps, show_help, headless, control):
+    """
+    Draw and display the frame, then process keyboard and control commands.
+
+    In headless mode nothing is drawn or displayed: no overlays, no
+    imshow() and no waitKey(). Only control commands are processed.
+
+    Parameters:
+        frame (numpy.ndarray): Mirrored BGR frame
+        results: MediaPipe hands.process() results
+        gestures (list): Gesture descriptions from recognize_gestures()
+        avg_fps (float): Average FPS to display
+        show_help (bool): Current help overlay state
+        headless (bool): Skip the whole visualization path
+        control (ControlChannel): Source of signal/socket commands
+
+    Returns:
+        tuple: (quit_requested, new show_help state)
+    """
+    if not headless:
+        # Draw visual feedback
+        start_ns = now_ns()
+        render_frame(frame, results, gestures, avg_fps, show_help, get_profile_lines())
+        start_ns = profiler.record("render", start_ns)
+
+        # Show the processed frame in a window
+        cv2.imshow(WINDOW_TITLE, frame)
+
+        # Wait 1ms for keyboard input
+        # cv2.waitKey returns -1 if no key pressed, otherwise the key code
+        key = cv2.waitKey(1) & 0xFF
+        profiler.record("display", start_ns)
+        quit_requested, show_help = handle_key(key, show_help)
+        if quit_requested:
+            return True, show_help
+
+    # Settings file changes are picked up by the session and the tracker
+    # on their next frame
+    if config_watcher is not None:
+        config_watcher.poll()
+
+    # Commands from signals or the control socket (all modes)
+    return handle_command(control.poll(), show_help, headless)
+
+
+# ============================================================================
+# SEQUENTIAL MAIN LOOP
+# ============================================================================
+
+def run_sequential(cap, hands, headless, control):
+    """
+    Run capture, inference, gesture logic and rendering one after another.
+
+    Parameters:
+        cap: FrameGrabber or cv2.VideoCapture to read frames from
+        hands (HandTracker): MediaPipe hand tracker
+        headless (bool): Skip overlays and the preview window
+        control (ControlChannel): Source of signal/socket commands
+    """
+    # Boolean to track if help overlay is visible
+    show_help = False
+
+    # One reused buffer for the mirrored display frame
+    pool = FramePool(count=1)
+
+    # This loop runs continuously until user quits (presses 'Q')
+    while cap.isOpened():
+        # ====================================================================
+        # STEP 1: CAPTURE FRAME FROM WEBCAM
+        # ====================================================================
+
+        # Read a frame from the webcam
+        # ret: boolean indicating if frame was read successfully
+        # frame: the actual image data as NumPy array
+        # capture_ns: when the frame was captured (for the latency profile)
+        ret, frame, capture_ns = read_frame(cap)
+
+        # Check if frame was read successfully
+        if not ret:
+            # If frame read failed, print error and break loop
+            print("\n[CONTROLLER] ✗ ERROR: Failed to read frame from webcam")
+            print("[CONTROLLER] Breaking main loop...")
+            break
+
+        # ====================================================================
+        # STEP 2: CALCULATE FPS (FRAMES PER SECOND)
+        # ====================================================================
+
+        avg_fps = update_fps()
+
+        # ====================================================================
+        # STEP 3 + 4: MIRROR FRAME AND PROCESS IT WITH MEDIAPIPE
+        # ====================================================================
+
+        # Detect hands on a scaled RGB copy of the frame
+        # Returns a results object with landmarks in mirrored full-frame
+        # coordinates; the mirrored display frame reuses a pooled buffer
+        frame, results = detect_hands(frame, hands, headless, pool)
+        frame_height, frame_width, _ = frame.shape
+
+        # ====================================================================
+        # STEP 5: GESTURE RECOGNITION AND MOUSE CONTROL
+        # ====================================================================
+
+        gestures = recognize_gestures(results, frame_width, frame_height,
+                                      capture_ns=capture_ns)
+
+        # ====================================================================
+        # STEP 6: DRAW, DISPLAY AND CHECK FOR COMMANDS
+        # ====================================================================
+
+        # Skipped entirely in headless mode (commands still processed)
+        quit_requested, show_help = present_frame(
+            frame, results, gestures, avg_fps, show_help, headless, control
+        )
+        if quit_requested:
+            break  # Exit the main loop
+
+
+# ============================================================================
+# PIPELINED MAIN LOOP
+# ============================================================================
+
+def pipeline_frames_in_flight():
+    """
+    Upper bound of frames the pipeline holds at once.
+
+    Three queues of PIPELINE_QUEUE_SIZE plus one frame in each of the
+    capture, inference, gesture and render steps. Frame buffers are reused
+    only after this many newer frames, so no stage sees its frame change.
+
+    Returns:
+        int: Maximum number of frames in flight
+    """
+    return 3 * PIPELINE_QUEUE_SIZE + 4
+
+
+def run_pipelined(cap, hands, headless, control):
+    """
+    Run capture, inference and gesture logic as concurrent pipeline stages.
+
+    Stages (each on its own thread, connected by bounded queues):
+        capture   -> reads the newest frame
+        inference -> mirrors the frame and runs HandTracker.process()
+        gesture   -> recognizes gestures and moves the mouse
+        render    -> draws overlays and shows the window (main thread,
+                     skipped in headless mode)
+
+    Rendering and mouse injection of one frame overlap with inference of
+    the next. Per-stage throughput and queue depth are printed every
+    PIPELINE_REPORT_INTERVAL seconds to show which stage limits FPS.
+
+    Parameters:
+        cap: FrameGrabber or cv2.VideoCapture to read frames from
+        hands (HandTracker): MediaPipe hand tracker
+        headless (bool): Skip overlays and the preview window
+        control (ControlChannel): Source of signal/socket commands
+    """
+    # Mirrored display frames are reused once no stage can still hold them
+    pool = FramePool(count=pipeline_frames_in_flight())
+
+    def capture_stage():
+        # Source stage: returning None ends the pipeline
+        ret, frame, capture_ns = read_frame(cap)
+        if not ret:
+            print("\n[CONTROLLER] ✗ ERROR: Failed to read frame from webcam")
+            return None
+        return {"frame": frame, "capture_ns": capture_ns}
+
+    def inference_stage(item):
+        item["frame"], item["results"] = detect_hands(item["frame"], hands, headless, pool)
+        return item
+
+    def gesture_stage(item):
+        frame_height, frame_width, _ = item["frame"].shape
+        item["gestures"] = recognize_gestures(item["results"], frame_width, frame_height,
+                                              capture_ns=item["capture_ns"])
+        return item
+
+    # Build the pipeline; the capture stage replaces a queued frame instead
+    # of blocking, so inference always receives the freshest frame
+    pipeline = Pipeline(queue_size=PIPELINE_QUEUE_SIZE)
+    pipeline.add_stage("capture", capture_stage, drop_when_full=True)
+    pipeline.add_stage("inference", inference_stage)
+    pipeline.add_stage("gesture", gesture_stage)
+    pipeline.start()
+    print("[CONTROLLER] ✓ Pipeline started: capture -> inference -> gesture -> render")
+
+    show_help = False
+    last_report_time = time.time()
+    render_busy = 0.0
+    rendered = 0
+
+    try:
+        while True:
+            # Wait for the next fully processed frame
+            item = pipeline.get(timeout=1.0)
+            if item is None:
+                if pipeline.finished:
+                    break
+                continue
+
+            # Render stage (main thread: OpenCV windows need it)
+            render_start = time.perf_counter()
+            avg_fps = update_fps()
+            quit_requested, show_help = present_frame(
+                item["frame"], item["results"], item["gestures"],
+                avg_fps, show_help, headless, control
+            )
+            render_busy += time.perf_counter() - render_start
+            rendered += 1
+
+            if quit_requested:
+                break
+
+            # Periodic per-stage report
+            if time.time() - last_report_time >= PIPELINE_REPORT_INTERVAL:
+                last_report_time = time.time()
+                print(f"[{time.strftime('%H:%M:%S')}] Pipeline stages:")
+                for line in pipeline.format_report():
+                    print(f"    {line}")
+                print(f"    {'render':<10} {1000.0 * render_busy / max(rendered, 1):6.2f} ms/item")
+    finally:
+        pipeline.stop()
+
+        # Final per-stage statistics
+        print("\n[CONTROLLER] Pipeline stage statistics:")
+        for line in pipeline.format_report():
+            print(f"[CONTROLLER]   {line}")
 
 
 # ============================================================================
 # MAIN GESTURE CONTROL FUNCTION
 # ============================================================================
 
-def main():
+def main(source=None, pipeline_mode=PIPELINE_MODE, headless=HEADLESS_MODE, record=RECORD_PATH,
+         profile=PROFILE_EXPORT, user=CALIBRATION_USER, recalibrate=False, tracker=None,
+         settings=RUNTIME_CONFIG_FILE, quality_governor=GOVERNOR_ENABLED):
     """
     Main function that runs the gesture-controlled mouse application.
 
     This function:
-    1. Initializes the webcam
+    1. Initializes the webcam (or a recorded video file)
     2. Creates MediaPipe hand detector
     3. Enters main loop to:
        - Capture video frames
@@ -101,26 +675,85 @@ def main():
        - Display visual feedback
     4. Handles cleanup on exit
 
+    Parameters:
+        source (int or str): Camera index or video file path
+                             (defaults to VIDEO_SOURCE, then CAMERA_INDEX)
+        pipeline_mode (bool): Run the steps as concurrent pipeline stages
+        headless (bool): Run without preview window and overlays
+        record (str or None): File to record the landmark stream to
+                              (replay it with replay.py)
+        profile (str or None): JSON file to export the per-stage latency
+                               percentiles and samples to at exit
+        user (str): User whose cached pinch calibration is loaded
+        recalibrate (bool): Measure the user's pinch (calibration.py) and
+                            cache the result before tracking starts
+        tracker (HandTracker): Already built (and warmed up) tracker to use
+                               instead of building one; the caller keeps
+                               it open across main() calls
+        settings (str or None): JSON file of runtime settings, re-read
+                                while running when it changes
+                                (runtime_config.py)
+        quality_governor (bool): Adapt model complexity, confidences and
+                                 inference scale to GOVERNOR_BUDGET_MS
+                                 (governor.py)
+
     Returns:
         None
     """
-    # Declare global variables that we'll modify in this function
-    global prev_cursor_x, prev_cursor_y, drag_mode, last_click_time
-    global gesture_mode, scroll_start_y, prev_frame_time, fps_history
+    global recorder, mouse, config_watcher, governor
+
+    # Startup milestones are measured from here
+    startup_timer.reset()
+
+    # Configuration report and mouse backend (unless init() was called)
+    if mouse_backend is None:
+        init()
+
+    # Runtime settings file, loaded before the tracker is built so the
+    # first MediaPipe graph already has its model settings
+    if settings is not None:
+        config_watcher = ConfigWatcher(settings)
+
+    # The governor publishes its first level before the tracker is built
+    if quality_governor:
+        governor = QualityGovernor()
+        print(f"[CONTROLLER] ✓ Quality governor: p{GOVERNOR_PERCENTILE} detection time within "
+              f"{GOVERNOR_BUDGET_MS:.1f} ms, {len(GOVERNOR_LEVELS)} levels")
 
     print("\n" + "=" * 70)
     print("STARTING GESTURE MOUSE CONTROLLER")
     print("=" * 70)
 
     # ========================================================================
-    # INITIALIZE WEBCAM
+    # INITIALIZE WEBCAM AND MEDIAPIPE
     # ========================================================================
 
-    print("\n[CONTROLLER] Initializing webcam...")
-
-    # Create VideoCapture object to access the webcam
-    # CAMERA_INDEX (usually 0) specifies which camera to use
-    cap = cv2.VideoCapture(CAMERA_INDEX)
+    print("\n[CONTROLLER] Initializing webcam and MediaPipe Hands detector...")
+
+    # Pick the capture source: explicit argument, configured file, or camera
+    if source is None:
+        source = VIDEO_SOURCE if VIDEO_SOURCE is not None else CAMERA_INDEX
+
+    def open_source():
+        # Threaded capture reads frames in the background and keeps only the newest,
+        # so a slow MediaPipe frame never makes us process stale camera frames
+        if THREADED_CAPTURE:
+            # Frames stay valid until <buffers - 2> newer ones were read, so the
+            # pipeline needs enough buffers for every frame it holds
+            buffers = pipeline_frames_in_flight() + 2 if pipeline_mode and CAPTURE_BUFFERS else CAPTURE_BUFFERS
+            return FrameGrabber(source, buffer_count=buffers)
+        return open_capture(source)
+
+    # The camera opens while the MediaPipe graph is built and warmed up on
+    # synthetic frames (STARTUP_CONCURRENT, WARMUP_FRAMES); a tracker passed
+    # in by the caller is already warm and is reused as is
+    if tracker is None:
+        cap, hands = startup.start(open_source, HandTracker)
+        tracker_context = hands  # Closed when main() ends
+    else:
+        cap, hands = open_source(), tracker
+        startup_timer.mark("camera_open")
+        tracker_context = contextlib.nullcontext(tracker)
 
     # Check if webcam opened successfully
     if not cap.isOpened():
@@ -130,28 +763,57 @@ def main():
         print("[CONTROLLER]   1. Webcam is connected")
         print("[CONTROLLER]   2. No other application is using the webcam")
         print("[CONTROLLER]   3. Camera permissions are granted")
+        if tracker is None:
+            hands.close()
         return  # Exit the function
 
-    print("[CONTROLLER] ✓ Webcam opened successfully")
+    print(f"[CONTROLLER] ✓ Capture source opened: {source}")
+    print(f"[CONTROLLER] ✓ Startup: {startup_timer.format()}")
 
     # ========================================================================
     # CONFIGURE WEBCAM SETTINGS
     # ========================================================================
 
-    print("\n[CONTROLLER] Configuring webcam settings...")
+    # Resolution and FPS are requested by open_capture() for cameras
+    print(f"[CONTROLLER] ✓ Requested resolution: {CAMERA_WIDTH}x{CAMERA_HEIGHT}")
+    print(f"[CONTROLLER] ✓ Target FPS: {TARGET_FPS}")
 
-    # Set webcam resolution width
-    # cv2.CAP_PROP_FRAME_WIDTH is the property ID for frame width
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, CAMERA_WIDTH)
-    print(f"[CONTROLLER] ✓ Resolution width: {CAMERA_WIDTH} pixels")
+    # Start the background producer thread
+    if THREADED_CAPTURE:
+        cap.start()
+        print("[CONTROLLER] ✓ Threaded capture started (latest frame wins)")
 
-    # Set webcam resolution height
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, CAMERA_HEIGHT)
-    print(f"[CONTROLLER] ✓ Resolution height: {CAMERA_HEIGHT} pixels")
+    # ========================================================================
+    # START MOUSE EVENT DISPATCHER
+    # ========================================================================
 
-    # Set target frames per second (actual FPS may vary by hardware)
-    cap.set(cv2.CAP_PROP_FPS, TARGET_FPS)
-    print(f"[CONTROLLER] ✓ Target FPS: {TARGET_FPS}")
+    # Mouse events are injected from a background thread; the vision loop
+    # only queues them (moves coalesced, capped at MOUSE_MAX_RATE_HZ).
+    # The interpolator sends while holding its lock, so it always needs one
+    if MOUSE_DISPATCHER or CURSOR_INTERPOLATION:
+        # The interpolator sends moves at the display rate, so the
+        # dispatcher must not throttle them below it
+        max_rate = max(MOUSE_MAX_RATE_HZ, CURSOR_OUTPUT_RATE_HZ) if CURSOR_INTERPOLATION else MOUSE_MAX_RATE_HZ
+        mouse = MouseDispatcher(mouse_backend, max_rate).start()
+        print(f"[CONTROLLER] ✓ Mouse dispatcher started (max {max_rate} moves/s)")
+
+    # Cursor moves at the display rate between processed frames
+    if CURSOR_INTERPOLATION:
+        mouse = CursorInterpolator(mouse, CURSOR_OUTPUT_RATE_HZ).start()
+        print(f"[CONTROLLER] ✓ Cursor interpolation started ({CURSOR_OUTPUT_RATE_HZ} moves/s)")
+
+    # ========================================================================
+    # START LANDMARK RECORDING (OPTIONAL)
+    # ========================================================================
+
+    if record:
+        if THREADED_CAPTURE:
+            frame_width, frame_height = cap.frame_width, cap.frame_height
+        else:
+            frame_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            frame_height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        recorder = LandmarkRecorder(record, frame_width, frame_height)
+        print(f"[CONTROLLER] ✓ Recording landmarks to: {record}")
 
     # ========================================================================
     # DISPLAY STARTUP INFORMATION
@@ -161,46 +823,74 @@ def main():
     print("SYSTEM READY - GESTURE CONTROL ACTIVE")
     print("=" * 70)
 
-    print("\n✨ AVAILABLE GESTURES:")
-    print("  🖱️  Move Cursor      → Point with index finger")
-    print("  👆 Left Click       → Pinch thumb + index finger")
-    print("  🖱️  Right Click      → Pinch thumb + middle finger")
-    print("  ✊ Drag & Drop      → Hold left click pinch while moving")
-    print("  🖐️  Scroll          → Extend all 5 fingers and move up/down")
-
-    print("\n⌨️  KEYBOARD CONTROLS:")
-    print("  Q → Quit program")
-    print("  H → Show/Hide help overlay")
-    print("=" * 70 + "\n")
+    print_gesture_help()
 
-    # ========================================================================
-    # INITIALIZE HELP OVERLAY STATE
-    # ========================================================================
+    # Commands from signals (and the control socket, if configured)
+    control = ControlChannel(port=CONTROL_PORT).start()
 
-    # Boolean to track if help overlay is visible
-    show_help = False
-    print("[CONTROLLER] ✓ Help overlay: OFF (press 'H' to toggle)")
+    if headless:
+        print("[CONTROLLER] ✓ Headless mode: no preview window, no overlays")
+        print("[CONTROLLER]   Quit with Ctrl+C / SIGTERM, print help with SIGUSR1")
+        print("[CONTROLLER]   print stage latency with SIGUSR2")
+        if config_watcher is not None:
+            print("[CONTROLLER]   reload the settings file with SIGHUP (also reloaded when it changes)")
+        if CONTROL_PORT is not None:
+            print(f"[CONTROLLER]   or send 'quit' / 'help' / 'profile' / 'reload' to udp://127.0.0.1:{CONTROL_PORT}")
+    else:
+        print("[CONTROLLER] ✓ Help overlay: OFF (press 'H' to toggle)")
+        print(f"[CONTROLLER] ✓ Latency overlay: {'ON' if show_profile else 'OFF'} (press 'P' to toggle)")
 
     # ========================================================================
-    # CREATE MEDIAPIPE HANDS DETECTOR
+    # MEDIAPIPE HANDS DETECTOR
     # ========================================================================
 
-    print("\n[CONTROLLER] Creating MediaPipe Hands detector...")
-
     # Use context manager (with statement) for proper resource management
     # This ensures MediaPipe resources are cleaned up properly
-    with mp_hands.Hands(
-            static_image_mode=STATIC_IMAGE_MODE,  # False = video stream mode
-            min_detection_confidence=MIN_DETECTION_CONFIDENCE,  # 0.8 = 80% confidence
-            min_tracking_confidence=MIN_TRACKING_CONFIDENCE,  # 0.8 = 80% confidence
-            max_num_hands=MAX_NUM_HANDS,  # Track only 1 hand
-            model_complexity=MODEL_COMPLEXITY  # 1 = full model for accuracy
-    ) as hands:
-
-        print("[CONTROLLER] ✓ MediaPipe Hands detector created")
+    # (detection settings come from config.py, see HandTracker)
+    with tracker_context:
+
+        print("\n[CONTROLLER] ✓ MediaPipe Hands detector ready")
         print(f"[CONTROLLER] ✓ Detection confidence: {MIN_DETECTION_CONFIDENCE}")
         print(f"[CONTROLLER] ✓ Tracking confidence: {MIN_TRACKING_CONFIDENCE}")
         print(f"[CONTROLLER] ✓ Max hands: {MAX_NUM_HANDS}")
+        if INFERENCE_AUTO_SCALE:
+            print(f"[CONTROLLER] ✓ Inference scale: auto (target {INFERENCE_TARGET_FPS} FPS)")
+        else:
+            print(f"[CONTROLLER] ✓ Inference scale: {INFERENCE_SCALE}")
+        if ROI_TRACKING:
+            print(f"[CONTROLLER] ✓ Hand-ROI tracking: {ROI_CROP_SIZE}x{ROI_CROP_SIZE} crops")
+        if hands.skipper.max_skip > 1:
+            print(f"[CONTROLLER] ✓ Frame skipping: inference at least every "
+                  f"{hands.skipper.max_skip} frames")
+
+        # ====================================================================
+        # PINCH CALIBRATION
+        # ====================================================================
+        # A cached calibration is loaded; the routine only runs on request
+        # (--calibrate), so a user calibrates once, not every session
+
+        state_machine = default_session.state_machine
+        calibration = None if recalibrate else load_calibration(user)
+        if recalibrate:
+            print(f"\n[CONTROLLER] Calibrating pinch thresholds for user '{user}'...")
+            try:
+                calibration = calibrate(cap, hands, headless)
+            except (RuntimeError, ValueError) as e:
+                print(f"[CONTROLLER] ⚠ Calibration failed: {e}")
+            else:
+                save_calibration(calibration, user)
+                print(f"[CONTROLLER] ✓ Calibration saved to: {CALIBRATION_FILE}")
+
+        if calibration is not None:
+            apply_calibration(state_machine, calibration)
+            print(f"[CONTROLLER] ✓ Pinch calibration of '{user}': "
+                  f"{state_machine.enter_threshold:.2f}-{state_machine.exit_threshold:.2f} palm lengths")
+        elif state_machine.units == "palm":
+            print(f"[CONTROLLER] ✓ Pinch thresholds: {state_machine.enter_threshold}-"
+                  f"{state_machine.exit_threshold} palm lengths (no calibration, use --calibrate)")
+        else:
+            print(f"[CONTROLLER] ✓ Pinch thresholds: {state_machine.enter_threshold}-"
+                  f"{state_machine.exit_threshold} pixels")
 
         print("\n[CONTROLLER] Entering main processing loop...")
         print("[CONTROLLER] System is now active and tracking hand gestures")
@@ -209,416 +899,45 @@ def main():
         # ====================================================================
         # MAIN PROCESSING LOOP
         # ====================================================================
-        # This loop runs continuously until user quits (presses 'Q')
-
-        while cap.isOpened():
-            # ================================================================
-            # STEP 1: CAPTURE FRAME FROM WEBCAM
-            # ================================================================
-
-            # Read a frame from the webcam
-            # ret: boolean indicating if frame was read successfully
-            # frame: the actual image data as NumPy array
-            ret, frame = cap.read()
-
-            # Check if frame was read successfully
-            if not ret:
-                # If frame read failed, print error and break loop
-                print("\n[CONTROLLER] ✗ ERROR: Failed to read frame from webcam")
-                print("[CONTROLLER] Breaking main loop...")
-                break
-
-            # ================================================================
-            # STEP 2: CALCULATE FPS (FRAMES PER SECOND)
-            # ================================================================
-
-            # Get current timestamp in seconds
-            current_time = time.time()
+        # Pipelined: stages run concurrently on worker threads
+        # Sequential: every step runs one after another in this thread
 
-            # Calculate FPS: 1 / (time between frames)
-            # If this is the first frame (prev_frame_time=0), FPS will be 0
-            if prev_frame_time != 0:
-                fps = 1 / (current_time - prev_frame_time)
+        try:
+            if pipeline_mode:
+                run_pipelined(cap, hands, headless, control)
             else:
-                fps = 0
-
-            # Update previous frame time for next iteration
-            prev_frame_time = current_time
-
-            # Add current FPS to history for averaging
-            fps_history.append(fps)
-
-            # Keep only last FPS_HISTORY_SIZE values (e.g., last 30 frames)
-            if len(fps_history) > FPS_HISTORY_SIZE:
-                fps_history.pop(0)  # Remove oldest FPS value
-
-            # Calculate average FPS for smoother display
-            avg_fps = sum(fps_history) / len(fps_history) if fps_history else 0
-
-            # ================================================================
-            # STEP 3: PREPROCESS FRAME
-            # ================================================================
-
-            # Flip frame horizontally (mirror effect)
-            # This makes the interaction more intuitive: moving hand right moves cursor right
-            frame = cv2.flip(frame, 1)
-
-            # Get frame dimensions (height, width, channels)
-            frame_height, frame_width, _ = frame.shape
-
-            # Convert frame from BGR (OpenCV format) to RGB (MediaPipe format)
-            # OpenCV uses BGR color order, MediaPipe expects RGB
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-            # ================================================================
-            # STEP 4: PROCESS FRAME WITH MEDIAPIPE
-            # ================================================================
-
-            # Process the RGB frame to detect hands
-            # Returns a results object containing detected hand landmarks
-            results = hands.process(rgb_frame)
-
-            # ================================================================
-            # STEP 5: RESET GESTURE MODE
-            # ================================================================
-
-            # Reset gesture mode to CURSOR at start of each frame
-            # Will be updated if specific gesture is detected
-            gesture_mode = MODE_CURSOR
-
-            # ================================================================
-            # STEP 6: CHECK IF HAND WAS DETECTED
-            # ================================================================
-
-            if results.multi_hand_landmarks:
-                # Hand detected! Draw indicator in top-right
-                draw_hand_detected_indicator(frame, frame_width)
-
-                # ============================================================
-                # STEP 7: PROCESS DETECTED HAND
-                # ============================================================
-
-                # Iterate through each detected hand
-                # (In our case, usually just one since MAX_NUM_HANDS=1)
-                for hand_landmarks in results.multi_hand_landmarks:
-
-                    # ========================================================
-                    # STEP 7A: DRAW HAND SKELETON
-                    # ========================================================
-
-                    # Draw hand landmarks and connections on the frame
-                    mp_drawing.draw_landmarks(
-                        frame,  # Image to draw on
-                        hand_landmarks,  # The 21 hand landmarks
-                        mp_hands.HAND_CONNECTIONS,  # Lines connecting landmarks
-                        # Landmark style: green circles, 2px thick, radius 2
-                        mp_drawing.DrawingSpec(
-                            color=COLOR_GREEN, thickness=2, circle_radius=2
-                        ),
-                        # Connection style: red lines, 2px thick
-                        mp_drawing.DrawingSpec(
-                            color=COLOR_RED, thickness=2
-                        )
-                    )
-
-                    # ========================================================
-                    # STEP 7B: EXTRACT HAND LANDMARKS
-                    # ========================================================
-
-                    # Get the landmarks list (21 points)
-                    landmarks = hand_landmarks.landmark
-
-                    # ========================================================
-                    # STEP 7C: GET FINGER TIP POSITIONS
-                    # ========================================================
-
-                    # Get INDEX finger tip (landmark 8)
-                    index_tip = landmarks[INDEX_TIP]
-                    # Convert normalized coordinates (0-1) to pixel coordinates
-                    index_x = int(index_tip.x * frame_width)
-                    index_y = int(index_tip.y * frame_height)
-
-                    # Get MIDDLE finger tip (landmark 12)
-                    middle_tip = landmarks[MIDDLE_TIP]
-                    middle_x = int(middle_tip.x * frame_width)
-                    middle_y = int(middle_tip.y * frame_height)
-
-                    # Get THUMB tip (landmark 4)
-                    thumb_tip = landmarks[THUMB_TIP]
-                    thumb_x = int(thumb_tip.x * frame_width)
-                    thumb_y = int(thumb_tip.y * frame_height)
-
-                    # ========================================================
-                    # STEP 7D: MAP HAND POSITION TO SCREEN COORDINATES
-                    # ========================================================
-
-                    # Calculate control area boundaries
-                    # We use only the middle 60% of the frame for better control
-                    control_start_x = int(frame_width * CONTROL_AREA_START)
-                    control_end_x = int(frame_width * CONTROL_AREA_END)
-                    control_start_y = int(frame_height * CONTROL_AREA_START)
-                    control_end_y = int(frame_height * CONTROL_AREA_END)
-
-                    # Map index finger position to screen coordinates
-                    # np.interp: linear interpolation between ranges
-                    screen_x = np.interp(
-                        index_x,  # Input value (hand x-position)
-                        [control_start_x, control_end_x],  # Input range
-                        [0, screen_width]  # Output range (screen width)
-                    )
-
-                    screen_y = np.interp(
-                        index_y,  # Input value (hand y-position)
-                        [control_start_y, control_end_y],  # Input range
-                        [0, screen_height]  # Output range (screen height)
-                    )
-
-                    # ========================================================
-                    # STEP 7E: SMOOTH CURSOR MOVEMENT
-                    # ========================================================
-
-                    # Apply exponential moving average for smooth cursor movement
-                    # Formula: new = old + (target - old) / smoothing_factor
-                    # Higher smoothing = smoother but slower response
-                    curr_x = prev_cursor_x + (screen_x - prev_cursor_x) / SMOOTHING_FACTOR
-                    curr_y = prev_cursor_y + (screen_y - prev_cursor_y) / SMOOTHING_FACTOR
-
-                    # Move the actual mouse cursor to the calculated position
-                    pyautogui.moveTo(curr_x, curr_y)
-
-                    # Update previous cursor position for next frame
-                    prev_cursor_x, prev_cursor_y = curr_x, curr_y
-
-                    # ========================================================
-                    # STEP 7F: CALCULATE DISTANCES FOR GESTURE DETECTION
-                    # ========================================================
-
-                    # Calculate distance between thumb and index finger
-                    # Used to detect left-click pinch gesture
-                    thumb_index_dist = get_distance(
-                        (thumb_x, thumb_y),
-                        (index_x, index_y)
-                    )
-
-                    # Calculate distance between thumb and middle finger
-                    # Used to detect right-click pinch gesture
-                    thumb_middle_dist = get_distance(
-                        (thumb_x, thumb_y),
-                        (middle_x, middle_y)
-                    )
-
-                    # Count how many fingers are extended
-                    # Used to detect scroll gesture (5 fingers)
-                    extended_fingers = count_extended_fingers(
-                        landmarks,
-                        frame_width,
-                        frame_height
-                    )
-
-                    # ========================================================
-                    # STEP 7G: GESTURE RECOGNITION
-                    # ========================================================
-
-                    # Get current time for cooldown checks
-                    current_gesture_time = time.time()
-
-                    # --------------------------------------------------------
-                    # GESTURE 1: LEFT CLICK (Thumb + Index Pinch)
-                    # --------------------------------------------------------
-
-                    if thumb_index_dist < CLICK_THRESHOLD:
-                        # Pinch detected! Update gesture mode
-                        gesture_mode = MODE_LEFT_CLICK
-
-                        # Draw red line between thumb and index
-                        cv2.line(
-                            frame,
-                            (thumb_x, thumb_y),  # Start point (thumb)
-                            (index_x, index_y),  # End point (index)
-                            COLOR_RED,  # Red color for left click
-                            3  # Line thickness
-                        )
-
-                        # Check if enough time has passed since last click (cooldown)
-                        if current_gesture_time - last_click_time > CLICK_COOLDOWN:
-                            # If not already in drag mode, perform a click
-                            if not drag_mode:
-                                # Execute left mouse button click
-                                pyautogui.click()
-                                # Update last click time
-                                last_click_time = current_gesture_time
-                                # Log the click action
-                                print(f"[{time.strftime('%H:%M:%S')}] LEFT CLICK performed")
-                            # Enter drag mode (will stay in drag until pinch released)
-                            drag_mode = True
-
-                    # --------------------------------------------------------
-                    # GESTURE 2: RIGHT CLICK (Thumb + Middle Pinch)
-                    # --------------------------------------------------------
-
-                    elif thumb_middle_dist < CLICK_THRESHOLD:
-                        # Pinch detected! Update gesture mode
-                        gesture_mode = MODE_RIGHT_CLICK
-
-                        # Draw blue line between thumb and middle finger
-                        cv2.line(
-                            frame,
-                            (thumb_x, thumb_y),  # Start point (thumb)
-                            (middle_x, middle_y),  # End point (middle)
-                            COLOR_BLUE,  # Blue color for right click
-                            3  # Line thickness
-                        )
-
-                        # Check cooldown before performing right click
-                        if current_gesture_time - last_click_time > CLICK_COOLDOWN:
-                            # Execute right mouse button click
-                            pyautogui.rightClick()
-                            # Update last click time
-                            last_click_time = current_gesture_time
-                            # Log the click action
-                            print(f"[{time.strftime('%H:%M:%S')}] RIGHT CLICK performed")
-
-                    # --------------------------------------------------------
-                    # GESTURE 3: SCROLL (All 5 Fingers Extended)
-                    # --------------------------------------------------------
-
-                    elif extended_fingers == 5:
-                        # All fingers extended! Update gesture mode
-                        gesture_mode = MODE_SCROLL
-
-                        # Initialize scroll start position if not set
-                        if scroll_start_y == 0:
-                            scroll_start_y = index_y
-
-                        # Calculate vertical movement since scroll started
-                        scroll_delta = scroll_start_y - index_y
-
-                        # Only scroll if movement exceeds threshold
-                        if abs(scroll_delta) > SCROLL_THRESHOLD:
-                            # Calculate scroll amount (scale down by factor of 10)
-                            scroll_amount = int(scroll_delta / 10)
-                            # Execute scroll action
-                            # Positive = scroll up, Negative = scroll down
-                            pyautogui.scroll(scroll_amount)
-                            # Update scroll start position
-                            scroll_start_y = index_y
-                            # Log the scroll action
-                            print(f"[{time.strftime('%H:%M:%S')}] SCROLL: {scroll_amount}")
-
-                        # Draw scrolling indicator
-                        draw_gesture_indicator(
-                            frame, MODE_SCROLL, frame_width, frame_height
-                        )
-
-                    # --------------------------------------------------------
-                    # NO SPECIFIC GESTURE DETECTED
-                    # --------------------------------------------------------
-
-                    else:
-                        # If we were in drag mode, release it
-                        if drag_mode:
-                            drag_mode = False
-                            print(f"[{time.strftime('%H:%M:%S')}] DRAG released")
-
-                        # Reset scroll start position
-                        scroll_start_y = 0
-
-                        # Draw green line between thumb and index (default)
-                        cv2.line(
-                            frame,
-                            (thumb_x, thumb_y),
-                            (index_x, index_y),
-                            COLOR_GREEN,  # Green = no active gesture
-                            2  # Thinner line for default state
-                        )
-
-                    # ========================================================
-                    # STEP 7H: DRAW VISUAL MARKERS ON FINGERS
-                    # ========================================================
-
-                    # Draw blue circle on index finger tip
-                    cv2.circle(
-                        frame,
-                        (index_x, index_y),  # Center position
-                        LANDMARK_CIRCLE_RADIUS,  # Radius (12 pixels)
-                        COLOR_BLUE,  # Blue color
-                        -1  # Filled circle
-                    )
-
-                    # Draw orange circle on middle finger tip
-                    cv2.circle(
-                        frame,
-                        (middle_x, middle_y),
-                        10,  # Slightly smaller radius
-                        COLOR_ORANGE,  # Orange color
-                        -1  # Filled
-                    )
-
-                    # Draw green circle on thumb tip
-                    cv2.circle(
-                        frame,
-                        (thumb_x, thumb_y),
-                        LANDMARK_CIRCLE_RADIUS,
-                        COLOR_GREEN,  # Green color
-                        -1  # Filled
-                    )
-
-                    # ========================================================
-                    # STEP 7I: DRAW DRAG MODE INDICATOR
-                    # ========================================================
-
-                    # If in drag mode, show indicator
-                    if drag_mode:
-                        draw_drag_indicator(frame, frame_width, frame_height)
-
-            # ================================================================
-            # STEP 8: DRAW INFO PANEL
-            # ================================================================
-
-            # Draw the information panel with FPS and mode
-            draw_info_panel(frame, avg_fps, gesture_mode, frame_width, frame_height)
-
-            # ================================================================
-            # STEP 9: DRAW HELP OVERLAY IF ENABLED
-            # ================================================================
-
-            # If help is toggled on, show the help overlay
-            if show_help:
-                show_help_overlay(frame, frame_width, frame_height)
-
-            # ================================================================
-            # STEP 10: DISPLAY THE FRAME
-            # ================================================================
-
-            # Show the processed frame in a window
-            cv2.imshow(WINDOW_TITLE, frame)
-
-            # ================================================================
-            # STEP 11: CHECK FOR KEYBOARD INPUT
-            # ================================================================
-
-            # Wait 1ms for keyboard input
-            # cv2.waitKey returns -1 if no key pressed, otherwise the key code
-            key = cv2.waitKey(1) & 0xFF
-
-            # Check if 'Q' key was pressed (quit)
-            if key == KEY_QUIT:
-                print("\n" + "=" * 70)
-                print("EXITING PROGRAM - User pressed 'Q'")
-                print("=" * 70)
-                break  # Exit the main loop
-
-            # Check if 'H' key was pressed (toggle help)
-            elif key == KEY_HELP:
-                # Toggle help overlay state
-                show_help = not show_help
-                # Log the state change
-                status = "ON" if show_help else "OFF"
-                print(f"[{time.strftime('%H:%M:%S')}] Help overlay: {status}")
+                run_sequential(cap, hands, headless, control)
+        finally:
+            control.close()
 
         # End of main loop
         print("\n[CONTROLLER] Exited main processing loop")
 
+        # Inference cost at the scale that was used
+        tracker_stats = hands.get_stats()
+        print(f"[CONTROLLER] ✓ Inference: {tracker_stats['mean_ms']:.1f} ms/frame at scale "
+              f"{tracker_stats['scale']} ({tracker_stats['scale_changes']} scale changes)")
+        if config_watcher is not None:
+            print(f"[CONTROLLER] ✓ Settings: {config_watcher.reloads} loads from {config_watcher.path} "
+                  f"({config_watcher.errors} rejected, {tracker_stats['model_changes']} model changes)")
+            config_watcher = None
+        if governor is not None:
+            stats = governor.get_stats()
+            print(f"[CONTROLLER] ✓ Quality governor: level {stats['level']} of {stats['levels'] - 1}, "
+                  f"{stats['changes']} changes ({stats['upgrades_undone']} upgrades undone), "
+                  f"last p{GOVERNOR_PERCENTILE} {stats['last_percentile_ms']:.1f} ms")
+            governor = None
+        if ROI_TRACKING:
+            print(f"[CONTROLLER] ✓ Hand-ROI tracking: {tracker_stats['roi_frames']} crop frames, "
+                  f"{tracker_stats['full_frames']} full-frame detections "
+                  f"({tracker_stats['redetections']} after losing the hand), "
+                  f"{tracker_stats['mean_pixels'] / 1000:.0f}k pixels/frame")
+        if tracker_stats['skipped_frames']:
+            mode = "extrapolated" if hands.skipper.extrapolate else "held"
+            print(f"[CONTROLLER] ✓ Frame skipping: {tracker_stats['skipped_frames']} of "
+                  f"{tracker_stats['frames']} frames {mode} "
+                  f"({tracker_stats['motion_triggers']} inferences forced by motion)")
+
     # ========================================================================
     # CLEANUP
     # ========================================================================
@@ -626,17 +945,69 @@ def main():
     print("\n[CONTROLLER] Cleaning up resources...")
 
     # Calculate and display session statistics
-    if fps_history:
-        avg_session_fps = int(sum(fps_history) / len(fps_history))
+    if fps_counter.frames > 1:
+        avg_session_fps = int(fps_counter.session_fps())
         print(f"[CONTROLLER] ✓ Average FPS during session: {avg_session_fps}")
 
-    # Release the webcam resource
+    # Time to first frame / first landmark (see startup.py)
+    print(f"[CONTROLLER] ✓ Startup: {startup_timer.format()}")
+
+    # Per-stage latency over the last PROFILE_WINDOW frames
+    print(f"[CONTROLLER] ✓ Stage latency (last {PROFILE_WINDOW} samples per stage):")
+    print_profile_report("[CONTROLLER]   ")
+    if profile:
+        profiler.export(profile)
+        print(f"[CONTROLLER] ✓ Latency profile exported to: {profile}")
+
+    # Report how often static HUD text came from the pre-rendered layer cache
+    if not headless:
+        cache_stats = text_cache.get_stats()
+        print(f"[CONTROLLER] ✓ Text layer cache: {cache_stats['hits']} hits, "
+              f"{cache_stats['misses']} misses ({cache_stats['hit_rate']:.0%} hit rate)")
+
+    # Finish the landmark recording
+    if recorder is not None:
+        recorder.close()
+        print(f"[CONTROLLER] ✓ Landmark frames recorded: {recorder.records} ({recorder.path})")
+        recorder = None
+
+    # Release a mouse button still held by a click or drag
+    release(mouse)
+
+    # Stop the display-rate cursor output
+    if isinstance(mouse, CursorInterpolator):
+        mouse.close()
+        stats = mouse.get_stats()
+        print(f"[CONTROLLER] ✓ Cursor interpolation: {stats['positions_received']} hand positions, "
+              f"{stats['moves_sent']} cursor moves ({stats['moves_per_position']:.1f} per position)")
+        mouse = mouse.mouse
+
+    # Send the remaining mouse events and report how many moves were merged
+    if isinstance(mouse, MouseDispatcher):
+        mouse.close()
+        stats = mouse.get_stats()
+        print(f"[CONTROLLER] ✓ Mouse moves: {stats['moves_submitted']} submitted, "
+              f"{stats['moves_sent']} sent, {stats['moves_coalesced']} coalesced "
+              f"({stats['backend_ms']:.2f} ms per injected event)")
+        mouse = mouse_backend
+    else:
+        mouse_backend.close()
+
+    # Report how many camera frames were skipped to stay on the newest one
+    if THREADED_CAPTURE:
+        stats = cap.get_stats()
+        print(f"[CONTROLLER] ✓ Frames captured: {stats['captured']}, "
+              f"processed: {stats['delivered']}, dropped: {stats['dropped']} "
+              f"({stats['allocations']} frame buffers allocated)")
+
+    # Release the webcam resource (also stops the capture thread)
     cap.release()
     print("[CONTROLLER] ✓ Webcam released")
 
-    # Close all OpenCV windows
-    cv2.destroyAllWindows()
-    print("[CONTROLLER] ✓ All windows closed")
+    # Close all OpenCV windows (none were opened in headless mode)
+    if not headless:
+        cv2.destroyAllWindows()
+        print("[CONTROLLER] ✓ All windows closed")
 
     print("[CONTROLLER] ✓ Resources released successfully")
     print("\n" + "=" * 70)
@@ -663,13 +1034,67 @@ if __name__ == "__main__":
     print("GESTURE CONTROLLED VIRTUAL MOUSE")
     print("=" * 70)
 
+    # Parse command-line options
+    parser = argparse.ArgumentParser(description="Gesture controlled virtual mouse")
+    parser.add_argument(
+        "--source",
+        default=None,
+        help="Camera index or video file to read instead of the webcam"
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        default=PIPELINE_MODE,
+        help="Run capture, inference, gesture logic and rendering as pipeline stages"
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        default=HEADLESS_MODE,
+        help="Run without preview window and overlays (quit with Ctrl+C or SIGTERM)"
+    )
+    parser.add_argument(
+        "--record",
+        default=RECORD_PATH,
+        help="Record timestamps and hand landmarks of every frame to this file"
+    )
+    parser.add_argument(
+        "--profile",
+        default=PROFILE_EXPORT,
+        help="Export per-stage latency percentiles and samples to this JSON file"
+    )
+    parser.add_argument(
+        "--user",
+        default=CALIBRATION_USER,
+        help="Load (or with --calibrate, store) the pinch calibration of this user"
+    )
+    parser.add_argument(
+        "--calibrate",
+        action="store_true",
+        help="Measure the user's pinch before starting and cache the thresholds"
+    )
+    parser.add_argument(
+        "--governor",
+        action="store_true",
+        default=GOVERNOR_ENABLED,
+        help="Switch model complexity and inference resolution to stay within GOVERNOR_BUDGET_MS"
+    )
+    parser.add_argument(
+        "--settings",
+        default=RUNTIME_CONFIG_FILE,
+        help="JSON file of runtime settings, reloaded while running when it changes"
+    )
+    args = parser.parse_args()
+
     try:
         # ====================================================================
         # NORMAL EXECUTION
         # ====================================================================
 
         # Call the main function to start the application
-        main()
+        main(source=args.source, pipeline_mode=args.pipeline, headless=args.headless,
+             record=args.record, profile=args.profile, user=args.user,
+             recalibrate=args.calibrate, settings=args.settings, quality_governor=args.governor)
 
     except KeyboardInterrupt:
         # ====================================================================
@@ -683,7 +1108,8 @@ if __name__ == "__main__":
         print("\nShutting down gracefully...")
 
         # Close all OpenCV windows
-        cv2.destroyAllWindows()
+        if not args.headless:
+            cv2.destroyAllWindows()
 
         print("✓ Program terminated successfully")
         print("=" * 70)
@@ -707,11 +1133,9 @@ if __name__ == "__main__":
         print("     pip install opencv-python mediapipe pyautogui numpy")
         print("  3. Ensure you have proper permissions to access the webcam")
         print("  4. Try restarting the application")
-        print("  5. Check if your Python version is 3.7 or higher")
+        print("  5. Check if your Python version is 3.10 or higher")
         print("=" * 70)
 
         # Close all windows even on error
-        cv2.destroyAllWindows()
-
-print("\n[CONTROLLER] ✓ Module loaded and ready")
-print("=" * 70)
\ No newline at end of file
+        if not args.headless:
+            cv2.destroyAllWindows()
@@ -0,0 +1,216 @@
+# ============================================================================
+# GESTURE_FEATURES.PY - Batched Hand Feature Engine
+# ============================================================================
+# This module computes every hand feature the gesture logic needs in one
+# vectorized pass over the (21, 3) landmark array:
+# - the full 5x5 fingertip-to-fingertip distance matrix
+# - finger extension flags (thumb, index, middle, ring, pinky)
+# - palm-normalized distance ratios (independent of hand size on screen)
+#
+# Gestures are described in a table (GESTURE_TABLE) and recognized by
+# looking up entries of these features, so adding a gesture means adding a
+# table row instead of more scalar distance calls.
+# ============================================================================
+
+# Import required libraries
+import math  # Scalar hypot for the palm size
+import numpy as np  # NumPy for vectorized math
+from config import *  # Import all configuration constants
+
+# ============================================================================
+# FINGER INDICES
+# ============================================================================
+
+# Row/column order of the fingertip distance matrix and extension flags
+FINGER_THUMB = 0
+FINGER_INDEX = 1
+FINGER_MIDDLE = 2
+FINGER_RING = 3
+FINGER_PINKY = 4
+
+# Landmark index of each fingertip, in finger order
+TIP_IDS = np.array([THUMB_TIP, INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP])
+
+# Landmark index of the joint each tip is compared against for extension
+# (thumb: IP joint horizontally, other fingers: PIP joint vertically)
+JOINT_IDS = np.array([THUMB_IP, INDEX_PIP, MIDDLE_PIP, RING_PIP, PINKY_PIP])
+
+# Axis compared for extension, per finger (0 = x for the thumb, 1 = y)
+EXTENSION_AXIS = np.array([0, 1, 1, 1, 1])
+
+# Every landmark the engine reads, gathered with a single fancy index:
+# rows 0-4 tips, 5-9 joints, 10 wrist, 11 middle finger knuckle
+FEATURE_IDS = np.concatenate([TIP_IDS, JOINT_IDS, [WRIST, MIDDLE_MCP]])
+_FINGERS = np.arange(5)
+
+# ============================================================================
+# GESTURE TABLE
+# ============================================================================
+# Checked in order, the first matching row wins. Row kinds:
+#   ("pinch", (finger_a, finger_b))  distance between two fingertips is
+#                                    below the click threshold
+#   ("extended", count)              exactly <count> fingers are extended
+
+GESTURE_TABLE = [
+    (MODE_LEFT_CLICK, "pinch", (FINGER_THUMB, FINGER_INDEX)),
+    (MODE_RIGHT_CLICK, "pinch", (FINGER_THUMB, FINGER_MIDDLE)),
+    (MODE_SCROLL, "extended", 5),
+]
+
+
+# ============================================================================
+# FEATURE ENGINE
+# ============================================================================
+
+class FeatureEngine:
+    """
+    Computes all hand features for one landmark array at a time.
+
+    All result arrays are preallocated and overwritten by every compute()
+    call, so no per-frame allocations are needed for the large buffers.
+
+    Attributes (valid after compute()):
+        tips (numpy.ndarray): (5, 2) fingertip pixel positions
+        distances (numpy.ndarray): (5, 5) fingertip distance matrix in pixels
+        extended (numpy.ndarray): (5,) bool, True if the finger is extended
+        extended_count (int): Number of extended fingers (0-5)
+        palm_size (float): Wrist to middle-finger knuckle distance in pixels
+        ratios (numpy.ndarray): (5, 5) distances divided by palm_size
+
+    Example:
+        engine = FeatureEngine()
+        engine.compute(points)
+        engine.distances[FINGER_THUMB, FINGER_INDEX]  # Thumb-index pinch distance
+    """
+
+    def __init__(self):
+        """
+        Allocate the feature buffers.
+        """
+        self.tips = np.zeros((5, 2), dtype=np.float32)
+        self._deltas = np.zeros((5, 5, 2), dtype=np.float32)
+        self.distances = np.zeros((5, 5), dtype=np.float32)
+        self.ratios = np.zeros((5, 5), dtype=np.float32)
+        self.extended = np.zeros(5, dtype=bool)
+        self.extended_count = 0
+        self.palm_size = 0.0
+
+    def compute(self, points):
+        """
+        Compute every feature from a landmark array.
+
+        Parameters:
+            points (numpy.ndarray): (21, 3) landmark array in pixels
+
+        Returns:
+            FeatureEngine: self (read the feature attributes)
+        """
+        # Gather every needed landmark (x, y) with one fancy index
+        selected = points[FEATURE_IDS, :2]
+        self.tips[:] = selected[:5]
+
+        # All pairwise tip-to-tip vectors via broadcasting: (5, 1, 2) - (1, 5, 2)
+        np.subtract(self.tips[:, None, :], self.tips[None, :, :], out=self._deltas)
+
+        # Distance matrix: length of every vector
+        np.hypot(self._deltas[..., 0], self._deltas[..., 1], out=self.distances)
+
+        # Extension flags: thumb compares x (tip left of IP joint in the
+        # mirrored view), the other fingers compare y (tip above PIP joint)
+        self.extended[:] = (selected[:5] < selected[5:10])[_FINGERS, EXTENSION_AXIS]
+        self.extended_count = int(np.count_nonzero(self.extended))
+
+        # Hand size: wrist to middle finger knuckle
+        self.palm_size = math.hypot(selected[11, 0] - selected[10, 0],
+                                    selected[11, 1] - selected[10, 1])
+
+        # Palm-normalized ratios (guard against a degenerate hand)
+        np.divide(self.distances, max(self.palm_size, 1e-6), out=self.ratios)
+
+        return self
+
+    def classify(self, click_threshold=CLICK_THRESHOLD):
+        """
+        Look up the first gesture in GESTURE_TABLE that matches the features.
+
+        Parameters:
+            click_threshold (float): Maximum fingertip distance (pixels)
+                                     for a pinch
+
+        Returns:
+            str: Matching gesture mode, or MODE_CURSOR if none matches
+        """
+        for mode, kind, argument in GESTURE_TABLE:
+            if kind == "pinch":
+                finger_a, finger_b = argument
+                if self.distances[finger_a, finger_b] < click_threshold:
+                    return mode
+            elif kind == "extended":
+                if self.extended_count == argument:
+                    return mode
+        return MODE_CURSOR
+
+
+# ============================================================================
+# BATCHED FEATURES (MANY HANDS AT ONCE)
+# ============================================================================
+
+def compute_batch(points_batch):
+    """
+    Compute the features of many hands at once (e.g. a recorded session).
+
+    Parameters:
+        points_batch (numpy.ndarray): (N, 21, 3) landmark arrays in pixels
+
+    Returns:
+        tuple: (distances (N, 5, 5), extended (N, 5) bool, palm_size (N,),
+                ratios (N, 5, 5))
+    """
+    selected = points_batch[:, FEATURE_IDS, :2]
+    tips = selected[:, :5]
+
+    # (N, 5, 1, 2) - (N, 1, 5, 2) -> all pairwise vectors of every hand
+    deltas = tips[:, :, None, :] - tips[:, None, :, :]
+    distances = np.hypot(deltas[..., 0], deltas[..., 1])
+
+    # Extension flags with the same per-finger axis as FeatureEngine
+    extended = (selected[:, :5] < selected[:, 5:10])[:, _FINGERS, EXTENSION_AXIS]
+
+    # Palm size and palm-normalized ratios
+    palm = selected[:, 11] - selected[:, 10]
+    palm_size = np.hypot(palm[:, 0], palm[:, 1])
+    ratios = distances / np.maximum(palm_size, 1e-6)[:, None, None]
+
+    return distances, extended, palm_size, ratios
+
+
+def classify_batch(distances, extended, click_threshold=CLICK_THRESHOLD):
+    """
+    Apply GESTURE_TABLE to the batched features of compute_batch().
+
+    Parameters:
+        distances (numpy.ndarray): (N, 5, 5) fingertip distance matrices
+        extended (numpy.ndarray): (N, 5) finger extension flags
+        click_threshold (float): Maximum fingertip distance (pixels) for a pinch
+
+    Returns:
+        numpy.ndarray: (N,) array of gesture mode strings
+    """
+    modes = np.full(len(distances), MODE_CURSOR, dtype=object)
+    unmatched = np.ones(len(distances), dtype=bool)
+    extended_count = np.count_nonzero(extended, axis=1)
+
+    # First matching row wins, exactly like FeatureEngine.classify()
+    for mode, kind, argument in GESTURE_TABLE:
+        if kind == "pinch":
+            finger_a, finger_b = argument
+            match = distances[:, finger_a, finger_b] < click_threshold
+        elif kind == "extended":
+            match = extended_count == argument
+        else:
+            continue
+        match &= unmatched
+        modes[match] = mode
+        unmatched &= ~match
+
+    return modes
@@ -0,0 +1,371 @@
+# ============================================================================
+# GESTURE_LOGIC.PY - Gesture Recognition and Mouse Control
+# ============================================================================
+# This module turns detected hand landmarks into mouse actions. It maps the
+# index finger to screen coordinates, filters the cursor (cursor_filters.py),
+# recognizes pinch and scroll gestures with a state machine
+# (gesture_state.py) and issues the corresponding mouse calls.
+# It does no drawing: it returns a description of what was recognized so the
+# rendering step can run separately (e.g. on another pipeline stage).
+#
+# All cursor and gesture state lives in a GestureSession, one per hand
+# source, so several cameras or users can be served from one machine
+# (multi_session.py). The module-level process_hand() and reset_state()
+# use a shared default session, for the single-camera application.
+#
+# Cursor smoothing, control area and gesture thresholds follow the runtime
+# settings (runtime_config.py): a reload is applied at the start of the
+# next processed hand.
+# ============================================================================
+
+# Import required libraries
+import time  # Time module for cooldowns and log timestamps
+import numpy as np  # NumPy for coordinate interpolation
+
+# Import our custom modules
+from config import *  # Import all configuration constants
+from gesture_utils import create_landmark_array, landmarks_to_array  # Landmark arrays
+from gesture_features import FeatureEngine  # Batched hand features
+from cursor_filters import create_filter, LerpFilter  # Cursor smoothing / prediction
+import runtime_config  # Live-tunable cursor and gesture settings
+from gesture_state import *  # Gesture state machine, states and events
+
+# ============================================================================
+# GESTURE SESSION (CURSOR AND GESTURE STATE OF ONE HAND SOURCE)
+# ============================================================================
+
+class GestureSession:
+    """
+    Cursor and gesture state of one camera / user.
+
+    Each session has its own cursor filter, click cooldown, drag and scroll
+    state and feature buffers, so sessions never influence each other.
+
+    Example:
+        session = GestureSession()
+        result = session.process_hand(landmarks, 1280, 720, 1920, 1080, mouse)
+    """
+
+    def __init__(self, cursor_filter=None, state_machine=None):
+        """
+        Parameters:
+            cursor_filter (CursorFilter): Filter for this session's cursor
+                                          (defaults to create_filter(CURSOR_FILTER))
+            state_machine (GestureStateMachine): Gesture recognizer with this
+                                                 session's thresholds
+                                                 (defaults to the config values)
+        """
+        # Cursor filter (CURSOR_FILTER: one_euro, kalman or the original lerp)
+        self.cursor_filter = create_filter(CURSOR_FILTER) if cursor_filter is None else cursor_filter
+
+        # Reusable landmark array, filled in-place for every processed hand
+        self._points = create_landmark_array()
+
+        # Feature engine with preallocated buffers, reused for every hand
+        self.feature_engine = FeatureEngine()
+
+        # Cursor / click / drag / right click / scroll state with hysteresis
+        self.state_machine = GestureStateMachine() if state_machine is None else state_machine
+
+        # Runtime settings in effect (the filter and state machine above
+        # are built from the config.py defaults)
+        self.settings = runtime_config.RuntimeConfig()
+
+        self.reset()
+
+    def reset(self):
+        """
+        Reset cursor and gesture state to their startup values.
+
+        Used by replay.py so every replay of a recording starts identically.
+        """
+        # Last cursor position sent to the mouse
+        self.prev_cursor_x = 0  # Previous X coordinate of cursor
+        self.prev_cursor_y = 0  # Previous Y coordinate of cursor
+        self.cursor_filter.reset()
+
+        # Gesture state (mode, drag, click cooldown) and scroll position
+        self.state_machine.reset()
+        self.scroll_start_y = 0  # Y position when scroll started (for delta calculation)
+
+    def apply_settings(self, settings):
+        """
+        Switch to reloaded runtime settings.
+
+        Only the settings that changed are applied, so a reload that does
+        not touch the thresholds keeps a user's calibration (and a filter
+        passed to the constructor is replaced only if cursor_filter changed).
+
+        Parameters:
+            settings (RuntimeConfig): New settings
+        """
+        changes = self.settings.diff(settings)
+        self.settings = settings
+
+        if "cursor_filter" in changes:
+            self.cursor_filter = create_filter(settings.cursor_filter)
+        if isinstance(self.cursor_filter, LerpFilter) and changes.keys() & {"cursor_filter", "smoothing_factor"}:
+            self.cursor_filter.factor = settings.smoothing_factor
+        if runtime_config.threshold_fields_changed(changes):
+            self.state_machine.set_thresholds(*settings.thresholds())
+        self.state_machine.cooldown = settings.click_cooldown
+
+    # ========================================================================
+    # HAND PROCESSING
+    # ========================================================================
+
+    def process_hand(self, hand_landmarks, frame_width, frame_height,
+                     screen_width, screen_height, mouse, now=None):
+        """
+        Recognize the gesture of one detected hand and perform the mouse action.
+
+        Steps:
+        1. Convert the landmarks to a pixel-space array
+        2. Map the index finger into screen coordinates and filter the cursor
+        3. Compute all hand features in one pass (gesture_features.py)
+        4. Advance the gesture state machine (gesture_state.py), issue the
+           mouse calls of its transitions and move the cursor (held still
+           while the button is down for a click)
+        5. Scroll while in the scroll state
+
+        Parameters:
+            hand_landmarks: MediaPipe hand landmarks for one hand, or a
+                            (21, 3) pixel-space array from landmarks_to_array()
+            frame_width (int): Width of the video frame in pixels
+            frame_height (int): Height of the video frame in pixels
+            screen_width (int): Width of the screen in pixels
+            screen_height (int): Height of the screen in pixels
+            mouse: Mouse backend or MouseDispatcher (mouse_output.py) with
+                   move_to/click/right_click/scroll
+            now (float): Current time in seconds (defaults to time.time())
+
+        Returns:
+            dict: Description of the recognized gesture for rendering:
+                "mode" (str): Gesture mode for this hand
+                "thumb", "index", "middle" (tuple): Finger tip pixel positions
+                "line" (tuple or None): (start, end, color, thickness) to draw
+                "drag_mode" (bool): True while a drag is active
+        """
+        # Get current time for cooldown checks
+        current_gesture_time = time.time() if now is None else now
+
+        # Follow a settings reload (one identity check per frame)
+        if runtime_config.get() is not self.settings:
+            self.apply_settings(runtime_config.get())
+
+        # ========================================================================
+        # STEP 1: CONVERT LANDMARKS TO A PIXEL-SPACE ARRAY
+        # ========================================================================
+
+        # Convert all 21 landmarks to pixel coordinates in one pass
+        # (replay and tests may pass an already converted array)
+        if isinstance(hand_landmarks, np.ndarray):
+            points = hand_landmarks
+        else:
+            points = landmarks_to_array(hand_landmarks, frame_width, frame_height, out=self._points)
+
+        # Finger tip pixel positions (integers for drawing and cursor mapping)
+        index_x, index_y = int(points[INDEX_TIP, 0]), int(points[INDEX_TIP, 1])
+        middle_x, middle_y = int(points[MIDDLE_TIP, 0]), int(points[MIDDLE_TIP, 1])
+        thumb_x, thumb_y = int(points[THUMB_TIP, 0]), int(points[THUMB_TIP, 1])
+
+        # ========================================================================
+        # STEP 2: MAP HAND POSITION TO SCREEN COORDINATES
+        # ========================================================================
+
+        # Calculate control area boundaries
+        # We use only the middle 60% of the frame for better control
+        area_start, area_end = self.settings.control_area_start, self.settings.control_area_end
+        control_start_x = int(frame_width * area_start)
+        control_end_x = int(frame_width * area_end)
+        control_start_y = int(frame_height * area_start)
+        control_end_y = int(frame_height * area_end)
+
+        # Map index finger position to screen coordinates
+        # np.interp: linear interpolation between ranges
+        screen_x = np.interp(
+            index_x,  # Input value (hand x-position)
+            [control_start_x, control_end_x],  # Input range
+            [0, screen_width]  # Output range (screen width)
+        )
+
+        screen_y = np.interp(
+            index_y,  # Input value (hand y-position)
+            [control_start_y, control_end_y],  # Input range
+            [0, screen_height]  # Output range (screen height)
+        )
+
+        # ========================================================================
+        # STEP 3: FILTER CURSOR MOVEMENT
+        # ========================================================================
+
+        # Remove fingertip jitter (and with the Kalman filter, predict ahead)
+        # The filters use the frame time, so smoothing does not depend on FPS
+        curr_x, curr_y = self.cursor_filter.update(screen_x, screen_y, current_gesture_time)
+
+        # Update previous cursor position for next frame
+        self.prev_cursor_x, self.prev_cursor_y = curr_x, curr_y
+
+        # ========================================================================
+        # STEP 4: CALCULATE HAND FEATURES
+        # ========================================================================
+
+        # All fingertip distances, extension flags and palm ratios in one pass
+        features = self.feature_engine.compute(points)
+
+        # ========================================================================
+        # STEP 5: GESTURE STATE MACHINE AND CURSOR MOVE
+        # ========================================================================
+
+        # Hysteresis and dwell frames filter out landmark noise; events only
+        # come from state transitions (gesture_state.py)
+        self._perform(self.state_machine.update(features, current_gesture_time), mouse, index_y)
+
+        # Move the actual mouse cursor to the calculated position, except
+        # while the button is down for a click: pinching moves the index
+        # finger, and a short pinch must release where it pressed (a click,
+        # not a tiny drag). Once the pinch is held long enough to become a
+        # drag, the moves stream with the button held.
+        if self.state_machine.state != STATE_CLICK:
+            mouse.move_to(curr_x, curr_y)
+
+        state = self.state_machine.state
+
+        # ========================================================================
+        # STEP 6: CONTINUOUS ACTIONS AND FEEDBACK OF THE CURRENT STATE
+        # ========================================================================
+
+        # Line to draw between finger tips (none while scrolling)
+        line = None
+
+        if state in (STATE_CLICK, STATE_DRAG):
+            # Red line between thumb and index
+            line = ((thumb_x, thumb_y), (index_x, index_y), COLOR_RED, 3)
+
+        elif state == STATE_RIGHT_CLICK:
+            # Blue line between thumb and middle finger
+            line = ((thumb_x, thumb_y), (middle_x, middle_y), COLOR_BLUE, 3)
+
+        elif state == STATE_SCROLL:
+            # Calculate vertical movement since the last scroll step
+            scroll_delta = self.scroll_start_y - index_y
+
+            # Only scroll if movement exceeds threshold (scaled to the hand)
+            if abs(scroll_delta) > self.state_machine.scroll_px:
+                # Calculate scroll amount (scale down by factor of 10)
+                scroll_amount = int(scroll_delta / 10)
+                # Execute scroll action
+                # Positive = scroll up, Negative = scroll down
+                mouse.scroll(scroll_amount)
+                # Update scroll start position
+                self.scroll_start_y = index_y
+                # Log the scroll action
+                print(f"[{time.strftime('%H:%M:%S')}] SCROLL: {scroll_amount}")
+
+        else:
+            # Green line between thumb and index (default)
+            line = ((thumb_x, thumb_y), (index_x, index_y), COLOR_GREEN, 2)
+
+        # Describe the result for the rendering step
+        return {
+            "mode": self.state_machine.mode,
+            "thumb": (thumb_x, thumb_y),
+            "index": (index_x, index_y),
+            "middle": (middle_x, middle_y),
+            "line": line,
+            "drag_mode": self.state_machine.dragging,
+        }
+
+    # ========================================================================
+    # MOUSE ACTIONS OF GESTURE EVENTS
+    # ========================================================================
+
+    def _perform(self, events, mouse, index_y=0):
+        """
+        Issue the mouse calls of state machine events.
+
+        Parameters:
+            events (tuple): Events from GestureStateMachine
+            mouse: Mouse backend or MouseDispatcher
+            index_y (int): Index fingertip Y position (scroll reference)
+        """
+        for event in events:
+            if event == EVENT_PRESS:
+                # Hold the left button: released as a click or after a drag
+                mouse.mouse_down()
+            elif event == EVENT_RELEASE:
+                mouse.mouse_up()
+                print(f"[{time.strftime('%H:%M:%S')}] LEFT CLICK performed")
+            elif event == EVENT_RIGHT_CLICK:
+                # Execute right mouse button click
+                mouse.right_click()
+                print(f"[{time.strftime('%H:%M:%S')}] RIGHT CLICK performed")
+            elif event == EVENT_DRAG_START:
+                print(f"[{time.strftime('%H:%M:%S')}] DRAG started")
+            elif event == EVENT_DRAG_END:
+                mouse.mouse_up()
+                print(f"[{time.strftime('%H:%M:%S')}] DRAG released")
+            elif event == EVENT_SCROLL_START:
+                # Vertical movement is measured from here
+                self.scroll_start_y = index_y
+            elif event == EVENT_SCROLL_END:
+                self.scroll_start_y = 0
+
+    def hand_missing(self, mouse):
+        """
+        Handle a frame without a hand (ends the gesture after
+        GESTURE_EXIT_FRAMES such frames, releasing a held button).
+
+        Parameters:
+            mouse: Mouse backend or MouseDispatcher
+        """
+        self._perform(self.state_machine.hand_missing(), mouse)
+
+    def release(self, mouse):
+        """
+        End the current gesture now, releasing a held button (at shutdown).
+
+        Parameters:
+            mouse: Mouse backend or MouseDispatcher
+        """
+        self._perform(self.state_machine.release(), mouse)
+
+# ============================================================================
+# DEFAULT SESSION (SINGLE-CAMERA APPLICATION)
+# ============================================================================
+
+# Session used by gesture_controller.py and replay.py
+default_session = GestureSession()
+
+
+def process_hand(hand_landmarks, frame_width, frame_height,
+                 screen_width, screen_height, mouse, now=None):
+    """
+    Process one hand with the default session (see GestureSession.process_hand).
+
+    Returns:
+        dict: Description of the recognized gesture for rendering
+    """
+    return default_session.process_hand(hand_landmarks, frame_width, frame_height,
+                                        screen_width, screen_height, mouse, now)
+
+
+def hand_missing(mouse):
+    """
+    Tell the default session that the frame had no hand.
+    """
+    default_session.hand_missing(mouse)
+
+
+def release(mouse):
+    """
+    End the default session's gesture, releasing a held button.
+    """
+    default_session.release(mouse)
+
+
+def reset_state():
+    """
+    Reset the default session to its startup values.
+    """
+    default_session.reset()
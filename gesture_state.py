@@ -0,0 +1,323 @@
+# ============================================================================
+# GESTURE_STATE.PY - Gesture State Machine with Hysteresis and Dwell
+# ============================================================================
+# Landmark noise makes per-frame threshold checks flicker: a pinch hovering
+# around CLICK_THRESHOLD used to start and stop every few frames (click
+# chatter, spurious drag releases), and a held right pinch clicked again
+# after every cooldown. GestureStateMachine instead keeps an explicit state
+# and changes it only through the rows of TRANSITIONS:
+#
+#   - hysteresis: a pinch starts below CLICK_THRESHOLD_RATIO and ends only
+#     above CLICK_RELEASE_RATIO (palm lengths, or CLICK_THRESHOLD /
+#     CLICK_RELEASE_THRESHOLD pixels); scrolling starts with 5 extended
+#     fingers and ends below SCROLL_EXIT_FINGERS
+#   - hand scale: with palm units the thresholds are multiplied by the
+#     smoothed palm length every frame, so they hold at any camera
+#     resolution and hand distance
+#   - dwell: a transition fires only after its condition held for a number
+#     of consecutive frames (GESTURE_ENTER_FRAMES / GESTURE_EXIT_FRAMES)
+#   - events: a mouse event is produced only when a transition fires
+#
+#   cursor ──left pinch──> click ──held DRAG_HOLD_FRAMES──> drag
+#     ^  ^   (press)         │                               │
+#     │  └── released ───────┘<──────── released ────────────┘
+#     │      (release)                  (drag end = release)
+#     ├──right pinch──> right click ──released──> cursor
+#     └──open hand────> scroll ──fingers folded──> cursor
+#
+# The left button is held from the pinch to its release: a short pinch is
+# a click (press + release), a held one a drag. When the hand disappears
+# for GESTURE_EXIT_FRAMES frames the button is released.
+# ============================================================================
+
+# Import required libraries
+from config import *  # Import all configuration constants
+from gesture_features import FINGER_THUMB, FINGER_INDEX, FINGER_MIDDLE  # Feature indices
+
+# ============================================================================
+# STATES AND EVENTS
+# ============================================================================
+
+# States
+STATE_CURSOR = "cursor"
+STATE_CLICK = "click"
+STATE_DRAG = "drag"
+STATE_RIGHT_CLICK = "right_click"
+STATE_SCROLL = "scroll"
+
+# Gesture mode shown in the HUD for every state
+STATE_MODES = {
+    STATE_CURSOR: MODE_CURSOR,
+    STATE_CLICK: MODE_LEFT_CLICK,
+    STATE_DRAG: MODE_LEFT_CLICK,
+    STATE_RIGHT_CLICK: MODE_RIGHT_CLICK,
+    STATE_SCROLL: MODE_SCROLL,
+}
+
+# Events produced by transitions
+EVENT_PRESS = "press"  # Left button down
+EVENT_RELEASE = "release"  # Left button up (a click when no drag started)
+EVENT_RIGHT_CLICK = "right_click"
+EVENT_DRAG_START = "drag_start"  # Informational: the button is already down
+EVENT_DRAG_END = "drag_end"  # Left button up after a drag
+EVENT_SCROLL_START = "scroll_start"
+EVENT_SCROLL_END = "scroll_end"
+
+# Default (pinch start, pinch release, scroll step) thresholds per unit
+THRESHOLD_DEFAULTS = {
+    "palm": (CLICK_THRESHOLD_RATIO, CLICK_RELEASE_RATIO, SCROLL_THRESHOLD_RATIO),
+    "pixels": (CLICK_THRESHOLD, CLICK_RELEASE_THRESHOLD, SCROLL_THRESHOLD),
+}
+
+# Events that start a click (subject to CLICK_COOLDOWN)
+CLICK_EVENTS = (EVENT_PRESS, EVENT_RIGHT_CLICK)
+
+# Event that ends each state when the hand is lost
+RELEASE_EVENTS = {
+    STATE_CLICK: EVENT_RELEASE,
+    STATE_DRAG: EVENT_DRAG_END,
+    STATE_SCROLL: EVENT_SCROLL_END,
+}
+
+# ============================================================================
+# TRANSITION TABLE
+# ============================================================================
+# (from state, condition, to state, dwell, event). Rows of the current state
+# are checked in order; a row fires when its condition held for <dwell>
+# consecutive frames ("enter", "exit" or "drag" select the configured frame
+# count). Conditions are defined in GestureStateMachine.CONDITIONS.
+
+TRANSITIONS = [
+    (STATE_CURSOR, "left_pinch", STATE_CLICK, "enter", EVENT_PRESS),
+    (STATE_CURSOR, "right_pinch", STATE_RIGHT_CLICK, "enter", EVENT_RIGHT_CLICK),
+    (STATE_CURSOR, "open_hand", STATE_SCROLL, "enter", EVENT_SCROLL_START),
+
+    (STATE_CLICK, "left_released", STATE_CURSOR, "exit", EVENT_RELEASE),
+    (STATE_CLICK, "left_held", STATE_DRAG, "drag", EVENT_DRAG_START),
+
+    (STATE_DRAG, "left_released", STATE_CURSOR, "exit", EVENT_DRAG_END),
+
+    (STATE_RIGHT_CLICK, "right_released", STATE_CURSOR, "exit", None),
+
+    (STATE_SCROLL, "left_pinch", STATE_CLICK, "enter", EVENT_PRESS),
+    (STATE_SCROLL, "right_pinch", STATE_RIGHT_CLICK, "enter", EVENT_RIGHT_CLICK),
+    (STATE_SCROLL, "hand_folded", STATE_CURSOR, "exit", EVENT_SCROLL_END),
+]
+
+
+# ============================================================================
+# STATE MACHINE
+# ============================================================================
+
+class GestureStateMachine:
+    """
+    Table-driven gesture recognizer for one hand.
+
+    Example:
+        machine = GestureStateMachine()
+        events = machine.update(feature_engine.compute(points), now)
+        if EVENT_PRESS in events:
+            mouse.mouse_down()
+        machine.state   # STATE_CURSOR, STATE_CLICK, STATE_DRAG, ...
+
+    Attributes:
+        state (str): Current state
+        transitions (int): Transitions fired since the last reset()
+        suppressed (int): Click transitions held back by the click cooldown
+        hand_scale (float): Smoothed palm length in pixels (palm units)
+        enter_px, exit_px, scroll_px (float): Thresholds of the current
+                                              frame in pixels
+    """
+
+    # Condition name -> test on (machine, features); pinch tests use the
+    # enter threshold to start and the release threshold to end
+    CONDITIONS = {
+        "left_pinch": lambda m, f: f.distances[FINGER_THUMB, FINGER_INDEX] < m.enter_px,
+        "left_held": lambda m, f: f.distances[FINGER_THUMB, FINGER_INDEX] <= m.exit_px,
+        "left_released": lambda m, f: f.distances[FINGER_THUMB, FINGER_INDEX] > m.exit_px,
+        "right_pinch": lambda m, f: f.distances[FINGER_THUMB, FINGER_MIDDLE] < m.enter_px,
+        "right_released": lambda m, f: f.distances[FINGER_THUMB, FINGER_MIDDLE] > m.exit_px,
+        "open_hand": lambda m, f: f.extended_count == 5,
+        "hand_folded": lambda m, f: f.extended_count < m.scroll_exit_fingers,
+    }
+
+    def __init__(self, enter_threshold=None, exit_threshold=None, scroll_threshold=None,
+                 units=GESTURE_THRESHOLD_UNITS, enter_frames=GESTURE_ENTER_FRAMES,
+                 exit_frames=GESTURE_EXIT_FRAMES, drag_frames=DRAG_HOLD_FRAMES,
+                 scroll_exit_fingers=SCROLL_EXIT_FINGERS, cooldown=CLICK_COOLDOWN,
+                 transitions=TRANSITIONS, scale_smoothing=PALM_SCALE_SMOOTHING):
+        """
+        Parameters:
+            enter_threshold (float): Fingertip distance below which a pinch
+                                     starts (None = default of the units)
+            exit_threshold (float): Fingertip distance above which a pinch
+                                    ends (None = default of the units)
+            scroll_threshold (float): Vertical movement per scroll step
+                                      (None = default of the units)
+            units (str): "palm" (thresholds in palm lengths) or "pixels"
+            enter_frames (int): Dwell frames of "enter" rows
+            exit_frames (int): Dwell frames of "exit" rows
+            drag_frames (int): Dwell frames of "drag" rows
+            scroll_exit_fingers (int): Scrolling ends below this many
+                                       extended fingers
+            cooldown (float): Minimum seconds between two click events
+            transitions (list): Transition table (defaults to TRANSITIONS)
+            scale_smoothing (float): Weight of the newest palm length in
+                                     its running average
+        """
+        self.hand_scale = 0.0
+        self.set_thresholds(enter_threshold, exit_threshold, scroll_threshold, units)
+        self.scale_smoothing = scale_smoothing
+        self.scroll_exit_fingers = scroll_exit_fingers
+        self.cooldown = cooldown
+        self.exit_frames = exit_frames
+        dwell = {"enter": enter_frames, "exit": exit_frames, "drag": drag_frames}
+
+        # Rows grouped by source state, with the dwell resolved and the
+        # condition looked up once: (condition, to state, dwell, event)
+        self._rows = {}
+        for source, condition, target, frames, event in transitions:
+            self._rows.setdefault(source, []).append(
+                (self.CONDITIONS[condition], target, dwell[frames], event))
+
+        self.reset()
+
+    def reset(self):
+        """
+        Return to the cursor state and forget all counters.
+        """
+        self.state = STATE_CURSOR
+        self._counts = [0] * len(self._rows.get(STATE_CURSOR, ()))
+        self.last_click_time = float("-inf")
+        self.missing = 0  # Consecutive frames without the hand
+        self.transitions = 0
+        self.suppressed = 0
+        self.hand_scale = 0.0  # No palm length measured yet
+        self._scale_thresholds(1.0 if self.units == "pixels" else 0.0)
+
+    def set_thresholds(self, enter_threshold=None, exit_threshold=None, scroll_threshold=None,
+                       units=GESTURE_THRESHOLD_UNITS):
+        """
+        Change the pinch and scroll thresholds (e.g. to a user calibration).
+
+        Parameters:
+            enter_threshold (float): Pinch start distance (None = default)
+            exit_threshold (float): Pinch release distance (None = default)
+            scroll_threshold (float): Scroll step distance (None = default)
+            units (str): "palm" or "pixels"
+        """
+        if units not in THRESHOLD_DEFAULTS:
+            raise ValueError(f"Unknown threshold units '{units}' (palm, pixels)")
+        defaults = THRESHOLD_DEFAULTS[units]
+        self.units = units
+        self.enter_threshold = defaults[0] if enter_threshold is None else enter_threshold
+        self.exit_threshold = defaults[1] if exit_threshold is None else exit_threshold
+        self.scroll_threshold = defaults[2] if scroll_threshold is None else scroll_threshold
+        self._scale_thresholds(1.0 if units == "pixels" else self.hand_scale)
+
+    def _scale_thresholds(self, scale):
+        """
+        Convert the thresholds to pixels for a hand scale.
+        """
+        self.enter_px = self.enter_threshold * scale
+        self.exit_px = self.exit_threshold * scale
+        self.scroll_px = self.scroll_threshold * scale
+
+    @property
+    def mode(self):
+        """Gesture mode (MODE_*) of the current state, for display."""
+        return STATE_MODES[self.state]
+
+    @property
+    def dragging(self):
+        """True while a drag is active."""
+        return self.state == STATE_DRAG
+
+    def update(self, features, now):
+        """
+        Advance the state machine by one frame.
+
+        At most one transition fires per frame.
+
+        Parameters:
+            features (FeatureEngine): Features of the current frame
+            now (float): Frame time in seconds (for the click cooldown)
+
+        Returns:
+            tuple: Events of the fired transition (empty for most frames)
+        """
+        self.missing = 0
+
+        # Palm units: thresholds follow the smoothed palm length
+        if self.units == "palm":
+            if self.hand_scale > 0.0:
+                self.hand_scale += self.scale_smoothing * (features.palm_size - self.hand_scale)
+            else:
+                self.hand_scale = features.palm_size
+            self._scale_thresholds(self.hand_scale)
+
+        rows = self._rows.get(self.state, ())
+        counts = self._counts
+        for i, (condition, target, dwell, event) in enumerate(rows):
+            # Consecutive frames this row's condition has held
+            if not condition(self, features):
+                counts[i] = 0
+                continue
+            counts[i] += 1
+            if counts[i] < dwell:
+                continue
+
+            # Clicks closer together than the cooldown are held back (the
+            # row stays armed and fires once the cooldown has passed)
+            if event in CLICK_EVENTS:
+                if now - self.last_click_time <= self.cooldown:
+                    self.suppressed += 1
+                    continue
+                self.last_click_time = now
+
+            self._enter(target)
+            return (event,) if event is not None else ()
+        return ()
+
+    def hand_missing(self, frames=None):
+        """
+        Count a frame without the hand; end the gesture after enough of them.
+
+        A single missed detection does not interrupt a drag, but a hand that
+        left the camera never leaves the button held down.
+
+        Parameters:
+            frames (int): Missing frames after which the gesture ends
+                          (None = the machine's exit frames)
+
+        Returns:
+            tuple: Events ending the current gesture (usually empty)
+        """
+        self.missing += 1
+        if frames is None:
+            frames = self.exit_frames
+        if self.missing < frames:
+            return ()
+        # The hand may come back at another distance: measure it anew
+        self.hand_scale = 0.0
+        return self.release()
+
+    def release(self):
+        """
+        End the current gesture immediately (hand lost, shutdown).
+
+        Returns:
+            tuple: Event ending the current state (e.g. EVENT_DRAG_END), if any
+        """
+        event = RELEASE_EVENTS.get(self.state)
+        if self.state != STATE_CURSOR:
+            self._enter(STATE_CURSOR)
+        return (event,) if event is not None else ()
+
+    def _enter(self, state):
+        """
+        Switch to a state and clear the dwell counters of its rows.
+        """
+        self.state = state
+        self._counts = [0] * len(self._rows.get(state, ()))
+        self.transitions += 1
@@ -4,15 +4,74 @@
 # This module contains utility functions for gesture recognition, distance
 # calculation, finger counting, and visual rendering of UI elements.
 # These functions are pure and reusable across the application.
+#
+# Importing this module is cheap and has no side effects: OpenCV is only
+# imported by the drawing functions, when the first frame is drawn, so
+# tools and tests that use the landmark and distance helpers never load it.
 # ============================================================================
 
 # Import required libraries
-import cv2  # OpenCV for drawing and image operations
+import math  # math.hypot for scalar distances
 import numpy as np  # NumPy for mathematical calculations
+from collections import OrderedDict  # LRU order for the text layer cache
 from config import *  # Import all configuration constants
 
-# Print module initialization message
-print("\n[GESTURE_UTILS] Loading gesture utility functions...")
+# ============================================================================
+# LANDMARK ARRAY CONVERSION
+# ============================================================================
+
+# Index arrays for vectorized finger checks (built once)
+FINGER_TIP_IDS = np.array(FINGER_TIPS)  # Index, middle, ring, pinky tips
+FINGER_PIP_IDS = np.array(FINGER_PIPS)  # Corresponding PIP joints
+
+
+def create_landmark_array():
+    """
+    Allocate a landmark array for landmarks_to_array() to fill.
+
+    Returns:
+        numpy.ndarray: Zeroed (NUM_LANDMARKS, 3) float32 array
+    """
+    return np.zeros((NUM_LANDMARKS, 3), dtype=np.float32)
+
+
+def landmarks_to_array(hand_landmarks, frame_width, frame_height, out=None):
+    """
+    Convert MediaPipe hand landmarks into a (21, 3) pixel-space array.
+
+    All 21 landmarks are read in a single pass and scaled from normalized
+    (0-1) coordinates to pixels, so downstream gesture math works on one
+    NumPy array instead of repeated protobuf attribute lookups.
+
+    Parameters:
+        hand_landmarks: MediaPipe hand landmarks (or its .landmark list)
+        frame_width (int): Width of the video frame in pixels
+        frame_height (int): Height of the video frame in pixels
+        out (numpy.ndarray): Preallocated (21, 3) float32 array to fill
+                             (a new one is allocated if None)
+
+    Returns:
+        numpy.ndarray: Array of rows (x, y, z) in pixels; z uses the same
+                       scale as x (MediaPipe's depth convention)
+
+    Example:
+        >>> points = create_landmark_array()
+        >>> landmarks_to_array(hand_landmarks, 1280, 720, out=points)
+        >>> points[INDEX_TIP, :2]  # Index finger tip (x, y) in pixels
+    """
+    if out is None:
+        out = create_landmark_array()
+
+    # Accept both the NormalizedLandmarkList and its repeated field
+    landmarks = getattr(hand_landmarks, "landmark", hand_landmarks)
+
+    # Fill all 63 coordinates in one assignment
+    out.reshape(-1)[:] = [c for lm in landmarks for c in (lm.x, lm.y, lm.z)]
+
+    # Scale normalized coordinates to pixels in-place
+    out *= (frame_width, frame_height, frame_width)
+
+    return out
 
 
 # ============================================================================
@@ -27,8 +86,9 @@ def get_distance(p1, p2):
     which is essential for detecting pinch gestures (thumb-index, thumb-middle).
 
     Parameters:
-        p1 (tuple): First point as (x, y) coordinates
-        p2 (tuple): Second point as (x, y) coordinates
+        p1 (tuple or numpy.ndarray): First point as (x, y) coordinates
+        p2 (tuple or numpy.ndarray): Second point as (x, y) coordinates
+                                     (rows of a landmark array work too)
 
     Returns:
         float: The Euclidean distance between the two points in pixels
@@ -42,24 +102,31 @@ def get_distance(p1, p2):
         >>> get_distance((100, 100), (100, 150))
         50.0
     """
-    # Extract x and y coordinates from the first point
-    x1, y1 = p1[0], p1[1]
+    # math.hypot computes sqrt(dx² + dy²) on plain floats, much cheaper
+    # than building NumPy scalars for a single distance
+    return math.hypot(float(p2[0] - p1[0]), float(p2[1] - p1[1]))
 
-    # Extract x and y coordinates from the second point
-    x2, y2 = p2[0], p2[1]
 
-    # Calculate the difference in x coordinates
-    dx = x2 - x1
+def fingertip_distances(points, tip_ids, origin_id=THUMB_TIP):
+    """
+    Calculate the distances from one landmark to several others at once.
 
-    # Calculate the difference in y coordinates
-    dy = y2 - y1
+    Parameters:
+        points (numpy.ndarray): (21, 3) landmark array in pixels
+        tip_ids (list or numpy.ndarray): Landmark indices to measure to
+        origin_id (int): Landmark index to measure from (default: thumb tip)
 
-    # Apply the Pythagorean theorem to find the distance
-    # sqrt(dx² + dy²) gives us the straight-line distance
-    distance = np.sqrt(dx ** 2 + dy ** 2)
+    Returns:
+        numpy.ndarray: One distance in pixels per entry of tip_ids
 
-    # Return the calculated distance
-    return distance
+    Example:
+        >>> thumb_index, thumb_middle = fingertip_distances(points, [INDEX_TIP, MIDDLE_TIP])
+    """
+    # Vector from the origin to every requested landmark (x, y only)
+    deltas = points[tip_ids, :2] - points[origin_id, :2]
+
+    # Euclidean length of every vector in one operation
+    return np.hypot(deltas[:, 0], deltas[:, 1])
 
 
 # ============================================================================
@@ -75,7 +142,8 @@ def count_extended_fingers(landmarks, frame_width, frame_height):
     An extended finger has its tip higher (lower y-value) than its joint.
 
     Parameters:
-        landmarks: MediaPipe hand landmarks object containing 21 3D points
+        landmarks: (21, 3) landmark array from landmarks_to_array(), or
+                   MediaPipe hand landmarks (converted on the fly)
         frame_width (int): Width of the video frame in pixels
         frame_height (int): Height of the video frame in pixels
 
@@ -89,53 +157,270 @@ def count_extended_fingers(landmarks, frame_width, frame_height):
     Use Case:
         This is primarily used to detect the 5-finger scroll gesture.
     """
-    # Initialize counter for extended fingers
-    extended_count = 0
+    # Work on a landmark array (convert MediaPipe landmarks if needed)
+    if isinstance(landmarks, np.ndarray):
+        points = landmarks
+    else:
+        points = landmarks_to_array(landmarks, frame_width, frame_height)
 
     # ========================================================================
     # CHECK THUMB (Special Case)
     # ========================================================================
     # The thumb moves horizontally rather than vertically, so we check
     # if the thumb tip is to the left of the thumb IP joint
-
-    # Get the thumb tip landmark (landmark index 4)
-    thumb_tip = landmarks[THUMB_TIP]
-
-    # Get the thumb IP (interphalangeal) joint landmark (landmark index 3)
-    thumb_ip = landmarks[THUMB_IP]
-
-    # Check if thumb is extended
     # For a right hand in mirror view, thumb tip should be LEFT of IP joint
-    # This means thumb_tip.x < thumb_ip.x indicates extension
-    if thumb_tip.x < thumb_ip.x:
-        extended_count += 1  # Increment counter if thumb is extended
-        # print(f"[GESTURE_UTILS] Thumb detected as extended")  # Debug output
+    thumb_extended = points[THUMB_TIP, 0] < points[THUMB_IP, 0]
 
     # ========================================================================
     # CHECK OTHER FOUR FINGERS (Index, Middle, Ring, Pinky)
     # ========================================================================
-    # These fingers move vertically, so we compare y-coordinates
+    # These fingers move vertically, so we compare y-coordinates of all four
+    # tips with their PIP joints in one vectorized comparison
     # Remember: In image coordinates, y increases downward
     # So a lower y value means higher on screen (extended finger)
+    fingers_extended = np.count_nonzero(
+        points[FINGER_TIP_IDS, 1] < points[FINGER_PIP_IDS, 1]
+    )
 
-    # Iterate through each finger using zip to pair tips with joints
-    for tip_id, pip_id in zip(FINGER_TIPS, FINGER_PIPS):
-        # Get the fingertip landmark
-        tip = landmarks[tip_id]
+    # Return the total count of extended fingers (0 to 5)
+    return int(thumb_extended) + int(fingers_extended)
 
-        # Get the PIP (Proximal Interphalangeal) joint landmark
-        pip = landmarks[pip_id]
 
-        # Check if finger is extended
-        # If tip y-coordinate < PIP y-coordinate, finger is extended upward
-        if tip.y < pip.y:
-            extended_count += 1  # Increment counter for this extended finger
-            # Map landmark ID to finger name for debugging
-            # finger_names = {8: "Index", 12: "Middle", 16: "Ring", 20: "Pinky"}
-            # print(f"[GESTURE_UTILS] {finger_names[tip_id]} finger detected as extended")
+# ============================================================================
+# IN-PLACE REGION BLENDING
+# ============================================================================
 
-    # Return the total count of extended fingers (0 to 5)
-    return extended_count
+# Preallocated solid-color buffers used as the blend source, keyed by
+# (height, width, color). Created once per panel size, reused every frame.
+_blend_buffers = {}
+
+
+def blend_region(frame, x1, y1, x2, y2, color, alpha):
+    """
+    Blend a solid color over a rectangular region of the frame, in-place.
+
+    Only the region of interest is touched: the blend works on a NumPy view
+    of the frame and writes straight back into it, using a preallocated
+    solid-color scratch buffer. No per-call allocations are made and the
+    cost is proportional to the region area, not the frame size.
+
+    Parameters:
+        frame (numpy.ndarray): The video frame (modified in-place)
+        x1, y1 (int): Top-left corner of the region
+        x2, y2 (int): Bottom-right corner of the region (exclusive)
+        color (tuple): BGR color to blend in
+        alpha (float): Weight of the color (0.0 = unchanged, 1.0 = solid)
+
+    Returns:
+        None (frame is modified in-place)
+
+    Formula:
+        region = color * alpha + region * (1 - alpha)
+    """
+    import cv2  # Imported lazily (see module header)
+
+    # Clip the region to the frame
+    frame_height, frame_width = frame.shape[:2]
+    x1, y1 = max(x1, 0), max(y1, 0)
+    x2, y2 = min(x2, frame_width), min(y2, frame_height)
+    if x1 >= x2 or y1 >= y2:
+        return
+
+    # View of the region (shares memory with the frame)
+    roi = frame[y1:y2, x1:x2]
+
+    # Reuse the solid-color buffer for this region size and color
+    key = (roi.shape, color)
+    solid = _blend_buffers.get(key)
+    if solid is None:
+        solid = np.empty(roi.shape, dtype=frame.dtype)
+        solid[:] = color
+        _blend_buffers[key] = solid
+
+    # Blend and write the result directly into the frame region
+    cv2.addWeighted(solid, alpha, roi, 1.0 - alpha, 0, dst=roi)
+
+
+# ============================================================================
+# CACHED TEXT LAYERS
+# ============================================================================
+
+class TextLayerCache:
+    """
+    Bounded cache of pre-rendered text tiles for static HUD text.
+
+    cv2.putText() rasterizes the glyph outlines on every call. For text that
+    rarely changes (help lines, shortcuts, indicators) the text is rendered
+    once into a small tile (BGR color layer + 8-bit alpha mask) and later
+    frames only composite that tile into the frame with cv2.copyTo().
+
+    Tiles are keyed by (text, font, font scale, color, thickness, frame size).
+    The least recently used tile is evicted when the cache is full, and the
+    whole cache is invalidated when the frame resolution changes.
+
+    Attributes:
+        max_size (int): Maximum number of cached tiles
+        hits (int): Lookups served from the cache
+        misses (int): Lookups that had to render a new tile
+        invalidations (int): Times the cache was cleared by a resolution change
+    """
+
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        """
+        Create an empty cache.
+
+        Parameters:
+            max_size (int): Maximum number of cached tiles
+        """
+        self.max_size = max_size
+        self._tiles = OrderedDict()  # Key -> (color layer, alpha mask, ascent)
+        self._frame_size = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get_tile(self, text, font_face, font_scale, color, thickness, frame_size):
+        """
+        Return the pre-rendered tile for a text, rendering it on a miss.
+
+        Parameters:
+            text (str): Text to render
+            font_face (int): OpenCV font (e.g. cv2.FONT_HERSHEY_SIMPLEX)
+            font_scale (float): Font scale
+            color (tuple): BGR text color
+            thickness (int): Stroke thickness
+            frame_size (tuple): (width, height) of the target frame
+
+        Returns:
+            tuple: (BGR color layer, uint8 alpha mask, ascent) where ascent is
+                   the distance from the tile top to the text baseline
+        """
+        # A different resolution invalidates every cached tile
+        if frame_size != self._frame_size:
+            if self._tiles:
+                self.invalidations += 1
+            self._tiles.clear()
+            self._frame_size = frame_size
+
+        key = (text, font_face, font_scale, color, thickness, frame_size)
+        entry = self._tiles.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._tiles.move_to_end(key)  # Mark as most recently used
+            return entry
+
+        # Render the text once into its own tile
+        self.misses += 1
+        entry = self._render(text, font_face, font_scale, color, thickness)
+        self._tiles[key] = entry
+
+        # Evict the least recently used tile when over capacity
+        if len(self._tiles) > self.max_size:
+            self._tiles.popitem(last=False)
+
+        return entry
+
+    @staticmethod
+    def _render(text, font_face, font_scale, color, thickness):
+        """
+        Rasterize text into a color layer with an alpha mask.
+        """
+        import cv2  # Imported lazily (see module header)
+
+        # Size of the text box; padding covers the stroke thickness
+        (text_width, text_height), baseline = cv2.getTextSize(
+            text, font_face, font_scale, thickness
+        )
+        pad = thickness + 1
+        ascent = text_height + pad
+        tile_height = ascent + baseline + pad
+        tile_width = text_width + 2 * pad
+
+        # Render the glyphs into the alpha mask only
+        alpha = np.zeros((tile_height, tile_width), dtype=np.uint8)
+        cv2.putText(alpha, text, (pad, ascent), font_face, font_scale, 255, thickness)
+
+        # Solid color layer; the alpha mask selects the text pixels
+        layer = np.empty((tile_height, tile_width, 3), dtype=np.uint8)
+        layer[:] = color
+
+        return layer, alpha, ascent
+
+    def clear(self):
+        """
+        Drop all cached tiles.
+        """
+        self._tiles.clear()
+
+    def get_stats(self):
+        """
+        Return the cache statistics.
+
+        Returns:
+            dict: size, hits, misses, hit rate and invalidations
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._tiles),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "invalidations": self.invalidations,
+        }
+
+
+# Shared cache used by all HUD drawing functions
+text_cache = TextLayerCache(TEXT_CACHE_SIZE)
+
+
+def draw_cached_text(frame, text, org, font_face, font_scale, color, thickness=1):
+    """
+    Draw static text using a cached pre-rendered tile.
+
+    Drop-in replacement for cv2.putText() (same argument order) for text
+    that rarely changes. The first call renders the text into a tile; later
+    calls only copy the tile's text pixels into the frame.
+
+    Parameters:
+        frame (numpy.ndarray): The video frame to draw on (modified in-place)
+        text (str): Text to draw
+        org (tuple): Bottom-left corner of the text baseline (x, y)
+        font_face (int): OpenCV font
+        font_scale (float): Font scale
+        color (tuple): BGR text color
+        thickness (int): Stroke thickness
+
+    Returns:
+        None (frame is modified in-place)
+    """
+    import cv2  # Imported lazily (see module header)
+
+    frame_height, frame_width = frame.shape[:2]
+    layer, alpha, ascent = text_cache.get_tile(
+        text, font_face, font_scale, color, thickness, (frame_width, frame_height)
+    )
+    pad = thickness + 1
+
+    # Tile position in the frame (top-left corner)
+    x1 = org[0] - pad
+    y1 = org[1] - ascent
+
+    # Clip the tile against the frame borders
+    fx1, fy1 = max(x1, 0), max(y1, 0)
+    fx2 = min(x1 + layer.shape[1], frame_width)
+    fy2 = min(y1 + layer.shape[0], frame_height)
+    if fx1 >= fx2 or fy1 >= fy2:
+        return
+    tx1, ty1 = fx1 - x1, fy1 - y1
+    tx2, ty2 = tx1 + (fx2 - fx1), ty1 + (fy2 - fy1)
+
+    # Composite: copy the text pixels only (putText's alpha mask is binary)
+    # cv2.copyTo writes straight into the frame view
+    cv2.copyTo(
+        layer[ty1:ty2, tx1:tx2],
+        alpha[ty1:ty2, tx1:tx2],
+        frame[fy1:fy2, fx1:fx2]
+    )
 
 
 # ============================================================================
@@ -162,36 +447,20 @@ def draw_info_panel(frame, fps, gesture_mode, frame_width, frame_height):
         None (frame is modified in-place)
 
     Visual Design:
-        - Semi-transparent black background (60% opacity)
+        - Semi-transparent black background (60% opacity, blended in-place)
         - Green text for FPS (indicating active/good performance)
         - Cyan/Orange text for mode (color depends on mode)
         - White text for instructions
     """
+    import cv2  # Imported lazily (see module header)
+
     # ========================================================================
-    # CREATE SEMI-TRANSPARENT OVERLAY
+    # DARKEN THE PANEL REGION
     # ========================================================================
-    # Make a copy of the frame to create the overlay effect
-    overlay = frame.copy()
-
-    # Draw a filled black rectangle for the info panel background
-    # Coordinates: (x1, y1) = top-left, (x2, y2) = bottom-right
-    cv2.rectangle(
-        overlay,  # Draw on the overlay copy
-        (0, 0),  # Top-left corner (x=0, y=0)
-        (frame_width, INFO_PANEL_HEIGHT),  # Bottom-right corner
-        COLOR_BLACK,  # Black color
-        -1  # -1 means filled rectangle (not just outline)
-    )
-
-    # Blend the overlay with the original frame to create transparency
-    # Formula: output = overlay * alpha + frame * beta + gamma
-    # alpha=0.6 (60% overlay) + beta=0.4 (40% original) = semi-transparent
-    cv2.addWeighted(
-        overlay, 0.6,  # Overlay image with 60% weight
-        frame, 0.4,  # Original frame with 40% weight
-        0,  # Gamma (brightness adjustment, 0 = none)
-        frame  # Output is written back to original frame
-    )
+    # Blend only the panel strip, in-place: 60% black + 40% original
+    # (no full-frame copy, cost proportional to the panel area)
+    # +1 keeps the bottom row that the inclusive cv2.rectangle() used to cover
+    blend_region(frame, 0, 0, frame_width, INFO_PANEL_HEIGHT + 1, COLOR_BLACK, 0.6)
 
     # ========================================================================
     # DRAW FPS COUNTER
@@ -228,7 +497,7 @@ def draw_info_panel(frame, fps, gesture_mode, frame_width, frame_height):
     mode_text = f"Mode: {gesture_mode}"
 
     # Draw the mode text below the FPS
-    cv2.putText(
+    draw_cached_text(
         frame,  # Image to draw on
         mode_text,  # Text to display
         (10, 60),  # Position (x=10, y=60 from top-left)
@@ -247,7 +516,7 @@ def draw_info_panel(frame, fps, gesture_mode, frame_width, frame_height):
     shortcuts_text = "Press 'Q' to quit | 'H' for help"
 
     # Draw the shortcuts text
-    cv2.putText(
+    draw_cached_text(
         frame,  # Image to draw on
         shortcuts_text,  # Text to display
         (10, 90),  # Position (x=10, y=90 from top-left)
@@ -280,34 +549,19 @@ def show_help_overlay(frame, frame_width, frame_height):
         None (frame is modified in-place)
 
     Visual Design:
-        - Dark semi-transparent background (80% opacity)
+        - Dark semi-transparent background (80% opacity, blended in-place)
         - Cyan headers for section titles
         - White text for instructions
         - Centered and well-spaced for readability
     """
+    import cv2  # Imported lazily (see module header)
+
     # ========================================================================
-    # CREATE DARK OVERLAY BACKGROUND
+    # DARKEN THE WHOLE FRAME
     # ========================================================================
-    # Create a copy of the frame for the overlay
-    overlay = frame.copy()
-
-    # Draw a filled black rectangle covering the entire frame
-    cv2.rectangle(
-        overlay,  # Draw on the overlay
-        (0, 0),  # Top-left corner
-        (frame_width, frame_height),  # Bottom-right corner (full frame)
-        COLOR_BLACK,  # Black color
-        -1  # Filled rectangle
-    )
-
-    # Blend the overlay with original frame for transparency
-    # 80% overlay makes it darker, ensuring text is readable
-    cv2.addWeighted(
-        overlay, 0.8,  # Dark overlay with 80% weight
-        frame, 0.2,  # Original frame with 20% weight (barely visible)
-        0,  # No gamma adjustment
-        frame  # Write back to original frame
-    )
+    # 80% black makes the background dark enough for readable text
+    # Blended in-place, no copy of the frame is made
+    blend_region(frame, 0, 0, frame_width, frame_height, COLOR_BLACK, 0.8)
 
     # ========================================================================
     # DEFINE HELP TEXT CONTENT
@@ -354,7 +608,7 @@ def show_help_overlay(frame, frame_width, frame_height):
         y_position = y_offset + (i * line_spacing)
 
         # Draw the text line
-        cv2.putText(
+        draw_cached_text(
             frame,  # Image to draw on
             text,  # Text content
             (50, y_position),  # Position (x=50 pixels from left, y=calculated)
@@ -384,12 +638,14 @@ def draw_hand_detected_indicator(frame, frame_width):
     Returns:
         None (frame is modified in-place)
     """
+    import cv2  # Imported lazily (see module header)
+
     # Calculate x-position for right-aligned text
     # Subtract 200 pixels from right edge for text placement
     x_position = frame_width - 200
 
     # Draw the "Hand Detected" text
-    cv2.putText(
+    draw_cached_text(
         frame,  # Image to draw on
         "Hand Detected",  # Text to display
         (x_position, 30),  # Position (top-right area)
@@ -420,10 +676,12 @@ def draw_gesture_indicator(frame, gesture_mode, frame_width, frame_height):
     Returns:
         None (frame is modified in-place)
     """
+    import cv2  # Imported lazily (see module header)
+
     # Check if we're in scroll mode
     if gesture_mode == MODE_SCROLL:
         # Draw "SCROLLING" text in the top-center of the frame
-        cv2.putText(
+        draw_cached_text(
             frame,
             "SCROLLING",  # Text to display
             (frame_width // 2 - 80, 50),  # Centered horizontally, near top
@@ -436,7 +694,7 @@ def draw_gesture_indicator(frame, gesture_mode, frame_width, frame_height):
     # Check if we're in left click mode
     elif gesture_mode == MODE_LEFT_CLICK:
         # Draw "CLICKING" text in the top-center
-        cv2.putText(
+        draw_cached_text(
             frame,
             "CLICKING",
             (frame_width // 2 - 80, 50),
@@ -463,8 +721,10 @@ def draw_drag_indicator(frame, frame_width, frame_height):
     Returns:
         None (frame is modified in-place)
     """
+    import cv2  # Imported lazily (see module header)
+
     # Draw "DRAGGING" text near the bottom-center
-    cv2.putText(
+    draw_cached_text(
         frame,
         "DRAGGING",
         (frame_width // 2 - 80, frame_height - 50),  # Bottom-center
@@ -476,16 +736,54 @@ def draw_drag_indicator(frame, frame_width, frame_height):
 
 
 # ============================================================================
-# MODULE INITIALIZATION COMPLETE
+# LATENCY PROFILE OVERLAY
 # ============================================================================
 
-print("[GESTURE_UTILS] ✓ All utility functions loaded successfully")
-print("[GESTURE_UTILS] ✓ Functions available:")
-print("[GESTURE_UTILS]   - get_distance()")
-print("[GESTURE_UTILS]   - count_extended_fingers()")
-print("[GESTURE_UTILS]   - draw_info_panel()")
-print("[GESTURE_UTILS]   - show_help_overlay()")
-print("[GESTURE_UTILS]   - draw_hand_detected_indicator()")
-print("[GESTURE_UTILS]   - draw_gesture_indicator()")
-print("[GESTURE_UTILS]   - draw_drag_indicator()")
-print("=" * 70)
\ No newline at end of file
+def draw_profile_overlay(frame, lines, frame_width, frame_height):
+    """
+    Draw the per-stage latency table (profiling.py) in the bottom-left corner.
+
+    Parameters:
+        frame (numpy.ndarray): The video frame to draw on (modified in-place)
+        lines (list): Text lines from StageProfiler.format_report()
+        frame_width (int): Width of the frame in pixels
+        frame_height (int): Height of the frame in pixels
+
+    Returns:
+        None (frame is modified in-place)
+    """
+    import cv2  # Imported lazily (see module header)
+
+    if not lines:
+        return
+
+    # Background box sized for the table (monospace-like fixed row height)
+    line_height = 18
+    box_height = line_height * len(lines) + 10
+    top = frame_height - box_height - 10
+    blend_region(frame, 0, top, 330, frame_height - 10, COLOR_BLACK, 0.6)
+
+    # Values change every refresh, so they are rasterized with putText
+    # (the header is static and comes from the text layer cache)
+    for row, text in enumerate(lines):
+        org = (10, top + 18 + row * line_height)
+        if row == 0:
+            draw_cached_text(frame, text, org, cv2.FONT_HERSHEY_PLAIN, 1.0, COLOR_CYAN, 1)
+        else:
+            cv2.putText(frame, text, org, cv2.FONT_HERSHEY_PLAIN, 1.0, COLOR_WHITE, 1)
+
+
+# ============================================================================
+# EXPORTS
+# ============================================================================
+# "from gesture_utils import *" brings in the helpers only, not the
+# libraries and configuration constants this module imports itself
+
+__all__ = [
+    "FINGER_TIP_IDS", "FINGER_PIP_IDS",
+    "create_landmark_array", "landmarks_to_array", "get_distance",
+    "fingertip_distances", "count_extended_fingers", "blend_region",
+    "TextLayerCache", "text_cache", "draw_cached_text", "draw_info_panel",
+    "show_help_overlay", "draw_hand_detected_indicator", "draw_gesture_indicator",
+    "draw_drag_indicator", "draw_profile_overlay",
+]
@@ -0,0 +1,231 @@
+# ============================================================================
+# GOVERNOR.PY - Frame-Time Governor for Model Complexity and Resolution
+# ============================================================================
+# MODEL_COMPLEXITY, the detection/tracking confidences and INFERENCE_SCALE
+# are fixed for a station, but the same settings that run at 60 FPS on a
+# desktop drop well below the target on a weak kiosk CPU. QualityGovernor
+# watches the hand-detection time of every frame and moves along a ladder of
+# quality levels (GOVERNOR_LEVELS, level 0 = best) to keep a percentile of it
+# (GOVERNOR_PERCENTILE, e.g. p95) within GOVERNOR_BUDGET_MS:
+#
+#   over budget          -> one level down (cheaper)
+#   predicted percentile -> one level up (better), after a hold time that
+#   at the better level     doubles every time an upgrade had to be undone
+#   below budget *
+#   UPGRADE_MARGIN
+#
+# The prediction uses the cost ratio of the two levels, measured on the
+# windows just before and after the governor last switched between them
+# (a level not yet measured is assumed to cost twice as much). Without it
+# a level that is just over budget would be tried again and again.
+#
+# A level is a set of runtime settings (runtime_config.py). Changing level
+# publishes new settings, so the hand tracker switches to them between two
+# frames (a model change is built and warmed up in the background). Every
+# decision is printed and kept in QualityGovernor.decisions.
+#
+# Decisions are made on full windows of GOVERNOR_WINDOW frames measured at
+# the current level. Frames processed while the tracker still builds the
+# graph of a new level (HandTracker.rebuilding) are not counted, so frames
+# of the previous level never count.
+# ============================================================================
+
+# Import required libraries
+import time  # Decision timing and log timestamps
+import numpy as np  # Percentiles
+from config import *  # Import all configuration constants
+from profiling import LatencyRing  # Fixed-size sample window
+import runtime_config  # Settings the levels are published as
+
+# Longest upgrade hold, as a multiple of the base hold time
+MAX_HOLD_FACTOR = 8
+
+
+class QualityGovernor:
+    """
+    Keeps a frame-time percentile within a budget by changing quality levels.
+
+    Example:
+        governor = QualityGovernor(budget_ms=33.3)
+        while True:
+            start = time.perf_counter()
+            results = tracker.process(frame)
+            governor.update(1000.0 * (time.perf_counter() - start))
+    """
+
+    def __init__(self, budget_ms=GOVERNOR_BUDGET_MS, levels=GOVERNOR_LEVELS,
+                 percentile=GOVERNOR_PERCENTILE, window=GOVERNOR_WINDOW,
+                 hold=GOVERNOR_HOLD_SECONDS, upgrade_margin=GOVERNOR_UPGRADE_MARGIN,
+                 start_level=0, publish=True, verbose=True):
+        """
+        Parameters:
+            budget_ms (float): Frame time the percentile must stay within
+            levels (sequence): Runtime setting overrides per level (dicts,
+                               best quality first)
+            percentile (float): Percentile of the window compared with the
+                                budget (e.g. 95)
+            window (int): Frames per decision
+            hold (float): Seconds at a level before an upgrade is tried
+            upgrade_margin (float): Upgrade only when the percentile predicted
+                                    at the better level is below
+                                    budget * upgrade_margin
+            start_level (int): Level to start at
+            publish (bool): Publish the level's settings (False = only
+                            decide, for simulations)
+            verbose (bool): Print every decision
+
+        Raises:
+            ValueError: If there are no levels or a level is not a valid
+                        set of runtime settings
+        """
+        if not levels:
+            raise ValueError("The governor needs at least one quality level")
+        base = runtime_config.RuntimeConfig()
+        for level in levels:
+            runtime_config.RuntimeConfig.from_dict(level, base)  # Validated once, here
+
+        self.budget_ms = budget_ms
+        self.levels = [dict(level) for level in levels]
+        self.percentile = percentile
+        self.window = window
+        self.hold = hold
+        self.upgrade_margin = upgrade_margin
+        self.publish = publish
+        self.verbose = verbose
+
+        self._samples = LatencyRing(window)
+        self._published = None  # Settings this governor published last
+        self._upgrade_failures = 0  # Upgrades undone at the next decision
+        self._last_upgrade_time = None
+        self._cost_ratios = {}  # Level -> cost of level / cost of level + 1
+        self._previous_window = None  # (level, percentile ms) of the last window
+
+        self.level = min(max(start_level, 0), len(self.levels) - 1)
+        self.decisions = []  # One dict per level change
+        self.last_percentile_ms = 0.0
+        self._changed_at = None  # Set by the first update()
+        self._apply()
+
+    # ------------------------------------------------------------------------
+    # Measurements
+    # ------------------------------------------------------------------------
+
+    def update(self, frame_ms, now=None, pending=False):
+        """
+        Record one frame time and change level if a decision is due.
+
+        Parameters:
+            frame_ms (float): Hand-detection time of the frame in milliseconds
+            now (float): Current time in seconds (defaults to time.monotonic())
+            pending (bool): The frame still ran with the previous level's
+                            model (not counted)
+
+        Returns:
+            int or None: The new level, None if it did not change
+        """
+        if now is None:
+            now = time.monotonic()
+        if self._changed_at is None:
+            self._changed_at = now
+
+        # A settings reload replaced the published settings: apply the
+        # current level on top of the reloaded ones
+        if self.publish and runtime_config.get() is not self._published:
+            self._apply()
+
+        if pending:
+            return None
+        self._samples.add(int(frame_ms * 1e6))
+        if self._samples.count < self.window:
+            return None
+
+        value_ms = float(np.percentile(self._samples.values(), self.percentile)) / 1e6
+        self.last_percentile_ms = value_ms
+        self._samples = LatencyRing(self.window)  # Next decision on new frames
+
+        # First window after a switch between neighbouring levels: their cost ratio
+        if self._previous_window is not None and abs(self._previous_window[0] - self.level) == 1:
+            previous_level, previous_ms = self._previous_window
+            better = min(previous_level, self.level)
+            better_ms, worse_ms = (previous_ms, value_ms) if previous_level == better else (value_ms, previous_ms)
+            self._cost_ratios[better] = max(better_ms / max(worse_ms, 1e-6), 1.0)
+        self._previous_window = (self.level, value_ms)
+
+        if value_ms > self.budget_ms and self.level < len(self.levels) - 1:
+            # An upgrade that immediately goes over budget is retried later
+            if self._last_upgrade_time is not None and self._last_upgrade_time == self._changed_at:
+                self._upgrade_failures += 1
+            return self._change(self.level + 1, value_ms, now, "over budget")
+
+        if self.level > 0:
+            hold = self.hold * min(2 ** self._upgrade_failures, MAX_HOLD_FACTOR)
+            predicted_ms = value_ms * self._cost_ratios.get(self.level - 1, 2.0)
+            if predicted_ms < self.budget_ms * self.upgrade_margin and now - self._changed_at >= hold:
+                self._last_upgrade_time = now
+                return self._change(self.level - 1, value_ms, now, "headroom", predicted_ms)
+
+        return None
+
+    # ------------------------------------------------------------------------
+    # Level changes
+    # ------------------------------------------------------------------------
+
+    def _change(self, level, value_ms, now, reason, predicted_ms=None):
+        """
+        Switch to a level, log the decision and publish its settings.
+        """
+        decision = {
+            "time": now,
+            "from": self.level,
+            "to": level,
+            "percentile_ms": round(value_ms, 2),
+            "predicted_ms": None if predicted_ms is None else round(predicted_ms, 2),
+            "budget_ms": round(self.budget_ms, 2),
+            "reason": reason,
+            "settings": dict(self.levels[level]),
+        }
+        self.decisions.append(decision)
+        self.level = level
+        self._changed_at = now
+        self._apply()
+
+        if self.verbose:
+            if predicted_ms is None:
+                detail = f"budget {self.budget_ms:.1f} ms"
+            else:
+                detail = f"predicted {predicted_ms:.1f} ms < {self.budget_ms * self.upgrade_margin:.1f} ms"
+            settings = ", ".join(f"{name}={value}" for name, value in self.levels[level].items())
+            print(f"[{time.strftime('%H:%M:%S')}] [GOVERNOR] Level {decision['from']} -> {level}: "
+                  f"p{self.percentile:g} {value_ms:.1f} ms ({reason}, {detail}); {settings}")
+        return level
+
+    def _apply(self):
+        """
+        Publish the current level on top of the current runtime settings.
+        """
+        if not self.publish:
+            return
+        current = runtime_config.get()
+        settings = current.replace(**self.levels[self.level])
+        # Unchanged settings keep their identity (no reload in the tracker)
+        if not current.diff(settings):
+            settings = current
+        runtime_config.publish(settings)
+        self._published = settings
+
+    def get_stats(self):
+        """
+        Get the governor state.
+
+        Returns:
+            dict: level, levels, changes, upgrades_undone, last_percentile_ms
+                  and budget_ms
+        """
+        return {
+            "level": self.level,
+            "levels": len(self.levels),
+            "changes": len(self.decisions),
+            "upgrades_undone": self._upgrade_failures,
+            "last_percentile_ms": self.last_percentile_ms,
+            "budget_ms": self.budget_ms,
+        }
@@ -0,0 +1,706 @@
+# ============================================================================
+# HAND_TRACKER.PY - MediaPipe Hand Tracking at a Reduced Inference Resolution
+# ============================================================================
+# MediaPipe's palm detector and landmark model work on small internal inputs
+# (192x192 / 224x224), so feeding them a full 1280x720 RGB frame mostly costs
+# memory bandwidth for the color conversion and resize. HandTracker sends
+# MediaPipe a scaled (and optionally cropped) copy of the frame instead and
+# re-projects the landmarks into full-frame coordinates, so drawing and
+# cursor mapping are unaffected.
+#
+# With INFERENCE_AUTO_SCALE the scale is chosen automatically from
+# INFERENCE_SCALES to keep inference within the INFERENCE_TARGET_FPS budget.
+#
+# With ROI_TRACKING, once a hand is found only a padded, motion-predicted
+# square crop around it is sent to MediaPipe, resized to a fixed
+# ROI_CROP_SIZE image. When the hand is lost in the crop (or its score drops
+# below ROI_MIN_CONFIDENCE) the same frame is processed again at full size.
+#
+# With MIRROR_LANDMARKS the frame is processed as captured and the returned
+# landmarks are mirrored (x -> 1 - x) to match the mirrored preview, so no
+# flipped copy of the frame is needed for inference.
+#
+# Model complexity, confidences and inference scale follow the runtime
+# settings (runtime_config.py). When they are reloaded, a new MediaPipe
+# graph is built and warmed up on a background thread while the old one
+# keeps processing frames, and is swapped in between two frames.
+#
+# With a frame skip above 1 (frame_skip.py), frames on which the hand
+# barely moved are not sent to MediaPipe at all. They hold the last
+# inferred landmarks by default, or extrapolate them from the last two
+# inferred frames with FRAME_SKIP_EXTRAPOLATE.
+# ============================================================================
+
+# Import required libraries
+import time  # Inference timing
+from types import SimpleNamespace  # Results of frames that skipped inference
+import threading  # Background model rebuild after a settings reload
+import numpy as np  # Landmark bounding boxes
+import cv2  # Resizing and color conversion
+import config  # Environment setup before MediaPipe loads
+from config import *  # Import all configuration constants
+from profiling import profiler, now_ns  # Per-stage latency samples
+import runtime_config  # Live-tunable model settings
+from frame_skip import FrameSkipper  # Frames that can skip inference
+
+# MediaPipe module, imported by load_mediapipe() on first use
+_mediapipe = None
+
+
+def load_mediapipe():
+    """
+    Import MediaPipe on first use.
+
+    MediaPipe (and the TensorFlow Lite runtime it loads) takes longer to
+    import than the rest of the application together, so modules that only
+    need the helpers below (replay, benchmarks, tools) never pay for it.
+
+    Returns:
+        module: The mediapipe module
+    """
+    global _mediapipe
+    if _mediapipe is None:
+        # Log levels must be set before the native library loads
+        config.configure_environment()
+        import mediapipe
+        _mediapipe = mediapipe
+    return _mediapipe
+
+
+# ============================================================================
+# HAND TRACKER
+# ============================================================================
+
+class HandTracker:
+    """
+    MediaPipe Hands with a configurable inference resolution.
+
+    process() takes the full-resolution BGR frame and returns MediaPipe
+    results whose landmarks are normalized to the full mirrored preview
+    frame, just like calling hands.process() on the flipped RGB frame.
+    With mirror=False the frame passed in must already be mirrored.
+
+    Example:
+        with HandTracker(inference_scale=0.5) as tracker:
+            results = tracker.process(frame)
+    """
+
+    def __init__(self, inference_scale=None, crop=INFERENCE_CROP,
+                 auto_scale=INFERENCE_AUTO_SCALE, target_fps=INFERENCE_TARGET_FPS,
+                 model_complexity=None, roi_tracking=ROI_TRACKING,
+                 mirror=MIRROR_LANDMARKS, frame_skip=None):
+        """
+        Create the MediaPipe Hands detector.
+
+        Parameters:
+            inference_scale (float): Scale of the image sent to MediaPipe
+                                     (None = runtime settings)
+            crop (tuple or None): (x1, y1, x2, y2) frame fractions sent to
+                                  MediaPipe (None = whole frame)
+            auto_scale (bool): Pick the scale from INFERENCE_SCALES to hit
+                               target_fps
+            target_fps (float): Frame rate the automatic scale aims for
+            model_complexity (int): 0 = lite model, 1 = full model
+                                    (None = runtime settings)
+            roi_tracking (bool): Process only a crop around the tracked hand
+            mirror (bool): process() receives unmirrored camera frames and
+                           returns landmarks mirrored to the preview
+            frame_skip (int): Inference at least every frame_skip frames,
+                              landmarks extrapolated in between
+                              (1 = every frame, None = runtime settings)
+        """
+        # Settings this tracker was built with; process() follows reloads
+        self.settings = runtime_config.get()
+        if inference_scale is None:
+            inference_scale = self.settings.inference_scale
+        if model_complexity is None:
+            model_complexity = self.settings.model_complexity
+        self.hands = create_hands(model_complexity, self.settings.min_detection_confidence,
+                                  self.settings.min_tracking_confidence)
+
+        self.crop = crop
+        self.auto_scale = auto_scale
+        self.roi_tracking = roi_tracking
+        self.mirror = mirror
+        self.budget_ms = 1000.0 / target_fps
+
+        # Automatic mode starts at the largest scale and steps down if needed
+        if auto_scale:
+            self._scale_index = 0
+            self.scale = INFERENCE_SCALES[0]
+        else:
+            self.scale = inference_scale
+
+        # Reused (resized BGR, RGB) inference buffers, one pair per image size
+        # (full-frame and ROI images alternate, so both pairs are kept)
+        self._buffers = {}
+
+        # ROI tracking state: crop for the next frame and last hand center
+        self._roi = None
+        self._prev_center = None
+
+        # Frame skipping: a fixed frame_skip argument is not overridden by reloads
+        self.fixed_frame_skip = frame_skip is not None
+        self.skipper = FrameSkipper(
+            max_skip=self.settings.frame_skip if frame_skip is None else frame_skip,
+            motion_threshold=self.settings.frame_skip_motion_threshold)
+        self._last_results = None  # Results of the last inferred frame
+        self.last_skipped = False  # Last processed frame was not inferred
+
+        # Statistics
+        self.frames = 0
+        self.scale_changes = 0
+        self.inference_pixels = 0  # Pixels of the last image sent to MediaPipe
+        self.total_pixels = 0  # Frame pixels converted for MediaPipe, all frames
+        self.roi_frames = 0  # Inferences on a hand-ROI crop
+        self.full_frames = 0  # Inferences on the full frame (or INFERENCE_CROP)
+        self.redetections = 0  # Hand lost in the crop: full frame processed again
+        self.model_changes = 0  # MediaPipe graphs swapped in after a reload
+        self._total_ms = 0.0
+        self._window_ms = 0.0  # Inference time since the last scale decision
+        self._window_frames = 0
+
+        # Background rebuild after a settings reload: the worker thread and
+        # the (graph, settings) it produced, swapped in by process()
+        self._rebuild_thread = None
+        self._next_hands = None
+        self._frame_size = (CAMERA_WIDTH, CAMERA_HEIGHT)
+
+    # ------------------------------------------------------------------------
+    # Inference
+    # ------------------------------------------------------------------------
+
+    def process(self, frame):
+        """
+        Detect hands in a full-resolution BGR frame.
+
+        Parameters:
+            frame (numpy.ndarray): BGR frame at full resolution, as captured
+                                   (already mirrored when mirror=False)
+
+        Returns:
+            MediaPipe results; landmarks are normalized to the full
+            mirrored frame
+        """
+        frame_height, frame_width = frame.shape[:2]
+        self._frame_size = (frame_width, frame_height)
+
+        # Follow settings reloads between frames (one identity check)
+        if runtime_config.get() is not self.settings:
+            self._apply_settings(runtime_config.get())
+        if self._next_hands is not None:
+            self._swap_model()
+
+        # Region sent to MediaPipe when no hand is tracked (pixels)
+        # (INFERENCE_CROP is given in preview coordinates)
+        if self.crop is None:
+            region = (0, 0, frame_width, frame_height)
+        else:
+            x1, y1, x2, y2 = self.crop
+            if self.mirror:
+                x1, x2 = 1.0 - x2, 1.0 - x1
+            region = (int(x1 * frame_width), int(y1 * frame_height),
+                      int(x2 * frame_width), int(y2 * frame_height))
+
+        start = time.perf_counter()
+
+        # Little motion since the last inference: hold or extrapolate the landmarks
+        self.last_skipped = self.skipper.max_skip > 1 and not self.skipper.should_infer(frame)
+        if self.last_skipped:
+            results = predicted_results(self.skipper.predict(), self._last_results)
+            self.frames += 1
+            self._total_ms += 1000.0 * (time.perf_counter() - start)
+            return results
+
+        if self._roi is not None:
+            # Tracking: only the predicted hand region, at a fixed size
+            results = self._infer(frame, self._roi, (ROI_CROP_SIZE, ROI_CROP_SIZE))
+            self.roi_frames += 1
+
+            # Lost (or unsure) in the crop: fall back to full-frame detection
+            if not hand_confident(results):
+                self.redetections += 1
+                results = self._infer(frame, region)
+                self.full_frames += 1
+        else:
+            results = self._infer(frame, region)
+            self.full_frames += 1
+
+        # Predict where to crop the next frame (in captured-frame coordinates)
+        if self.roi_tracking:
+            self._update_roi(results, frame_width, frame_height)
+
+        # Match the mirrored preview
+        if self.mirror and results.multi_hand_landmarks:
+            mirror_landmarks(results)
+
+        # Landmarks skipped frames are extrapolated from
+        if self.skipper.max_skip > 1:
+            self.skipper.observe(landmark_array(results))
+            self._last_results = results
+
+        elapsed_ms = 1000.0 * (time.perf_counter() - start)
+
+        self.frames += 1
+        self._total_ms += elapsed_ms
+        if self.auto_scale:
+            self._adapt(elapsed_ms)
+
+        return results
+
+    def warm_up(self, frame_width=CAMERA_WIDTH, frame_height=CAMERA_HEIGHT, count=WARMUP_FRAMES,
+                hands=None):
+        """
+        Run MediaPipe on synthetic frames before the first camera frame.
+
+        The first process() calls start the MediaPipe graph and allocate
+        the TFLite tensors, and are many times slower than steady state.
+        Warm-up frames pay for that during startup (alongside opening the
+        camera) instead of on the user's first frames. They are sent at
+        the size the first real frame will have and do not count in the
+        statistics or the automatic scale.
+
+        Parameters:
+            frame_width (int): Expected camera frame width in pixels
+            frame_height (int): Expected camera frame height in pixels
+            count (int): Warm-up inferences
+            hands: MediaPipe graph to warm up instead of the current one
+                   (a rebuild; uses its own images, as the current graph
+                   may be processing a frame in the reused buffers)
+
+        Returns:
+            list: Milliseconds of every warm-up inference
+        """
+        sizes = [(max(1, int(round(frame_width * self.scale))),
+                  max(1, int(round(frame_height * self.scale))))]
+        if self.roi_tracking:
+            sizes.append((ROI_CROP_SIZE, ROI_CROP_SIZE))
+
+        timings = []
+        for i in range(count):
+            width, height = sizes[i % len(sizes)]
+            if hands is None:
+                _, rgb = self._get_buffers(width, height)
+                rgb.fill(128)  # Mid-gray frame: no hand, but every model runs its setup
+            else:
+                rgb = np.full((height, width, 3), 128, dtype=np.uint8)
+            start = time.perf_counter()
+            (self.hands if hands is None else hands).process(rgb)
+            timings.append(1000.0 * (time.perf_counter() - start))
+        return timings
+
+    # ------------------------------------------------------------------------
+    # Runtime settings
+    # ------------------------------------------------------------------------
+
+    @property
+    def rebuilding(self):
+        """True while a graph for new model settings is built or waiting to be swapped in."""
+        return self._next_hands is not None or (
+            self._rebuild_thread is not None and self._rebuild_thread.is_alive())
+
+    def _apply_settings(self, settings):
+        """
+        Follow reloaded runtime settings (called by process(), between frames).
+
+        The inference scale changes immediately (unless it is automatic);
+        model settings start a background rebuild of the MediaPipe graph.
+        """
+        changes = self.settings.diff(settings)
+        self.settings = settings
+        if "inference_scale" in changes and not self.auto_scale:
+            self.scale = settings.inference_scale
+        if "frame_skip" in changes and not self.fixed_frame_skip:
+            self.skipper.max_skip = settings.frame_skip
+            self.skipper.reset()  # Next frame is inferred
+        if "frame_skip_motion_threshold" in changes:
+            self.skipper.motion_threshold = settings.frame_skip_motion_threshold
+
+        # One rebuild at a time; _swap_model() starts another one if the
+        # settings changed again meanwhile
+        rebuilding = self._rebuild_thread is not None and self._rebuild_thread.is_alive()
+        if any(name in changes for name in runtime_config.MODEL_FIELDS) and not rebuilding:
+            self._rebuild_thread = threading.Thread(
+                target=self._rebuild_model, args=(settings,), name="model-rebuild", daemon=True)
+            self._rebuild_thread.start()
+
+    def _rebuild_model(self, settings):
+        """
+        Build and warm up a MediaPipe graph for new settings (worker thread).
+        """
+        try:
+            hands = create_hands(settings.model_complexity, settings.min_detection_confidence,
+                                 settings.min_tracking_confidence)
+            self.warm_up(*self._frame_size, count=max(WARMUP_FRAMES, 1), hands=hands)
+        except Exception as e:  # Keep running with the current graph
+            print(f"[TRACKER] ⚠ Could not build MediaPipe graph for the new settings: {e}")
+            return
+        self._next_hands = (hands, settings)
+
+    def _swap_model(self):
+        """
+        Replace the MediaPipe graph with the rebuilt one (between frames).
+        """
+        (hands, built_for), self._next_hands = self._next_hands, None
+        previous, self.hands = self.hands, hands
+        previous.close()
+        self.model_changes += 1
+        print(f"[TRACKER] ✓ MediaPipe graph replaced: model complexity {built_for.model_complexity}, "
+              f"confidence {built_for.min_detection_confidence}/{built_for.min_tracking_confidence}")
+
+        # Settings changed again while the graph was being built
+        if any(getattr(built_for, name) != getattr(self.settings, name)
+               for name in runtime_config.MODEL_FIELDS):
+            self._rebuild_thread = threading.Thread(
+                target=self._rebuild_model, args=(self.settings,), name="model-rebuild", daemon=True)
+            self._rebuild_thread.start()
+
+    def _infer(self, frame, region, size=None):
+        """
+        Run MediaPipe on one region of the frame.
+
+        Parameters:
+            frame (numpy.ndarray): Full-resolution BGR frame
+            region (tuple): (x1, y1, x2, y2) pixel region to process
+            size (tuple): (width, height) of the image sent to MediaPipe
+                          (None = region size times the current scale)
+
+        Returns:
+            MediaPipe results with landmarks re-projected to the full frame
+        """
+        frame_height, frame_width = frame.shape[:2]
+        x1, y1, x2, y2 = region
+        source = frame[y1:y2, x1:x2]
+
+        # Size of the image sent to MediaPipe
+        if size is None:
+            size = (max(1, int(round((x2 - x1) * self.scale))),
+                    max(1, int(round((y2 - y1) * self.scale))))
+        width, height = size
+        resized, rgb = self._get_buffers(width, height)
+        start_ns = now_ns()
+
+        # Downscale the region into a reused buffer (INTER_AREA averages
+        # pixels, which keeps edges stable when shrinking)
+        if (width, height) != (x2 - x1, y2 - y1):
+            cv2.resize(source, (width, height), dst=resized, interpolation=cv2.INTER_AREA)
+            source = resized
+
+        # Convert BGR (OpenCV) to RGB (MediaPipe) into a reused buffer
+        cv2.cvtColor(source, cv2.COLOR_BGR2RGB, dst=rgb)
+        self.inference_pixels = width * height
+        self.total_pixels += (x2 - x1) * (y2 - y1)
+        start_ns = profiler.record("preprocess", start_ns)
+
+        results = self.hands.process(rgb)
+        profiler.record("inference", start_ns)
+
+        # Scaling alone keeps normalized coordinates; a crop needs re-projection
+        if results.multi_hand_landmarks and (x2 - x1, y2 - y1) != (frame_width, frame_height):
+            reproject_landmarks(results, region, frame_width, frame_height)
+
+        return results
+
+    def _get_buffers(self, width, height):
+        """
+        Get the reused (resized BGR, RGB) buffer pair for an image size.
+
+        Parameters:
+            width (int): Image width in pixels
+            height (int): Image height in pixels
+
+        Returns:
+            tuple: (BGR buffer, RGB buffer), both (height, width, 3) uint8
+        """
+        buffers = self._buffers.get((width, height))
+        if buffers is None:
+            buffers = (np.empty((height, width, 3), dtype=np.uint8),
+                       np.empty((height, width, 3), dtype=np.uint8))
+            self._buffers[(width, height)] = buffers
+        return buffers
+
+    # ------------------------------------------------------------------------
+    # Hand-ROI tracking
+    # ------------------------------------------------------------------------
+
+    def _update_roi(self, results, frame_width, frame_height):
+        """
+        Set the crop for the next frame from this frame's landmarks.
+
+        Parameters:
+            results: MediaPipe results (landmarks normalized to the full frame)
+            frame_width (int): Full frame width in pixels
+            frame_height (int): Full frame height in pixels
+        """
+        if not hand_confident(results):
+            # No usable hand: next frame is a full-frame detection
+            self._roi = None
+            self._prev_center = None
+            return
+
+        landmarks = results.multi_hand_landmarks[0].landmark
+        xs = np.fromiter((lm.x for lm in landmarks), dtype=np.float32, count=len(landmarks))
+        ys = np.fromiter((lm.y for lm in landmarks), dtype=np.float32, count=len(landmarks))
+        self._roi, self._prev_center = predict_roi(
+            xs * frame_width, ys * frame_height, self._prev_center, frame_width, frame_height
+        )
+
+    # ------------------------------------------------------------------------
+    # Automatic scale
+    # ------------------------------------------------------------------------
+
+    def _adapt(self, elapsed_ms):
+        """
+        Step the scale down when inference exceeds the frame budget and back
+        up when the next larger scale is predicted to fit comfortably.
+
+        Parameters:
+            elapsed_ms (float): Inference time of the last frame
+        """
+        self._window_ms += elapsed_ms
+        self._window_frames += 1
+        if self._window_frames < INFERENCE_ADAPT_INTERVAL:
+            return
+
+        mean_ms = self._window_ms / self._window_frames
+        self._window_ms = 0.0
+        self._window_frames = 0
+
+        index = self._scale_index
+        if mean_ms > self.budget_ms and index < len(INFERENCE_SCALES) - 1:
+            index += 1
+        elif index > 0:
+            # Cost grows with the pixel count: predict it at the larger scale
+            ratio = (INFERENCE_SCALES[index - 1] / INFERENCE_SCALES[index]) ** 2
+            if mean_ms * ratio < 0.8 * self.budget_ms:
+                index -= 1
+
+        if index != self._scale_index:
+            self._scale_index = index
+            self.scale = INFERENCE_SCALES[index]
+            self.scale_changes += 1
+            print(f"[{time.strftime('%H:%M:%S')}] Inference scale -> {self.scale} "
+                  f"({mean_ms:.1f} ms/frame, budget {self.budget_ms:.1f} ms)")
+
+    # ------------------------------------------------------------------------
+    # Statistics and cleanup
+    # ------------------------------------------------------------------------
+
+    def get_stats(self):
+        """
+        Get inference statistics.
+
+        Returns:
+            dict: frames, mean_ms, scale, scale_changes, inference_pixels,
+                  mean_pixels (frame pixels converted per frame), roi_frames,
+                  full_frames, redetections, model_changes, skipped_frames
+                  and motion_triggers
+        """
+        return {
+            "frames": self.frames,
+            "mean_ms": self._total_ms / self.frames if self.frames else 0.0,
+            "scale": self.scale,
+            "scale_changes": self.scale_changes,
+            "inference_pixels": self.inference_pixels,
+            "mean_pixels": self.total_pixels / self.frames if self.frames else 0.0,
+            "roi_frames": self.roi_frames,
+            "full_frames": self.full_frames,
+            "redetections": self.redetections,
+            "model_changes": self.model_changes,
+            "skipped_frames": self.skipper.skipped,
+            "motion_triggers": self.skipper.motion_triggers,
+        }
+
+    def close(self):
+        """
+        Release the MediaPipe graph (and one still being rebuilt).
+        """
+        if self._rebuild_thread is not None:
+            self._rebuild_thread.join()
+        if self._next_hands is not None:
+            self._next_hands[0].close()
+            self._next_hands = None
+        self.hands.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def create_hands(model_complexity, min_detection_confidence, min_tracking_confidence):
+    """
+    Build a MediaPipe Hands graph.
+
+    Parameters:
+        model_complexity (int): 0 = lite model, 1 = full model
+        min_detection_confidence (float): Confidence to detect a new hand
+        min_tracking_confidence (float): Confidence to keep tracking it
+
+    Returns:
+        mediapipe.solutions.hands.Hands: New detector
+    """
+    return load_mediapipe().solutions.hands.Hands(
+        static_image_mode=STATIC_IMAGE_MODE,  # False = video stream mode
+        min_detection_confidence=min_detection_confidence,
+        min_tracking_confidence=min_tracking_confidence,
+        max_num_hands=MAX_NUM_HANDS,
+        model_complexity=model_complexity
+    )
+
+
+# ============================================================================
+# HAND-ROI HELPERS
+# ============================================================================
+
+def hand_confident(results, min_confidence=ROI_MIN_CONFIDENCE):
+    """
+    Check that a hand was found with at least the given handedness score.
+
+    Parameters:
+        results: MediaPipe hands.process() results
+        min_confidence (float): Minimum handedness score (0.0 to 1.0)
+
+    Returns:
+        bool: True if the first hand is present and confident enough
+    """
+    if not results.multi_hand_landmarks:
+        return False
+    handedness = getattr(results, "multi_handedness", None)
+    if not handedness:
+        return True  # No score available: trust the detection
+    return handedness[0].classification[0].score >= min_confidence
+
+
+def predict_roi(xs, ys, prev_center, frame_width, frame_height):
+    """
+    Compute the square crop for the next frame from the hand's landmarks.
+
+    The crop is centered where the hand is predicted to be (current center
+    plus the last frame-to-frame motion), padded by ROI_PADDING on every
+    side, at least ROI_MIN_SIZE and clamped to the frame.
+
+    Parameters:
+        xs (numpy.ndarray): Landmark x positions in frame pixels
+        ys (numpy.ndarray): Landmark y positions in frame pixels
+        prev_center (tuple or None): Hand center of the previous frame
+        frame_width (int): Frame width in pixels
+        frame_height (int): Frame height in pixels
+
+    Returns:
+        tuple: ((x1, y1, x2, y2) crop in pixels, current hand center)
+    """
+    x_min, x_max = float(xs.min()), float(xs.max())
+    y_min, y_max = float(ys.min()), float(ys.max())
+    center = ((x_min + x_max) / 2, (y_min + y_max) / 2)
+
+    # Constant-velocity prediction of the next center
+    if prev_center is None:
+        predicted = center
+    else:
+        predicted = (2 * center[0] - prev_center[0], 2 * center[1] - prev_center[1])
+
+    # Square side: padded bounding box, within [ROI_MIN_SIZE, frame size]
+    side = max(x_max - x_min, y_max - y_min) * (1 + 2 * ROI_PADDING)
+    side = int(min(max(side, ROI_MIN_SIZE), frame_width, frame_height))
+
+    # Keep the whole square inside the frame
+    x1 = int(min(max(predicted[0] - side / 2, 0), frame_width - side))
+    y1 = int(min(max(predicted[1] - side / 2, 0), frame_height - side))
+    return (x1, y1, x1 + side, y1 + side), center
+
+
+# ============================================================================
+# LANDMARK RE-PROJECTION
+# ============================================================================
+
+def reproject_landmarks(results, region, frame_width, frame_height):
+    """
+    Convert landmarks normalized to a region into full-frame coordinates.
+
+    MediaPipe normalizes x by the width and y by the height of the image it
+    was given; uniform resizing does not change them, but cropping does.
+    Modifies the results in place.
+
+    Parameters:
+        results: MediaPipe results computed on the region
+        region (tuple): (x1, y1, x2, y2) pixel region that was processed
+        frame_width (int): Full frame width in pixels
+        frame_height (int): Full frame height in pixels
+    """
+    x1, y1, x2, y2 = region
+    offset_x, offset_y = x1 / frame_width, y1 / frame_height
+    scale_x, scale_y = (x2 - x1) / frame_width, (y2 - y1) / frame_height
+
+    for hand_landmarks in results.multi_hand_landmarks:
+        for lm in hand_landmarks.landmark:
+            lm.x = offset_x + lm.x * scale_x
+            lm.y = offset_y + lm.y * scale_y
+            lm.z = lm.z * scale_x  # z uses the same scale as x
+
+
+def landmark_array(results):
+    """
+    Landmarks of all detected hands as an array.
+
+    Parameters:
+        results: MediaPipe results
+
+    Returns:
+        numpy.ndarray or None: (hands, 21, 3) normalized (x, y, z), None if
+                               no hand was found
+    """
+    if not results.multi_hand_landmarks:
+        return None
+    return np.array([[(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark]
+                     for hand_landmarks in results.multi_hand_landmarks], dtype=np.float32)
+
+
+def predicted_results(points, last_results):
+    """
+    MediaPipe-style results for a frame that skipped inference.
+
+    Parameters:
+        points (numpy.ndarray or None): (hands, 21, 3) predicted landmarks
+        last_results: Results of the last inferred frame (handedness is
+                      taken from it)
+
+    Returns:
+        object: Object with multi_hand_landmarks (NormalizedLandmarkList
+                per hand, None without a hand) and multi_handedness
+    """
+    if points is None:
+        return SimpleNamespace(multi_hand_landmarks=None, multi_handedness=None)
+
+    load_mediapipe()
+    from mediapipe.framework.formats import landmark_pb2  # Loaded with MediaPipe
+
+    hands = []
+    for hand in points:
+        hand_landmarks = landmark_pb2.NormalizedLandmarkList()
+        for x, y, z in hand:
+            hand_landmarks.landmark.add(x=float(x), y=float(y), z=float(z))
+        hands.append(hand_landmarks)
+    return SimpleNamespace(multi_hand_landmarks=hands,
+                           multi_handedness=getattr(last_results, "multi_handedness", None))
+
+
+def mirror_landmarks(results):
+    """
+    Mirror landmarks horizontally, as if the frame had been flipped.
+
+    Handedness labels are swapped as well, since MediaPipe assumes a
+    mirrored (selfie) input when labeling left and right hands. Modifies
+    the results in place.
+
+    Parameters:
+        results: MediaPipe results computed on an unmirrored frame
+    """
+    for hand_landmarks in results.multi_hand_landmarks:
+        for lm in hand_landmarks.landmark:
+            lm.x = 1.0 - lm.x
+
+    for handedness in getattr(results, "multi_handedness", None) or []:
+        for classification in handedness.classification:
+            classification.label = "Left" if classification.label == "Right" else "Right"
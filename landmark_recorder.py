@@ -0,0 +1,159 @@
+# ============================================================================
+# LANDMARK_RECORDER.PY - Binary Landmark Stream Recording
+# ============================================================================
+# Records what MediaPipe saw, frame by frame, so the gesture logic can be
+# replayed later without a webcam or MediaPipe (see replay.py).
+#
+# File layout (little-endian):
+#   header  (32 bytes)  magic "VMLM", format version, landmarks per hand,
+#                       frame width/height, record size
+#   records (fixed stride, RECORD_DTYPE):
+#       ts_ns      int64           capture time in nanoseconds (time.time_ns)
+#       present    uint32          1 if a hand was detected, 0 otherwise
+#       landmarks  float32[21, 3]  normalized x, y, z of the first hand
+#
+# Because every record has the same size, a recording can be opened with
+# numpy.memmap and indexed like an array without parsing.
+# ============================================================================
+
+# Import required libraries
+import os  # File size
+import struct  # Header packing
+import time  # Default timestamps
+import numpy as np  # Structured record arrays and memmap
+from config import *  # Import all configuration constants
+
+# ============================================================================
+# FILE FORMAT
+# ============================================================================
+
+# File signature and format version
+RECORDING_MAGIC = b"VMLM"
+RECORDING_VERSION = 1
+
+# Header: magic, version, landmarks per hand, frame width, frame height,
+# record size, then padding up to 32 bytes
+HEADER_FORMAT = "<4sHHIII12x"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+# One record per processed frame
+RECORD_DTYPE = np.dtype([
+    ("ts_ns", "<i8"),
+    ("present", "<u4"),
+    ("landmarks", "<f4", (NUM_LANDMARKS, 3)),
+])
+
+
+# ============================================================================
+# RECORDER
+# ============================================================================
+
+class LandmarkRecorder:
+    """
+    Appends one fixed-size record per frame to a recording file.
+
+    Example:
+        with LandmarkRecorder("session.vmlm", 1280, 720) as recorder:
+            recorder.write(results)
+    """
+
+    def __init__(self, path, frame_width, frame_height):
+        """
+        Create the file and write its header.
+
+        Parameters:
+            path (str): Output file path (overwritten)
+            frame_width (int): Width of the recorded video frames in pixels
+            frame_height (int): Height of the recorded video frames in pixels
+        """
+        self.path = path
+        self.frame_width = frame_width
+        self.frame_height = frame_height
+        self.records = 0
+
+        # One reusable record; write() fills it and appends its bytes
+        self._record = np.zeros(1, dtype=RECORD_DTYPE)
+
+        self._file = open(path, "wb")
+        self._file.write(struct.pack(
+            HEADER_FORMAT, RECORDING_MAGIC, RECORDING_VERSION, NUM_LANDMARKS,
+            frame_width, frame_height, RECORD_DTYPE.itemsize
+        ))
+
+    def write(self, results, timestamp_ns=None):
+        """
+        Append the landmarks of one frame.
+
+        Parameters:
+            results: MediaPipe hands.process() results (only the first hand
+                     is recorded; no hand is recorded as present = 0)
+            timestamp_ns (int): Frame time in nanoseconds (defaults to now)
+        """
+        record = self._record[0]
+        record["ts_ns"] = time.time_ns() if timestamp_ns is None else timestamp_ns
+
+        hands = getattr(results, "multi_hand_landmarks", None)
+        if hands:
+            record["present"] = 1
+            record["landmarks"] = [(lm.x, lm.y, lm.z) for lm in hands[0].landmark]
+        else:
+            record["present"] = 0
+            record["landmarks"] = 0.0
+
+        self._file.write(self._record.tobytes())
+        self.records += 1
+
+    def close(self):
+        """
+        Flush and close the file.
+        """
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+# ============================================================================
+# LOADING
+# ============================================================================
+
+def load_recording(path):
+    """
+    Open a recording without reading it into memory.
+
+    Parameters:
+        path (str): Recording file path
+
+    Returns:
+        tuple: (header dict with frame_width/frame_height/version,
+                numpy.memmap of RECORD_DTYPE records)
+
+    Raises:
+        ValueError: If the file is not a compatible recording
+    """
+    with open(path, "rb") as handle:
+        header_bytes = handle.read(HEADER_SIZE)
+    if len(header_bytes) < HEADER_SIZE:
+        raise ValueError(f"{path}: too short for a landmark recording")
+
+    magic, version, landmarks, width, height, record_size = struct.unpack(HEADER_FORMAT, header_bytes)
+    if magic != RECORDING_MAGIC:
+        raise ValueError(f"{path}: not a landmark recording")
+    if version != RECORDING_VERSION or landmarks != NUM_LANDMARKS or record_size != RECORD_DTYPE.itemsize:
+        raise ValueError(f"{path}: unsupported recording format (version {version})")
+
+    header = {"version": version, "frame_width": width, "frame_height": height}
+
+    # Whole records only (a recording cut off mid-write keeps its complete frames)
+    count = (os.path.getsize(path) - HEADER_SIZE) // RECORD_DTYPE.itemsize
+
+    # An empty recording cannot be memory-mapped
+    if count <= 0:
+        return header, np.zeros(0, dtype=RECORD_DTYPE)
+
+    records = np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER_SIZE, shape=(count,))
+    return header, records
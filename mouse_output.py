@@ -0,0 +1,526 @@
+# ============================================================================
+# MOUSE_OUTPUT.PY - Mouse Output Backends and Event Dispatcher
+# ============================================================================
+# Gesture logic talks to a mouse object with these methods:
+#   move_to(x, y), click(), right_click(), scroll(amount),
+#   mouse_down(), mouse_up()   (left button held for clicks and drags)
+#
+# Backends implement them for a specific output:
+# - PyAutoGUIBackend: cross-platform (pyautogui)
+# - XlibBackend:      X11 XTest fake input (python-xlib, optional)
+# - UInputBackend:    Linux virtual input device (evdev, optional)
+# - RecordingBackend: logs every call (replay, tests, benchmarks)
+# - NullBackend:      discards every call
+#
+# MouseDispatcher wraps any backend with the same interface. Calls only queue
+# an event and return immediately; a dedicated thread injects the events,
+# coalesces consecutive moves (only the newest position matters) and caps
+# moves at MOUSE_MAX_RATE_HZ, so the vision loop never blocks on the OS.
+# ============================================================================
+
+# Import required libraries
+import collections  # Event queue
+import threading  # Dispatcher thread
+import time  # Rate limiting and timing
+from config import *  # Import all configuration constants
+from profiling import profiler  # Per-stage latency samples
+
+# Event kinds (also used in RecordingBackend logs)
+EVENT_MOVE = "move"
+EVENT_CLICK = "click"
+EVENT_RIGHT_CLICK = "right_click"
+EVENT_SCROLL = "scroll"
+EVENT_MOUSE_DOWN = "mouse_down"
+EVENT_MOUSE_UP = "mouse_up"
+
+
+# ============================================================================
+# BACKENDS
+# ============================================================================
+
+class MouseBackend:
+    """
+    Base class of all mouse backends; every method is a no-op.
+
+    Subclasses override the methods their output supports.
+    """
+
+    name = "base"
+
+    # Frame the next events belong to (set by the caller before each frame's
+    # calls; the controller uses the frame's capture time in perf_counter_ns)
+    frame = None
+
+    def move_to(self, x, y):
+        """Move the cursor to screen position (x, y) in pixels."""
+
+    def click(self):
+        """Click the left mouse button."""
+
+    def right_click(self):
+        """Click the right mouse button."""
+
+    def scroll(self, amount):
+        """Scroll the wheel (positive = up, negative = down)."""
+
+    def mouse_down(self):
+        """Press and hold the left mouse button."""
+
+    def mouse_up(self):
+        """Release the left mouse button."""
+
+    def screen_size(self):
+        """
+        Returns:
+            tuple: (screen width, screen height) in pixels
+        """
+        return UINPUT_SCREEN_SIZE
+
+    def close(self):
+        """Release any OS resources held by the backend."""
+
+
+class NullBackend(MouseBackend):
+    """
+    Backend that discards every event.
+    """
+
+    name = "null"
+
+
+class RecordingBackend(MouseBackend):
+    """
+    Backend that logs every call instead of moving the real cursor.
+
+    Events are (frame, action, args) tuples; cursor positions are rounded to
+    0.01 pixel so logs from different runs compare exactly. Set the frame
+    attribute before each frame's calls to tag its events.
+    """
+
+    name = "recording"
+
+    def __init__(self, screen_width=1920, screen_height=1080):
+        """
+        Parameters:
+            screen_width (int): Screen width reported by screen_size()
+            screen_height (int): Screen height reported by screen_size()
+        """
+        self.events = []
+        self.frame = 0  # Frame index attached to the next events
+        self._screen_size = (screen_width, screen_height)
+
+    def move_to(self, x, y):
+        self.events.append((self.frame, EVENT_MOVE, (round(float(x), 2), round(float(y), 2))))
+
+    def click(self):
+        self.events.append((self.frame, EVENT_CLICK, ()))
+
+    def right_click(self):
+        self.events.append((self.frame, EVENT_RIGHT_CLICK, ()))
+
+    def scroll(self, amount):
+        self.events.append((self.frame, EVENT_SCROLL, (int(amount),)))
+
+    def mouse_down(self):
+        self.events.append((self.frame, EVENT_MOUSE_DOWN, ()))
+
+    def mouse_up(self):
+        self.events.append((self.frame, EVENT_MOUSE_UP, ()))
+
+    def screen_size(self):
+        return self._screen_size
+
+
+class PyAutoGUIBackend(MouseBackend):
+    """
+    Cross-platform backend using pyautogui.
+    """
+
+    name = "pyautogui"
+
+    def __init__(self):
+        import pyautogui  # Imported here so other backends work without it
+
+        # Disable PyAutoGUI failsafe
+        # Failsafe: moving mouse to screen corner aborts program
+        pyautogui.FAILSAFE = PYAUTOGUI_FAILSAFE
+
+        # Pause after every call (runs on the dispatcher thread when enabled)
+        pyautogui.PAUSE = PYAUTOGUI_PAUSE
+
+        self._pyautogui = pyautogui
+
+    def move_to(self, x, y):
+        self._pyautogui.moveTo(x, y)
+
+    def click(self):
+        self._pyautogui.click()
+
+    def right_click(self):
+        self._pyautogui.rightClick()
+
+    def scroll(self, amount):
+        self._pyautogui.scroll(amount)
+
+    def mouse_down(self):
+        self._pyautogui.mouseDown()
+
+    def mouse_up(self):
+        self._pyautogui.mouseUp()
+
+    def screen_size(self):
+        width, height = self._pyautogui.size()
+        return width, height
+
+
+class XlibBackend(MouseBackend):
+    """
+    X11 backend that injects events with the XTest extension.
+
+    Skips pyautogui's per-call pause and bookkeeping. Requires python-xlib
+    and a running X server (DISPLAY).
+    """
+
+    name = "xlib"
+
+    # X11 pointer buttons
+    BUTTON_LEFT = 1
+    BUTTON_RIGHT = 3
+    BUTTON_WHEEL_UP = 4
+    BUTTON_WHEEL_DOWN = 5
+
+    def __init__(self):
+        from Xlib import X, display  # Optional dependency
+        from Xlib.ext import xtest
+
+        self._X = X
+        self._xtest = xtest
+        self._display = display.Display()
+
+    def _press(self, button):
+        self._xtest.fake_input(self._display, self._X.ButtonPress, button)
+        self._xtest.fake_input(self._display, self._X.ButtonRelease, button)
+
+    def move_to(self, x, y):
+        self._xtest.fake_input(self._display, self._X.MotionNotify, x=int(x), y=int(y))
+        self._display.sync()
+
+    def click(self):
+        self._press(self.BUTTON_LEFT)
+        self._display.sync()
+
+    def right_click(self):
+        self._press(self.BUTTON_RIGHT)
+        self._display.sync()
+
+    def scroll(self, amount):
+        # X11 scrolls in wheel clicks: one button 4/5 press per step
+        button = self.BUTTON_WHEEL_UP if amount > 0 else self.BUTTON_WHEEL_DOWN
+        for _ in range(abs(int(amount))):
+            self._press(button)
+        self._display.sync()
+
+    def mouse_down(self):
+        self._xtest.fake_input(self._display, self._X.ButtonPress, self.BUTTON_LEFT)
+        self._display.sync()
+
+    def mouse_up(self):
+        self._xtest.fake_input(self._display, self._X.ButtonRelease, self.BUTTON_LEFT)
+        self._display.sync()
+
+    def screen_size(self):
+        screen = self._display.screen()
+        return screen.width_in_pixels, screen.height_in_pixels
+
+    def close(self):
+        self._display.close()
+
+
+class UInputBackend(MouseBackend):
+    """
+    Linux backend that creates a virtual absolute-pointer input device.
+
+    Works under X11 and Wayland alike. Requires the evdev package and write
+    access to /dev/uinput. The device cannot query the display, so the
+    screen size comes from UINPUT_SCREEN_SIZE.
+    """
+
+    name = "uinput"
+
+    def __init__(self, screen_width=None, screen_height=None):
+        from evdev import UInput, AbsInfo, ecodes  # Optional dependency
+
+        if screen_width is None or screen_height is None:
+            screen_width, screen_height = UINPUT_SCREEN_SIZE
+        self._screen_size = (screen_width, screen_height)
+        self._ecodes = ecodes
+
+        capabilities = {
+            ecodes.EV_KEY: [ecodes.BTN_LEFT, ecodes.BTN_RIGHT],
+            ecodes.EV_REL: [ecodes.REL_WHEEL],
+            ecodes.EV_ABS: [
+                (ecodes.ABS_X, AbsInfo(0, 0, screen_width - 1, 0, 0, 0)),
+                (ecodes.ABS_Y, AbsInfo(0, 0, screen_height - 1, 0, 0, 0)),
+            ],
+        }
+        self._device = UInput(capabilities, name="virtual-mouse-gesture")
+
+    def _press(self, button):
+        ecodes = self._ecodes
+        self._device.write(ecodes.EV_KEY, button, 1)
+        self._device.write(ecodes.EV_KEY, button, 0)
+        self._device.syn()
+
+    def move_to(self, x, y):
+        ecodes = self._ecodes
+        self._device.write(ecodes.EV_ABS, ecodes.ABS_X, int(x))
+        self._device.write(ecodes.EV_ABS, ecodes.ABS_Y, int(y))
+        self._device.syn()
+
+    def click(self):
+        self._press(self._ecodes.BTN_LEFT)
+
+    def right_click(self):
+        self._press(self._ecodes.BTN_RIGHT)
+
+    def scroll(self, amount):
+        self._device.write(self._ecodes.EV_REL, self._ecodes.REL_WHEEL, int(amount))
+        self._device.syn()
+
+    def mouse_down(self):
+        self._device.write(self._ecodes.EV_KEY, self._ecodes.BTN_LEFT, 1)
+        self._device.syn()
+
+    def mouse_up(self):
+        self._device.write(self._ecodes.EV_KEY, self._ecodes.BTN_LEFT, 0)
+        self._device.syn()
+
+    def screen_size(self):
+        return self._screen_size
+
+    def close(self):
+        self._device.close()
+
+
+# Backend classes by MOUSE_BACKEND name
+BACKENDS = {
+    "pyautogui": PyAutoGUIBackend,
+    "xlib": XlibBackend,
+    "uinput": UInputBackend,
+    "recording": RecordingBackend,
+    "null": NullBackend,
+}
+
+
+def create_backend(name=MOUSE_BACKEND):
+    """
+    Create a mouse backend by name.
+
+    Parameters:
+        name (str): One of the BACKENDS keys
+
+    Returns:
+        MouseBackend: The created backend
+
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If the backend's optional dependency is missing
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown mouse backend '{name}' (choose from {', '.join(BACKENDS)})")
+    return BACKENDS[name]()
+
+
+# ============================================================================
+# EVENT DISPATCHER
+# ============================================================================
+
+class MouseDispatcher:
+    """
+    Sends mouse events to a backend from a dedicated thread.
+
+    Has the same methods as a backend, but they only queue the event:
+    - consecutive moves are coalesced (a queued move is replaced by a newer one)
+    - moves are sent at most max_rate_hz times per second
+    - clicks, button presses/releases and scrolls are never dropped and
+      keep their order relative to moves (a click is sent after the move
+      queued before it), so a drag is down, moves, up
+
+    Example:
+        mouse = MouseDispatcher(create_backend("pyautogui")).start()
+        mouse.move_to(100, 200)   # Returns immediately
+        mouse.close()             # Sends remaining events, stops the thread
+    """
+
+    def __init__(self, backend, max_rate_hz=MOUSE_MAX_RATE_HZ):
+        """
+        Create the dispatcher (the thread starts with start()).
+
+        Parameters:
+            backend (MouseBackend): Backend that performs the events
+            max_rate_hz (float): Maximum moves per second (None = unlimited)
+        """
+        self.backend = backend
+        self.min_move_interval = 1.0 / max_rate_hz if max_rate_hz else 0.0
+
+        self._events = collections.deque()  # Pending (kind, args, frame) events
+        self.frame = None  # Frame tag queued with the next events (see MouseBackend)
+        self._condition = threading.Condition()
+        self._running = False
+        self._thread = None
+        self._next_move_time = 0.0
+
+        # Statistics
+        self.moves_submitted = 0
+        self.moves_sent = 0
+        self.moves_coalesced = 0
+        self.actions_sent = 0
+        self.backend_time = 0.0  # Seconds spent inside backend calls
+
+    def start(self):
+        """
+        Start the dispatcher thread.
+
+        Returns:
+            MouseDispatcher: self
+        """
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="MouseDispatcher", daemon=True)
+        self._thread.start()
+        return self
+
+    # ------------------------------------------------------------------------
+    # Mouse interface (called from the vision loop, never blocks on the OS)
+    # ------------------------------------------------------------------------
+
+    def move_to(self, x, y):
+        with self._condition:
+            self.moves_submitted += 1
+            # Replace a queued move that has not been sent yet
+            if self._events and self._events[-1][0] == EVENT_MOVE:
+                self._events[-1] = (EVENT_MOVE, (x, y), self.frame)
+                self.moves_coalesced += 1
+            else:
+                self._events.append((EVENT_MOVE, (x, y), self.frame))
+            self._condition.notify()
+
+    def click(self):
+        self._queue(EVENT_CLICK, ())
+
+    def right_click(self):
+        self._queue(EVENT_RIGHT_CLICK, ())
+
+    def scroll(self, amount):
+        self._queue(EVENT_SCROLL, (amount,))
+
+    def mouse_down(self):
+        self._queue(EVENT_MOUSE_DOWN, ())
+
+    def mouse_up(self):
+        self._queue(EVENT_MOUSE_UP, ())
+
+    def screen_size(self):
+        return self.backend.screen_size()
+
+    def _queue(self, kind, args):
+        with self._condition:
+            self._events.append((kind, args, self.frame))
+            self._condition.notify()
+
+    # ------------------------------------------------------------------------
+    # Dispatcher thread
+    # ------------------------------------------------------------------------
+
+    def _run(self):
+        """
+        Thread body: send queued events in order, rate-limiting moves.
+        """
+        while True:
+            with self._condition:
+                # Wait for work (or for close() with nothing left to send)
+                while not self._events and self._running:
+                    self._condition.wait()
+                if not self._events:
+                    return
+
+                kind, args, frame = self._events[0]
+
+                # A move that comes too early stays queued, so newer moves can
+                # still replace it while we wait (skipped when closing)
+                if kind == EVENT_MOVE and self._running:
+                    delay = self._next_move_time - time.perf_counter()
+                    if delay > 0:
+                        self._condition.wait(delay)
+                        continue
+
+                self._events.popleft()
+
+            # Inject outside the lock so the vision loop can keep queueing
+            self._send(kind, args, frame)
+
+    def _send(self, kind, args, frame=None):
+        """
+        Perform one event on the backend and update the statistics.
+
+        The frame tag the event was queued with is passed on to the backend,
+        so a RecordingBackend logs the frame each injected event came from.
+        """
+        self.backend.frame = frame
+        start = time.perf_counter()
+        if kind == EVENT_MOVE:
+            self.backend.move_to(*args)
+            self._next_move_time = start + self.min_move_interval
+            self.moves_sent += 1
+        else:
+            if kind == EVENT_CLICK:
+                self.backend.click()
+            elif kind == EVENT_RIGHT_CLICK:
+                self.backend.right_click()
+            elif kind == EVENT_SCROLL:
+                self.backend.scroll(*args)
+            elif kind == EVENT_MOUSE_DOWN:
+                self.backend.mouse_down()
+            elif kind == EVENT_MOUSE_UP:
+                self.backend.mouse_up()
+            self.actions_sent += 1
+        elapsed = time.perf_counter() - start
+        self.backend_time += elapsed
+        profiler.add("mouse", int(elapsed * 1e9))
+
+    # ------------------------------------------------------------------------
+    # Shutdown and statistics
+    # ------------------------------------------------------------------------
+
+    def close(self, timeout=1.0):
+        """
+        Send the remaining events, stop the thread and close the backend.
+
+        Parameters:
+            timeout (float): Maximum seconds to wait for the thread
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self.backend.close()
+
+    def get_stats(self):
+        """
+        Get dispatcher statistics.
+
+        Returns:
+            dict: moves_submitted, moves_sent, moves_coalesced, actions_sent,
+                  pending and backend_ms (mean time per backend call)
+        """
+        with self._condition:
+            pending = len(self._events)
+        calls = self.moves_sent + self.actions_sent
+        return {
+            "moves_submitted": self.moves_submitted,
+            "moves_sent": self.moves_sent,
+            "moves_coalesced": self.moves_coalesced,
+            "actions_sent": self.actions_sent,
+            "pending": pending,
+            "backend_ms": 1000.0 * self.backend_time / calls if calls else 0.0,
+        }
@@ -0,0 +1,297 @@
+# ============================================================================
+# MULTI_SESSION.PY - Several Cameras / Users on One Machine
+# ============================================================================
+# Serves several capture sources (cameras or video files) at once. Every
+# source gets its own session process with its own MediaPipe instance,
+# HandTracker, GestureSession (cursor and gesture state) and mouse backend,
+# so sessions run on separate CPU cores without sharing the GIL:
+#
+#   orchestrator ──┬── session 0: FrameGrabber -> HandTracker -> GestureSession -> mouse
+#                  ├── session 1: ...
+#                  └── session N-1
+#
+# Sessions start together (after every MediaPipe instance is loaded) and
+# report their statistics when their source ends: frames processed, FPS,
+# capture-to-mouse latency percentiles and inference time. The orchestrator
+# adds the aggregate throughput of all sessions.
+#
+# Usage:
+#   python multi_session.py 0 1                      # Two cameras (Ctrl+C to stop)
+#   python multi_session.py a.avi b.avi c.avi        # Video files as stand-in cameras
+#   python multi_session.py a.avi b.avi --lossless   # Every file frame, as fast as possible
+# ============================================================================
+
+# Import required libraries
+import argparse  # Command-line options
+import contextlib  # Session cleanup (ExitStack)
+import multiprocessing  # One process per session
+import os  # CPU affinity
+import queue  # Result timeout
+import threading  # BrokenBarrierError (also raised by multiprocessing barriers)
+import time  # Session timing
+import cv2  # OpenCV thread settings
+
+# Import our custom modules
+from config import *  # Import all configuration constants
+
+# ============================================================================
+# SESSION PROCESS
+# ============================================================================
+
+def pin_to_core(index):
+    """
+    Restrict the calling process to one CPU core.
+
+    Parameters:
+        index (int): Session index (core = index modulo the available cores)
+
+    Returns:
+        int or None: The core, or None where affinity is not supported
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return None
+    cores = sorted(os.sched_getaffinity(0))
+    core = cores[index % len(cores)]
+    os.sched_setaffinity(0, {core})
+    return core
+
+
+def run_session(index, source, realtime=True, max_frames=None, barrier=None):
+    """
+    Run one capture source through hand tracking and gesture recognition.
+
+    Headless: no overlays or preview window. Runs until the source ends
+    (or max_frames frames were processed).
+
+    Parameters:
+        index (int): Session index (also selects the CPU core)
+        source (int or str): Camera index or video file path
+        realtime (bool): Pace video files like a camera (False = process
+                         every frame as fast as possible)
+        max_frames (int or None): Stop after this many frames
+        barrier: multiprocessing Barrier every session waits at before
+                 capturing, so all sessions start together (None = no wait)
+
+    Returns:
+        dict: Session statistics ("error" is set if the source failed)
+    """
+    # Imported here so only the session processes load MediaPipe
+    from capture import FrameGrabber
+    from gesture_logic import GestureSession
+    from hand_tracker import HandTracker
+    from mouse_output import create_backend, MouseDispatcher
+    from profiling import profiler, now_ns
+
+    # One OpenCV thread and one core per session
+    cv2.setNumThreads(MULTI_SESSION_OPENCV_THREADS)
+    core = pin_to_core(index) if MULTI_SESSION_PIN_CORES else None
+
+    stats = {"index": index, "source": source, "core": core, "error": None}
+
+    # Everything the session needs, created before the common start
+    # (loading MediaPipe takes about a second). Each part is registered for
+    # cleanup as soon as it exists, so a failure while building the rest
+    # still releases the capture and stops the dispatcher.
+    with contextlib.ExitStack() as cleanup:
+        grabber = FrameGrabber(source, realtime=realtime)
+        cleanup.callback(grabber.release)
+        tracker = HandTracker(mirror=True)
+        cleanup.callback(tracker.close)
+        tracker.warm_up()  # First inferences are slow; keep them out of the measured run
+        session = GestureSession()
+        backend = create_backend(MULTI_SESSION_BACKEND)
+        if MOUSE_DISPATCHER:
+            mouse = MouseDispatcher(backend)
+            cleanup.callback(mouse.close)  # Also closes the backend
+            mouse.start()
+        else:
+            mouse = backend
+            cleanup.callback(backend.close)
+        cleanup.callback(session.release, mouse)  # Never leave a button held
+        screen_width, screen_height = backend.screen_size()
+
+        if barrier is not None:
+            try:
+                barrier.wait(timeout=MULTI_SESSION_TIMEOUT)
+            except threading.BrokenBarrierError:
+                pass  # Another session failed or timed out during setup; start anyway
+
+        if not grabber.isOpened():
+            stats["error"] = f"could not open source {source}"
+            return stats
+
+        grabber.start()
+        frames = 0
+        hand_frames = 0
+        start = time.perf_counter()
+
+        try:
+            while max_frames is None or frames < max_frames:
+                start_ns = now_ns()
+                ret, frame, capture_time = grabber.read_with_timestamp()
+                if not ret:
+                    break
+                profiler.record("capture", start_ns)
+                capture_ns = int(capture_time * 1e9)
+                frames += 1
+
+                # Landmarks come back mirrored; the frame itself is never flipped
+                results = tracker.process(frame)
+                if not results.multi_hand_landmarks:
+                    session.hand_missing(mouse)
+                    continue
+
+                hand_frames += 1
+                mouse.frame = capture_ns
+                start_ns = now_ns()
+                for hand_landmarks in results.multi_hand_landmarks:
+                    session.process_hand(hand_landmarks, grabber.frame_width, grabber.frame_height,
+                                         screen_width, screen_height, mouse)
+                end_ns = profiler.record("gesture", start_ns)
+                profiler.record("latency", capture_ns, end_ns)
+        except KeyboardInterrupt:
+            pass  # Ctrl+C reaches every session: stop and report like at the end of a file
+
+        seconds = time.perf_counter() - start
+
+    stats.update({
+        "frames": frames,
+        "hand_frames": hand_frames,
+        "seconds": seconds,
+        "fps": frames / seconds if seconds > 0 else 0.0,
+        "dropped": grabber.get_stats()["dropped"],
+        "stages": profiler.summary(),
+    })
+    return stats
+
+
+def _session_main(index, source, realtime, max_frames, barrier, results):
+    """
+    Process entry point: run the session and send its statistics back.
+    """
+    try:
+        stats = run_session(index, source, realtime, max_frames, barrier)
+    except Exception as e:
+        # Release the others if this session failed before the start
+        if barrier is not None and not barrier.broken:
+            barrier.abort()
+        stats = {"index": index, "source": source, "error": f"{type(e).__name__}: {e}"}
+    results.put(stats)
+
+
+# ============================================================================
+# ORCHESTRATOR
+# ============================================================================
+
+def run_sessions(sources, realtime=True, max_frames=None):
+    """
+    Run one session process per source and collect their statistics.
+
+    Processes are started with the "spawn" method, so each one imports
+    MediaPipe and creates its own graph (no state inherited via fork).
+
+    Parameters:
+        sources (list): Camera indices or video file paths
+        realtime (bool): Pace video files like cameras
+        max_frames (int or None): Frames per session before it stops
+
+    Returns:
+        tuple: (list of per-session stats sorted by index, aggregate dict
+               with "sessions", "frames", "hand_frames", "seconds", "fps",
+               "failed")
+    """
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(len(sources) + 1)  # Sessions + orchestrator
+    results = context.Queue()
+
+    processes = [
+        context.Process(target=_session_main, name=f"session-{index}",
+                        args=(index, source, realtime, max_frames, barrier, results))
+        for index, source in enumerate(sources)
+    ]
+    for process in processes:
+        process.start()
+
+    # Wait until every session is ready, then start the clock
+    try:
+        barrier.wait(timeout=MULTI_SESSION_TIMEOUT)
+    except threading.BrokenBarrierError:
+        pass  # A session failed or timed out during setup; it reports its error
+    start = time.perf_counter()
+
+    # Collect one result per session (a crashed process sends none)
+    sessions = []
+    while len(sessions) < len(processes):
+        try:
+            sessions.append(results.get(timeout=MULTI_SESSION_TIMEOUT))
+        except queue.Empty:
+            if not any(process.is_alive() for process in processes):
+                break
+        except KeyboardInterrupt:
+            # The sessions received Ctrl+C too and are sending their results
+            print("\n[MULTI_SESSION] Stopping sessions...")
+    seconds = time.perf_counter() - start
+
+    for process in processes:
+        process.join(timeout=MULTI_SESSION_TIMEOUT)
+
+    sessions.sort(key=lambda stats: stats["index"])
+    succeeded = [stats for stats in sessions if not stats["error"]]
+    frames = sum(stats["frames"] for stats in succeeded)
+    aggregate = {
+        "sessions": len(succeeded),
+        "frames": frames,
+        "hand_frames": sum(stats["hand_frames"] for stats in succeeded),
+        "seconds": seconds,
+        "fps": frames / seconds if seconds > 0 else 0.0,
+        "failed": len(sources) - len(succeeded),
+    }
+    return sessions, aggregate
+
+
+def format_report(sessions, aggregate):
+    """
+    Format per-session and aggregate statistics as aligned text lines.
+
+    Parameters:
+        sessions (list): Per-session stats from run_sessions()
+        aggregate (dict): Aggregate stats from run_sessions()
+
+    Returns:
+        list: Text lines
+    """
+    lines = [f"{'session':<8}{'core':>5}{'frames':>8}{'fps':>8}{'infer p50':>11}"
+             f"{'lat p50':>9}{'p95':>8}{'p99':>8}  source"]
+    for stats in sessions:
+        if stats["error"]:
+            lines.append(f"{stats['index']:<8}{'-':>5}  ERROR {stats['error']}  {stats['source']}")
+            continue
+        stages = stats["stages"]
+        inference = stages.get("inference", {}).get("p50", 0.0)
+        latency = stages.get("latency", {"p50": 0.0, "p95": 0.0, "p99": 0.0})
+        core = "-" if stats["core"] is None else stats["core"]
+        lines.append(f"{stats['index']:<8}{core:>5}{stats['frames']:>8}{stats['fps']:>8.1f}"
+                     f"{inference:>11.1f}{latency['p50']:>9.1f}{latency['p95']:>8.1f}"
+                     f"{latency['p99']:>8.1f}  {stats['source']}")
+    lines.append(f"aggregate: {aggregate['sessions']} sessions, {aggregate['frames']} frames "
+                 f"in {aggregate['seconds']:.1f} s = {aggregate['fps']:.1f} FPS "
+                 f"({aggregate['failed']} failed)")
+    return lines
+
+
+# ============================================================================
+# PROGRAM ENTRY POINT
+# ============================================================================
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run one gesture session per capture source")
+    parser.add_argument("sources", nargs="+", help="Camera indices and/or video files")
+    parser.add_argument("--lossless", action="store_true",
+                        help="Process every frame of video files as fast as possible")
+    parser.add_argument("--max-frames", type=int, default=None, help="Frames per session")
+    args = parser.parse_args()
+
+    sources = [int(source) if source.isdigit() else source for source in args.sources]
+    sessions, aggregate = run_sessions(sources, realtime=not args.lossless,
+                                       max_frames=args.max_frames)
+    print("\n" + "\n".join(format_report(sessions, aggregate)))
@@ -0,0 +1,321 @@
+# ============================================================================
+# PIPELINE.PY - Multi-Stage Pipelined Execution
+# ============================================================================
+# This module runs the per-frame work as a chain of stages, each on its own
+# worker thread, connected by bounded queues:
+#
+#   capture -> inference -> gesture -> (render on the main thread)
+#
+# While one frame is being rendered and its mouse events injected, the next
+# frame is already going through hand inference. Per-frame latency is no
+# longer the sum of every stage; throughput is limited by the slowest stage,
+# which the per-stage statistics make visible.
+# ============================================================================
+
+# Import required libraries
+import queue  # Bounded thread-safe queues between stages
+import threading  # Worker threads
+import time  # Busy-time and throughput measurement
+from config import *  # Import all configuration constants
+
+# Marker object passed down the pipeline to shut the stages down in order
+STOP = object()
+
+
+# ============================================================================
+# PIPELINE STAGE
+# ============================================================================
+
+class PipelineStage:
+    """
+    One worker thread that applies a function to every item of its queue.
+
+    A stage without an input queue is a source: it calls its function
+    repeatedly and forwards each returned item until the function returns
+    None. Other stages take items from their input queue, apply the function
+    and put the result (unless it is None) on their output queue.
+
+    Attributes:
+        name (str): Stage name used in reports
+        processed (int): Number of items processed
+        busy_time (float): Seconds spent inside the stage function
+        dropped (int): Items discarded because the output queue was full
+                       (only for stages created with drop_when_full=True)
+    """
+
+    def __init__(self, name, func, input_queue, output_queue, drop_when_full=False):
+        """
+        Create the stage (the thread starts with start()).
+
+        Parameters:
+            name (str): Stage name
+            func (callable): Function applied to each item
+            input_queue (queue.Queue or None): Items to process (None = source)
+            output_queue (queue.Queue): Destination for results
+            drop_when_full (bool): Replace the oldest queued item instead of
+                                   blocking when the output queue is full
+        """
+        self.name = name
+        self.func = func
+        self.input_queue = input_queue
+        self.output_queue = output_queue
+        self.drop_when_full = drop_when_full
+
+        # Statistics counters
+        self.processed = 0
+        self.busy_time = 0.0
+        self.dropped = 0
+        self.start_time = 0.0
+
+        self._running = False
+        self._thread = threading.Thread(target=self._run, name=f"Stage-{name}", daemon=True)
+
+    def start(self):
+        """
+        Start the worker thread.
+        """
+        self._running = True
+        self.start_time = time.perf_counter()
+        self._thread.start()
+
+    def stop(self):
+        """
+        Ask a source stage to stop producing items.
+        """
+        self._running = False
+
+    def join(self, timeout=None):
+        """
+        Wait for the worker thread to exit.
+
+        Parameters:
+            timeout (float): Maximum seconds to wait
+        """
+        self._thread.join(timeout)
+
+    def _put(self, item):
+        """
+        Put an item on the output queue, dropping the oldest item if allowed.
+        """
+        if not self.drop_when_full or item is STOP:
+            self.output_queue.put(item)
+            return
+
+        # Latest wins: make room by discarding the oldest queued item
+        while True:
+            try:
+                self.output_queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self.output_queue.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def _run(self):
+        """
+        Worker thread body.
+        """
+        try:
+            while True:
+                # Source stages produce items, others consume their input queue
+                if self.input_queue is None:
+                    if not self._running:
+                        break
+                    item = None
+                else:
+                    item = self.input_queue.get()
+                    if item is STOP:
+                        break
+
+                # Apply the stage function and measure the busy time
+                start = time.perf_counter()
+                result = self.func() if self.input_queue is None else self.func(item)
+                self.busy_time += time.perf_counter() - start
+
+                # A source returning None has no more items
+                if result is None:
+                    if self.input_queue is None:
+                        break
+                    continue
+
+                self.processed += 1
+                self._put(result)
+        finally:
+            # Always forward the stop marker so downstream stages exit too
+            self._put(STOP)
+
+    def get_stats(self):
+        """
+        Return the stage statistics.
+
+        Returns:
+            dict: processed items, throughput (items/s), mean busy time per
+                  item (ms), utilization (0-1), dropped items and the depth
+                  of the stage's input queue
+        """
+        elapsed = max(time.perf_counter() - self.start_time, 1e-9)
+        return {
+            "processed": self.processed,
+            "throughput": self.processed / elapsed,
+            "busy_ms": 1000.0 * self.busy_time / self.processed if self.processed else 0.0,
+            "utilization": min(self.busy_time / elapsed, 1.0),
+            "dropped": self.dropped,
+            "queue_depth": self.input_queue.qsize() if self.input_queue is not None else 0,
+        }
+
+
+# ============================================================================
+# PIPELINE
+# ============================================================================
+
+class Pipeline:
+    """
+    A chain of PipelineStage workers connected by bounded queues.
+
+    The first stage is a source (called without arguments), every following
+    stage receives the previous stage's result. Results of the last stage are
+    read by the caller with get(), typically on the main thread (OpenCV
+    windows must be updated from the main thread on several platforms).
+
+    Example:
+        pipeline = Pipeline()
+        pipeline.add_stage("capture", read_frame)
+        pipeline.add_stage("inference", detect_hands)
+        pipeline.start()
+        while (item := pipeline.get()) is not None:
+            render(item)
+        pipeline.stop()
+    """
+
+    def __init__(self, queue_size=PIPELINE_QUEUE_SIZE):
+        """
+        Create an empty pipeline.
+
+        Parameters:
+            queue_size (int): Capacity of every inter-stage queue
+        """
+        self.queue_size = queue_size
+        self.stages = []
+        self.output_queue = queue.Queue(maxsize=queue_size)
+        self._finished = False
+
+    def add_stage(self, name, func, drop_when_full=False):
+        """
+        Append a stage to the end of the pipeline.
+
+        Parameters:
+            name (str): Stage name
+            func (callable): Stage function (no argument for the first stage)
+            drop_when_full (bool): Drop the oldest queued item instead of
+                                   blocking when the next stage falls behind
+
+        Returns:
+            PipelineStage: The created stage
+        """
+        # The previous stage's output queue becomes this stage's input queue
+        input_queue = self.stages[-1].output_queue if self.stages else None
+        output_queue = queue.Queue(maxsize=self.queue_size)
+
+        stage = PipelineStage(name, func, input_queue, output_queue, drop_when_full)
+        self.stages.append(stage)
+        self.output_queue = output_queue
+        return stage
+
+    def start(self):
+        """
+        Start all stage threads.
+
+        Returns:
+            Pipeline: self
+        """
+        for stage in self.stages:
+            stage.start()
+        return self
+
+    def get(self, timeout=None):
+        """
+        Return the next result of the last stage.
+
+        Parameters:
+            timeout (float): Maximum seconds to wait (None = wait forever)
+
+        Returns:
+            object: The next result, or None when the pipeline has finished
+                    or no result arrived within the timeout
+        """
+        if self._finished:
+            return None
+
+        try:
+            item = self.output_queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+        if item is STOP:
+            self._finished = True
+            return None
+        return item
+
+    @property
+    def finished(self):
+        """
+        bool: True once the last stage forwarded the stop marker.
+        """
+        return self._finished
+
+    def stop(self, timeout=2.0):
+        """
+        Stop the source, drain the queues and wait for all stages to exit.
+
+        Parameters:
+            timeout (float): Maximum seconds to wait for each stage
+        """
+        # Stopping the source sends the stop marker down the chain
+        if self.stages:
+            self.stages[0].stop()
+
+        # Keep draining the last queue so no stage stays blocked on a full
+        # output queue while the stop marker travels down the chain
+        deadline = time.perf_counter() + timeout
+        while not self._finished and time.perf_counter() < deadline:
+            self.get(timeout=0.05)
+
+        for stage in self.stages:
+            stage.join(timeout=0.5)
+
+    def get_stats(self):
+        """
+        Return the statistics of every stage.
+
+        Returns:
+            dict: Stage name -> stage statistics (see PipelineStage.get_stats)
+        """
+        return {stage.name: stage.get_stats() for stage in self.stages}
+
+    def format_report(self):
+        """
+        Format the per-stage statistics as printable lines.
+
+        The stage with the highest utilization is marked as the bottleneck.
+
+        Returns:
+            list: Report lines
+        """
+        stats = self.get_stats()
+        if not stats:
+            return []
+
+        bottleneck = max(stats, key=lambda name: stats[name]["utilization"])
+        lines = []
+        for name, s in stats.items():
+            marker = "  <- bottleneck" if name == bottleneck else ""
+            lines.append(
+                f"{name:<10} {s['throughput']:6.1f} items/s  "
+                f"{s['busy_ms']:6.2f} ms/item  "
+                f"util {s['utilization']:4.0%}  "
+                f"queue {s['queue_depth']}  "
+                f"dropped {s['dropped']}{marker}"
+            )
+        return lines
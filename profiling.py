@@ -0,0 +1,276 @@
+# ============================================================================
+# PROFILING.PY - Hot-Path Latency Instrumentation
+# ============================================================================
+# Records how long each step of the frame path takes, with
+# time.perf_counter_ns(), into fixed-size ring buffers (no allocation per
+# sample) and reports p50/p95/p99 per stage, in the HUD, on the console or
+# exported to a JSON file.
+#
+# Stages recorded by the application:
+#   capture     - waiting for / reading the next frame
+#   preprocess  - resize + BGR->RGB conversion for MediaPipe
+#   inference   - hands.process()
+#   gesture     - gesture classification and queueing mouse events
+#   mouse       - OS mouse injection (dispatcher thread, per event)
+#   mirror      - flipping the frame for the preview
+#   render      - drawing the overlays
+#   display     - cv2.imshow() + cv2.waitKey()
+#   latency     - end to end: frame captured -> mouse event queued
+#
+# Usage:
+#   t = now_ns()
+#   ... work ...
+#   t = profiler.record("inference", t)   # returns the new timestamp
+# ============================================================================
+
+# Import required libraries
+import collections  # Rolling FPS window
+import json  # Export
+import threading  # Stage registration lock
+import time  # perf_counter_ns
+import numpy as np  # Ring buffers and percentiles
+from config import *  # Import all configuration constants
+
+# Monotonic nanosecond clock used for every sample
+now_ns = time.perf_counter_ns
+
+# Stage display order (stages recorded under other names are listed after)
+STAGE_ORDER = ("capture", "preprocess", "inference", "gesture", "mouse",
+               "mirror", "render", "display", "latency")
+
+# Percentiles reported per stage
+PERCENTILES = (50, 95, 99)
+
+
+# ============================================================================
+# RING BUFFER
+# ============================================================================
+
+class LatencyRing:
+    """
+    Fixed-size ring buffer of durations in nanoseconds.
+
+    Each ring is written by one thread (one stage); reads copy the filled
+    part, so reporting never blocks the hot path.
+    """
+
+    def __init__(self, size=PROFILE_WINDOW):
+        """
+        Parameters:
+            size (int): Number of most recent samples kept
+        """
+        self.samples = np.zeros(size, dtype=np.int64)
+        self.size = size
+        self.count = 0  # Total samples ever recorded
+
+    def add(self, duration_ns):
+        """
+        Store one duration, overwriting the oldest when full.
+
+        Parameters:
+            duration_ns (int): Duration in nanoseconds
+        """
+        self.samples[self.count % self.size] = duration_ns
+        self.count += 1
+
+    def values(self):
+        """
+        Returns:
+            numpy.ndarray: Copy of the stored samples (unordered)
+        """
+        return self.samples[:min(self.count, self.size)].copy()
+
+
+# ============================================================================
+# STAGE PROFILER
+# ============================================================================
+
+class StageProfiler:
+    """
+    Collection of per-stage latency rings.
+
+    Example:
+        t = now_ns()
+        results = hands.process(rgb)
+        t = profiler.record("inference", t)
+        profiler.summary()["inference"]["p95"]  # milliseconds
+    """
+
+    def __init__(self, window=PROFILE_WINDOW):
+        """
+        Parameters:
+            window (int): Samples kept per stage
+        """
+        self.window = window
+        self.rings = {}
+        self._lock = threading.Lock()
+
+    def _ring(self, stage):
+        ring = self.rings.get(stage)
+        if ring is None:
+            # First sample of a stage: create its ring (rare, so locked)
+            with self._lock:
+                ring = self.rings.setdefault(stage, LatencyRing(self.window))
+        return ring
+
+    def record(self, stage, start_ns, end_ns=None):
+        """
+        Record the duration of a stage.
+
+        Parameters:
+            stage (str): Stage name
+            start_ns (int): now_ns() taken when the stage started
+            end_ns (int): now_ns() when it ended (defaults to now)
+
+        Returns:
+            int: The end timestamp, usable as the start of the next stage
+        """
+        if end_ns is None:
+            end_ns = now_ns()
+        self._ring(stage).add(end_ns - start_ns)
+        return end_ns
+
+    def add(self, stage, duration_ns):
+        """
+        Record an already measured duration.
+
+        Parameters:
+            stage (str): Stage name
+            duration_ns (int): Duration in nanoseconds
+        """
+        self._ring(stage).add(duration_ns)
+
+    def stages(self):
+        """
+        Returns:
+            list: Recorded stage names in display order
+        """
+        known = [stage for stage in STAGE_ORDER if stage in self.rings]
+        return known + sorted(stage for stage in self.rings if stage not in STAGE_ORDER)
+
+    def summary(self):
+        """
+        Compute percentiles of every stage over its window.
+
+        Returns:
+            dict: stage -> {"count", "mean", "p50", "p95", "p99"} (milliseconds)
+        """
+        result = {}
+        for stage in self.stages():
+            ring = self.rings[stage]
+            values = ring.values()
+            if not len(values):
+                continue
+            p50, p95, p99 = np.percentile(values, PERCENTILES) / 1e6
+            result[stage] = {
+                "count": ring.count,
+                "mean": float(values.mean() / 1e6),
+                "p50": float(p50),
+                "p95": float(p95),
+                "p99": float(p99),
+            }
+        return result
+
+    def format_report(self, summary=None):
+        """
+        Format the summary as aligned text lines.
+
+        Parameters:
+            summary (dict): Result of summary() (computed if None)
+
+        Returns:
+            list: Header line followed by one line per stage
+        """
+        if summary is None:
+            summary = self.summary()
+        lines = [f"{'stage':<11}{'p50':>8}{'p95':>8}{'p99':>8}  ms"]
+        for stage, stats in summary.items():
+            lines.append(f"{stage:<11}{stats['p50']:8.2f}{stats['p95']:8.2f}{stats['p99']:8.2f}")
+        return lines
+
+    def export(self, path):
+        """
+        Write the summary and the raw samples (milliseconds) as JSON.
+
+        Parameters:
+            path (str): Output file path
+        """
+        data = {
+            "window": self.window,
+            "summary": self.summary(),
+            "samples_ms": {stage: (self.rings[stage].values() / 1e6).round(4).tolist()
+                           for stage in self.stages()},
+        }
+        with open(path, "w") as handle:
+            json.dump(data, handle, indent=2)
+
+    def reset(self):
+        """
+        Forget all samples.
+        """
+        with self._lock:
+            self.rings = {}
+
+
+# ============================================================================
+# ROLLING FPS
+# ============================================================================
+
+class RollingFPS:
+    """
+    Frame rate over the last <window> frames in O(1) per frame.
+
+    Keeps frame timestamps in a bounded deque; the FPS is the number of
+    intervals divided by the time they span.
+    """
+
+    def __init__(self, window=FPS_HISTORY_SIZE):
+        """
+        Parameters:
+            window (int): Frames averaged over
+        """
+        self._times = collections.deque(maxlen=window + 1)
+        self.frames = 0
+        self._first_time = None
+
+    def tick(self, timestamp=None):
+        """
+        Record one frame.
+
+        Parameters:
+            timestamp (float): Frame time in seconds (defaults to perf_counter)
+
+        Returns:
+            float: FPS over the window (0 until two frames were seen)
+        """
+        if timestamp is None:
+            timestamp = time.perf_counter()
+        if self._first_time is None:
+            self._first_time = timestamp
+        self._times.append(timestamp)
+        self.frames += 1
+        return self.fps()
+
+    def fps(self):
+        """
+        Returns:
+            float: FPS over the window
+        """
+        if len(self._times) < 2:
+            return 0.0
+        span = self._times[-1] - self._times[0]
+        return (len(self._times) - 1) / span if span > 0 else 0.0
+
+    def session_fps(self):
+        """
+        Returns:
+            float: Average FPS since the first frame
+        """
+        if self.frames < 2:
+            return 0.0
+        span = self._times[-1] - self._first_time
+        return (self.frames - 1) / span if span > 0 else 0.0
+
+
+# Shared profiler used by the application modules
+profiler = StageProfiler(PROFILE_WINDOW)
@@ -0,0 +1,134 @@
+# ============================================================================
+# RENDERING.PY - Preview Frame Rendering
+# ============================================================================
+# This module draws all visual feedback for the preview window: the hand
+# skeleton, finger tip markers, gesture lines and indicators, the info panel
+# and the help overlay. It is only used when the preview window is shown;
+# headless mode skips it entirely.
+# ============================================================================
+
+# Import required libraries
+import cv2  # OpenCV for drawing
+
+# Import our custom modules
+from config import *  # Import all configuration constants
+from gesture_utils import *  # Import all drawing helpers
+from hand_tracker import load_mediapipe  # MediaPipe drawing utilities (lazy)
+
+# MediaPipe drawing utilities, connection list and styles
+# (loaded with MediaPipe on the first rendered frame, see _drawing())
+_drawing_tools = None
+
+
+def _drawing():
+    """
+    Load MediaPipe's drawing utilities and create the drawing styles once.
+
+    Returns:
+        tuple: (drawing_utils, HAND_CONNECTIONS, landmark style, connection style)
+    """
+    global _drawing_tools
+    if _drawing_tools is None:
+        mp = load_mediapipe()
+        mp_drawing = mp.solutions.drawing_utils
+        _drawing_tools = (
+            mp_drawing,
+            mp.solutions.hands.HAND_CONNECTIONS,
+            # Landmark style: green circles, 2px thick, radius 2
+            mp_drawing.DrawingSpec(color=COLOR_GREEN, thickness=2, circle_radius=2),
+            # Connection style: red lines, 2px thick
+            mp_drawing.DrawingSpec(color=COLOR_RED, thickness=2),
+        )
+    return _drawing_tools
+
+
+# ============================================================================
+# FRAME RENDERING FUNCTION
+# ============================================================================
+
+def render_frame(frame, results, gestures, avg_fps, show_help, profile_lines=None):
+    """
+    Draw all visual feedback onto the frame.
+
+    Parameters:
+        frame (numpy.ndarray): Mirrored BGR frame (modified in-place)
+        results: MediaPipe hands.process() results
+        gestures (list): Gesture descriptions from recognize_gestures()
+        avg_fps (float): Average FPS to display
+        show_help (bool): Draw the help overlay
+        profile_lines (list): Latency table to draw (None = hidden)
+
+    Returns:
+        None (frame is modified in-place)
+    """
+    # Get frame dimensions (height, width, channels)
+    frame_height, frame_width, _ = frame.shape
+
+    # Current gesture mode (CURSOR unless a hand performs a gesture)
+    gesture_mode = gestures[-1]["mode"] if gestures else MODE_CURSOR
+
+    if gestures:
+        # Hand detected! Draw indicator in top-right
+        draw_hand_detected_indicator(frame, frame_width)
+
+    for hand_landmarks, gesture in zip(results.multi_hand_landmarks or [], gestures):
+        # Draw hand landmarks and connections on the frame
+        mp_drawing, connections, landmark_style, connection_style = _drawing()
+        mp_drawing.draw_landmarks(
+            frame,  # Image to draw on
+            hand_landmarks,  # The 21 hand landmarks
+            connections,  # Lines connecting landmarks
+            landmark_style,  # Green landmark circles
+            connection_style  # Red connection lines
+        )
+
+        # Line between the pinching fingers (color depends on gesture)
+        if gesture["line"] is not None:
+            start, end, color, thickness = gesture["line"]
+            cv2.line(frame, start, end, color, thickness)
+
+        # Draw scrolling indicator
+        if gesture["mode"] == MODE_SCROLL:
+            draw_gesture_indicator(frame, MODE_SCROLL, frame_width, frame_height)
+
+        # Draw blue circle on index finger tip
+        cv2.circle(
+            frame,
+            gesture["index"],  # Center position
+            LANDMARK_CIRCLE_RADIUS,  # Radius (12 pixels)
+            COLOR_BLUE,  # Blue color
+            -1  # Filled circle
+        )
+
+        # Draw orange circle on middle finger tip
+        cv2.circle(
+            frame,
+            gesture["middle"],
+            10,  # Slightly smaller radius
+            COLOR_ORANGE,  # Orange color
+            -1  # Filled
+        )
+
+        # Draw green circle on thumb tip
+        cv2.circle(
+            frame,
+            gesture["thumb"],
+            LANDMARK_CIRCLE_RADIUS,
+            COLOR_GREEN,  # Green color
+            -1  # Filled
+        )
+
+        # If in drag mode, show indicator
+        if gesture["drag_mode"]:
+            draw_drag_indicator(frame, frame_width, frame_height)
+
+    # Draw the information panel with FPS and mode
+    draw_info_panel(frame, avg_fps, gesture_mode, frame_width, frame_height)
+
+    # Per-stage latency table (toggled with 'P')
+    if profile_lines:
+        draw_profile_overlay(frame, profile_lines, frame_width, frame_height)
+
+    # If help is toggled on, show the help overlay
+    if show_help:
+        show_help_overlay(frame, frame_width, frame_height)
@@ -0,0 +1,209 @@
+# ============================================================================
+# REPLAY.PY - Offline Replay of Landmark Recordings
+# ============================================================================
+# Feeds a recording made with --record (landmark_recorder.py) straight into
+# the gesture classification and cursor mapping code, as fast as possible.
+# No webcam, MediaPipe or display is needed, so this runs on CI hosts.
+#
+# - Throughput: frames and hands processed per second by process_hand()
+# - Regression testing: every mouse call is logged as an event; the log can
+#   be saved and diffed against a log from another version of the code
+#
+# Usage:
+#   python replay.py session.vmlm [--repeat 5] [--save-events new.jsonl]
+#                                 [--compare-events old.jsonl]
+# ============================================================================
+
+# Import required libraries
+import argparse  # Command-line options
+import json  # Event logs
+import time  # Throughput timing
+import numpy as np  # Landmark scaling
+
+# Import our custom modules
+import gesture_logic  # Gesture recognition (state is reset between replays)
+from gesture_utils import create_landmark_array  # Reusable landmark buffer
+from landmark_recorder import load_recording  # Recording files
+from mouse_output import RecordingBackend  # Logs mouse calls as events
+
+# Screen size used when replaying (fixed so event logs are comparable)
+REPLAY_SCREEN_WIDTH = 1920
+REPLAY_SCREEN_HEIGHT = 1080
+
+
+# ============================================================================
+# REPLAY DRIVER
+# ============================================================================
+
+def replay(records, frame_width, frame_height, mouse=None,
+           screen_width=REPLAY_SCREEN_WIDTH, screen_height=REPLAY_SCREEN_HEIGHT):
+    """
+    Run every recorded frame through process_hand().
+
+    Gesture state is reset first and the recorded timestamps are used as the
+    current time, so click cooldowns behave as they did live and every
+    replay of the same recording emits the same events.
+
+    Parameters:
+        records (numpy.ndarray): Records from load_recording()
+        frame_width (int): Recorded frame width in pixels
+        frame_height (int): Recorded frame height in pixels
+        mouse: Mouse backend (defaults to a new RecordingBackend)
+        screen_width (int): Screen width the cursor is mapped to
+        screen_height (int): Screen height the cursor is mapped to
+
+    Returns:
+        dict: "frames", "hands", "seconds", "fps" and "mouse"
+    """
+    if mouse is None:
+        mouse = RecordingBackend(screen_width, screen_height)
+
+    gesture_logic.reset_state()
+    scale = np.array([frame_width, frame_height, frame_width], dtype=np.float32)
+    points = create_landmark_array()
+
+    # Copy the columns out of the memmap once (fast sequential read)
+    present = np.asarray(records["present"]) != 0
+    timestamps = np.asarray(records["ts_ns"]) / 1e9
+    landmarks = np.asarray(records["landmarks"])
+
+    hands = 0
+    start = time.perf_counter()
+    for i in range(len(records)):
+        mouse.frame = i
+        if not present[i]:
+            # Like the live loop: a gesture in progress ends without a hand
+            gesture_logic.hand_missing(mouse)
+            continue
+        np.multiply(landmarks[i], scale, out=points)
+        gesture_logic.process_hand(points, frame_width, frame_height,
+                                   screen_width, screen_height, mouse, timestamps[i])
+        hands += 1
+    gesture_logic.release(mouse)
+    seconds = time.perf_counter() - start
+
+    return {
+        "frames": len(records),
+        "hands": hands,
+        "seconds": seconds,
+        "fps": len(records) / seconds if seconds > 0 else float("inf"),
+        "mouse": mouse,
+    }
+
+
+# ============================================================================
+# EVENT LOGS
+# ============================================================================
+
+def save_events(events, path):
+    """
+    Write an event log as JSON lines.
+
+    Parameters:
+        events (list): Events from RecordingBackend.events
+        path (str): Output file path
+    """
+    with open(path, "w") as handle:
+        for frame, action, args in events:
+            handle.write(json.dumps([frame, action, list(args)]) + "\n")
+
+
+def load_events(path):
+    """
+    Read an event log written by save_events().
+
+    Parameters:
+        path (str): Event log path
+
+    Returns:
+        list: Events as (frame, action, args) tuples
+    """
+    with open(path) as handle:
+        return [(frame, action, tuple(args))
+                for frame, action, args in (json.loads(line) for line in handle if line.strip())]
+
+
+def diff_events(expected, actual, limit=10):
+    """
+    Compare two event logs.
+
+    Parameters:
+        expected (list): Reference events
+        actual (list): Events to check
+        limit (int): Maximum number of differences to describe
+
+    Returns:
+        list: Human-readable descriptions of the first differences
+              (empty if the logs are identical)
+    """
+    differences = []
+    for i, (old, new) in enumerate(zip(expected, actual)):
+        if old != new:
+            differences.append(f"event {i}: expected {old}, got {new}")
+            if len(differences) >= limit:
+                return differences
+    if len(expected) != len(actual):
+        differences.append(f"event count: expected {len(expected)}, got {len(actual)}")
+    return differences
+
+
+# ============================================================================
+# COMMAND-LINE ENTRY POINT
+# ============================================================================
+
+def main():
+    """
+    Replay a recording, report throughput and optionally save/compare events.
+
+    Returns:
+        int: Process exit code (1 if the compared event logs differ)
+    """
+    parser = argparse.ArgumentParser(description="Replay a landmark recording")
+    parser.add_argument("recording", help="Recording made with gesture_controller.py --record")
+    parser.add_argument("--repeat", type=int, default=3, help="Replays for throughput timing")
+    parser.add_argument("--save-events", help="Write the mouse event log (JSON lines)")
+    parser.add_argument("--compare-events", help="Compare against a saved event log")
+    args = parser.parse_args()
+
+    header, records = load_recording(args.recording)
+    width, height = header["frame_width"], header["frame_height"]
+    print(f"[REPLAY] ✓ {args.recording}: {len(records)} frames at {width}x{height}")
+
+    # Repeat to get stable throughput; every run must emit the same events
+    runs = [replay(records, width, height) for _ in range(max(args.repeat, 1))]
+    events = runs[0]["mouse"].events
+    deterministic = all(run["mouse"].events == events for run in runs)
+    best = max(runs, key=lambda run: run["fps"])
+
+    counts = {}
+    for _, action, _ in events:
+        counts[action] = counts.get(action, 0) + 1
+
+    print(f"[REPLAY] ✓ Hands processed: {best['hands']} of {best['frames']} frames")
+    print(f"[REPLAY] ✓ Throughput: {best['fps']:.0f} frames/s "
+          f"({1e6 * best['seconds'] / max(best['frames'], 1):.1f} us/frame, best of {len(runs)})")
+    print(f"[REPLAY] ✓ Mouse events: {counts}")
+    print(f"[REPLAY] {'✓' if deterministic else '✗'} Deterministic across runs: {deterministic}")
+
+    if args.save_events:
+        save_events(events, args.save_events)
+        print(f"[REPLAY] ✓ Event log written: {args.save_events}")
+
+    if args.compare_events:
+        differences = diff_events(load_events(args.compare_events), events)
+        if differences:
+            print(f"[REPLAY] ✗ Events differ from {args.compare_events}:")
+            for line in differences:
+                print(f"[REPLAY]   {line}")
+            return 1
+        print(f"[REPLAY] ✓ Events identical to {args.compare_events}")
+
+    return 0 if deterministic else 1
+
+
+# ============================================================================
+# PROGRAM ENTRY POINT
+# ============================================================================
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,358 @@
+# ============================================================================
+# RUNTIME_CONFIG.PY - Live-Tunable Settings and Hot Reload
+# ============================================================================
+# config.py constants are copied into every module by "from config import *"
+# at import time, so changing them needs a restart (and a new MediaPipe
+# graph and warm-up). The settings operators tune on a running station are
+# grouped here in one immutable RuntimeConfig object instead:
+#
+#   cursor    smoothing_factor, cursor_filter, control_area_start/end
+#   gestures  gesture_threshold_units, click_threshold(_ratio),
+#             click_release_threshold / click_release_ratio,
+#             scroll_threshold(_ratio), click_cooldown
+#   model     model_complexity, min_detection_confidence,
+#             min_tracking_confidence, inference_scale,
+#             frame_skip, frame_skip_motion_threshold
+#
+# Field names are the lower-case config.py names, and the defaults are the
+# config.py values. A RuntimeConfig is validated once, when it is created,
+# and never changes afterwards. A reload builds a new object and publishes
+# it with one reference assignment (publish()). The gesture session and the
+# hand tracker compare get() with the object they last applied at the start
+# of every frame, in their own thread, so a reload never tears down the
+# capture or inference pipeline and never changes settings mid-frame.
+#
+# Settings file (JSON, RUNTIME_CONFIG_FILE), only the keys to change:
+#   {"smoothing_factor": 5, "model_complexity": 0, "control_area_end": 0.85}
+#
+# ConfigWatcher re-reads the file when its modification time changes, or
+# on the "reload" control command (SIGHUP or the control socket). An
+# invalid file is reported and the running settings are kept.
+# ============================================================================
+
+# Import required libraries
+import os  # Settings file modification time
+import json  # Settings file format
+import time  # Poll interval and log timestamps
+import dataclasses  # Frozen settings object
+from config import *  # Import all configuration constants
+
+# Fields whose change rebuilds the MediaPipe graph (HandTracker)
+MODEL_FIELDS = ("model_complexity", "min_detection_confidence", "min_tracking_confidence")
+
+# Cursor filter names (cursor_filters.FILTERS, not imported to keep this
+# module free of NumPy)
+CURSOR_FILTER_NAMES = ("lerp", "one_euro", "kalman")
+
+
+# ============================================================================
+# SETTINGS OBJECT
+# ============================================================================
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class RuntimeConfig:
+    """
+    Immutable, validated set of the live-tunable settings.
+
+    Example:
+        settings = RuntimeConfig.from_file("station.json")
+        publish(settings.replace(smoothing_factor=5))
+    """
+
+    # Cursor
+    smoothing_factor: float = SMOOTHING_FACTOR
+    cursor_filter: str = CURSOR_FILTER
+    control_area_start: float = CONTROL_AREA_START
+    control_area_end: float = CONTROL_AREA_END
+
+    # Gestures
+    gesture_threshold_units: str = GESTURE_THRESHOLD_UNITS
+    click_threshold_ratio: float = CLICK_THRESHOLD_RATIO
+    click_release_ratio: float = CLICK_RELEASE_RATIO
+    scroll_threshold_ratio: float = SCROLL_THRESHOLD_RATIO
+    click_threshold: float = CLICK_THRESHOLD
+    click_release_threshold: float = CLICK_RELEASE_THRESHOLD
+    scroll_threshold: float = SCROLL_THRESHOLD
+    click_cooldown: float = CLICK_COOLDOWN
+
+    # MediaPipe
+    model_complexity: int = MODEL_COMPLEXITY
+    min_detection_confidence: float = MIN_DETECTION_CONFIDENCE
+    min_tracking_confidence: float = MIN_TRACKING_CONFIDENCE
+    inference_scale: float = INFERENCE_SCALE
+    frame_skip: int = FRAME_SKIP
+    frame_skip_motion_threshold: float = FRAME_SKIP_MOTION_THRESHOLD
+
+    def __post_init__(self):
+        """
+        Check types and ranges once, when the object is created.
+
+        Raises:
+            ValueError: Listing every invalid setting
+        """
+        problems = []
+
+        # Types: JSON numbers are int or float, a float field accepts both
+        for field in dataclasses.fields(self):
+            value = getattr(self, field.name)
+            allowed = (int, float) if field.type is float else field.type
+            if isinstance(value, bool) or not isinstance(value, allowed):
+                problems.append(f"{field.name} must be {field.type.__name__}, got {value!r}")
+            elif field.type is float:
+                object.__setattr__(self, field.name, float(value))  # Frozen: set once here
+        if problems:
+            raise ValueError("; ".join(problems))
+
+        # Ranges (the same rules as config.validate())
+        if not (1 <= self.smoothing_factor <= 20):
+            problems.append(f"smoothing_factor ({self.smoothing_factor}) must be 1-20")
+        if self.cursor_filter not in CURSOR_FILTER_NAMES:
+            problems.append(f"cursor_filter '{self.cursor_filter}' must be one of "
+                            f"{', '.join(CURSOR_FILTER_NAMES)}")
+        if not (0.0 <= self.control_area_start < self.control_area_end <= 1.0):
+            problems.append(f"Invalid control area: {self.control_area_start}-{self.control_area_end}")
+        if self.gesture_threshold_units not in ("palm", "pixels"):
+            problems.append(f"gesture_threshold_units '{self.gesture_threshold_units}' "
+                            "must be palm or pixels")
+        if self.click_release_ratio < self.click_threshold_ratio:
+            problems.append(f"click_release_ratio ({self.click_release_ratio}) "
+                            f"below click_threshold_ratio ({self.click_threshold_ratio})")
+        if self.click_release_threshold < self.click_threshold:
+            problems.append(f"click_release_threshold ({self.click_release_threshold}) "
+                            f"below click_threshold ({self.click_threshold})")
+        if min(self.click_threshold_ratio, self.scroll_threshold_ratio,
+               self.click_threshold, self.scroll_threshold) <= 0:
+            problems.append("Pinch and scroll thresholds must be positive")
+        if self.click_cooldown < 0:
+            problems.append(f"click_cooldown ({self.click_cooldown}) must not be negative")
+        if self.model_complexity not in (0, 1):
+            problems.append(f"model_complexity ({self.model_complexity}) must be 0 or 1")
+        for name in ("min_detection_confidence", "min_tracking_confidence"):
+            if not (0.0 <= getattr(self, name) <= 1.0):
+                problems.append(f"{name} ({getattr(self, name)}) must be 0.0-1.0")
+        if not (0.0 < self.inference_scale <= 1.0):
+            problems.append(f"inference_scale ({self.inference_scale}) must be in (0.0, 1.0]")
+        if self.frame_skip < 1:
+            problems.append(f"frame_skip ({self.frame_skip}) must be at least 1")
+        if self.frame_skip_motion_threshold < 0:
+            problems.append(f"frame_skip_motion_threshold ({self.frame_skip_motion_threshold}) "
+                            "must not be negative")
+
+        if problems:
+            raise ValueError("; ".join(problems))
+
+    @classmethod
+    def from_dict(cls, values, base=None):
+        """
+        Create settings from a dictionary of changes.
+
+        Parameters:
+            values (dict): Field name -> value (missing fields keep base)
+            base (RuntimeConfig): Settings the changes apply to
+                                  (None = the config.py defaults)
+
+        Returns:
+            RuntimeConfig: New validated settings
+
+        Raises:
+            ValueError: If a key is unknown or a value is invalid
+        """
+        if not isinstance(values, dict):
+            raise ValueError("Settings must be a JSON object")
+        unknown = sorted(set(values) - {field.name for field in dataclasses.fields(cls)})
+        if unknown:
+            raise ValueError(f"Unknown setting(s): {', '.join(unknown)}")
+        return dataclasses.replace(cls() if base is None else base, **values)
+
+    @classmethod
+    def from_file(cls, path, base=None):
+        """
+        Load settings from a JSON file of changes.
+
+        Parameters:
+            path (str): Settings file
+            base (RuntimeConfig): Settings the file's values apply to
+                                  (None = the config.py defaults)
+
+        Returns:
+            RuntimeConfig: New validated settings
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If it is not valid JSON or a setting is invalid
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            values = json.load(f)
+        return cls.from_dict(values, base)
+
+    def replace(self, **changes):
+        """
+        Copy with some settings changed (validated like a new object).
+
+        Returns:
+            RuntimeConfig: New settings
+        """
+        return dataclasses.replace(self, **changes)
+
+    def diff(self, other):
+        """
+        Settings that differ from another RuntimeConfig.
+
+        Parameters:
+            other (RuntimeConfig): Settings to compare with
+
+        Returns:
+            dict: Field name -> (this value, other value), changed fields only
+        """
+        changes = {}
+        for field in dataclasses.fields(self):
+            mine, theirs = getattr(self, field.name), getattr(other, field.name)
+            if mine != theirs:
+                changes[field.name] = (mine, theirs)
+        return changes
+
+    def thresholds(self):
+        """
+        Pinch start, pinch release and scroll step in the configured units.
+
+        Returns:
+            tuple: (enter, exit, scroll, units) for GestureStateMachine.set_thresholds()
+        """
+        if self.gesture_threshold_units == "pixels":
+            return (self.click_threshold, self.click_release_threshold,
+                    self.scroll_threshold, "pixels")
+        return (self.click_threshold_ratio, self.click_release_ratio,
+                self.scroll_threshold_ratio, "palm")
+
+
+# ============================================================================
+# CURRENT SETTINGS
+# ============================================================================
+
+# Settings in effect; replaced as a whole by publish(), never modified
+_current = RuntimeConfig()
+
+
+def get():
+    """
+    Settings in effect.
+
+    Returns:
+        RuntimeConfig: Current settings (compare by identity to detect a reload)
+    """
+    return _current
+
+
+def publish(settings):
+    """
+    Make new settings current.
+
+    One reference assignment: threads that read get() see either the old
+    or the new object, never a mix.
+
+    Parameters:
+        settings (RuntimeConfig): Already validated settings
+    """
+    global _current
+    _current = settings
+
+
+# Fields that select the pinch and scroll thresholds
+THRESHOLD_FIELDS = ("gesture_threshold_units", "click_threshold_ratio", "click_release_ratio",
+                    "scroll_threshold_ratio", "click_threshold", "click_release_threshold",
+                    "scroll_threshold")
+
+
+def threshold_fields_changed(changes):
+    """
+    True if a reload changed a pinch or scroll threshold setting.
+
+    Used so a reload keeps a user's calibrated thresholds unless the
+    threshold settings themselves were changed.
+
+    Parameters:
+        changes (dict): Result of RuntimeConfig.diff()
+    """
+    return any(name in changes for name in THRESHOLD_FIELDS)
+
+
+# ============================================================================
+# SETTINGS FILE WATCHER
+# ============================================================================
+
+class ConfigWatcher:
+    """
+    Re-reads a settings file when it changes and publishes the result.
+
+    The main loop calls poll() once per frame; the file is checked at most
+    every interval seconds (one os.stat), so polling costs nothing
+    measurable. No watcher thread or extra dependency is needed.
+
+    Example:
+        watcher = ConfigWatcher("station.json")
+        while True:
+            watcher.poll()
+    """
+
+    def __init__(self, path, interval=RUNTIME_CONFIG_POLL_INTERVAL):
+        """
+        Load the file (if it exists) and publish it.
+
+        Parameters:
+            path (str): Settings file (JSON)
+            interval (float): Minimum seconds between modification checks
+        """
+        self.path = os.path.expanduser(path)
+        self.interval = interval
+        self.reloads = 0
+        self.errors = 0
+        self._mtime = None
+        self._next_check = 0.0
+        self._loaded = False
+        self.poll(force=True)
+
+    def poll(self, force=False):
+        """
+        Reload the file if it changed since the last load.
+
+        Parameters:
+            force (bool): Reload now, even if it looks unchanged (the
+                          "reload" control command)
+
+        Returns:
+            RuntimeConfig or None: The new settings, None if nothing changed
+                                   or the file was invalid
+        """
+        now = time.monotonic()
+        if not force and now < self._next_check:
+            return None
+        self._next_check = now + self.interval
+
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            if force:
+                print(f"[CONFIG] ⚠ Settings file not found: {self.path} (keeping current settings)")
+            return None
+        if not force and mtime == self._mtime:
+            return None
+        self._mtime = mtime
+
+        # Every reload starts from the config.py defaults, so a key removed
+        # from the file returns to its default
+        try:
+            settings = RuntimeConfig.from_file(self.path)
+        except (OSError, ValueError) as e:
+            self.errors += 1
+            print(f"[CONFIG] ⚠ Ignoring invalid settings file {self.path}: {e}")
+            return None
+
+        changes = get().diff(settings)
+        publish(settings)
+        action = "reloaded" if self._loaded else "loaded"
+        self._loaded = True
+        self.reloads += 1
+        summary = ", ".join(f"{name} {old} -> {new}" for name, (old, new) in changes.items())
+        print(f"[{time.strftime('%H:%M:%S')}] [CONFIG] ✓ Settings {action} from {self.path}: "
+              f"{summary or 'no changes'}")
+        return settings
@@ -0,0 +1,155 @@
+# ============================================================================
+# STARTUP.PY - Concurrent Camera / Model Startup and Startup Metrics
+# ============================================================================
+# Before the user sees a cursor move, three slow things happen: the camera
+# is opened and negotiates its format, the MediaPipe graph is built (model
+# files loaded, TFLite interpreters created), and the first hands.process()
+# calls allocate tensors and run far slower than steady state. They used to
+# run one after another. start() runs the camera in the calling thread and
+# builds and warms up the model (HandTracker.warm_up) on a worker thread at
+# the same time, so startup costs the slower of the two instead of the sum.
+#
+# StartupTimer records when each startup milestone was reached, relative to
+# the start of main():
+#   camera_open     capture source opened
+#   model_loaded    MediaPipe graph built
+#   model_ready     warm-up inferences done
+#   first_frame     first camera frame read by the main loop
+#   first_landmark  first frame with a detected hand
+# ============================================================================
+
+# Import required libraries
+import threading  # Model startup thread
+import time  # Milestone timestamps
+from config import *  # Import all configuration constants
+
+
+# ============================================================================
+# STARTUP TIMER
+# ============================================================================
+
+class StartupTimer:
+    """
+    Milestone times since the start of the application, in milliseconds.
+
+    Every milestone is recorded once (the first mark() wins), so the per-
+    frame marks in the main loop cost one dictionary lookup.
+
+    Example:
+        startup_timer.reset()
+        ...
+        startup_timer.mark("first_frame")
+        startup_timer.get_stats()["first_frame"]  # ms after reset()
+    """
+
+    def __init__(self):
+        """
+        Start timing now.
+        """
+        self.reset()
+
+    def reset(self):
+        """
+        Restart timing and forget all milestones.
+        """
+        self.start = time.perf_counter()
+        self.marks = {}
+        self.warmup_ms = []
+
+    def mark(self, name):
+        """
+        Record a milestone, unless it was already reached.
+
+        Parameters:
+            name (str): Milestone name (e.g. "first_frame")
+        """
+        if name not in self.marks:
+            self.marks[name] = 1000.0 * (time.perf_counter() - self.start)
+
+    def get_stats(self):
+        """
+        Get the milestone times.
+
+        Returns:
+            dict: Milestone -> ms since reset(), plus "warmup_ms" (list of
+                  warm-up inference times)
+        """
+        stats = dict(self.marks)
+        stats["warmup_ms"] = list(self.warmup_ms)
+        return stats
+
+    def format(self):
+        """
+        Format the milestones as one report line.
+
+        Returns:
+            str: e.g. "camera_open 310 ms, model_ready 420 ms, ..."
+        """
+        parts = [f"{name} {ms:.0f} ms" for name, ms in sorted(self.marks.items(), key=lambda item: item[1])]
+        if self.warmup_ms:
+            parts.append("warm-up " + "/".join(f"{ms:.0f}" for ms in self.warmup_ms) + " ms")
+        return ", ".join(parts)
+
+
+# Timer used by gesture_controller.py
+startup_timer = StartupTimer()
+
+
+# ============================================================================
+# CONCURRENT STARTUP
+# ============================================================================
+
+def start(open_source, create_tracker, concurrent=STARTUP_CONCURRENT,
+          warmup_frames=WARMUP_FRAMES, timer=startup_timer):
+    """
+    Open the capture source and build the hand tracker, concurrently.
+
+    Parameters:
+        open_source (callable): Returns the opened capture object
+                                (FrameGrabber or cv2.VideoCapture)
+        create_tracker (callable): Returns a new HandTracker
+        concurrent (bool): Build the tracker on a worker thread while the
+                           source opens (False = one after the other)
+        warmup_frames (int): Warm-up inferences after building the tracker
+        timer (StartupTimer): Records camera_open, model_loaded and
+                              model_ready
+
+    Returns:
+        tuple: (capture object, HandTracker). The caller checks
+               isOpened() and closes both.
+
+    Raises:
+        Exception: Whatever building the tracker raised (the capture
+                   object is released first)
+    """
+    result = {}
+
+    def build_tracker():
+        try:
+            tracker = create_tracker()
+            timer.mark("model_loaded")
+            if warmup_frames > 0:
+                timer.warmup_ms = tracker.warm_up(count=warmup_frames)
+            timer.mark("model_ready")
+            result["tracker"] = tracker
+        except BaseException as e:  # Re-raised in the calling thread
+            result["error"] = e
+
+    worker = None
+    if concurrent:
+        worker = threading.Thread(target=build_tracker, name="model-startup", daemon=True)
+        worker.start()
+
+    # OpenCV releases the GIL while the camera opens, so the model keeps
+    # loading meanwhile
+    cap = open_source()
+    timer.mark("camera_open")
+
+    if worker is not None:
+        worker.join()
+    else:
+        build_tracker()
+    if "error" in result:
+        cap.release()
+        raise result["error"]
+    return cap, result["tracker"]